@@ -0,0 +1,122 @@
+"""Partial reads, writes, compact forms: seeks, extraction, .cl2 writes, compaction, snapshots."""
+
+from __future__ import annotations
+
+import shutil
+
+from harness import Context, Metric, Spec, bench, best_of, traced
+
+from tunas import (
+    extract_cl2,
+    index_cl2,
+    open_cl2,
+    read_cl2,
+    seek_cl2,
+    write_cl2,
+    write_snapshot,
+)
+from tunas.snapshot import Snapshot
+
+
+def _spec(ctx: Context) -> Spec:
+    return Spec(meets=2, clubs=20, swimmers=ctx.scale(2000, 200), seed=2)
+
+
+@bench("access.lazy")
+def lazy(ctx: Context) -> list[Metric]:
+    """Scanning a file versus loading one club of it versus a full parse."""
+    path = ctx.corpus("cl2", _spec(ctx))
+    full = best_of(lambda: next(read_cl2(path)), ctx.repeat)
+    scan = best_of(lambda: open_cl2(path), ctx.repeat)
+
+    def one_club() -> None:
+        meet = open_cl2(path).meets[0]
+        meet.club(meet.team_codes[0])
+
+    club = best_of(one_club, ctx.repeat)
+    return [
+        Metric("full_parse", full, "s"),
+        Metric("scan", scan, "s"),
+        Metric("scan_and_one_club", club, "s"),
+    ]
+
+
+@bench("access.seek")
+def seek(ctx: Context) -> list[Metric]:
+    """One swimmer out of a file, through a fresh sidecar index."""
+    path = ctx.workdir / "seek.cl2"
+    shutil.copy(ctx.corpus("cl2", _spec(ctx)), path)
+    (meet, *_) = next(read_cl2(path)).meets
+    member_id = meet.swimmers[len(meet.swimmers) // 2].id_short
+    build = best_of(lambda: index_cl2(path), ctx.repeat)
+    seconds = best_of(lambda: seek_cl2(path, member_id=member_id), ctx.repeat)
+    return [Metric("build_sidecar", build, "s"), Metric("swimmer", seconds, "s")]
+
+
+@bench("access.extract")
+def extract(ctx: Context) -> list[Metric]:
+    """One club's subset of a file versus copying the file line by line."""
+    path = ctx.corpus("cl2", _spec(ctx))
+    team_code = open_cl2(path).meets[0].team_codes[0]
+    target = ctx.workdir / "extract.cl2"
+
+    def copy() -> None:
+        with open(path, "rb") as src, open(target, "wb") as out:
+            out.writelines(src)
+
+    return [
+        Metric("copy", best_of(copy, ctx.repeat), "s"),
+        Metric(
+            "one_club",
+            best_of(lambda: extract_cl2(path, target, clubs=[team_code]), ctx.repeat),
+            "s",
+        ),
+        Metric("everything", best_of(lambda: extract_cl2(path, target), ctx.repeat), "s"),
+    ]
+
+
+@bench("access.write")
+def write(ctx: Context) -> list[Metric]:
+    """Writing parsed meets back out as a .cl2 file versus parsing that file."""
+    path = ctx.corpus("cl2", _spec(ctx))
+    meets = next(read_cl2(path)).meets
+    target = ctx.workdir / "write.cl2"
+    return [
+        Metric("parse", best_of(lambda: next(read_cl2(path)), ctx.repeat), "s"),
+        Metric("write", best_of(lambda: write_cl2(meets, target), ctx.repeat), "s"),
+    ]
+
+
+@bench("access.compact")
+def compact(ctx: Context) -> list[Metric]:
+    """Retained bytes of a parsed meet before and after ``Meet.compact()``."""
+    path = ctx.corpus("cl2", _spec(ctx))
+    with traced() as mem:
+        archive = next(read_cl2(path))
+    before = mem["current"]
+    with traced() as mem:
+        archive = next(read_cl2(path))
+        for meet in archive.meets:
+            meet.compact()
+    after = mem["current"]
+    del archive
+    return [
+        Metric("retained_objects", before, "bytes"),
+        Metric("retained_compact", after, "bytes"),
+        Metric("ratio", after / before, "x"),
+    ]
+
+
+@bench("access.snapshot")
+def snapshot(ctx: Context) -> list[Metric]:
+    path = ctx.corpus("cl2", _spec(ctx))
+    meets = next(read_cl2(path)).meets
+    target = ctx.workdir / "bench.tunas"
+    write = best_of(lambda: write_snapshot(meets, target), ctx.repeat)
+
+    def load_meet() -> None:
+        with Snapshot(target) as snap:
+            snap.meet(0)
+
+    load = best_of(load_meet, ctx.repeat)
+    return [Metric("write", write, "s"), Metric("load_meet", load, "s")]
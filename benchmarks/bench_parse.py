@@ -0,0 +1,161 @@
+"""Parse throughput, per-record cost, memory, and the reader options that trade between them."""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from pathlib import Path
+
+from harness import DATA_DIR, Context, Metric, Spec, bench, best_of, traced
+
+from tunas import read_cl2, read_hy3, validate_cl2, validate_hy3
+
+READERS = {"cl2": read_cl2, "hy3": read_hy3}
+VALIDATORS = {"cl2": validate_cl2, "hy3": validate_hy3}
+GOLDEN = {
+    "cl2": [DATA_DIR / "reno_walk_on_meet.cl2", DATA_DIR / "aaa_league_championship.cl2"],
+    "hy3": [DATA_DIR / "pasa_distance_intersquad.hy3"],
+}
+
+
+def _spec(ctx: Context, *, meets: int = 2) -> Spec:
+    return Spec(meets=meets, clubs=8, swimmers=ctx.scale(1500, 150), relay_ratio=0.1, seed=1)
+
+
+def _consume(fmt: str, paths: list[Path], **options: object) -> None:
+    deque(READERS[fmt](paths, **options), maxlen=0)
+
+
+def _throughput(ctx: Context, fmt: str, paths: list[Path]) -> list[Metric]:
+    lines = sum(p.read_bytes().count(b"\n") for p in paths)
+    size = sum(p.stat().st_size for p in paths)
+    seconds = best_of(lambda: _consume(fmt, paths), ctx.repeat)
+    return [
+        Metric("lines_per_s", lines / seconds, "lines/s", "higher"),
+        Metric("mb_per_s", size / seconds / 1e6, "MB/s", "higher"),
+        Metric("seconds", seconds, "s"),
+    ]
+
+
+@bench("parse.cl2.synthetic")
+def cl2_synthetic(ctx: Context) -> list[Metric]:
+    return _throughput(ctx, "cl2", [ctx.corpus("cl2", _spec(ctx))])
+
+
+@bench("parse.hy3.synthetic")
+def hy3_synthetic(ctx: Context) -> list[Metric]:
+    return _throughput(ctx, "hy3", [ctx.corpus("hy3", _spec(ctx))])
+
+
+@bench("parse.cl2.golden")
+def cl2_golden(ctx: Context) -> list[Metric]:
+    return _throughput(ctx, "cl2", GOLDEN["cl2"])
+
+
+@bench("parse.hy3.golden")
+def hy3_golden(ctx: Context) -> list[Metric]:
+    return _throughput(ctx, "hy3", GOLDEN["hy3"])
+
+
+@bench("parse.record_cost")
+def record_cost(ctx: Context) -> list[Metric]:
+    """Mean handler time per record type, from the built-in profiler."""
+    metrics = []
+    for fmt in READERS:
+        path = ctx.corpus(fmt, _spec(ctx))
+        archive = next(READERS[fmt](path, profile=True))
+        for record_type, stats in sorted(archive.report.profile.items()):
+            if stats.calls:
+                per_record = stats.seconds / stats.calls * 1e6
+                metrics.append(Metric(f"{fmt}.{record_type}", per_record, "us/record"))
+    return metrics
+
+
+@bench("parse.validate")
+def validate(ctx: Context) -> list[Metric]:
+    """Structural validation against a full parse of the same file."""
+    metrics = []
+    for fmt, validator in VALIDATORS.items():
+        path = ctx.corpus(fmt, _spec(ctx))
+        parse = best_of(lambda fmt=fmt, path=path: _consume(fmt, [path]), ctx.repeat)
+        check = best_of(lambda v=validator, path=path: deque(v(path), maxlen=0), ctx.repeat)
+        metrics.append(Metric(f"{fmt}.seconds", check, "s"))
+        metrics.append(Metric(f"{fmt}.speedup", parse / check, "x", "higher"))
+    return metrics
+
+
+@bench("parse.profile_overhead")
+def profile_overhead(ctx: Context) -> list[Metric]:
+    path = ctx.corpus("cl2", _spec(ctx))
+    plain = best_of(lambda: _consume("cl2", [path]), ctx.repeat)
+    profiled = best_of(lambda: _consume("cl2", [path], profile=True), ctx.repeat)
+    return [Metric("ratio", profiled / plain, "x")]
+
+
+@bench("parse.checksum_overhead")
+def checksum_overhead(ctx: Context) -> list[Metric]:
+    """``read_hy3(..., verify_checksums=True)`` relative to a plain parse."""
+    path = ctx.corpus("hy3", _spec(ctx))
+    plain = best_of(lambda: _consume("hy3", [path]), ctx.repeat)
+    verified = best_of(lambda: _consume("hy3", [path], verify_checksums=True), ctx.repeat)
+    return [Metric("ratio", verified / plain, "x")]
+
+
+@bench("parse.memory")
+def memory(ctx: Context) -> list[Metric]:
+    """Peak and retained bytes per meet, and peak over a multi-file stream."""
+    metrics = []
+    for fmt in READERS:
+        spec = _spec(ctx)
+        path = ctx.corpus(fmt, spec)
+        with traced() as mem:
+            archive = next(READERS[fmt](path))
+        metrics.append(Metric(f"{fmt}.peak_per_meet", mem["peak"] / spec.meets, "bytes"))
+        metrics.append(Metric(f"{fmt}.retained_per_meet", mem["current"] / spec.meets, "bytes"))
+        del archive
+    # Streaming a corpus one archive at a time should peak near one file, not the sum.
+    paths = [ctx.corpus("cl2", Spec(swimmers=ctx.scale(500, 50), seed=s)) for s in range(8)]
+    with traced() as mem:
+        _consume("cl2", paths)
+    metrics.append(Metric("cl2.stream_peak_8_files", mem["peak"], "bytes"))
+    return metrics
+
+
+@bench("parse.interning")
+def interning(ctx: Context) -> list[Metric]:
+    """Retained archive bytes with and without ``intern=True``."""
+    metrics = []
+    for fmt in READERS:
+        path = ctx.corpus(fmt, _spec(ctx))
+        for intern in (False, True):
+            with traced() as mem:
+                archive = next(READERS[fmt](path, intern=intern))
+            label = "interned" if intern else "plain"
+            metrics.append(Metric(f"{fmt}.retained_{label}", mem["current"], "bytes"))
+            del archive
+    return metrics
+
+
+@bench("parse.gc_mode")
+def gc_mode(ctx: Context) -> list[Metric]:
+    path = ctx.corpus("cl2", _spec(ctx))
+    metrics = []
+    for mode in ("default", "pause", "freeze"):
+        seconds = best_of(lambda mode=mode: _consume("cl2", [path], gc_mode=mode), ctx.repeat)
+        metrics.append(Metric(mode, seconds, "s"))
+    return metrics
+
+
+@bench("parse.workers")
+def workers(ctx: Context) -> list[Metric]:
+    """One multi-meet file parsed serially and with a meet per worker process."""
+    spec = _spec(ctx, meets=4)
+    path = ctx.corpus("cl2", spec)
+    serial = best_of(lambda: _consume("cl2", [path]), ctx.repeat)
+    count = min(4, os.cpu_count() or 1)
+    pooled = best_of(lambda: _consume("cl2", [path], workers=max(count, 2)), ctx.repeat)
+    return [
+        Metric("serial", serial, "s"),
+        Metric("pooled", pooled, "s"),
+        Metric("speedup", serial / pooled, "x", "higher"),
+    ]
@@ -0,0 +1,128 @@
+"""Startup and query costs: import time, standards lookups, model accessors and indexes."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from collections.abc import Callable
+
+from harness import Context, Metric, Spec, bench, best_of
+
+from tunas import AthleteIndex, Event, Sex, Store, Time, read_cl2, read_hy3
+
+
+def _per_call(fn: Callable[[], object], calls: int, repeat: int) -> float:
+    """Microseconds per call of ``fn``, best of ``repeat`` batches of ``calls``."""
+
+    def batch() -> None:
+        for _ in range(calls):
+            fn()
+
+    return best_of(batch, repeat) / calls * 1e6
+
+
+def _fresh(code: str) -> float:
+    """Run ``code`` in a new interpreter; it prints one float (seconds)."""
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return float(out.stdout)
+
+
+# Metric name -> import statement timed by startup.import.
+_IMPORTS = {
+    "tunas": "import tunas",
+    "time": "from tunas import Time",
+    "standards": "from tunas import qualifies_for",
+    "read_cl2": "from tunas import read_cl2",
+    "everything": "from tunas import *",
+}
+
+
+@bench("startup.import")
+def import_time(ctx: Context) -> list[Metric]:
+    """Wall time of each import in a fresh interpreter, excluding interpreter start.
+
+    ``import tunas`` loads nothing but the package; the others show what a name's
+    first access costs once the package resolves it lazily.
+    """
+    metrics = []
+    for name, statement in _IMPORTS.items():
+        code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+        seconds = min(_fresh(code) for _ in range(ctx.repeat))
+        metrics.append(Metric(name, seconds * 1e3, "ms"))
+    return metrics
+
+
+@bench("startup.standards")
+def standards(ctx: Context) -> list[Metric]:
+    """First ``qualifies_for`` call in a fresh interpreter (loads the bundled table) vs warm."""
+    code = (
+        "import time\n"
+        "from tunas import Event, Sex, Time, qualifies_for\n"
+        "t = time.perf_counter()\n"
+        "qualifies_for(Time.parse('1:05.00'), Event.FREE_100_SCY, 12, Sex.FEMALE)\n"
+        "print(time.perf_counter() - t)\n"
+    )
+    cold = min(_fresh(code) for _ in range(ctx.repeat))
+    from tunas import qualifies_for
+
+    swim = (Time.parse("1:05.00"), Event.FREE_100_SCY, 12, Sex.FEMALE)
+    qualifies_for(*swim)
+    warm = _per_call(lambda: qualifies_for(*swim), 10_000, ctx.repeat)
+    return [Metric("first_lookup", cold * 1e3, "ms"), Metric("warm_lookup", warm, "us")]
+
+
+@bench("query.models")
+def models(ctx: Context) -> list[Metric]:
+    """The per-call cost of the common ``Meet``/``Swimmer`` accessors."""
+    path = ctx.corpus("hy3", Spec(swimmers=ctx.scale(2000, 200), seed=3))
+    meet = next(read_hy3(path)).meets[0]
+    swimmer = meet.swimmers[len(meet.swimmers) // 2]
+    event = swimmer.individual_swims[0].event
+    calls, repeat = ctx.scale(200, 50), ctx.repeat
+    all_swims = _per_call(lambda: meet.individual_swims, calls, repeat)
+    event_swims = _per_call(lambda: meet.individual_swims_for(event), calls, repeat)
+    swimmer_swims = _per_call(lambda: swimmer.swims_in(event), calls * 10, repeat)
+    return [
+        Metric("meet_individual_swims", all_swims, "us"),
+        Metric("meet_swims_for_event", event_swims, "us"),
+        Metric("swimmer_swims_in", swimmer_swims, "us"),
+    ]
+
+
+@bench("query.athletes")
+def athletes(ctx: Context) -> list[Metric]:
+    """Building an ``AthleteIndex`` over a corpus and looking athletes up in it."""
+    paths = [ctx.corpus("cl2", Spec(swimmers=ctx.scale(1000, 100), seed=s)) for s in range(4)]
+    archives = list(read_cl2(paths))
+    build = best_of(lambda: AthleteIndex.from_archives(archives), ctx.repeat)
+    index = AthleteIndex.from_archives(archives)
+    ids = [s.id_short for a in archives for m in a.meets for s in m.swimmers if s.id_short]
+    lookup = _per_call(lambda: [index.swims(i) for i in ids], 1, ctx.repeat) / len(ids)
+    swims = sum(a.report.individual_swims_parsed for a in archives)
+    return [Metric("build_per_swim", build / swims * 1e6, "us"), Metric("lookup", lookup, "us")]
+
+
+@bench("query.store")
+def store(ctx: Context) -> list[Metric]:
+    """SQLite ingest rate, then athlete and best-time queries."""
+    path = ctx.corpus("cl2", Spec(meets=2, swimmers=ctx.scale(1000, 100), seed=4))
+    archive = next(read_cl2(path))
+    swims = archive.report.individual_swims_parsed
+
+    def ingest() -> None:
+        with Store() as db:
+            db.ingest(archive)
+
+    seconds = best_of(ingest, ctx.repeat)
+    db = Store()
+    db.ingest(archive)
+    swimmer = archive.meets[0].swimmers[0]
+    athlete, event = swimmer.id_short or "", swimmer.individual_swims[0].event
+    with db:
+        by_athlete = _per_call(lambda: db.swims(athlete=athlete), 100, ctx.repeat)
+        best = _per_call(lambda: db.best(athlete, event), 100, ctx.repeat)
+    return [
+        Metric("ingest_swims_per_s", swims / seconds, "swims/s", "higher"),
+        Metric("athlete_swims", by_athlete, "us"),
+        Metric("best", best, "us"),
+    ]
@@ -0,0 +1,175 @@
+"""Benchmark registry, timing and memory helpers, JSON results and baseline comparison.
+
+A benchmark is a function registered with :func:`bench` that takes a :class:`Context`
+and returns :class:`Metric` values. Timings are the best of ``ctx.repeat`` runs
+(the least-disturbed run is the most repeatable on a shared machine); memory is
+measured with :mod:`tracemalloc`, so it counts Python allocations, not RSS.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT / "tests" / "data"
+RESULTS_VERSION = 1
+
+# synth.py (and the conftest builders it uses) live with the tests.
+sys.path.insert(0, str(ROOT / "tests"))
+
+from synth import Spec, write_corpus  # noqa: E402
+
+
+@dataclass(frozen=True)
+class Metric:
+    """One measured value: ``better`` says which direction is an improvement."""
+
+    name: str
+    value: float
+    unit: str
+    better: Literal["higher", "lower"] = "lower"
+
+
+@dataclass
+class Context:
+    """What every benchmark gets: run size, repeat count and a corpus cache."""
+
+    quick: bool = False
+    repeat: int = 5
+    workdir: Path = field(default_factory=lambda: Path(tempfile.mkdtemp(prefix="tunas-bench-")))
+    _corpora: dict[tuple[str, Spec], Path] = field(default_factory=dict)
+
+    def corpus(self, fmt: str, spec: Spec) -> Path:
+        """The path of one synthetic file for ``spec``, generated once per run."""
+        key = (fmt, spec)
+        if key not in self._corpora:
+            directory = self.workdir / f"{fmt}-{len(self._corpora)}"
+            (path,) = write_corpus(directory, spec, fmt=fmt)
+            self._corpora[key] = path
+        return self._corpora[key]
+
+    def scale(self, full: int, quick: int) -> int:
+        return quick if self.quick else full
+
+
+type BenchFn = Callable[[Context], list[Metric]]
+
+REGISTRY: dict[str, BenchFn] = {}
+
+
+def bench(name: str) -> Callable[[BenchFn], BenchFn]:
+    """Register a benchmark; its metrics are reported as ``"<name>.<metric>"``."""
+
+    def register(fn: BenchFn) -> BenchFn:
+        if name in REGISTRY:
+            raise ValueError(f"duplicate benchmark {name!r}")
+        REGISTRY[name] = fn
+        return fn
+
+    return register
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    """The fastest of ``repeat`` calls of ``fn``, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@contextmanager
+def traced() -> Iterator[dict[str, int]]:
+    """Trace allocations in the block; yields a dict filled with ``current``/``peak`` bytes."""
+    gc.collect()
+    tracemalloc.start()
+    out: dict[str, int] = {}
+    try:
+        yield out
+    finally:
+        gc.collect()
+        out["current"], out["peak"] = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+
+def run(ctx: Context, selected: list[str] | None = None) -> dict[str, Any]:
+    """Run the registered benchmarks (those whose name contains any of ``selected``)."""
+    results: dict[str, dict[str, Any]] = {}
+    for name, fn in REGISTRY.items():
+        if selected and not any(s in name for s in selected):
+            continue
+        start = time.perf_counter()
+        metrics = fn(ctx)
+        print(f"{name:<28} {time.perf_counter() - start:6.1f}s", file=sys.stderr)
+        for metric in metrics:
+            entry = asdict(metric)
+            results[f"{name}.{entry.pop('name')}"] = entry
+    from tunas import __version__
+
+    return {
+        "version": RESULTS_VERSION,
+        "tunas": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "quick": ctx.quick,
+        "repeat": ctx.repeat,
+        "results": results,
+    }
+
+
+def load(path: Path) -> dict[str, Any]:
+    """Read a results file written by ``run.py --output``.
+
+    Raises:
+        ValueError: If the file is not a results file of this version.
+    """
+    data = json.loads(path.read_text())
+    if not isinstance(data, dict) or data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path} is not a version {RESULTS_VERSION} benchmark results file")
+    return data
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> tuple[list[str], list[str]]:
+    """Report lines for every shared metric, and the names of those that regressed.
+
+    A metric regresses when it moves in its worse direction by more than
+    ``threshold`` (a fraction: ``0.1`` is 10%).
+    """
+    lines, regressions = [], []
+    old, new = baseline["results"], current["results"]
+    if baseline.get("quick") != current.get("quick"):
+        lines.append("note: comparing a --quick run with a full run; sizes differ")
+    for name in sorted(old.keys() & new.keys()):
+        before, after = old[name]["value"], new[name]["value"]
+        if not before:
+            continue
+        change = (after - before) / before
+        worse = -change if new[name]["better"] == "higher" else change
+        flag = "REGRESSED" if worse > threshold else "improved" if worse < -threshold else ""
+        if flag == "REGRESSED":
+            regressions.append(name)
+        unit = new[name]["unit"]
+        lines.append(
+            f"{name:<48} {before:>14.4g} -> {after:<14.4g} {unit:<10} {change:+7.1%} {flag}"
+        )
+    for name in sorted(old.keys() - new.keys()):
+        lines.append(f"{name:<48} (not measured in this run)")
+    return lines, regressions
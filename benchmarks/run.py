@@ -0,0 +1,72 @@
+"""Run the tunas benchmark suite, write JSON results, and compare against a baseline.
+
+Usage::
+
+    python benchmarks/run.py                                # full run, table to stdout
+    python benchmarks/run.py --quick --output results.json  # smaller inputs, JSON file
+    python benchmarks/run.py --compare baseline.json        # exit 1 on a regression
+    python benchmarks/run.py --only parse. startup.         # benchmarks by name prefix/part
+
+Inputs are the golden files under ``tests/data`` and synthetic files generated by
+``tests/synth.py`` into a temporary directory, so the suite runs offline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import bench_access  # noqa: E402, F401  (registers benchmarks)
+import bench_parse  # noqa: E402, F401
+import bench_query  # noqa: E402, F401
+from harness import REGISTRY, Context, compare, load, run  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--quick", action="store_true", help="small inputs (a smoke run)")
+    parser.add_argument("--repeat", type=int, default=None, help="runs per timing (best kept)")
+    parser.add_argument(
+        "--only", nargs="+", metavar="NAME", help="benchmarks whose name contains NAME"
+    )
+    parser.add_argument("--output", type=Path, help="write results as JSON to this file")
+    parser.add_argument(
+        "--compare", type=Path, metavar="BASELINE", help="results JSON to compare with"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="regression threshold as a fraction (0.10)"
+    )
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(REGISTRY))
+        return 0
+    baseline = load(args.compare) if args.compare else None
+    ctx = Context(quick=args.quick, repeat=args.repeat or (2 if args.quick else 5))
+    try:
+        results = run(ctx, args.only)
+    finally:
+        shutil.rmtree(ctx.workdir, ignore_errors=True)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if baseline is None:
+        for name, entry in results["results"].items():
+            print(f"{name:<48} {entry['value']:>14.4g} {entry['unit']}")
+        return 0
+    lines, regressions = compare(baseline, results, args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,58 +5,197 @@ Parses meet results into structured domain models and queries offline motivation
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from tunas._version import __version__
-from tunas.enums import (
-    Affiliation,
-    AttachStatus,
-    Citizenship,
-    Course,
-    Ethnicity,
-    EventTimeClass,
-    FileType,
-    Hy3FileType,
-    MeetType,
-    MemberStatus,
-    Organization,
-    Region,
-    RelayLegOrder,
-    ResultStatus,
-    Season,
-    Session,
-    Sex,
-    SplitType,
-    Stroke,
-)
-from tunas.event import Event
-from tunas.exceptions import ParseError, StandardsError, TunasError
-from tunas.geography import LSC, Country, State
-from tunas.models import (
-    Club,
-    ClubEntryCounts,
-    IndividualSwim,
-    Meet,
-    MeetHost,
-    MeetResult,
-    Relay,
-    RelaySwim,
-    SourceFile,
-    Split,
-    Swim,
-    Swimmer,
-    SwimmerContact,
-    SwimmerRegistration,
-)
-from tunas.parser import (
-    IssueKind,
-    MeetArchive,
-    ParseReport,
-    ParseWarning,
-    Severity,
-    read_cl2,
-    read_hy3,
-)
-from tunas.standards import TimeStandard, all_qualified, qualifies_for, standard_time
-from tunas.time import Time
+
+if TYPE_CHECKING:
+    from tunas.athletes import Athlete, AthleteIndex, SwimRef, athlete_key
+    from tunas.bests import CourseConverter, PersonalBest, PersonalBests
+    from tunas.columns import (
+        COLUMNS,
+        NULL,
+        WARNING_COLUMNS,
+        ResultTable,
+        WarningTable,
+        to_columns,
+        warnings_to_columns,
+    )
+    from tunas.compact import CompactSwim, SwimStore
+    from tunas.distributions import DistributionKey, QuantileSketch, TimeDistributions
+    from tunas.enums import (
+        Affiliation,
+        AttachStatus,
+        Citizenship,
+        Course,
+        Ethnicity,
+        EventTimeClass,
+        FileType,
+        Hy3FileType,
+        MeetType,
+        MemberStatus,
+        Organization,
+        Region,
+        RelayLegOrder,
+        ResultStatus,
+        Season,
+        Session,
+        Sex,
+        SplitType,
+        Stroke,
+    )
+    from tunas.event import Event
+    from tunas.exceptions import ParseError, StandardsError, TunasError
+    from tunas.extract import extract_cl2
+    from tunas.geography import LSC, Country, State
+    from tunas.jsonl import write_jsonl
+    from tunas.lazy import (
+        LazyArchive,
+        LazyMeet,
+        index_cl2,
+        index_hy3,
+        open_cl2,
+        open_hy3,
+        seek_cl2,
+        seek_hy3,
+    )
+    from tunas.models import (
+        Club,
+        ClubEntryCounts,
+        IndividualSwim,
+        Meet,
+        MeetHost,
+        MeetResult,
+        Relay,
+        RelaySwim,
+        SourceFile,
+        Split,
+        Swim,
+        Swimmer,
+        SwimmerContact,
+        SwimmerRegistration,
+    )
+    from tunas.parser import (
+        HandlerStats,
+        IssueKind,
+        MeetArchive,
+        ParseReport,
+        ParseWarning,
+        Severity,
+        WarningTally,
+        read_cl2,
+        read_hy3,
+    )
+    from tunas.rankings import RankedSwim, RankingKey, Rankings
+    from tunas.sdif import write_cl2
+    from tunas.snapshot import MeetHeader, Snapshot, write_snapshot
+    from tunas.standards import (
+        TimeStandard,
+        age_group,
+        all_qualified,
+        qualifies_for,
+        standard_time,
+    )
+    from tunas.store import Store, StoredMeet, StoredSwim
+    from tunas.time import Time
+    from tunas.validate import ValidationResult, validate_cl2, validate_hy3
+
+# Public names are imported from their modules on first access (PEP 562), so
+# `import tunas` stays cheap and `from tunas import Time` loads only `tunas.time`
+# and what it needs. Keep in step with the imports above and `__all__`.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "tunas.athletes": ("Athlete", "AthleteIndex", "SwimRef", "athlete_key"),
+    "tunas.bests": ("CourseConverter", "PersonalBest", "PersonalBests"),
+    "tunas.columns": (
+        "COLUMNS",
+        "NULL",
+        "WARNING_COLUMNS",
+        "ResultTable",
+        "WarningTable",
+        "to_columns",
+        "warnings_to_columns",
+    ),
+    "tunas.compact": ("CompactSwim", "SwimStore"),
+    "tunas.distributions": ("DistributionKey", "QuantileSketch", "TimeDistributions"),
+    "tunas.enums": (
+        "Affiliation",
+        "AttachStatus",
+        "Citizenship",
+        "Course",
+        "Ethnicity",
+        "EventTimeClass",
+        "FileType",
+        "Hy3FileType",
+        "MeetType",
+        "MemberStatus",
+        "Organization",
+        "Region",
+        "RelayLegOrder",
+        "ResultStatus",
+        "Season",
+        "Session",
+        "Sex",
+        "SplitType",
+        "Stroke",
+    ),
+    "tunas.event": ("Event",),
+    "tunas.exceptions": ("ParseError", "StandardsError", "TunasError"),
+    "tunas.extract": ("extract_cl2",),
+    "tunas.geography": ("LSC", "Country", "State"),
+    "tunas.jsonl": ("write_jsonl",),
+    "tunas.lazy": (
+        "LazyArchive",
+        "LazyMeet",
+        "index_cl2",
+        "index_hy3",
+        "open_cl2",
+        "open_hy3",
+        "seek_cl2",
+        "seek_hy3",
+    ),
+    "tunas.models": (
+        "Club",
+        "ClubEntryCounts",
+        "IndividualSwim",
+        "Meet",
+        "MeetHost",
+        "MeetResult",
+        "Relay",
+        "RelaySwim",
+        "SourceFile",
+        "Split",
+        "Swim",
+        "Swimmer",
+        "SwimmerContact",
+        "SwimmerRegistration",
+    ),
+    "tunas.parser": (
+        "HandlerStats",
+        "IssueKind",
+        "MeetArchive",
+        "ParseReport",
+        "ParseWarning",
+        "Severity",
+        "WarningTally",
+        "read_cl2",
+        "read_hy3",
+    ),
+    "tunas.rankings": ("RankedSwim", "RankingKey", "Rankings"),
+    "tunas.sdif": ("write_cl2",),
+    "tunas.snapshot": ("MeetHeader", "Snapshot", "write_snapshot"),
+    "tunas.standards": (
+        "TimeStandard",
+        "age_group",
+        "all_qualified",
+        "qualifies_for",
+        "standard_time",
+    ),
+    "tunas.store": ("Store", "StoredMeet", "StoredSwim"),
+    "tunas.time": ("Time",),
+    "tunas.validate": ("ValidationResult", "validate_cl2", "validate_hy3"),
+}
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
 
 __all__ = [
     "__version__",
@@ -68,6 +207,21 @@ __all__ = [
     "ParseWarning",
     "Severity",
     "IssueKind",
+    "HandlerStats",
+    "WarningTally",
+    # lazy access
+    "open_cl2",
+    "open_hy3",
+    "LazyArchive",
+    "LazyMeet",
+    "index_cl2",
+    "index_hy3",
+    "seek_cl2",
+    "seek_hy3",
+    # validation
+    "validate_cl2",
+    "validate_hy3",
+    "ValidationResult",
     # exceptions
     "TunasError",
     "ParseError",
@@ -87,6 +241,8 @@ __all__ = [
     "MeetHost",
     "SourceFile",
     "ClubEntryCounts",
+    "CompactSwim",
+    "SwimStore",
     # value types
     "Time",
     "Event",
@@ -113,9 +269,57 @@ __all__ = [
     "LSC",
     "State",
     "Country",
+    # corpus
+    "AthleteIndex",
+    "Athlete",
+    "SwimRef",
+    "athlete_key",
+    "PersonalBests",
+    "PersonalBest",
+    "CourseConverter",
+    "Rankings",
+    "RankingKey",
+    "RankedSwim",
+    "TimeDistributions",
+    "DistributionKey",
+    "QuantileSketch",
+    # columnar export
+    "ResultTable",
+    "to_columns",
+    "COLUMNS",
+    "NULL",
+    "WarningTable",
+    "warnings_to_columns",
+    "WARNING_COLUMNS",
+    "write_jsonl",
+    "extract_cl2",
+    "write_cl2",
+    # store
+    "Store",
+    "StoredMeet",
+    "StoredSwim",
+    # snapshots
+    "Snapshot",
+    "MeetHeader",
+    "write_snapshot",
     # standards
     "TimeStandard",
     "qualifies_for",
     "standard_time",
     "all_qualified",
+    "age_group",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module defining public ``name`` on first access, then cache it."""
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,5 @@
+"""``python -m tunas``: the :mod:`tunas.cli` command line."""
+
+from tunas.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,43 @@
+"""Shared helpers for the corpus-level aggregates (bests, rankings, statistics)."""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterator
+
+from tunas.enums import ResultStatus
+from tunas.models import IndividualSwim, Meet
+
+__all__ = ["COUNTING_STATUSES", "timed_swims", "swim_age"]
+
+# Statuses whose time is a legitimate swim (exhibition swims don't score, but count).
+COUNTING_STATUSES = frozenset({ResultStatus.OK, ResultStatus.EXHIBITION})
+
+
+def timed_swims(meet: Meet) -> Iterator[IndividualSwim]:
+    """A meet's individual swims that carry a time with a counting status, in order."""
+    for result in meet.results:
+        if (
+            isinstance(result, IndividualSwim)
+            and result.time is not None
+            and result.status in COUNTING_STATUSES
+        ):
+            yield result
+
+
+def swim_age(swim: IndividualSwim) -> int | None:
+    """The swimmer's age for a swim, or None if the file doesn't say.
+
+    Prefers the numeric age the meet recorded (``swimmer_age_class``), falling back
+    to the birthday on the meet's age-up date (else the swim or meet start date).
+    School-grade classes (``JR``, ``SO``, ...) carry no age.
+    """
+    age_class = swim.swimmer_age_class
+    if age_class is not None and age_class.isdigit():
+        return int(age_class)
+    birthday = swim.swimmer.birthday
+    if birthday is None:
+        return None
+    meet = swim.meet
+    on: datetime.date = meet.age_up_date or swim.date or meet.start_date
+    return on.year - birthday.year - ((on.month, on.day) < (birthday.month, birthday.day))
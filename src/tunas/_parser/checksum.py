@@ -2,25 +2,106 @@
 
 Every `.hy3` record is 130 columns: 128 data columns plus a 2-digit checksum in
 columns 129-130, computed over the raw single-byte (CP-1252) representation of the
-first 128 columns. The parser does not validate the checksum (it isn't a data field
-and `USAS Club Times Export` files omit it), but :func:`hy3_checksum` documents the
-algorithm and is used to build byte-accurate test fixtures.
+first 128 columns. `USAS Club Times Export` files (``A1`` file type ``17``) do not
+use it. The readers only verify checksums on request (``verify_checksums=True``):
+:func:`checked_lines` computes them a batch of lines at a time, ahead of the engine.
 """
 
 from __future__ import annotations
 
-__all__ = ["DATA_WIDTH", "RECORD_WIDTH", "hy3_checksum"]
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import batched
+from zlib import adler32
+
+__all__ = [
+    "DATA_WIDTH",
+    "RECORD_WIDTH",
+    "hy3_checksum",
+    "hy3_checksums",
+    "checked_lines",
+    "mismatch_reason",
+]
 
 DATA_WIDTH = 128  # columns 1-128 hold the data fields
 RECORD_WIDTH = 130  # 128 data columns + a 2-digit checksum
+BATCH_LINES = 1024  # lines checksummed per batch by checked_lines
+
+# Checksum text for the last two digits n of the result: units digit first (reversed).
+_TEXT = [f"{n % 10}{n // 10}" for n in range(100)]
 
 
 def hy3_checksum(data: bytes) -> str:
-    """Compute the 2-digit checksum for a 128-byte (CP-1252) record body."""
+    """Compute the 2-digit checksum for a 128-byte (CP-1252) record body.
+
+    The result is ``(2 * sum_even + sum_odd) // 21 + 205`` over the bytes at
+    1-based even and odd columns — ``sum(data) + sum(data[1::2])`` — with its last
+    two digits emitted units first.
+    """
     if len(data) != DATA_WIDTH:
         raise ValueError(f"expected {DATA_WIDTH} bytes, got {len(data)}")
-    sum_odd = sum(data[i] for i in range(0, DATA_WIDTH, 2))  # 1-based odd columns
-    sum_even = sum(data[i] for i in range(1, DATA_WIDTH, 2))  # 1-based even columns
-    result = (2 * sum_even + sum_odd) // 21 + 205
-    tens, units = (result // 10) % 10, result % 10
-    return f"{units}{tens}"  # emitted units digit first (reversed)
+    return _TEXT[((sum(data) + sum(data[1::2])) // 21 + 205) % 100]
+
+
+def hy3_checksums(bodies: Sequence[bytes]) -> list[str]:
+    """:func:`hy3_checksum` of many 128-byte bodies at once.
+
+    The byte sums come from :func:`zlib.adler32`, whose low 16 bits are one more
+    than the sum of the bytes modulo 65521 — exact here, as 128 bytes sum to at most
+    32,640 — so each line costs two C calls and no per-byte Python work.
+
+    Raises:
+        ValueError: If any body is not 128 bytes.
+    """
+    if any(len(body) != DATA_WIDTH for body in bodies):
+        raise ValueError(f"expected {DATA_WIDTH}-byte bodies")
+    totals = map(adler32, bodies)
+    evens = map(adler32, [body[1::2] for body in bodies])
+    return [
+        _TEXT[(((total & 0xFFFF) + (even & 0xFFFF) - 2) // 21 + 205) % 100]
+        for total, even in zip(totals, evens, strict=True)
+    ]
+
+
+def checked_lines(
+    lines: Iterable[tuple[int, object]],
+    mismatches: dict[int, tuple[str, str]],
+    encoding: str = "cp1252",
+) -> Iterator[tuple[int, object]]:
+    """Pass ``(line_no, line)`` pairs through, checksumming them a batch ahead.
+
+    Before yielding a batch, adds ``line_no -> (declared, expected)`` to
+    ``mismatches`` for each of its lines whose columns 129-130 do not hold the
+    checksum of its data (blank columns included), so a consumer that pops its
+    line's entry sees every mismatch in line order. Blank, over-long and non-text
+    lines are not checked. Bodies are re-encoded with ``encoding`` (an ASCII-compatible
+    one), recovering the file's bytes when the lines were decoded with it.
+    """
+    for batch in batched(lines, BATCH_LINES):
+        numbers, texts = zip(*batch, strict=True)
+        if not all(isinstance(text, str) for text in texts):
+            yield from batch  # the consumer rejects bytes
+            continue
+        if numbers[0] == 1:
+            texts = (texts[0].removeprefix("\ufeff"), *texts[1:])
+        # Most lines are a full record whose checksum matches: compare the raw
+        # columns first and only look closer at the lines that differ.
+        bodies = [_body(text, encoding) for text in texts]
+        for line_no, text, expected in zip(numbers, texts, hy3_checksums(bodies), strict=True):
+            if text[DATA_WIDTH:RECORD_WIDTH] != expected:
+                line = text.rstrip("\r\n")
+                if line.strip() and len(line) <= RECORD_WIDTH:
+                    mismatches[line_no] = (line[DATA_WIDTH:RECORD_WIDTH], expected)
+        yield from batch
+
+
+def _body(text: str, encoding: str) -> bytes:
+    """The 128 data columns of ``text`` as bytes (ASCII lines skip the codec)."""
+    body = text[:DATA_WIDTH].ljust(DATA_WIDTH)
+    return body.encode("ascii") if body.isascii() else body.encode(encoding, "replace")
+
+
+def mismatch_reason(declared: str, expected: str) -> str:
+    """The warning reason for a line whose checksum columns hold ``declared``."""
+    if not declared.strip():
+        return f"missing checksum (expected {expected!r})"
+    return f"checksum {declared!r} does not match {expected!r}"
@@ -21,7 +21,7 @@ from tunas._parser.fields import (
     int_value,
     time_value,
 )
-from tunas._parser.ids import normalize_id
+from tunas._parser.interning import Interner
 from tunas._parser.names import parse_name
 from tunas._parser.state import ParserState, PendingIndividual
 from tunas.enums import (
@@ -194,8 +194,25 @@ class _Cl2Engine(_BaseEngine):
     RECORD_WIDTH: ClassVar[int] = RECORD_WIDTH
     READER: ClassVar[str] = "read_cl2"
 
-    def __init__(self, *, strict: bool) -> None:
-        super().__init__(strict=strict)
+    def __init__(
+        self,
+        *,
+        strict: bool,
+        interner: Interner | None = None,
+        profile: bool = False,
+        max_warnings: int | None = None,
+        verify_checksums: bool = False,
+        encoding: str = "cp1252",
+    ) -> None:
+        super().__init__(
+            strict=strict,
+            interner=interner,
+            profile=profile,
+            max_warnings=max_warnings,
+            verify_checksums=verify_checksums,
+            encoding=encoding,
+        )
+        self._handlers = self._dispatch(_HANDLERS)
         self.state: ParserState | None = None
 
     # -- per-file hooks ---------------------------------------------------- #
@@ -218,7 +235,7 @@ class _Cl2Engine(_BaseEngine):
         if rec.type not in _CONTINUATION and self.state and self.state.pending_individual:
             self._commit_pending()
 
-        handler = _HANDLERS.get(rec.type)
+        handler = self._handlers.get(rec.type)
         if handler is None:
             self._warn(
                 rec,
@@ -385,11 +402,11 @@ class _Cl2Engine(_BaseEngine):
 
     # -- contact / registration enrichment --------------------------------- #
 
-    @staticmethod
-    def _update_contact(sw: Swimmer, **kw: object) -> None:
+    def _update_contact(self, sw: Swimmer, **kw: object) -> None:
         present = {k: v for k, v in kw.items() if v is not None}
         if present:
-            sw.contact = replace(sw.contact or SwimmerContact(), **present)  # type: ignore[arg-type]
+            contact = replace(sw.contact or SwimmerContact(), **present)  # type: ignore[arg-type]
+            sw.contact = self._share(contact)
 
     @staticmethod
     def _update_registration(sw: Swimmer, **kw: object) -> None:
@@ -444,6 +461,12 @@ class _Cl2Engine(_BaseEngine):
         self.meets_this_file += 1
         self.state = ParserState(meet=meet)
 
+    def _swimmer_name(self, rec: Record, start: int) -> tuple[str, str, str | None]:
+        """Mandatory 28-char NAME field at ``start`` as ``(last, first, middle)``."""
+        raw = self._require_text(rec, start, 28, "swimmer_name", f"{start}/28")
+        last, first, middle = parse_name(raw)
+        return self._share(last), self._share(first), middle
+
     def _m2_text(self, rec: Record, start: int, length: int, field: str, column: str) -> str | None:
         v = rec.text(start, length)
         if v is None:
@@ -475,36 +498,26 @@ class _Cl2Engine(_BaseEngine):
     def _h_b2(self, rec: Record) -> None:
         if self.state is None:
             return
-        self.state.meet.host = MeetHost(
-            name=self._m2_text(rec, 12, 30, "host_name", "12/30"),
-            address_one=rec.text(42, 22),
-            address_two=rec.text(64, 22),
-            city=rec.text(86, 20),
-            state=self._code(rec, 106, 2, State, "state", "106/2", None),
-            postal_code=rec.text(108, 10),
-            country=self._code(rec, 118, 3, Country, "country", "118/3", None),
-            phone=rec.text(121, 12),
+        self.state.meet.host = self._share(
+            MeetHost(
+                name=self._m2_text(rec, 12, 30, "host_name", "12/30"),
+                address_one=rec.text(42, 22),
+                address_two=rec.text(64, 22),
+                city=rec.text(86, 20),
+                state=self._code(rec, 106, 2, State, "state", "106/2", None),
+                postal_code=rec.text(108, 10),
+                country=self._code(rec, 118, 3, Country, "country", "118/3", None),
+                phone=rec.text(121, 12),
+            )
         )
 
-    def _team_code(self, rec: Record, code_start: int, ext_start: int) -> tuple[str, LSC | None]:
-        base = rec.raw(code_start, 6)
-        lsc_raw = base[0:2].strip()
-        team = base[2:].strip()
-        ext = rec.raw(ext_start, 1).strip()
-        full = (lsc_raw + team + ext) or base.strip()
-        try:
-            lsc: LSC | None = LSC(lsc_raw) if lsc_raw else None
-        except ValueError:
-            lsc = None
-        return full, lsc
-
     def _h_c1(self, rec: Record) -> None:
         st = self.state
         if st is None:
             return
         self._commit_pending()
         org = self._code(rec, 3, 1, Organization, "organization", "3/1", "M2")
-        team_code, lsc = self._team_code(rec, 12, 150)
+        team_code, lsc = c1_team_code(rec)
         name = self._require_text(rec, 18, 30, "full_team_name", "18/30")
         team_part = rec.raw(12, 6)[2:].strip().upper()
         if team_part == "UN" or "UNATTACHED" in name.upper():
@@ -550,12 +563,14 @@ class _Cl2Engine(_BaseEngine):
         short = rec.text(89, 16)
         if short is not None:
             club.short_name = short
-        club.entry_counts = ClubEntryCounts(
-            num_individual_swims=self._opt_int(rec, 60, 6),
-            num_athletes=self._opt_int(rec, 66, 6),
-            num_relay_entries=self._opt_int(rec, 72, 5),
-            num_relay_name_records=self._opt_int(rec, 77, 6),
-            num_split_records=self._opt_int(rec, 83, 6),
+        club.entry_counts = self._share(
+            ClubEntryCounts(
+                num_individual_swims=self._opt_int(rec, 60, 6),
+                num_athletes=self._opt_int(rec, 66, 6),
+                num_relay_entries=self._opt_int(rec, 72, 5),
+                num_relay_name_records=self._opt_int(rec, 77, 6),
+                num_split_records=self._opt_int(rec, 83, 6),
+            )
         )
 
     def _h_d0(self, rec: Record) -> None:
@@ -564,8 +579,8 @@ class _Cl2Engine(_BaseEngine):
             self._skip_orphan(rec, "D0 with no preceding B1 meet")
             return
         org = self._code(rec, 3, 1, Organization, "organization", "3/1", "M2")
-        last, first, middle = parse_name(self._require_text(rec, 12, 28, "swimmer_name", "12/28"))
-        id_short = normalize_id(rec.raw(40, 12))
+        last, first, middle = self._swimmer_name(rec, 12)
+        id_short = self._member_id(rec.raw(40, 12))
         citizenship = self._citizenship(rec, 53, 3)
         birthday = self._date(rec, 56, 8, "birthday", "56/8", "M2")
         sex = self._require_code(rec, 66, 1, Sex, "sex", "66/1")
@@ -801,7 +816,7 @@ class _Cl2Engine(_BaseEngine):
             self._skip_orphan(rec, "D3 with no current swimmer")
             return
         sw = st.current_swimmer
-        id_long = normalize_id(rec.raw(3, 14))
+        id_long = self._member_id(rec.raw(3, 14))
         preferred = rec.text(17, 15)
         if id_long is not None and sw.id_long is None:
             sw.id_long = id_long
@@ -924,10 +939,10 @@ class _Cl2Engine(_BaseEngine):
         if st is None or not st.current_relays:
             self._skip_orphan(rec, "F0 relay name with no preceding E0 relay event")
             return
-        last, first, middle = parse_name(self._require_text(rec, 23, 28, "swimmer_name", "23/28"))
+        last, first, middle = self._swimmer_name(rec, 23)
         sex = self._require_code(rec, 76, 1, Sex, "sex", "76/1")
-        id_short = normalize_id(rec.raw(51, 12))
-        id_long = normalize_id(rec.raw(93, 14))
+        id_short = self._member_id(rec.raw(51, 12))
+        id_long = self._member_id(rec.raw(93, 14))
         citizenship = self._citizenship(rec, 63, 3)
         birthday = self._date(rec, 66, 8, "birthday", "66/8", "M2")
         age_class = rec.text(74, 2)
@@ -1118,6 +1133,20 @@ class _Cl2Engine(_BaseEngine):
                 )
 
 
+def c1_team_code(rec: Record) -> tuple[str, LSC | None]:
+    """A C1 record's full team code (LSC + code + extension, cols 12/6 and 150/1) and LSC."""
+    base = rec.raw(12, 6)
+    lsc_raw = base[0:2].strip()
+    team = base[2:].strip()
+    ext = rec.raw(150, 1).strip()
+    full = (lsc_raw + team + ext) or base.strip()
+    try:
+        lsc: LSC | None = LSC(lsc_raw) if lsc_raw else None
+    except ValueError:
+        lsc = None
+    return full, lsc
+
+
 # Dispatch table — every modeled record type.
 _HANDLERS: dict[str, Callable[[_Cl2Engine, Record], None]] = {
     "A0": _Cl2Engine._h_a0,
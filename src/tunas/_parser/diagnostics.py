@@ -1,17 +1,50 @@
-"""Structured parse diagnostics (Severity, IssueKind, ParseWarning, ParseReport)."""
+"""Structured parse diagnostics (Severity, IssueKind, ParseWarning, ParseReport, HandlerStats)."""
 
 from __future__ import annotations
 
+import dataclasses
 import enum
-from dataclasses import dataclass, field, fields
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Any
 
-__all__ = ["Severity", "IssueKind", "ParseWarning", "ParseReport"]
+__all__ = [
+    "Severity",
+    "IssueKind",
+    "ParseWarning",
+    "ParseReport",
+    "HandlerStats",
+    "WarningTally",
+    "check_max_warnings",
+]
+
+#: Suppressed-warning line numbers kept per :class:`WarningTally`.
+MAX_EXAMPLES = 10
+
+#: The summed counters of a :class:`ParseReport`.
+COUNT_FIELDS = (
+    "files_read",
+    "meets_parsed",
+    "swimmers_parsed",
+    "individual_swims_parsed",
+    "relays_parsed",
+    "splits_parsed",
+    "records_skipped",
+    "fields_recovered",
+)
+
+type TallyKey = tuple[str | None, str | None, IssueKind]
+type IssueKey = tuple[str, str | None, str | None, IssueKind, Severity]
+
+#: The ParseWarning attributes a ParseReport indexes and counts by (IssueKey order).
+INDEXED = ("source", "record_type", "field", "kind", "severity")
 
 
 class Severity(enum.Enum):
     """How a parse issue was handled."""
 
-    FATAL = "fatal"  # Structural (M1) violation; carried only by the raised ParseError
+    FATAL = "fatal"  # Structural (M1) violation; carried by the raised ParseError
     SKIPPED = "skipped"  # Record dropped entirely
     RECOVERED = "recovered"  # Field set to None, record kept
 
@@ -26,6 +59,12 @@ class IssueKind(enum.Enum):
     ORPHANED = "orphaned"  # No anchor record found
     UNKNOWN_RECORD = "unknown_record"  # Unmodeled record header
     COUNT_MISMATCH = "count_mismatch"  # Z0 declared count != parsed total
+    BAD_CHECKSUM = "bad_checksum"  # .hy3 line checksum doesn't match its data
+
+
+#: RECOVERED kinds that flag a whole line or file rather than a recovered field, so
+#: they are not counted in ``fields_recovered``.
+LINE_KINDS = frozenset({IssueKind.COUNT_MISMATCH, IssueKind.BAD_CHECKSUM})
 
 
 @dataclass(frozen=True)
@@ -57,6 +96,79 @@ class ParseWarning:
     raw_line: str  # truncated to 200 chars
 
 
+@dataclass(slots=True)
+class HandlerStats:
+    """Profiling totals for one record type's handler (see ``profile=`` on the readers).
+
+    Attributes:
+        handler: Name of the engine method that handles the record type (e.g. "_h_d0").
+        calls: Records dispatched to the handler.
+        seconds: Cumulative wall time spent in the handler.
+        warnings: Warnings the handler emitted.
+    """
+
+    handler: str
+    calls: int = 0
+    seconds: float = 0.0
+    warnings: int = 0
+
+    def merge(self, other: HandlerStats) -> None:
+        """Add another handler's totals to these."""
+        self.calls += other.calls
+        self.seconds += other.seconds
+        self.warnings += other.warnings
+
+
+@dataclass(slots=True)
+class WarningTally:
+    """Warnings past the ``max_warnings`` cap for one (record type, field, kind).
+
+    Attributes:
+        record_type: Coded record type of the suppressed warnings.
+        field: Field they concern.
+        kind: Their IssueKind.
+        count: How many were suppressed.
+        by_severity: ``count`` split by Severity.
+        examples: ``(source, line_no)`` of the first few suppressed warnings
+            (at most 10).
+    """
+
+    record_type: str | None
+    field: str | None
+    kind: IssueKind
+    count: int = 0
+    # `dataclasses.field` is shadowed by the `field` attribute in this class body.
+    by_severity: dict[Severity, int] = dataclasses.field(default_factory=dict)
+    examples: list[tuple[str, int]] = dataclasses.field(default_factory=list)
+
+    def add(self, warning: ParseWarning) -> None:
+        """Count one suppressed warning."""
+        self.count += 1
+        self.by_severity[warning.severity] = self.by_severity.get(warning.severity, 0) + 1
+        if len(self.examples) < MAX_EXAMPLES:
+            self.examples.append((warning.source, warning.line_no))
+
+    def merge(self, other: WarningTally) -> None:
+        """Add another tally of the same key to this one."""
+        self.count += other.count
+        for severity, n in other.by_severity.items():
+            self.by_severity[severity] = self.by_severity.get(severity, 0) + n
+        self.examples.extend(other.examples[: MAX_EXAMPLES - len(self.examples)])
+
+
+def check_max_warnings(max_warnings: int | None) -> int | None:
+    """Validate a ``max_warnings`` argument (None, or a non-negative int).
+
+    Raises:
+        ValueError: If ``max_warnings`` is not None or a non-negative int.
+    """
+    if max_warnings is None:
+        return None
+    if isinstance(max_warnings, bool) or not isinstance(max_warnings, int) or max_warnings < 0:
+        raise ValueError(f"max_warnings must be None or a non-negative int, got {max_warnings!r}")
+    return max_warnings
+
+
 @dataclass
 class ParseReport:
     """Metrics and warnings for a single parsed source (one file or stream).
@@ -64,6 +176,10 @@ class ParseReport:
     Both :func:`~tunas.read_cl2` and :func:`~tunas.read_hy3` attach one report per
     :class:`~tunas.MeetArchive`; use :meth:`merge` to fold several into a corpus-wide total.
 
+    With ``max_warnings`` set, only the first ``max_warnings`` warnings of each
+    (record type, field, kind) are kept in ``warnings``; the rest are counted in
+    ``suppressed``. The counters below stay exact either way.
+
     Attributes:
         warnings: List of collected ParseWarning diagnostics.
         files_read: Count of processed files.
@@ -74,6 +190,12 @@ class ParseReport:
         splits_parsed: Count of split-time objects parsed.
         records_skipped: Count of records dropped entirely.
         fields_recovered: Count of recovered (nulled) optional fields.
+        profile: Per-record-type handler statistics, keyed by record type (e.g.
+            "D0"); empty unless the source was parsed with ``profile=True``.
+        max_warnings: Full warnings kept per (record type, field, kind), or None
+            for no limit.
+        suppressed: Tallies of the warnings past the cap, keyed by
+            ``(record_type, field, kind)``.
     """
 
     warnings: list[ParseWarning] = field(default_factory=list)
@@ -85,26 +207,176 @@ class ParseReport:
     splits_parsed: int = 0
     records_skipped: int = 0  # records dropped entirely
     fields_recovered: int = 0  # nulled M2 fields (excludes COUNT_MISMATCH)
+    profile: dict[str, HandlerStats] = field(default_factory=dict)
+    max_warnings: int | None = None
+    suppressed: dict[TallyKey, WarningTally] = field(default_factory=dict)
+    _kept: dict[TallyKey, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Counts per IssueKey of the first `_counted` of `warnings` (the list object
+    # `_synced`) and of the suppressed warnings; positions in `warnings` per
+    # (attribute, value), extended on query up to `_indexed`. `warnings` is public, so
+    # both are rebuilt if it is replaced or shortened.
+    _issues: Counter[IssueKey] = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    _counted: int = field(default=0, init=False, repr=False, compare=False)
+    _synced: list[ParseWarning] | None = field(default=None, init=False, repr=False, compare=False)
+    _tallied: Counter[IssueKey] = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    _index: dict[tuple[str, object], array[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        initial, self.warnings = self.warnings, []
+        self._synced = self.warnings
+        for warning in initial:
+            self.add(warning)
+
+    def add(self, warning: ParseWarning) -> None:
+        """Count ``warning`` and keep it, or tally it if its (record type, field, kind)
+        is at the cap.
+
+        Only stores the warning: the caller bumps ``records_skipped``/``fields_recovered``.
+        """
+        self._store(warning)
+
+    def _store(self, warning: ParseWarning) -> None:
+        """Keep or tally a warning, counting it either way."""
+        cap = self.max_warnings
+        if cap is not None:
+            key = (warning.record_type, warning.field, warning.kind)
+            kept = self._kept.get(key, 0)
+            if kept >= cap:
+                tally = self.suppressed.get(key)
+                if tally is None:
+                    tally = self.suppressed[key] = WarningTally(*key)
+                tally.add(warning)
+                self._tallied[_issue_key(warning)] += 1
+                return
+            self._kept[key] = kept + 1
+        if self._counted != len(self.warnings) or self.warnings is not self._synced:
+            self._sync()
+        self.warnings.append(warning)
+        self._issues[_issue_key(warning)] += 1
+        self._counted += 1
+
+    def _sync(self) -> None:
+        """Count warnings appended to ``warnings`` directly; recount if it was replaced
+        or shortened (dropping the position index too)."""
+        warnings = self.warnings
+        if warnings is not self._synced or len(warnings) < self._counted:
+            self._synced = warnings
+            self._issues = Counter()
+            self._counted = 0
+            self._index = {}
+            self._indexed = 0
+        for warning in warnings[self._counted :]:
+            self._issues[_issue_key(warning)] += 1
+        self._counted = len(warnings)
+
+    def _positions(self, key: tuple[str, object]) -> array[int]:
+        """Positions in ``warnings`` of those whose ``key[0]`` attribute is ``key[1]``."""
+        self._sync()
+        index, warnings = self._index, self.warnings
+        for position in range(self._indexed, len(warnings)):
+            for entry in zip(INDEXED, _issue_key(warnings[position]), strict=True):
+                positions = index.get(entry)
+                if positions is None:
+                    positions = index[entry] = array("I")
+                positions.append(position)
+        self._indexed = len(warnings)
+        return index.get(key, array("I"))
 
     def merge(self, other: ParseReport) -> None:
-        """Fold another report into this report: append warnings and sum all counts."""
-        self.warnings.extend(other.warnings)
-        for f in fields(self):
-            if f.name != "warnings":
-                setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+        """Fold another report into this report: add its warnings (under this report's
+        ``max_warnings``), combine suppressed tallies and sum all counts (handler
+        profiles included)."""
+        other._sync()
+        for warning in other.warnings:
+            self._store(warning)
+        self.merge_suppressed(other.suppressed)
+        self._tallied.update(other._tallied)
+        for name in COUNT_FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for record_type, stats in other.profile.items():
+            mine = self.profile.get(record_type)
+            if mine is None:
+                self.profile[record_type] = replace(stats)
+            else:
+                mine.merge(stats)
+
+    def merge_suppressed(self, tallies: dict[TallyKey, WarningTally]) -> None:
+        """Add suppressed-warning tallies to this report's."""
+        for key, tally in tallies.items():
+            mine = self.suppressed.get(key)
+            if mine is None:
+                mine = self.suppressed[key] = WarningTally(*key)
+            mine.merge(tally)
 
     @property
     def has_warnings(self) -> bool:
-        """True if any warnings were collected."""
-        return bool(self.warnings)
+        """True if any warnings were collected (suppressed ones included)."""
+        return bool(self.warnings or self.suppressed)
+
+    @property
+    def warning_count(self) -> int:
+        """Every warning emitted: those kept in ``warnings`` plus those suppressed."""
+        self._sync()
+        return self._issues.total() + self._tallied.total()
+
+    def count(
+        self,
+        *,
+        source: str | None = None,
+        record_type: str | None = None,
+        field: str | None = None,
+        kind: IssueKind | None = None,
+        severity: Severity | None = None,
+    ) -> int:
+        """How many warnings match every given attribute, suppressed ones included.
+
+        Reads running counts kept per distinct (source, record type, field, kind,
+        severity), so no warning list is built or scanned.
+        """
+        self._sync()
+        wanted = [
+            (i, value)
+            for i, value in enumerate((source, record_type, field, kind, severity))
+            if value is not None
+        ]
+        return sum(
+            n
+            for issues in (self._issues, self._tallied)
+            for key, n in issues.items()
+            if all(key[i] == value for i, value in wanted)
+        )
+
+    def counts(self, by: str) -> dict[Any, int]:
+        """Warning counts grouped by one attribute, suppressed ones included.
+
+        Args:
+            by: ``"source"``, ``"record_type"``, ``"field"``, ``"kind"`` or ``"severity"``.
+
+        Raises:
+            ValueError: If ``by`` is not one of those attributes.
+        """
+        if by not in INDEXED:
+            raise ValueError(f"by must be one of {', '.join(INDEXED)}, got {by!r}")
+        self._sync()
+        i = INDEXED.index(by)
+        out: Counter[Any] = Counter()
+        for issues in (self._issues, self._tallied):
+            for key, n in issues.items():
+                out[key[i]] += n
+        return dict(out)
 
     @property
     def by_severity(self) -> dict[Severity, list[ParseWarning]]:
-        """Warnings grouped by Severity."""
-        out: dict[Severity, list[ParseWarning]] = {s: [] for s in Severity}
-        for w in self.warnings:
-            out[w.severity].append(w)
-        return out
+        """Kept warnings grouped by Severity."""
+        warnings = self.warnings
+        return {s: [warnings[i] for i in self._positions(("severity", s))] for s in Severity}
 
     def warnings_for(
         self,
@@ -113,13 +385,32 @@ class ParseReport:
         field: str | None = None,
         severity: Severity | None = None,
         kind: IssueKind | None = None,
+        source: str | None = None,
     ) -> list[ParseWarning]:
-        """Warnings filtered by attributes."""
+        """Kept warnings filtered by attributes, in order.
+
+        Candidates come from the smallest matching per-attribute index (built on the
+        first query, extended on later ones), so a selective filter touches only the
+        warnings it returns and a few more.
+        """
+        filters = {
+            "source": source,
+            "record_type": record_type,
+            "field": field,
+            "kind": kind,
+            "severity": severity,
+        }
+        wanted = [(name, value) for name, value in filters.items() if value is not None]
+        if not wanted:
+            return list(self.warnings)
+        candidates = min((self._positions(key) for key in wanted), key=len)
+        warnings = self.warnings
         return [
             w
-            for w in self.warnings
-            if (record_type is None or w.record_type == record_type)
-            and (field is None or w.field == field)
-            and (severity is None or w.severity is severity)
-            and (kind is None or w.kind is kind)
+            for w in (warnings[i] for i in candidates)
+            if all(getattr(w, name) == value for name, value in wanted)
         ]
+
+
+def _issue_key(warning: ParseWarning) -> IssueKey:
+    return (warning.source, warning.record_type, warning.field, warning.kind, warning.severity)
@@ -11,11 +11,19 @@ from __future__ import annotations
 
 import datetime
 from collections import Counter
-from collections.abc import Iterable
+from collections.abc import Callable, Hashable, Iterable
 from enum import StrEnum
+from time import perf_counter
 from typing import ClassVar, NoReturn
 
-from tunas._parser.diagnostics import IssueKind, ParseReport, ParseWarning, Severity
+from tunas._parser.diagnostics import (
+    LINE_KINDS,
+    HandlerStats,
+    IssueKind,
+    ParseReport,
+    ParseWarning,
+    Severity,
+)
 from tunas._parser.fields import (
     Record,
     code_value,
@@ -24,6 +32,8 @@ from tunas._parser.fields import (
     int_value,
     time_value,
 )
+from tunas._parser.ids import normalize_id
+from tunas._parser.interning import Interner
 from tunas.enums import Citizenship, Course, ResultStatus, Sex, SplitType, Stroke
 from tunas.event import Event
 from tunas.exceptions import ParseError
@@ -31,6 +41,9 @@ from tunas.geography import Country
 from tunas.models import CitizenshipOrCountry, Meet, MeetResult, SourceFile, Split, Swimmer
 from tunas.time import Time
 
+#: A record handler: an engine method taking the sized record.
+type Handler[E: _BaseEngine] = Callable[[E, Record], None]
+
 
 class _BaseEngine:
     """Stateful fixed-width parser. ``parse_source`` resets all per-file state, so one
@@ -41,9 +54,24 @@ class _BaseEngine:
     #: Public reader name, used in the bytes-source error message.
     READER: ClassVar[str]
 
-    def __init__(self, *, strict: bool) -> None:
+    def __init__(
+        self,
+        *,
+        strict: bool,
+        interner: Interner | None = None,
+        profile: bool = False,
+        max_warnings: int | None = None,
+        verify_checksums: bool = False,
+        encoding: str = "cp1252",
+    ) -> None:
         self.strict = strict
-        self.report = ParseReport()
+        self.interner = interner
+        self.profile = profile
+        self.max_warnings = max_warnings
+        self.verify_checksums = verify_checksums
+        self.encoding = encoding  # of the source's bytes, for checksums
+        self.emitted = 0  # warnings emitted so far (handler profiles diff it)
+        self.report = ParseReport(max_warnings=max_warnings)
         self.meets: list[Meet] = []
         self.source = "<stream>"
         self.source_file: SourceFile | None = None
@@ -58,30 +86,49 @@ class _BaseEngine:
         Fully resets every per-file accumulator, so one engine instance is safe
         to reuse across files: each call yields results for *this source only*.
         """
+        self.parse_numbered(enumerate(lines, start=1), source)
+
+    def parse_numbered(self, lines: Iterable[tuple[int, object]], source: str) -> None:
+        """Like :meth:`parse_source`, for ``(line_no, line)`` pairs.
+
+        Lets a caller parse a subset of a file's lines (e.g. one meet's header and
+        one club's records) while diagnostics keep the lines' real numbers.
+        """
         self.source = source
         self.meets = []
-        self.report = ParseReport()
+        self.report = ParseReport(max_warnings=self.max_warnings)
         self.report.files_read += 1
         self.source_file = None
         self.file_counts = Counter()
         self.meets_this_file = 0
         self._reset_state()
 
-        first = True
-        for line_no, raw in enumerate(lines, start=1):
+        for line_no, raw in self._lines(lines):
             if not isinstance(raw, str):
                 raise TypeError(f"{self.READER} requires a text source yielding str, not bytes")
-            if first:
-                raw = raw.removeprefix("﻿")
-                first = False
+            if line_no == 1:
+                raw = raw.removeprefix("\ufeff")
             self._feed(raw, line_no)
         self._finish_file()
 
+    def _dispatch[E: _BaseEngine](
+        self: E, handlers: dict[str, Handler[E]]
+    ) -> dict[str, Handler[E]]:
+        """The handler table to dispatch through: ``handlers`` itself, or, when
+        profiling, wrappers that time each call into ``report.profile``."""
+        if not self.profile:
+            return handlers
+        return {record_type: _timed(record_type, h) for record_type, h in handlers.items()}
+
     # -- per-format hooks (overridden by subclasses) ----------------------- #
 
     def _reset_state(self) -> None:
         """Clear per-file/per-meet state at the start of each file."""
 
+    def _lines(self, lines: Iterable[tuple[int, object]]) -> Iterable[tuple[int, object]]:
+        """The numbered lines to feed: ``lines``, or a wrapper that checks them first."""
+        return lines
+
     def _feed(self, raw: str, line_no: int) -> None:
         """Handle one raw line. Subclasses build the record and dispatch it."""
         raise NotImplementedError  # pragma: no cover - always overridden
@@ -108,7 +155,17 @@ class _BaseEngine:
             return None
         if len(line) < width:
             line = line.ljust(width)
-        return Record(line, line_no, self.source)
+        return Record(line, line_no, self.source, self.interner)
+
+    def _share[V: Hashable](self, value: V) -> V:
+        """``value``, or the equal instance already interned this run (if enabled)."""
+        interner = self.interner
+        return value if interner is None else interner(value)
+
+    def _member_id(self, raw: str) -> str | None:
+        """A normalized member-ID field (see :func:`normalize_id`), shared if interning."""
+        value = normalize_id(raw)
+        return value if value is None else self._share(value)
 
     # -- diagnostics ------------------------------------------------------- #
 
@@ -128,8 +185,9 @@ class _BaseEngine:
         """Record one diagnostic — or raise it.
 
         A ``FATAL`` issue, or any issue while ``strict``, raises :class:`ParseError`
-        immediately. Otherwise the warning is appended to the report and the matching
-        counter (``records_skipped`` / ``fields_recovered``) is bumped.
+        immediately. Otherwise the warning is added to the report (kept or, past its
+        ``max_warnings`` cap, tallied) and the matching counter (``records_skipped`` /
+        ``fields_recovered``) is bumped.
         """
         warning = ParseWarning(
             source=source,
@@ -145,10 +203,11 @@ class _BaseEngine:
         )
         if severity is Severity.FATAL or self.strict:
             raise ParseError(warning)
-        self.report.warnings.append(warning)
+        self.emitted += 1
+        self.report.add(warning)
         if severity is Severity.SKIPPED:
             self.report.records_skipped += 1
-        elif severity is Severity.RECOVERED and kind is not IssueKind.COUNT_MISMATCH:
+        elif severity is Severity.RECOVERED and kind not in LINE_KINDS:
             self.report.fields_recovered += 1
 
     def _warn(
@@ -409,8 +468,29 @@ class _BaseEngine:
                 IssueKind.MALFORMED,
                 "malformed split time",
             )
-            target.append(Split(distance=distance, time=None, split_type=split_type))
+            split = Split(distance=distance, time=None, split_type=split_type)
         else:
             assert isinstance(val, Time)
-            target.append(Split(distance=distance, time=val, split_type=split_type))
+            split = Split(distance=distance, time=val, split_type=split_type)
+        target.append(self._share(split))
         self.report.splits_parsed += 1
+
+
+def _timed[E: _BaseEngine](record_type: str, handler: Handler[E]) -> Handler[E]:
+    """Wrap ``handler`` to add its calls, time and warnings to the engine's report."""
+    name = getattr(handler, "__name__", repr(handler))
+
+    def timed(engine: E, rec: Record) -> None:
+        stats = engine.report.profile.get(record_type)
+        if stats is None:
+            stats = engine.report.profile[record_type] = HandlerStats(name)
+        emitted = engine.emitted
+        start = perf_counter()
+        try:
+            handler(engine, rec)
+        finally:
+            stats.calls += 1
+            stats.seconds += perf_counter() - start
+            stats.warnings += engine.emitted - emitted
+
+    return timed
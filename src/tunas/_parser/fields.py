@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import datetime
 import math
+from collections.abc import Callable
 from enum import StrEnum
 
 from tunas.enums import Course, ResultStatus
@@ -50,15 +51,26 @@ _AGE_OPEN_HIGH = "OV"
 
 
 class Record:
-    """A padded SDIF line sliced by 1-indexed start/length."""
+    """A padded SDIF line sliced by 1-indexed start/length.
 
-    __slots__ = ("line", "line_no", "source", "type")
+    ``intern``, when given, is applied to every non-blank :meth:`text` value so
+    equal strings across a reader run share one instance.
+    """
+
+    __slots__ = ("intern", "line", "line_no", "source", "type")
 
-    def __init__(self, line: str, line_no: int, source: str) -> None:
+    def __init__(
+        self,
+        line: str,
+        line_no: int,
+        source: str,
+        intern: Callable[[str], str] | None = None,
+    ) -> None:
         self.line = line
         self.line_no = line_no
         self.source = source
         self.type = line[0:2]
+        self.intern = intern
 
     def raw(self, start: int, length: int) -> str:
         """Raw unstripped slice for a 1-indexed start/length field."""
@@ -66,7 +78,10 @@ class Record:
 
     def text(self, start: int, length: int) -> str | None:
         """Stripped ALPHA field, or None if blank."""
-        return self.raw(start, length).strip() or None
+        value = self.raw(start, length).strip()
+        if not value:
+            return None
+        return value if self.intern is None else self.intern(value)
 
 
 def course_value(raw: str) -> tuple[str, Course | None]:
@@ -9,14 +9,15 @@ entry, and their result into one `D0` — `.hy3` splits these across `D1` / `E1`
 from __future__ import annotations
 
 import datetime
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import ClassVar
 
 from tunas._parser.checksum import RECORD_WIDTH as HY3_RECORD_WIDTH
+from tunas._parser.checksum import checked_lines, mismatch_reason
 from tunas._parser.diagnostics import IssueKind, Severity
 from tunas._parser.engine import _BaseEngine
 from tunas._parser.fields import Record, time_value
-from tunas._parser.ids import normalize_id
+from tunas._parser.interning import Interner
 from tunas._parser.state import Hy3Entry, Hy3RelayEntry, Hy3State
 from tunas.enums import (
     AttachStatus,
@@ -136,14 +137,39 @@ class _Hy3Engine(_BaseEngine):
     RECORD_WIDTH: ClassVar[int] = HY3_RECORD_WIDTH
     READER: ClassVar[str] = "read_hy3"
 
-    def __init__(self, *, strict: bool) -> None:
-        super().__init__(strict=strict)
+    def __init__(
+        self,
+        *,
+        strict: bool,
+        interner: Interner | None = None,
+        profile: bool = False,
+        max_warnings: int | None = None,
+        verify_checksums: bool = False,
+        encoding: str = "cp1252",
+    ) -> None:
+        super().__init__(
+            strict=strict,
+            interner=interner,
+            profile=profile,
+            max_warnings=max_warnings,
+            verify_checksums=verify_checksums,
+            encoding=encoding,
+        )
+        self._handlers = self._dispatch(_HANDLERS)
         self.state: Hy3State | None = None
 
     # -- per-file hooks ---------------------------------------------------- #
 
     def _reset_state(self) -> None:
         self.state = None
+        # line_no -> (declared, expected), filled a batch ahead by `checked_lines`.
+        self.checksum_mismatches: dict[int, tuple[str, str]] = {}
+        self.checksummed = True  # False once an A1 marks a Club Times Export
+
+    def _lines(self, lines: Iterable[tuple[int, object]]) -> Iterable[tuple[int, object]]:
+        if not self.verify_checksums:
+            return lines
+        return checked_lines(lines, self.checksum_mismatches, self.encoding)
 
     def _feed(self, raw: str, line_no: int) -> None:
         line = raw.rstrip("\r\n")
@@ -154,10 +180,12 @@ class _Hy3Engine(_BaseEngine):
             return
         self.file_counts[rec.type] += 1
 
-        # Columns 129-130 hold a checksum that we don't validate: it isn't a data
-        # field, and `USAS Club Times Export` files omit it entirely. Field slicing
-        # only ever touches columns 1-128, so the trailing checksum is simply ignored.
-        handler = _HANDLERS.get(rec.type)
+        # Columns 129-130 hold a checksum, not a data field: field slicing only ever
+        # touches columns 1-128. It is verified on request, except in `USAS Club
+        # Times Export` files, which omit it.
+        if self.verify_checksums:
+            self._check_sum(rec, line_no)
+        handler = self._handlers.get(rec.type)
         if handler is None:
             if rec.type not in _IGNORED:
                 self._warn(
@@ -172,6 +200,23 @@ class _Hy3Engine(_BaseEngine):
             return
         handler(self, rec)
 
+    def _check_sum(self, rec: Record, line_no: int) -> None:
+        """Report this line's checksum mismatch, if `checked_lines` found one."""
+        if rec.type == "A1":
+            self.checksummed = rec.raw(3, 2) != Hy3FileType.CLUB_TIMES_EXPORT
+        mismatch = self.checksum_mismatches.pop(line_no, None)
+        if mismatch is None or not self.checksummed:
+            return
+        self._warn(
+            rec,
+            "checksum",
+            "129/2",
+            None,
+            Severity.RECOVERED,
+            IssueKind.BAD_CHECKSUM,
+            mismatch_reason(*mismatch),
+        )
+
     # -- hy3-specific field helpers ---------------------------------------- #
 
     def _hy3_time(self, rec: Record, start: int, length: int) -> Time | None:
@@ -314,7 +359,7 @@ class _Hy3Engine(_BaseEngine):
         # Prefix the LSC code so the team code matches `read_cl2` (e.g. "PCSCSC",
         # not "SCSC"); `.cl2` stores the LSC-prefixed code in its C1 record. Falls
         # back to the bare code when the LSC is absent, as `read_cl2` does.
-        team_code = f"{lsc.value}{abbrev}" if lsc else abbrev
+        team_code = prefixed_team_code(abbrev, lsc)
         key = (team_code, lsc)
         existing = st.clubs_by_key.get(key)
         if existing is not None:
@@ -388,7 +433,7 @@ class _Hy3Engine(_BaseEngine):
         # The D1 "USA-S Member ID" field (cols 70-83) is the 14-char SWIMS ID, which
         # belongs in `id_long`; `read_cl2` stores its 12-char USS# prefix in `id_short`,
         # so derive the same prefix here (cl2's own `id_short == id_long[:12]`).
-        member_id = normalize_id(rec.raw(70, 14))
+        member_id = self._member_id(rec.raw(70, 14))
         swimmer = Swimmer(
             meet=st.meet,
             first_name=first,
@@ -676,6 +721,11 @@ class _Hy3Engine(_BaseEngine):
         result.dq_reason = f"{result.dq_reason} {text}".strip() if result.dq_reason else text
 
 
+def prefixed_team_code(abbrev: str, lsc: LSC | None) -> str:
+    """The `read_cl2`-compatible team code: the C1 abbreviation behind its LSC, if any."""
+    return f"{lsc.value}{abbrev}" if lsc else abbrev
+
+
 # Dispatch table — every record type we extract confirmed fields from.
 _HANDLERS: dict[str, Callable[[_Hy3Engine, Record], None]] = {
     "A1": _Hy3Engine._h_a1,
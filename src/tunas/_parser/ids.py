@@ -1,10 +1,38 @@
-"""Swimmer member-ID normalization helper."""
+"""Swimmer member-ID normalization and identity helpers."""
 
 from __future__ import annotations
 
-__all__ = ["normalize_id"]
+__all__ = ["SHORT_ID_LENGTH", "normalize_id", "short_id", "identity_keys"]
+
+SHORT_ID_LENGTH = 12  # SDIF USS# (`id_short`); the new SWIMS ID (`id_long`) is 14
 
 
 def normalize_id(raw: str) -> str | None:
     """Normalize an ID field, returning None if blank."""
     return raw.strip() or None
+
+
+def short_id(id_short: str | None, id_long: str | None) -> str | None:
+    """The 12-char USS# for a swimmer: ``id_short``, else the ``id_long`` prefix.
+
+    SDIF files store both forms with ``id_short == id_long[:12]``, and the `.hy3`
+    reader derives ``id_short`` the same way, so this is the one key that matches
+    a swimmer across both formats whichever form a file happens to carry.
+    """
+    if id_short:
+        return id_short
+    return id_long[:SHORT_ID_LENGTH] if id_long else None
+
+
+def identity_keys(id_short: str | None, id_long: str | None) -> tuple[str, ...]:
+    """Every member-ID string that identifies one swimmer, without duplicates.
+
+    Includes the 12-char prefix of ``id_long`` alongside both stored forms, so a
+    legacy swimmer whose stored ``id_short`` differs from that prefix still links
+    to a `.hy3` export of the same meet (which only carries the 14-char ID).
+    """
+    keys: list[str] = []
+    for key in (id_short, id_long, id_long[:SHORT_ID_LENGTH] if id_long else None):
+        if key and key not in keys:
+            keys.append(key)
+    return tuple(keys)
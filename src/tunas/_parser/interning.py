@@ -0,0 +1,68 @@
+"""Bounded, per-run value interning shared by the parse engines.
+
+A corpus repeats the same small values endlessly: club and city names, phone
+numbers, swimmer IDs, the host block of every meet a club runs, and split rows
+such as ``(50, 28.91)``. With interning enabled, each reader run owns one
+:class:`Interner` and routes those strings and frozen value objects through it,
+so equal values parsed from any file of the run end up as one shared instance.
+
+Only immutable values are interned (``str`` and frozen dataclasses), so sharing
+is never observable except through ``is`` and a smaller heap.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+
+__all__ = ["DEFAULT_INTERN_LIMIT", "Interner", "intern_limit"]
+
+DEFAULT_INTERN_LIMIT = 65_536
+
+
+class Interner:
+    """Map each value to the first equal instance seen, up to ``limit`` entries.
+
+    Once the table is full, values already in it keep being shared but new ones
+    pass through unchanged, so memory stays bounded however large the run is.
+
+    Attributes:
+        limit: Maximum number of distinct values retained.
+        hits: Lookups answered with an existing shared instance.
+    """
+
+    __slots__ = ("_table", "hits", "limit")
+
+    def __init__(self, limit: int = DEFAULT_INTERN_LIMIT) -> None:
+        if limit < 1:
+            raise ValueError(f"intern limit must be positive, got {limit}")
+        self._table: dict[Hashable, Hashable] = {}
+        self.limit = limit
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __call__[V: Hashable](self, value: V) -> V:
+        table = self._table
+        shared = table.get(value)
+        if shared is not None:
+            self.hits += 1
+            return shared  # type: ignore[return-value]
+        if len(table) < self.limit:
+            table[value] = value
+        return value
+
+
+def intern_limit(intern: bool | int) -> int | None:
+    """Resolve a reader's ``intern`` argument to a table bound, or None when off.
+
+    Raises:
+        ValueError: If ``intern`` is a non-positive integer.
+    """
+    if intern is True:
+        return DEFAULT_INTERN_LIMIT
+    if intern is False:
+        return None
+    if intern < 1:
+        raise ValueError(f"intern must be a bool or a positive int, got {intern}")
+    return intern
@@ -0,0 +1,500 @@
+"""Structural checks over raw `.cl2`/`.hy3` lines, without building objects.
+
+A linter runs the checks the parse engines apply before they build anything —
+record width, unknown record types, the parent context each record needs (a
+``D0`` needs a meet, a ``G0`` a swim, ...), the mandatory (M1) fields whose
+absence makes a reader raise, and the ``Z0`` count reconciliation — plus,
+optionally, the `.hy3` line checksums. It slices fields straight out of each
+line and tracks only which parent records are open, so it runs several times
+faster than a parse.
+
+Findings are :class:`ParseWarning` values shaped like the engines' (same record
+type, field, column, kind and reason text). Unlike a reader, a linter never
+raises: a fatal issue is recorded with ``Severity.FATAL`` and checking goes on,
+treating the record as present, so one pass reports every structural problem.
+Checks that need resolved values (event lookup, name parsing, relay swimmer
+matching) are left to the parse.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Iterable
+from enum import StrEnum
+from typing import ClassVar
+
+from tunas._parser.checksum import RECORD_WIDTH as HY3_RECORD_WIDTH
+from tunas._parser.checksum import checked_lines, mismatch_reason
+from tunas._parser.cl2 import _Z0_CHECKS
+from tunas._parser.diagnostics import LINE_KINDS, IssueKind, ParseReport, ParseWarning, Severity
+from tunas._parser.fields import RECORD_WIDTH, code_value, date_value, int_value
+from tunas._parser.hy3 import _IGNORED as _HY3_IGNORED
+from tunas.enums import Hy3FileType, Sex, SplitType
+
+__all__ = ["Linter", "Cl2Linter", "Hy3Linter"]
+
+# D0 event columns (sex, distance, stroke, age): any set means the record has a swim.
+_D0_EVENT_SLICES = (slice(66, 67), slice(67, 71), slice(71, 72), slice(76, 80))
+
+
+class Linter:
+    """Per-format structural checker. ``lint`` resets all per-file state, so one
+    instance can check many files in turn."""
+
+    RECORD_WIDTH: ClassVar[int]
+    READER: ClassVar[str]
+    #: Record type -> check; types absent here (and not ignored) are unknown.
+    CHECKS: ClassVar[dict[str, Callable[[Linter, str, int], None]]]
+    IGNORED: ClassVar[frozenset[str]] = frozenset()
+
+    def __init__(self, *, max_warnings: int | None = None) -> None:
+        self.max_warnings = max_warnings
+        self.report = ParseReport(max_warnings=max_warnings)
+        self.source = "<stream>"
+        self.file_counts: Counter[str] = Counter()
+        #: A check run on every sized line before its record check, if any.
+        self._every_line: Callable[[str, int], None] | None = None
+
+    def lint(self, lines: Iterable[object], source: str) -> ParseReport:
+        """Check one file/stream's lines, returning a fresh report for it."""
+        self.source = source
+        self.report = ParseReport(max_warnings=self.max_warnings)
+        self.report.files_read += 1
+        self.file_counts = Counter()
+        self._reset()
+        checks, ignored, width = self.CHECKS, self.IGNORED, self.RECORD_WIDTH
+        counts, every_line = self.file_counts, self._every_line
+        for line_no, raw in self._lines(enumerate(lines, start=1)):
+            if not isinstance(raw, str):
+                raise TypeError(f"{self.READER} requires a text source yielding str, not bytes")
+            if line_no == 1:
+                raw = raw.removeprefix("\ufeff")
+            line = raw.rstrip("\r\n")
+            if not line.strip():
+                continue
+            record_type = line[0:2]
+            if len(line) > width:
+                self._emit(
+                    line,
+                    line_no,
+                    None,
+                    None,
+                    None,
+                    Severity.SKIPPED,
+                    IssueKind.BAD_LENGTH,
+                    f"line is {len(line)} chars (> {width})",
+                    record_type or None,
+                )
+                continue
+            if every_line is not None:
+                every_line(line, line_no)
+            counts[record_type] += 1
+            check = checks.get(record_type)
+            if check is not None:
+                check(self, line, line_no)
+            elif record_type not in ignored:
+                self._emit(
+                    line,
+                    line_no,
+                    None,
+                    None,
+                    None,
+                    Severity.SKIPPED,
+                    IssueKind.UNKNOWN_RECORD,
+                    f"unmodeled record type {record_type.ljust(2)!r}",
+                    record_type.ljust(2),
+                )
+        self._finish()
+        return self.report
+
+    # -- per-format hooks -------------------------------------------------- #
+
+    def _lines(self, lines: Iterable[tuple[int, object]]) -> Iterable[tuple[int, object]]:
+        """The numbered lines to check: ``lines``, or a wrapper that checks them first."""
+        return lines
+
+    def _reset(self) -> None:
+        """Clear per-file state at the start of each file."""
+
+    def _finish(self) -> None:
+        """Run end-of-file checks."""
+
+    # -- diagnostics ------------------------------------------------------- #
+
+    def _emit(
+        self,
+        line: str,
+        line_no: int,
+        field: str | None,
+        column: str | None,
+        mandatory: str | None,
+        severity: Severity,
+        kind: IssueKind,
+        reason: str,
+        record_type: str | None = None,
+    ) -> None:
+        """Record one finding, counted as the engines count it."""
+        self.report.add(
+            ParseWarning(
+                source=self.source,
+                line_no=line_no,
+                record_type=line[0:2] if record_type is None else record_type,
+                field=field,
+                column=column,
+                mandatory=mandatory,
+                severity=severity,
+                kind=kind,
+                reason=reason,
+                raw_line=line[:200],
+            )
+        )
+        if severity is Severity.SKIPPED:
+            self.report.records_skipped += 1
+        elif severity is Severity.RECOVERED and kind not in LINE_KINDS:
+            self.report.fields_recovered += 1
+
+    def _orphan(self, line: str, line_no: int, reason: str) -> None:
+        self._emit(line, line_no, None, None, None, Severity.SKIPPED, IssueKind.ORPHANED, reason)
+
+    def _fatal(
+        self, line: str, line_no: int, field: str, column: str, kind: IssueKind, reason: str
+    ) -> None:
+        self._emit(line, line_no, field, column, "M1", Severity.FATAL, kind, reason)
+
+    # -- M1 field checks (reasons match the engines' _require_* helpers) ---- #
+
+    def _require_text(self, line: str, line_no: int, start: int, length: int, field: str) -> bool:
+        if line[start - 1 : start - 1 + length].strip():
+            return True
+        self._fatal(
+            line, line_no, field, f"{start}/{length}", IssueKind.MISSING, f"missing {field}"
+        )
+        return False
+
+    def _require_code(
+        self,
+        line: str,
+        line_no: int,
+        start: int,
+        length: int,
+        enum_cls: type[StrEnum],
+        field: str,
+    ) -> None:
+        raw = line[start - 1 : start - 1 + length]
+        tag, _ = code_value(raw, enum_cls)
+        column = f"{start}/{length}"
+        if tag == "blank":
+            self._fatal(line, line_no, field, column, IssueKind.MISSING, f"missing {field}")
+        elif tag == "unknown":
+            self._fatal(
+                line,
+                line_no,
+                field,
+                column,
+                IssueKind.UNKNOWN_CODE,
+                f"unknown {field} code {raw.strip()!r}",
+            )
+
+    def _require_int(self, line: str, line_no: int, start: int, length: int, field: str) -> None:
+        tag, value = int_value(line[start - 1 : start - 1 + length])
+        if tag != "int" or value is None:
+            self._fatal(
+                line,
+                line_no,
+                field,
+                f"{start}/{length}",
+                IssueKind.MALFORMED,
+                f"missing/malformed {field}",
+            )
+
+    def _require_date(self, line: str, line_no: int, start: int, field: str) -> None:
+        raw = line[start - 1 : start + 7]
+        tag, _ = date_value(raw)
+        column = f"{start}/8"
+        if tag == "bad":
+            self._emit(
+                line,
+                line_no,
+                field,
+                column,
+                "M1",
+                Severity.RECOVERED,
+                IssueKind.MALFORMED,
+                f"malformed {field} date {raw.strip()!r}",
+            )
+        if tag != "date":
+            self._fatal(line, line_no, field, column, IssueKind.MISSING, "missing meet start date")
+
+
+class Cl2Linter(Linter):
+    """Structural checks for SDIF (`.cl2`) files."""
+
+    RECORD_WIDTH: ClassVar[int] = RECORD_WIDTH
+    READER: ClassVar[str] = "validate_cl2"
+
+    def _reset(self) -> None:
+        self.meets = 0
+        self.in_meet = False
+        self.swimmer = False  # a D0 (or F0 leg with a USS#) is current
+        self.relay = False  # an E0 is current
+        self.last: str | None = None  # "individual" / "relay": what a G0 attaches to
+
+    def _b1(self, line: str, line_no: int) -> None:
+        self._require_text(line, line_no, 12, 30, "name")
+        self._require_date(line, line_no, 122, "start_date")
+        self.meets += 1
+        self.in_meet = True
+        self.swimmer = self.relay = False
+        self.last = None
+
+    def _c1(self, line: str, line_no: int) -> None:
+        if self.in_meet:
+            self._require_text(line, line_no, 18, 30, "full_team_name")
+
+    def _d0(self, line: str, line_no: int) -> None:
+        if not self.in_meet:
+            self._orphan(line, line_no, "D0 with no preceding B1 meet")
+            return
+        self._require_text(line, line_no, 12, 28, "swimmer_name")
+        self._require_code(line, line_no, 66, 1, Sex, "sex")
+        self.swimmer = True
+        has_swim = any(line[s].strip() for s in _D0_EVENT_SLICES)
+        self.last = "individual" if has_swim else None
+
+    def _d_continuation(self, line: str, line_no: int) -> None:
+        if not self.swimmer:
+            self._orphan(line, line_no, f"{line[0:2]} with no current swimmer")
+
+    def _e0(self, line: str, line_no: int) -> None:
+        if not self.in_meet:
+            self._orphan(line, line_no, "E0 with no preceding B1 meet")
+            return
+        self._require_text(line, line_no, 12, 1, "relay_letter")
+        self.relay = True
+        self.last = "relay"
+
+    def _f0(self, line: str, line_no: int) -> None:
+        if not self.relay:
+            self._orphan(line, line_no, "F0 relay name with no preceding E0 relay event")
+            return
+        self._require_text(line, line_no, 23, 28, "swimmer_name")
+        self._require_code(line, line_no, 76, 1, Sex, "sex")
+        self.swimmer = bool(line[50:62].strip() or line[92:106].strip())
+        self.last = "relay"
+
+    def _g0(self, line: str, line_no: int) -> None:
+        if not self.in_meet:
+            self._orphan(line, line_no, "G0 splits with no preceding swim")
+            return
+        self._require_int(line, line_no, 56, 1, "sequence_number")
+        self._require_int(line, line_no, 59, 4, "split_distance")
+        self._require_code(line, line_no, 63, 1, SplitType, "split_type")
+        if self.last is None:
+            self._orphan(line, line_no, "G0 splits could not be attached to a swim")
+
+    def _z0(self, line: str, line_no: int) -> None:
+        by_letter: Counter[str] = Counter()
+        for record_type, n in self.file_counts.items():
+            by_letter[record_type[0]] += n
+        for chk in _Z0_CHECKS:
+            actual = self.meets if chk.letter is None else by_letter[chk.letter]
+            tag, declared = int_value(line[chk.start - 1 : chk.start - 1 + chk.length])
+            if tag == "int" and declared != actual:
+                self._emit(
+                    line,
+                    line_no,
+                    chk.label,
+                    chk.column,
+                    None,
+                    Severity.RECOVERED,
+                    IssueKind.COUNT_MISMATCH,
+                    f"Z0 declares {declared} {chk.label} but parsed {actual}",
+                )
+        self.in_meet = self.swimmer = self.relay = False
+        self.last = None
+
+
+class Hy3Linter(Linter):
+    """Structural checks for Hy-Tek (`.hy3`) files, optionally with line checksums.
+
+    With ``verify_checksums``, every line's columns 129-130 are compared with the
+    checksum of its first 128 columns (encoded with ``encoding``), unless an ``A1``
+    marks the file as a `USAS Club Times Export`, which carries none.
+    """
+
+    RECORD_WIDTH: ClassVar[int] = HY3_RECORD_WIDTH
+    READER: ClassVar[str] = "validate_hy3"
+    IGNORED: ClassVar[frozenset[str]] = frozenset(_HY3_IGNORED)
+
+    def __init__(
+        self,
+        *,
+        max_warnings: int | None = None,
+        verify_checksums: bool = False,
+        encoding: str = "cp1252",
+    ) -> None:
+        super().__init__(max_warnings=max_warnings)
+        self.verify_checksums = verify_checksums
+        self.encoding = encoding
+        if verify_checksums:
+            self._every_line = self._checksum
+
+    def _lines(self, lines: Iterable[tuple[int, object]]) -> Iterable[tuple[int, object]]:
+        if not self.verify_checksums:
+            return lines
+        return checked_lines(lines, self.mismatches, self.encoding)
+
+    def _reset(self) -> None:
+        self.mismatches: dict[int, tuple[str, str]] = {}  # filled by `checked_lines`
+        self.checksummed = True  # False once an A1 marks a Club Times Export
+        self.in_meet = False
+        self.numbers: set[str] = set()  # athlete numbers of the meet's D1 records
+        self.entry: bool | None = None  # pending E1: does its athlete resolve?
+        self.relay_entry = False  # pending F1
+        self.relay = False  # an F2 is current
+        self.last: str | None = None
+
+    def _checksum(self, line: str, line_no: int) -> None:
+        if line.startswith("A1"):
+            self.checksummed = line[2:4] != Hy3FileType.CLUB_TIMES_EXPORT
+        mismatch = self.mismatches.pop(line_no, None)
+        if mismatch is None or not self.checksummed:
+            return
+        self._emit(
+            line,
+            line_no,
+            "checksum",
+            "129/2",
+            None,
+            Severity.RECOVERED,
+            IssueKind.BAD_CHECKSUM,
+            mismatch_reason(*mismatch),
+        )
+
+    def _b1(self, line: str, line_no: int) -> None:
+        self._require_text(line, line_no, 3, 45, "name")
+        self._require_date(line, line_no, 93, "start_date")
+        self.in_meet = True
+        self.numbers = set()
+        self.entry = None
+        self.relay_entry = self.relay = False
+        self.last = None
+
+    def _c1(self, line: str, line_no: int) -> None:
+        if self.in_meet:
+            self._require_text(line, line_no, 3, 5, "team_code")
+            self._require_text(line, line_no, 8, 30, "full_team_name")
+
+    def _d1(self, line: str, line_no: int) -> None:
+        if not self.in_meet:
+            self._orphan(line, line_no, "D1 athlete with no preceding B1 meet")
+            return
+        self.relay = False
+        self.last = None
+        number = line[3:8].strip()
+        if not number:
+            self._emit(
+                line,
+                line_no,
+                "athlete_number",
+                "4/5",
+                "M1",
+                Severity.SKIPPED,
+                IssueKind.MISSING,
+                "D1 athlete with no athlete number",
+            )
+            return
+        self._require_code(line, line_no, 3, 1, Sex, "sex")
+        first, last = line[28:48].strip(), line[8:28].strip()
+        if not first or not last:
+            self._emit(
+                line,
+                line_no,
+                "last_name" if first else "first_name",
+                "9/20" if first else "29/20",
+                "M1",
+                Severity.SKIPPED,
+                IssueKind.MISSING,
+                "D1 athlete with no name; record skipped",
+            )
+            return
+        self.numbers.add(number)
+
+    def _e1(self, line: str, line_no: int) -> None:
+        if self.in_meet:
+            number = line[3:8].strip()
+            self.entry = bool(number) and number in self.numbers
+
+    def _e2(self, line: str, line_no: int) -> None:
+        if not self.in_meet:
+            return
+        entry, self.entry = self.entry, None
+        if entry is None:
+            self._orphan(line, line_no, "E2 result with no preceding E1 entry")
+        elif not entry:
+            self._orphan(line, line_no, "E2 result with no resolvable athlete")
+        else:
+            self.relay = False
+            self.last = "individual"
+
+    def _f1(self, line: str, line_no: int) -> None:
+        if self.in_meet:
+            self._require_text(line, line_no, 8, 1, "relay_letter")
+            self.relay_entry = True
+
+    def _f2(self, line: str, line_no: int) -> None:
+        if not self.in_meet:
+            return
+        entry, self.relay_entry = self.relay_entry, False
+        if not entry:
+            self._orphan(line, line_no, "F2 relay result with no preceding F1 entry")
+            return
+        self.relay = True
+        self.last = "relay"
+
+    def _f3(self, line: str, line_no: int) -> None:
+        if not self.relay:
+            self._orphan(line, line_no, "F3 relay athletes with no preceding F2 relay")
+
+    def _g1(self, line: str, line_no: int) -> None:
+        if self.in_meet and self.last is None:
+            self._orphan(line, line_no, "G1 splits could not be attached to a swim")
+
+
+def _unchecked(linter: Linter, line: str, line_no: int) -> None:
+    """A modeled record with no structural requirements."""
+
+
+_CL2_CHECKS: dict[str, Callable[[Cl2Linter, str, int], None]] = {
+    "A0": _unchecked,
+    "B1": Cl2Linter._b1,
+    "B2": _unchecked,
+    "C1": Cl2Linter._c1,
+    "C2": _unchecked,
+    "D0": Cl2Linter._d0,
+    "D1": Cl2Linter._d_continuation,
+    "D2": Cl2Linter._d_continuation,
+    "D3": Cl2Linter._d_continuation,
+    "E0": Cl2Linter._e0,
+    "F0": Cl2Linter._f0,
+    "G0": Cl2Linter._g0,
+    "Z0": Cl2Linter._z0,
+}
+_HY3_CHECKS: dict[str, Callable[[Hy3Linter, str, int], None]] = {
+    "A1": _unchecked,
+    "B1": Hy3Linter._b1,
+    "B2": _unchecked,
+    "C1": Hy3Linter._c1,
+    "C3": _unchecked,
+    "D1": Hy3Linter._d1,
+    "E1": Hy3Linter._e1,
+    "E2": Hy3Linter._e2,
+    "F1": Hy3Linter._f1,
+    "F2": Hy3Linter._f2,
+    "F3": Hy3Linter._f3,
+    "G1": Hy3Linter._g1,
+    "H1": _unchecked,
+    "H2": _unchecked,
+}
+Cl2Linter.CHECKS = _CL2_CHECKS  # type: ignore[assignment]
+Hy3Linter.CHECKS = _HY3_CHECKS  # type: ignore[assignment]
@@ -0,0 +1,199 @@
+"""Parse the meets of one multi-meet file in worker processes.
+
+The file is scanned (or its fresh sidecar index read) to find each meet's byte
+ranges. The file header is parsed in the calling process; every meet is parsed
+by a worker from the file header, its ``B`` header and its club blocks, and the
+results are reassembled in file order onto the calling engine: meets share the
+header's ``SourceFile``, record counts and reports are summed without the header
+each worker repeated, and the trailer (``Z0``) lines are then fed to that engine,
+so the file-wide count checks see the whole file.
+
+Files whose records do not form one header, contiguous meets and a trailer (for
+example a second ``Z0`` mid-file) are left to the sequential path.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import Executor, Future
+from pathlib import Path
+
+from tunas._parser.diagnostics import COUNT_FIELDS, HandlerStats, ParseReport
+from tunas._parser.engine import _BaseEngine
+from tunas._parser.gcmode import managed_gc
+from tunas._parser.interning import Interner
+from tunas._parser.scan import LAYOUTS, FileIndex, Span, read_sidecar, read_spans, scan
+from tunas.models import Meet
+
+__all__ = ["check_workers", "parse_parallel"]
+
+type _Part = tuple[list[Meet], ParseReport, Counter[str]]
+
+
+def check_workers(workers: int) -> int:
+    """Validate a ``workers`` argument (a positive process count).
+
+    Raises:
+        ValueError: If ``workers`` is not a positive int.
+    """
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+        raise ValueError(f"workers must be a positive int, got {workers!r}")
+    return workers
+
+
+def _plan(index: FileIndex) -> list[list[Span]] | None:
+    """Each meet's spans (header, then blocks), or None if the file cannot be split.
+
+    Splitting needs at least two meets whose spans, with the file header, cover
+    every line up to the trailer without gaps.
+    """
+    if len(index.meets) < 2:
+        return None
+    meets = [
+        sorted([m.header, *(s for b in m.blocks.values() for s in b.spans)], key=lambda s: s.offset)
+        for m in index.meets
+    ]
+    line = 1
+    for span in [*([index.header] if index.header else []), *(s for m in meets for s in m)]:
+        if span.line != line:
+            return None
+        line += span.lines
+    return meets
+
+
+def _parse_meet(
+    engine_cls: type[_BaseEngine],
+    path: str,
+    spans: list[Span],
+    strict: bool,
+    encoding: str,
+    errors: str,
+    intern: int | None,
+    pause: bool,
+    profile: bool,
+    max_warnings: int | None,
+    verify_checksums: bool,
+) -> _Part:
+    """Worker: parse the file header plus one meet's spans with a fresh engine."""
+    interner = Interner(intern) if intern else None
+    engine = engine_cls(
+        strict=strict,
+        interner=interner,
+        profile=profile,
+        max_warnings=max_warnings,
+        verify_checksums=verify_checksums,
+        encoding=encoding,
+    )
+    with open(path, "rb") as fh, managed_gc("pause" if pause else "default"):
+        engine.parse_numbered(read_spans(fh, spans, encoding=encoding, errors=errors), path)
+    return engine.meets, engine.report, engine.file_counts
+
+
+def parse_parallel(
+    engine: _BaseEngine,
+    path: Path,
+    fmt: str,
+    pool: Executor,
+    *,
+    encoding: str,
+    errors: str,
+    intern: int | None,
+    mode: str,
+) -> FileIndex | None:
+    """Parse ``path`` onto ``engine`` with one ``pool`` task per meet.
+
+    Returns the file's index, or None, leaving ``engine`` untouched, if the file
+    cannot be split (see the module docs); the caller then parses it sequentially.
+
+    Raises:
+        ParseError: As for a sequential parse. The earliest failing meet raises first.
+    """
+    index = read_sidecar(path, fmt)
+    if index is None:
+        with open(path, "rb") as fh:
+            index = scan(fh, LAYOUTS[fmt], encoding=encoding, errors=errors)
+    plan = _plan(index)
+    if plan is None:
+        return None
+
+    source = str(path)
+    header = [index.header] if index.header is not None else []
+    futures: list[Future[_Part]] = [
+        pool.submit(
+            _parse_meet,
+            type(engine),
+            source,
+            [*header, *spans],
+            engine.strict,
+            encoding,
+            errors,
+            intern,
+            mode != "default",
+            engine.profile,
+            engine.max_warnings,
+            engine.verify_checksums,
+        )
+        for spans in plan
+    ]
+    try:
+        with open(path, "rb") as fh, managed_gc(mode):
+            engine.parse_numbered(read_spans(fh, header, encoding=encoding, errors=errors), source)
+            header_report, header_counts = engine.report, Counter(engine.file_counts)
+            engine.report = ParseReport(max_warnings=engine.max_warnings)
+            engine.report.merge(header_report)
+            for future in futures:
+                _absorb(engine, *future.result(), header_report, header_counts)
+            end = plan[-1][-1]
+            tail_line = end.line + end.lines
+            fh.seek(end.offset + end.length)
+            tail = ((i, raw.decode(encoding, errors)) for i, raw in enumerate(fh, start=tail_line))
+            for i, line in engine._lines(tail):
+                engine._feed(line, i)  # type: ignore[arg-type]
+            engine._finish_file()
+    finally:
+        for future in futures:
+            future.cancel()
+    return index
+
+
+def _absorb(
+    engine: _BaseEngine,
+    meets: list[Meet],
+    report: ParseReport,
+    counts: Counter[str],
+    header_report: ParseReport,
+    header_counts: Counter[str],
+) -> None:
+    """Add one worker's meets, counts and report, minus the repeated file header."""
+    for meet in meets:
+        meet.source_file = engine.source_file
+    engine.meets.extend(meets)
+    engine.meets_this_file += len(meets)
+    counts.subtract(header_counts)
+    engine.file_counts.update(counts)
+    merged = engine.report
+    # Re-applying the cap in file order keeps exactly the warnings a serial parse
+    # would: each worker kept a superset of them (its budget started at the header).
+    for warning in report.warnings[len(header_report.warnings) :]:
+        merged._store(warning)
+    merged._tallied.update(report._tallied - header_report._tallied)
+    for key, tally in report.suppressed.items():
+        header_tally = header_report.suppressed.get(key)
+        if header_tally is not None:
+            tally.count -= header_tally.count
+            for severity, n in header_tally.by_severity.items():
+                tally.by_severity[severity] -= n
+            del tally.examples[: len(header_tally.examples)]
+    merged.merge_suppressed({k: t for k, t in report.suppressed.items() if t.count})
+    for name in COUNT_FIELDS:
+        if name != "files_read":
+            extra = getattr(report, name) - getattr(header_report, name)
+            setattr(merged, name, getattr(merged, name) + extra)
+    for record_type, stats in report.profile.items():
+        repeated = header_report.profile.get(record_type)
+        if repeated is not None:  # header records: keep only the calling engine's pass
+            stats.calls -= repeated.calls
+            stats.warnings -= repeated.warnings
+            stats.seconds = max(stats.seconds - repeated.seconds, 0.0)
+        if stats.calls:
+            merged.profile.setdefault(record_type, HandlerStats(stats.handler)).merge(stats)
@@ -0,0 +1,530 @@
+"""Structural scan of a result file into byte/line spans, without building objects.
+
+One pass over the raw bytes splits a file into its header (the ``A`` records before
+the first meet), each meet's header (``B1`` and the ``B`` records after it) and,
+per meet, one block per club: every span of records from a ``C1`` up to the next
+``C1``/``B1``/trailer, grouped by team code (records before a meet's first ``C1``
+form a block with no team code). Within a block it also records the leading
+``C`` records and, per swimmer, each individual-entry record (``D0``/``D1``) with
+the lines that continue it (registration, splits, ...). Only the key fields of a
+few record types are decoded — team codes, member IDs and event distance/stroke —
+so a scan costs a fraction of a parse, and any subset of spans can later be
+re-read by seeking (:func:`read_spans`) and parsed by a fresh engine.
+
+An index round-trips through JSON (:func:`index_to_json` / :func:`index_from_json`)
+and is kept next to the file it describes as a sidecar (:func:`write_sidecar` /
+:func:`read_sidecar`), stamped with the file's size and modification time.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+
+from tunas._parser.cl2 import c1_team_code
+from tunas._parser.fields import Record, code_value, date_value, int_value
+from tunas._parser.hy3 import _RELAY_STROKE, _STROKE, prefixed_team_code
+from tunas._parser.ids import identity_keys, normalize_id, short_id
+from tunas.enums import Stroke
+from tunas.geography import LSC
+
+__all__ = [
+    "Span",
+    "BlockIndex",
+    "MeetIndex",
+    "FileIndex",
+    "Layout",
+    "Scanner",
+    "CL2_LAYOUT",
+    "HY3_LAYOUT",
+    "scan",
+    "read_spans",
+    "index_to_json",
+    "index_from_json",
+    "LAYOUTS",
+    "SIDECAR_SUFFIX",
+    "sidecar_path",
+    "write_sidecar",
+    "read_sidecar",
+]
+
+type EventKey = tuple[int, Stroke]
+
+
+@dataclass(frozen=True, slots=True)
+class Span:
+    """A run of consecutive lines: where it starts in bytes and in line numbers.
+
+    Attributes:
+        offset: Byte offset of the first line.
+        length: Length in bytes, line endings included.
+        line: 1-based number of the first line.
+        lines: Number of lines.
+    """
+
+    offset: int
+    length: int
+    line: int
+    lines: int
+
+
+@dataclass(slots=True)
+class BlockIndex:
+    """One club's records in a meet, and the keys found in them.
+
+    Attributes:
+        team_code: Team code from the ``C1`` record(s), or None for records before
+            the meet's first ``C1``.
+        spans: The club's record runs, in file order (a club may appear twice).
+        heads: The leading ``C`` records of each run.
+        swimmer_ids: Every member-ID form (see ``identity_keys``) in the block.
+        events: ``(distance, stroke)`` of every swim and relay entry in the block.
+        swimmers: 12-char member ID (see ``short_id``) -> the runs of that
+            swimmer's entry records, in file order; the IDs on the entries'
+            continuation records (a ``D3``'s 14-char ID) map to the same runs.
+            Relay records are not included.
+    """
+
+    team_code: str | None
+    spans: list[Span] = field(default_factory=list)
+    heads: list[Span] = field(default_factory=list)
+    swimmer_ids: set[str] = field(default_factory=set)
+    events: set[EventKey] = field(default_factory=set)
+    swimmers: dict[str, list[Span]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class MeetIndex:
+    """One meet's header span and club blocks.
+
+    Attributes:
+        name: Meet name from ``B1`` (None if blank).
+        start_date: Meet start date from ``B1`` (None if blank or malformed).
+        header: The ``B1`` record and the ``B`` records after it.
+        blocks: Club blocks by team code, in first-seen order.
+    """
+
+    name: str | None
+    start_date: datetime.date | None
+    header: Span
+    blocks: dict[str | None, BlockIndex] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class FileIndex:
+    """A scanned file.
+
+    Attributes:
+        size: File size in bytes when scanned.
+        header: Records before the first meet (None if there are none).
+        meets: One entry per ``B1`` record, in file order.
+    """
+
+    size: int
+    header: Span | None = None
+    meets: list[MeetIndex] = field(default_factory=list)
+
+
+class _Keys(NamedTuple):
+    ids: tuple[str, ...]
+    event: EventKey | None
+
+
+class Layout(NamedTuple):
+    """Where a format keeps the fields a scan reads.
+
+    Attributes:
+        meet_name: Meet-name column of ``B1`` (start, length).
+        meet_date: Meet start-date column (start, length).
+        team_code: Team code of a ``C1`` record.
+        trailer: Record types that end the last block (e.g. ``Z0``).
+        keys: Record type -> extractor of its member IDs and event key.
+        swimmer: Record types that start one swimmer's entry (keyed by their first ID).
+        swimmer_continued: Record types that continue the open swimmer entry.
+    """
+
+    meet_name: tuple[int, int]
+    meet_date: tuple[int, int]
+    team_code: Callable[[Record], str]
+    trailer: frozenset[str]
+    keys: dict[str, Callable[[Record], _Keys]]
+    swimmer: frozenset[str]
+    swimmer_continued: frozenset[str]
+
+
+def _ids(*raw: str) -> tuple[str, ...]:
+    """All identity keys for the given raw ID fields (any may be blank)."""
+    values = [normalize_id(r) for r in raw]
+    keys: list[str] = []
+    for value in values:
+        if value:
+            keys.extend(k for k in identity_keys(None, value) if k not in keys)
+    return tuple(keys)
+
+
+def _cl2_event(rec: Record, dist: int, stroke: int) -> EventKey | None:
+    distance = int_value(rec.raw(dist, 4))[1]
+    code = code_value(rec.raw(stroke, 1), Stroke)[1]
+    return (distance, code) if distance is not None and code is not None else None
+
+
+def _hy3_event(rec: Record, dist: int, width: int, strokes: dict[str, Stroke]) -> EventKey | None:
+    distance = int_value(rec.raw(dist, width))[1]
+    code = strokes.get(rec.raw(22, 1).strip().upper())
+    return (distance, code) if distance is not None and code is not None else None
+
+
+def _hy3_team_code(rec: Record) -> str:
+    lsc = code_value(rec.raw(54, 2), LSC)[1]
+    return prefixed_team_code(rec.raw(3, 5).strip(), lsc)
+
+
+CL2_LAYOUT = Layout(
+    meet_name=(12, 30),
+    meet_date=(122, 8),
+    team_code=lambda rec: c1_team_code(rec)[0],
+    trailer=frozenset({"Z0"}),
+    keys={
+        "D0": lambda rec: _Keys(_ids(rec.raw(40, 12)), _cl2_event(rec, 68, 72)),
+        "D3": lambda rec: _Keys(_ids(rec.raw(3, 14)), None),
+        "E0": lambda rec: _Keys((), _cl2_event(rec, 22, 26)),
+        "F0": lambda rec: _Keys(_ids(rec.raw(51, 12), rec.raw(93, 14)), None),
+    },
+    swimmer=frozenset({"D0"}),
+    swimmer_continued=frozenset({"D1", "D2", "D3", "G0"}),
+)
+
+HY3_LAYOUT = Layout(
+    meet_name=(3, 45),
+    meet_date=(93, 8),
+    team_code=_hy3_team_code,
+    trailer=frozenset(),
+    keys={
+        "D1": lambda rec: _Keys(_ids(rec.raw(70, 14)), None),
+        "E1": lambda rec: _Keys((), _hy3_event(rec, 16, 6, _STROKE)),
+        "F1": lambda rec: _Keys((), _hy3_event(rec, 19, 3, _RELAY_STROKE)),
+    },
+    swimmer=frozenset({"D1"}),
+    swimmer_continued=frozenset({"E1", "E2", "G1", "H1", "H2"}),
+)
+
+LAYOUTS = {"cl2": CL2_LAYOUT, "hy3": HY3_LAYOUT}
+
+
+class _Spans:
+    """Groups consecutive lines into spans appended to the current target list."""
+
+    __slots__ = ("count", "line", "start", "target")
+
+    def __init__(self) -> None:
+        self.target: list[Span] | None = None
+        self.start = self.line = self.count = 0
+
+    def switch(self, target: list[Span] | None, offset: int, line_no: int) -> None:
+        """Close the open span at ``offset`` and start one for ``target``."""
+        self.close(offset)
+        self.target, self.start, self.line, self.count = target, offset, line_no, 0
+
+    def close(self, offset: int) -> None:
+        """Append the open span, merging it into the previous one when adjacent."""
+        target = self.target
+        if target is not None and self.count:
+            span = Span(self.start, offset - self.start, self.line, self.count)
+            last = target[-1] if target else None
+            if last is not None and last.offset + last.length == span.offset:
+                span = Span(
+                    last.offset, last.length + span.length, last.line, last.lines + span.lines
+                )
+                target[-1] = span
+            else:
+                target.append(span)
+        self.count = 0
+
+    def add(self) -> None:
+        """Count the current line into the open span (if any)."""
+        if self.target is not None:
+            self.count += 1
+
+
+class Scanner:
+    """Incremental scan: feed raw lines in file order, then :meth:`finish`.
+
+    Lets a caller index a file while reading it for another purpose (e.g. a full
+    parse); :func:`scan` is the plain loop over a binary file.
+    """
+
+    __slots__ = (
+        "layout",
+        "encoding",
+        "errors",
+        "index",
+        "_file_header",
+        "_meet_headers",
+        "_meet",
+        "_block",
+        "_spans",
+        "_heads",
+        "_runs",
+        "_offset",
+        "_line_no",
+    )
+
+    def __init__(self, layout: Layout, *, encoding: str, errors: str) -> None:
+        self.layout = layout
+        self.encoding = encoding
+        self.errors = errors
+        self.index = FileIndex(size=0)
+        self._file_header: list[Span] = []
+        self._meet_headers: list[list[Span]] = []
+        self._meet: MeetIndex | None = None
+        self._block: BlockIndex | None = None
+        self._spans = _Spans()  # file header / meet header / club block runs
+        self._heads = _Spans()  # each block run's leading C records
+        self._runs = _Spans()  # one swimmer's D record and its continuation lines
+        self._offset = 0
+        self._line_no = 0
+
+    def _record(self, raw: bytes) -> Record:
+        return Record(raw.decode(self.encoding, self.errors), self._line_no, "")
+
+    def feed(self, raw: bytes) -> None:
+        """Account for the next raw line (line ending included)."""
+        layout = self.layout
+        self._line_no += 1
+        offset, line_no = self._offset, self._line_no
+        spans, heads, runs = self._spans, self._heads, self._runs
+        kind = raw[0:2].decode("latin-1")
+        meet, block = self._meet, self._block
+        keys: _Keys | None = None
+        if not raw.strip():
+            pass  # blank lines stay in the open spans (the engines skip them)
+        elif kind == "B1":
+            rec = self._record(raw)
+            meet = self._meet = MeetIndex(
+                name=rec.text(*layout.meet_name),
+                start_date=date_value(rec.raw(*layout.meet_date))[1],
+                header=Span(offset, 0, line_no, 0),
+            )
+            self.index.meets.append(meet)
+            self._meet_headers.append([])
+            block = self._block = None
+            spans.switch(self._meet_headers[-1], offset, line_no)
+            heads.switch(None, offset, line_no)
+            runs.switch(None, offset, line_no)
+        elif kind == "C1" and meet is not None:
+            code = layout.team_code(self._record(raw)) or None
+            block = self._block = meet.blocks.get(code)
+            if block is None:
+                block = self._block = meet.blocks[code] = BlockIndex(code)
+            spans.switch(block.spans, offset, line_no)
+            heads.switch(block.heads, offset, line_no)
+            runs.switch(None, offset, line_no)
+        elif kind in layout.trailer or (meet is None and not kind.startswith("A")):
+            block = self._block = None
+            for builder in (spans, heads, runs):
+                if builder.target is not None:
+                    builder.switch(None, offset, line_no)
+        elif meet is None:
+            if spans.target is not self._file_header:
+                spans.switch(self._file_header, offset, line_no)
+        else:
+            if block is None and not kind.startswith("B"):
+                # Records between a meet's header and its first C1 have no club.
+                block = self._block = meet.blocks.get(None)
+                if block is None:
+                    block = self._block = meet.blocks[None] = BlockIndex(None)
+                spans.switch(block.spans, offset, line_no)
+            if heads.target is not None and not kind.startswith("C"):
+                heads.switch(None, offset, line_no)
+            extract = layout.keys.get(kind) if block is not None else None
+            if extract is not None and block is not None:
+                keys = extract(self._record(raw))
+                block.swimmer_ids.update(keys.ids)
+                if keys.event is not None:
+                    block.events.add(keys.event)
+            if kind in layout.swimmer and block is not None:
+                key = short_id(None, keys.ids[0]) if keys and keys.ids else None
+                target = block.swimmers.setdefault(key, []) if key else None
+                runs.switch(target, offset, line_no)
+            elif runs.target is not None and kind not in layout.swimmer_continued:
+                runs.switch(None, offset, line_no)
+            elif runs.target is not None and keys is not None and block is not None:
+                # IDs on a continuation record (a D3's 14-char ID, which a legacy
+                # 12-char ID is not the prefix of) find the same entry runs.
+                for key in keys.ids:
+                    block.swimmers.setdefault(key, runs.target)
+
+        spans.add()
+        heads.add()
+        runs.add()
+        self._offset += len(raw)
+
+    def finish(self) -> FileIndex:
+        """Close the open spans and return the index."""
+        index, offset = self.index, self._offset
+        for builder in (self._spans, self._heads, self._runs):
+            builder.close(offset)
+        index.size = offset
+        index.header = self._file_header[0] if self._file_header else None
+        for meet_index, header in zip(index.meets, self._meet_headers, strict=True):
+            meet_index.header = header[0]
+        return index
+
+
+def raw_lines(fh: BinaryIO) -> Iterator[bytes]:
+    """Yield ``fh``'s lines with their endings, split like text mode splits them.
+
+    A line ends at ``\r\n``, ``\n`` or a lone ``\r``, so line numbers match the
+    engines' (which read text with universal newlines) for any line endings.
+    """
+    for chunk in fh:
+        if chunk.find(b"\r", 0, len(chunk) - 2) == -1:
+            yield chunk  # the common case: no carriage return before the ending
+        else:
+            yield from chunk.splitlines(keepends=True)
+
+
+def scan(fh: BinaryIO, layout: Layout, *, encoding: str, errors: str) -> FileIndex:
+    """Scan an open binary file from its start into a :class:`FileIndex`."""
+    scanner = Scanner(layout, encoding=encoding, errors=errors)
+    for raw in raw_lines(fh):
+        scanner.feed(raw)
+    return scanner.finish()
+
+
+def read_spans(
+    fh: BinaryIO, spans: Iterable[Span], *, encoding: str, errors: str
+) -> Iterator[tuple[int, str]]:
+    """Seek to each span and yield its ``(line_no, line)`` pairs, decoded."""
+    for span in spans:
+        fh.seek(span.offset)
+        data = fh.read(span.length)
+        for i, raw in enumerate(data.splitlines()[: span.lines]):
+            yield span.line + i, raw.decode(encoding, errors)
+
+
+# -- persistence ----------------------------------------------------------- #
+
+
+def _span_json(span: Span) -> list[int]:
+    return [span.offset, span.length, span.line, span.lines]
+
+
+def _spans_json(spans: list[Span]) -> list[list[int]]:
+    return [_span_json(span) for span in spans]
+
+
+def _spans(rows: list[list[int]]) -> list[Span]:
+    return [Span(*row) for row in rows]
+
+
+def index_to_json(index: FileIndex) -> dict[str, Any]:
+    """A JSON-serializable form of ``index`` (spans as ``[offset, length, line, lines]``)."""
+    return {
+        "size": index.size,
+        "header": _span_json(index.header) if index.header is not None else None,
+        "meets": [
+            {
+                "name": meet.name,
+                "start_date": meet.start_date.isoformat() if meet.start_date else None,
+                "header": _span_json(meet.header),
+                "blocks": [
+                    {
+                        "team_code": block.team_code,
+                        "spans": _spans_json(block.spans),
+                        "heads": _spans_json(block.heads),
+                        "swimmer_ids": sorted(block.swimmer_ids),
+                        "events": sorted([d, s.name] for d, s in block.events),
+                        "swimmers": {k: _spans_json(v) for k, v in block.swimmers.items()},
+                    }
+                    for block in meet.blocks.values()
+                ],
+            }
+            for meet in index.meets
+        ],
+    }
+
+
+def index_from_json(data: dict[str, Any]) -> FileIndex:
+    """Rebuild a :class:`FileIndex` from :func:`index_to_json` output."""
+    meets = []
+    for meet in data["meets"]:
+        blocks = [
+            BlockIndex(
+                team_code=block["team_code"],
+                spans=_spans(block["spans"]),
+                heads=_spans(block["heads"]),
+                swimmer_ids=set(block["swimmer_ids"]),
+                events={(d, Stroke[s]) for d, s in block["events"]},
+                swimmers={k: _spans(v) for k, v in block["swimmers"].items()},
+            )
+            for block in meet["blocks"]
+        ]
+        start = meet["start_date"]
+        meets.append(
+            MeetIndex(
+                name=meet["name"],
+                start_date=datetime.date.fromisoformat(start) if start else None,
+                header=Span(*meet["header"]),
+                blocks={block.team_code: block for block in blocks},
+            )
+        )
+    header = data["header"]
+    return FileIndex(size=data["size"], header=Span(*header) if header else None, meets=meets)
+
+
+SIDECAR_SUFFIX = ".idx.json"
+_SIDECAR_VERSION = 2
+
+
+def sidecar_path(path: str | os.PathLike[str]) -> Path:
+    """Where the index of ``path`` is kept: ``<name>.idx.json`` beside it."""
+    path = Path(os.fspath(path))
+    return path.with_name(path.name + SIDECAR_SUFFIX)
+
+
+def write_sidecar(path: str | os.PathLike[str], index: FileIndex, fmt: str) -> Path:
+    """Write ``index`` (of the ``fmt`` file at ``path``) to its sidecar and return it."""
+    stat = os.stat(path)
+    data = {
+        "version": _SIDECAR_VERSION,
+        "format": fmt,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "index": index_to_json(index),
+    }
+    target = sidecar_path(path)
+    with open(target, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, separators=(",", ":"))
+    return target
+
+
+def read_sidecar(path: str | os.PathLike[str], fmt: str) -> FileIndex | None:
+    """The sidecar index of ``path``, or None if missing, unreadable or stale.
+
+    Stale means written for another format or index version, or the file's size or
+    modification time differs from when the index was built.
+    """
+    try:
+        with open(sidecar_path(path), encoding="utf-8") as fh:
+            data = json.load(fh)
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != _SIDECAR_VERSION
+        or data.get("format") != fmt
+        or data.get("size") != stat.st_size
+        or data.get("mtime_ns") != stat.st_mtime_ns
+    ):
+        return None
+    try:
+        return index_from_json(data["index"])
+    except (KeyError, TypeError, ValueError):
+        return None
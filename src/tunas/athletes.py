@@ -0,0 +1,296 @@
+"""Cross-meet athlete identity: an incrementally built index of swims per athlete.
+
+Swimmers are scoped to one :class:`~tunas.models.Meet`, so the same person appears
+as unrelated :class:`~tunas.models.Swimmer` objects across a corpus. An
+:class:`AthleteIndex` unions those by member ID as archives stream past and keeps
+only compact :class:`SwimRef` rows per athlete, so the parsed meets themselves can
+be released while "every swim of athlete X" stays an O(1) lookup.
+"""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from tunas._parser.ids import identity_keys, short_id
+from tunas.enums import ResultStatus, Session, Sex
+from tunas.event import Event
+from tunas.models import IndividualSwim, Meet, Relay, RelaySwim, Swimmer
+from tunas.time import Time
+
+if TYPE_CHECKING:
+    from tunas.parser import MeetArchive
+
+__all__ = ["athlete_key", "SwimRef", "Athlete", "AthleteIndex"]
+
+
+def athlete_key(swimmer: Swimmer) -> str | None:
+    """A stable cross-meet key for a swimmer: the 12-char USS#, or None if unidentified.
+
+    Uses ``id_short``, falling back to the 12-char prefix of ``id_long`` (the form
+    ``read_hy3`` derives), so one athlete keys the same in `.cl2` and `.hy3` files.
+    Stateless, so it suits persisted per-athlete tables; :class:`AthleteIndex`
+    additionally unions legacy IDs whose short form differs from that prefix.
+    """
+    return short_id(swimmer.id_short, swimmer.id_long)
+
+
+@dataclass(frozen=True, slots=True)
+class SwimRef:
+    """A compact, meet-independent reference to one swim.
+
+    Carries the fields most corpus queries need, plus the position of the swim in
+    its archive, so the full object can be recovered with :meth:`resolve` when the
+    archive is re-read.
+
+    Attributes:
+        source: Archive source the swim was parsed from (file path or "<stream>").
+        meet_index: Position of the meet in ``MeetArchive.meets``.
+        result_index: Position of the result row in ``Meet.results``.
+        leg_index: Position in ``Relay.legs`` for a relay leg, else None.
+        event: The swum event (the leg's individual event for a relay leg).
+        session: Meet session of the swim.
+        status: Result status of the swim.
+        time: The swim time, or None.
+        date: Date of the swim, or None.
+    """
+
+    source: str
+    meet_index: int
+    result_index: int
+    leg_index: int | None
+    event: Event | None
+    session: Session
+    status: ResultStatus
+    time: Time | None
+    date: datetime.date | None
+
+    @property
+    def is_relay_leg(self) -> bool:
+        """True if this references a relay leg."""
+        return self.leg_index is not None
+
+    def resolve(self, meets: Sequence[Meet]) -> IndividualSwim | RelaySwim:
+        """Recover the referenced swim from its archive's ``meets``.
+
+        Raises:
+            LookupError: If ``meets`` does not hold a swim at this position.
+        """
+        result = meets[self.meet_index].results[self.result_index]
+        if self.leg_index is None:
+            if not isinstance(result, IndividualSwim):
+                raise LookupError(f"result {self.result_index} is not an individual swim")
+            return result
+        if not isinstance(result, Relay):
+            raise LookupError(f"result {self.result_index} is not a relay")
+        return result.legs[self.leg_index]
+
+
+@dataclass(slots=True, eq=False)
+class Athlete:
+    """One person across every meet added to an :class:`AthleteIndex`.
+
+    Personal details are taken from the first swimmer record that supplies them.
+
+    Attributes:
+        key: Canonical ID (the first ID this athlete was seen under).
+        ids: Every member ID (12- and 14-char forms) known for this athlete.
+        first_name: First name.
+        last_name: Last name.
+        sex: Sex.
+        birthday: Birthday, if any meet recorded it.
+        swims: References to every swim, in the order they were added.
+    """
+
+    key: str
+    ids: set[str]
+    first_name: str
+    last_name: str
+    sex: Sex
+    birthday: datetime.date | None = None
+    swims: list[SwimRef] = field(default_factory=list)
+
+    def __repr__(self) -> str:
+        return (
+            f"Athlete(key={self.key!r}, full_name={self.full_name!r}, "
+            f"ids={len(self.ids)}, swims={len(self.swims)})"
+        )
+
+    def __str__(self) -> str:
+        return self.full_name
+
+    @property
+    def full_name(self) -> str:
+        """Combined first and last name."""
+        return f"{self.first_name} {self.last_name}"
+
+    def swims_in(self, event: Event) -> list[SwimRef]:
+        """Swims for one event, in the order they were added."""
+        return [s for s in self.swims if s.event == event]
+
+
+class AthleteIndex:
+    """Incremental cross-meet index of athletes and their swims.
+
+    Feed archives as a reader yields them; each swimmer is unioned with any athlete
+    already known under one of its IDs (``id_short``, ``id_long``, and the 12-char
+    ``id_long`` prefix), merging two previously separate athletes when a record
+    links them. Every known ID maps straight to its :class:`Athlete`, so lookups
+    are O(1); a merge re-points the smaller athlete's IDs (weighted union).
+
+    Swimmers without any member ID cannot be matched across meets and are counted
+    in :attr:`unidentified_swims` instead of being indexed.
+    """
+
+    __slots__ = ("_by_id", "_athletes", "unidentified_swims")
+
+    def __init__(self) -> None:
+        self._by_id: dict[str, Athlete] = {}
+        self._athletes: dict[str, Athlete] = {}  # canonical key -> athlete
+        self.unidentified_swims = 0
+
+    @classmethod
+    def from_archives(cls, archives: Iterable[MeetArchive]) -> AthleteIndex:
+        """Build an index from an iterable of archives (e.g. a reader's iterator)."""
+        index = cls()
+        for archive in archives:
+            index.add(archive)
+        return index
+
+    # -- building ---------------------------------------------------------- #
+
+    def add(self, archive: MeetArchive) -> None:
+        """Index every swim in one archive."""
+        for meet_index, meet in enumerate(archive.meets):
+            self.add_meet(meet, source=archive.source, meet_index=meet_index)
+
+    def add_meet(self, meet: Meet, *, source: str, meet_index: int = 0) -> None:
+        """Index every swim of one meet (``source``/``meet_index`` locate it for ``resolve``)."""
+        # id(swimmer) -> one of its member IDs, so each swimmer is unioned once per
+        # meet. An ID (not the Athlete) is cached because a later swimmer in the same
+        # meet may merge that athlete into another; every ID re-points to the survivor.
+        resolved: dict[int, str | None] = {}
+
+        def lookup(swimmer: Swimmer | None) -> Athlete | None:
+            if swimmer is None:
+                return None
+            if id(swimmer) not in resolved:
+                athlete = self._union(swimmer)
+                resolved[id(swimmer)] = athlete.key if athlete is not None else None
+            key = resolved[id(swimmer)]
+            return self._by_id[key] if key is not None else None
+
+        for result_index, result in enumerate(meet.results):
+            if isinstance(result, IndividualSwim):
+                athlete = lookup(result.swimmer)
+                if athlete is None:
+                    self.unidentified_swims += 1
+                    continue
+                athlete.swims.append(
+                    SwimRef(
+                        source,
+                        meet_index,
+                        result_index,
+                        None,
+                        result.event,
+                        result.session,
+                        result.status,
+                        result.time,
+                        result.date,
+                    )
+                )
+            elif isinstance(result, Relay):
+                for leg_index, leg in enumerate(result.legs):
+                    athlete = lookup(leg.swimmer)
+                    if athlete is None:
+                        self.unidentified_swims += 1
+                        continue
+                    athlete.swims.append(
+                        SwimRef(
+                            source,
+                            meet_index,
+                            result_index,
+                            leg_index,
+                            leg.event,
+                            result.session,
+                            leg.status,
+                            leg.time,
+                            result.date,
+                        )
+                    )
+
+    def _union(self, swimmer: Swimmer) -> Athlete | None:
+        """The athlete for ``swimmer``'s IDs, creating or merging athletes as needed."""
+        keys = identity_keys(swimmer.id_short, swimmer.id_long)
+        if not keys:
+            return None
+        target: Athlete | None = None
+        for key in keys:
+            found = self._by_id.get(key)
+            if found is None or found is target:
+                continue
+            target = found if target is None else self._merge(target, found)
+        if target is None:
+            target = Athlete(
+                key=keys[0],
+                ids=set(),
+                first_name=swimmer.first_name,
+                last_name=swimmer.last_name,
+                sex=swimmer.sex,
+            )
+            self._athletes[target.key] = target
+        if target.birthday is None:
+            target.birthday = swimmer.birthday
+        for key in keys:
+            if key not in target.ids:
+                target.ids.add(key)
+                self._by_id[key] = target
+        return target
+
+    def _merge(self, a: Athlete, b: Athlete) -> Athlete:
+        """Fold the athlete with fewer IDs into the other; return the survivor."""
+        keep, drop = (a, b) if len(a.ids) >= len(b.ids) else (b, a)
+        for key in drop.ids:
+            self._by_id[key] = keep
+        keep.ids |= drop.ids
+        keep.swims.extend(drop.swims)
+        if keep.birthday is None:
+            keep.birthday = drop.birthday
+        del self._athletes[drop.key]
+        return keep
+
+    # -- queries ----------------------------------------------------------- #
+
+    def __len__(self) -> int:
+        return len(self._athletes)
+
+    def __contains__(self, member_id: object) -> bool:
+        return member_id in self._by_id
+
+    def __iter__(self) -> Iterator[Athlete]:
+        return iter(self._athletes.values())
+
+    def __getitem__(self, member_id: str) -> Athlete:
+        return self._by_id[member_id]
+
+    def __repr__(self) -> str:
+        return f"AthleteIndex(athletes={len(self)}, ids={len(self._by_id)})"
+
+    def get(self, member_id: str) -> Athlete | None:
+        """The athlete known under ``member_id`` (any 12- or 14-char form), or None."""
+        return self._by_id.get(member_id)
+
+    def find(self, swimmer: Swimmer) -> Athlete | None:
+        """The indexed athlete matching a parsed swimmer's IDs, or None."""
+        for key in identity_keys(swimmer.id_short, swimmer.id_long):
+            athlete = self._by_id.get(key)
+            if athlete is not None:
+                return athlete
+        return None
+
+    def swims(self, member_id: str) -> list[SwimRef]:
+        """Every indexed swim of the athlete known under ``member_id`` (empty if unknown)."""
+        athlete = self._by_id.get(member_id)
+        return athlete.swims if athlete is not None else []
@@ -0,0 +1,265 @@
+"""Incremental personal bests per athlete and event, persisted as JSON.
+
+:class:`PersonalBests` consumes archives as a reader yields them and keeps only the
+fastest :class:`~tunas.time.Time` per ``(athlete, event)`` along with where it was
+swum. Each update costs time proportional to the new archive alone, and the table
+can be saved and reloaded, so a nightly job only has to read the files it has not
+seen before (see :attr:`PersonalBests.sources`).
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from tunas._corpus import timed_swims
+from tunas.athletes import athlete_key
+from tunas.enums import Session
+from tunas.event import Event
+from tunas.models import Meet
+from tunas.time import Time
+
+if TYPE_CHECKING:
+    from tunas.parser import MeetArchive
+
+__all__ = ["CourseConverter", "PersonalBest", "PersonalBests"]
+
+# A course conversion hook: given a swum event and time, yield equivalent
+# (event, time) pairs in other courses. tunas ships no conversion factors.
+type CourseConverter = Callable[[Event, Time], Iterable[tuple[Event, Time]]]
+
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class PersonalBest:
+    """An athlete's fastest time in one event, with its provenance.
+
+    Attributes:
+        event: The event the best applies to.
+        time: The best time.
+        meet: Name of the meet it was swum at.
+        meet_date: Start date of that meet.
+        date: Date of the swim, if recorded.
+        session: Session it was swum in.
+        source: Archive source (file path) it was parsed from.
+        converted_from: For a course-converted best, the event actually swum; else None.
+    """
+
+    event: Event
+    time: Time
+    meet: str
+    meet_date: datetime.date
+    date: datetime.date | None
+    session: Session
+    source: str
+    converted_from: Event | None = None
+
+    def beats(self, other: PersonalBest) -> bool:
+        """True if this best should replace ``other`` (faster, or as fast but earlier)."""
+        if self.time != other.time:
+            return self.time < other.time
+        return (self.date or self.meet_date) < (other.date or other.meet_date)
+
+
+class PersonalBests:
+    """Best time per ``(athlete, event)`` across every archive added so far.
+
+    Athletes are keyed by :func:`~tunas.athletes.athlete_key` (the 12-char USS#);
+    swimmers without an ID are skipped. Only individual swims with a time and an
+    ``OK`` or ``EXHIBITION`` status count. On equal times the earlier swim is kept,
+    so adding the same archive twice never changes the table.
+
+    Args:
+        converter: Optional hook mapping a swum ``(event, time)`` to equivalent
+            times in other courses. Converted times are kept in a separate table so
+            they never displace a real best; query them with ``converted=True``.
+    """
+
+    __slots__ = ("_bests", "_converted", "_sources", "converter")
+
+    def __init__(self, *, converter: CourseConverter | None = None) -> None:
+        self.converter = converter
+        self._bests: dict[str, dict[Event, PersonalBest]] = {}
+        self._converted: dict[str, dict[Event, PersonalBest]] = {}
+        self._sources: set[str] = set()
+
+    # -- building ---------------------------------------------------------- #
+
+    def update(self, archives: Iterable[MeetArchive]) -> int:
+        """Add every archive in ``archives``; return how many bests improved."""
+        return sum(self.add(archive) for archive in archives)
+
+    def add(self, archive: MeetArchive) -> int:
+        """Add one archive's swims; return how many ``(athlete, event)`` bests improved."""
+        improved: set[tuple[str, Event]] = set()
+        for meet in archive.meets:
+            self._add_meet(meet, archive.source, improved)
+        self._sources.add(archive.source)
+        return len(improved)
+
+    def add_meet(self, meet: Meet, *, source: str) -> int:
+        """Add one meet's swims; return how many ``(athlete, event)`` bests improved."""
+        improved: set[tuple[str, Event]] = set()
+        self._add_meet(meet, source, improved)
+        return len(improved)
+
+    def _add_meet(self, meet: Meet, source: str, improved: set[tuple[str, Event]]) -> None:
+        for result in timed_swims(meet):
+            assert result.time is not None
+            key = athlete_key(result.swimmer)
+            if key is None:
+                continue
+            best = PersonalBest(
+                event=result.event,
+                time=result.time,
+                meet=meet.name,
+                meet_date=meet.start_date,
+                date=result.date,
+                session=result.session,
+                source=source,
+            )
+            if _offer(self._bests, key, best):
+                improved.add((key, result.event))
+            if self.converter is not None:
+                for event, time in self.converter(result.event, result.time):
+                    converted = PersonalBest(
+                        event=event,
+                        time=time,
+                        meet=best.meet,
+                        meet_date=best.meet_date,
+                        date=best.date,
+                        session=best.session,
+                        source=source,
+                        converted_from=result.event,
+                    )
+                    _offer(self._converted, key, converted)
+
+    # -- queries ----------------------------------------------------------- #
+
+    @property
+    def sources(self) -> frozenset[str]:
+        """Every archive source added so far (to skip already-read files)."""
+        return frozenset(self._sources)
+
+    def __len__(self) -> int:
+        return len(self._bests)
+
+    def __contains__(self, athlete: object) -> bool:
+        return athlete in self._bests
+
+    def __repr__(self) -> str:
+        events = sum(len(b) for b in self._bests.values())
+        return f"PersonalBests(athletes={len(self)}, bests={events}, sources={len(self._sources)})"
+
+    def athletes(self) -> list[str]:
+        """Keys of every athlete with at least one best."""
+        return list(self._bests)
+
+    def best(self, athlete: str, event: Event, *, converted: bool = False) -> PersonalBest | None:
+        """The athlete's best in ``event``, or None.
+
+        With ``converted=True``, a course-converted time also qualifies when it is
+        faster than anything actually swum in that event.
+        """
+        actual = self._bests.get(athlete, {}).get(event)
+        if not converted:
+            return actual
+        other = self._converted.get(athlete, {}).get(event)
+        if actual is None or (other is not None and other.beats(actual)):
+            return other
+        return actual
+
+    def bests_for(self, athlete: str, *, converted: bool = False) -> dict[Event, PersonalBest]:
+        """Every best for one athlete, keyed by event (in event order)."""
+        events = set(self._bests.get(athlete, {}))
+        if converted:
+            events |= set(self._converted.get(athlete, {}))
+        out: dict[Event, PersonalBest] = {}
+        for event in sorted(events):
+            best = self.best(athlete, event, converted=converted)
+            assert best is not None
+            out[event] = best
+        return out
+
+    # -- persistence ------------------------------------------------------- #
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the table (and its consumed sources) to a JSON file."""
+        data = {
+            "version": _FORMAT_VERSION,
+            "sources": sorted(self._sources),
+            "bests": _rows(self._bests),
+            "converted": _rows(self._converted),
+        }
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, separators=(",", ":"))
+
+    @classmethod
+    def load(
+        cls, path: str | os.PathLike[str], *, converter: CourseConverter | None = None
+    ) -> PersonalBests:
+        """Reload a table written by :meth:`save`.
+
+        Raises:
+            ValueError: If the file is not a supported personal-bests table.
+        """
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        if not isinstance(data, dict) or data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"{os.fspath(path)!r} is not a version {_FORMAT_VERSION} table")
+        table = cls(converter=converter)
+        table._sources.update(data["sources"])
+        for row in data["bests"]:
+            key, best = _from_row(row)
+            table._bests.setdefault(key, {})[best.event] = best
+        for row in data["converted"]:
+            key, best = _from_row(row)
+            table._converted.setdefault(key, {})[best.event] = best
+        return table
+
+
+def _offer(table: dict[str, dict[Event, PersonalBest]], key: str, best: PersonalBest) -> bool:
+    """Store ``best`` if it beats the current entry; return whether it did."""
+    per_athlete = table.setdefault(key, {})
+    current = per_athlete.get(best.event)
+    if current is None or best.beats(current):
+        per_athlete[best.event] = best
+        return True
+    return False
+
+
+def _rows(table: dict[str, dict[Event, PersonalBest]]) -> list[list[Any]]:
+    return [
+        [
+            key,
+            b.event.name,
+            b.time.centiseconds,
+            b.meet,
+            b.meet_date.isoformat(),
+            b.date.isoformat() if b.date else None,
+            b.session.value,
+            b.source,
+            b.converted_from.name if b.converted_from else None,
+        ]
+        for key, per_athlete in table.items()
+        for b in per_athlete.values()
+    ]
+
+
+def _from_row(row: list[Any]) -> tuple[str, PersonalBest]:
+    key, event, centis, meet, meet_date, date, session, source, converted_from = row
+    return key, PersonalBest(
+        event=Event[event],
+        time=Time(centis),
+        meet=meet,
+        meet_date=datetime.date.fromisoformat(meet_date),
+        date=datetime.date.fromisoformat(date) if date else None,
+        session=Session(session),
+        source=source,
+        converted_from=Event[converted_from] if converted_from else None,
+    )
@@ -0,0 +1,498 @@
+"""The ``tunas`` command-line tool: bulk parsing, scanning, validation, stats and export.
+
+Every command takes any mix of files, directories (walked recursively for `.cl2`
+and `.hy3` files) and `.zip` archives of them (a member's source is
+``archive.zip!member``), and works through them one file per task — in
+``--jobs`` worker processes when there is more than one. Per-file output streams
+to ``--output`` (default stdout) in input order as each file finishes; a summary
+of throughput and warnings goes to stderr.
+
+Usage::
+
+    tunas parse meets/ --jobs 8 > files.jsonl         # one summary row per file
+    tunas scan results.zip                             # meets and clubs, no parse
+    tunas validate uploads/ --verify-checksums         # exit status 1 if any invalid
+    tunas stats meets/ -j 0                            # corpus totals as one JSON object
+    tunas export meets/ --to csv --kinds swim -o swims.csv
+
+The exit status is 0 on success, 1 if any file failed to parse (or, for
+``validate``, is invalid) and 2 on a usage error.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+import zipfile
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple, TextIO, cast
+
+from tunas._parser.cl2 import _Cl2Engine
+from tunas._parser.diagnostics import Severity
+from tunas._parser.engine import _BaseEngine
+from tunas._parser.hy3 import _Hy3Engine
+from tunas._parser.lint import Cl2Linter, Hy3Linter, Linter
+from tunas._parser.scan import LAYOUTS, scan, write_sidecar
+from tunas.exceptions import ParseError
+from tunas.jsonl import FIELDS, KINDS, iter_records
+from tunas.parser import MeetArchive, _iter_stream
+
+__all__ = ["main"]
+
+_ENGINES: dict[str, type[_BaseEngine]] = {"cl2": _Cl2Engine, "hy3": _Hy3Engine}
+_SUFFIXES = {".cl2": "cl2", ".hy3": "hy3"}
+
+
+class _Input(NamedTuple):
+    """One file to process: a path, or a member of the `.zip` at ``path``."""
+
+    path: str
+    member: str | None
+    fmt: str
+    size: int
+
+    @property
+    def source(self) -> str:
+        return self.path if self.member is None else f"{self.path}!{self.member}"
+
+
+@dataclass(frozen=True, slots=True)
+class _Options:
+    """The command-line options a worker needs (picklable)."""
+
+    encoding: str = "cp1252"
+    errors: str = "replace"
+    strict: bool = False
+    max_warnings: int | None = None
+    verify_checksums: bool = False
+    index: bool = False
+    kinds: tuple[str, ...] = ("swim", "relay")
+    fields: tuple[str, ...] | None = None
+    to: str = "jsonl"
+
+
+@dataclass(slots=True)
+class _Outcome:
+    """What one file contributed: output rows, counts for the summary, any error."""
+
+    source: str
+    rows: list[str] = field(default_factory=list)
+    counts: Counter[str] = field(default_factory=Counter)
+    first: str | None = None  # earliest meet start date (ISO)
+    last: str | None = None  # latest meet start date (ISO)
+    error: str | None = None
+    failed: bool = False
+
+
+# -- inputs ------------------------------------------------------------------ #
+
+
+def _inputs(paths: Sequence[str], fmt: str | None) -> list[_Input]:
+    """Expand files, directories and `.zip` archives into files, in a stable order.
+
+    Raises:
+        ValueError: If a path does not exist, or a named file's format is unknown.
+    """
+    found: list[_Input] = []
+    for name in paths:
+        path = Path(name)
+        if path.is_dir():
+            children = sorted(p for p in path.rglob("*") if p.is_file())
+            found.extend(_matching(children, fmt))
+        elif path.suffix.lower() == ".zip":
+            with zipfile.ZipFile(path) as zf:
+                for info in sorted(zf.infolist(), key=lambda i: i.filename):
+                    member_fmt = _SUFFIXES.get(Path(info.filename).suffix.lower())
+                    if not info.is_dir() and member_fmt and fmt in (None, member_fmt):
+                        found.append(_Input(name, info.filename, member_fmt, info.file_size))
+        elif path.is_file():
+            file_fmt = fmt or _SUFFIXES.get(path.suffix.lower())
+            if file_fmt is None:
+                raise ValueError(f"{name}: unknown file type (use --format cl2 or hy3)")
+            found.append(_Input(name, None, file_fmt, path.stat().st_size))
+        else:
+            raise ValueError(f"{name}: no such file or directory")
+    return found
+
+
+def _matching(paths: list[Path], fmt: str | None) -> Iterator[_Input]:
+    for path in paths:
+        path_fmt = _SUFFIXES.get(path.suffix.lower())
+        if path_fmt is not None and fmt in (None, path_fmt):
+            yield _Input(str(path), None, path_fmt, path.stat().st_size)
+
+
+@contextmanager
+def _binary(item: _Input) -> Iterator[BinaryIO]:
+    if item.member is None:
+        with open(item.path, "rb") as fh:
+            yield fh
+    else:
+        with zipfile.ZipFile(item.path) as zf, zf.open(item.member) as member:
+            yield cast(BinaryIO, member)
+
+
+@contextmanager
+def _text(item: _Input, options: _Options) -> Iterator[TextIO]:
+    with _binary(item) as raw:
+        yield io.TextIOWrapper(raw, encoding=options.encoding, errors=options.errors)
+
+
+def _parse(item: _Input, options: _Options) -> MeetArchive:
+    with _text(item, options) as fh:
+        return next(
+            _iter_stream(
+                fh,
+                _ENGINES[item.fmt],
+                options.strict,
+                max_warnings=options.max_warnings,
+                verify_checksums=options.verify_checksums,
+                encoding=options.encoding,
+                source=item.source,
+            )
+        )
+
+
+def _tally(outcome: _Outcome, archive: MeetArchive) -> None:
+    """Count ``archive``'s objects and warnings into ``outcome``."""
+    report, counts = archive.report, outcome.counts
+    counts["meets"] += report.meets_parsed
+    counts["clubs"] += sum(len(meet.clubs) for meet in archive.meets)
+    counts["swimmers"] += report.swimmers_parsed
+    counts["swims"] += report.individual_swims_parsed
+    counts["relays"] += report.relays_parsed
+    counts["splits"] += report.splits_parsed
+    for severity, n in report.counts("severity").items():
+        counts[f"severity.{severity.value}"] += n
+    for kind, n in report.counts("kind").items():
+        counts[f"kind.{kind.value}"] += n
+    dates = [m.start_date.isoformat() for m in archive.meets if m.start_date is not None]
+    if dates:
+        outcome.first, outcome.last = min(dates), max(dates)
+
+
+def _run(
+    task: Callable[[_Input, _Options, _Outcome], None], options: _Options, item: _Input
+) -> _Outcome:
+    """Worker: run one command on one file, turning parse, decoding and I/O errors into data."""
+    outcome = _Outcome(item.source)
+    outcome.counts["files"] = 1
+    outcome.counts["bytes"] = item.size
+    try:
+        task(item, options, outcome)
+    except (ParseError, OSError, ValueError, zipfile.BadZipFile) as exc:
+        outcome.error, outcome.failed = str(exc), True
+    return outcome
+
+
+# -- commands (each fills one file's outcome) -------------------------------- #
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _parse_task(item: _Input, options: _Options, outcome: _Outcome) -> None:
+    archive = _parse(item, options)
+    _tally(outcome, archive)
+    report = archive.report
+    row = {
+        "source": item.source,
+        "format": item.fmt,
+        "meets": report.meets_parsed,
+        "swimmers": report.swimmers_parsed,
+        "swims": report.individual_swims_parsed,
+        "relays": report.relays_parsed,
+        "splits": report.splits_parsed,
+        "warnings": report.warning_count,
+        "records_skipped": report.records_skipped,
+        "fields_recovered": report.fields_recovered,
+    }
+    outcome.rows.append(_dumps(row))
+
+
+def _scan_task(item: _Input, options: _Options, outcome: _Outcome) -> None:
+    with _binary(item) as fh:
+        index = scan(fh, LAYOUTS[item.fmt], encoding=options.encoding, errors=options.errors)
+    if options.index and item.member is None:
+        write_sidecar(item.path, index, item.fmt)
+    outcome.counts["meets"] += len(index.meets)
+    for meet in index.meets:
+        blocks = meet.blocks.values()
+        swimmers = {member for block in blocks for member in block.swimmers}
+        outcome.counts["clubs"] += len(meet.blocks)
+        outcome.counts["swimmers"] += len(swimmers)
+        row = {
+            "source": item.source,
+            "meet": meet.name,
+            "start_date": meet.start_date.isoformat() if meet.start_date else None,
+            "clubs": sum(1 for code in meet.blocks if code is not None),
+            "swimmers": len(swimmers),
+            "lines": meet.header.lines + sum(s.lines for b in blocks for s in b.spans),
+        }
+        outcome.rows.append(_dumps(row))
+
+
+def _validate_task(item: _Input, options: _Options, outcome: _Outcome) -> None:
+    linter: Linter
+    if item.fmt == "cl2":
+        linter = Cl2Linter(max_warnings=options.max_warnings)
+    else:
+        linter = Hy3Linter(
+            max_warnings=options.max_warnings,
+            verify_checksums=options.verify_checksums,
+            encoding=options.encoding,
+        )
+    with _text(item, options) as fh:
+        report = linter.lint(fh, item.source)
+    fatal = report.count(severity=Severity.FATAL)
+    outcome.failed = fatal > 0
+    for severity, n in report.counts("severity").items():
+        outcome.counts[f"severity.{severity.value}"] += n
+    kinds = {kind.value: n for kind, n in report.counts("kind").items()}
+    for kind, n in kinds.items():
+        outcome.counts[f"kind.{kind}"] += n
+    row = {
+        "source": item.source,
+        "valid": not outcome.failed,
+        "warnings": report.warning_count,
+        "fatal": fatal,
+        "kinds": kinds,
+    }
+    outcome.rows.append(_dumps(row))
+
+
+def _stats_task(item: _Input, options: _Options, outcome: _Outcome) -> None:
+    archive = _parse(item, options)
+    _tally(outcome, archive)
+    for meet in archive.meets:
+        software = meet.source_file.software_name if meet.source_file else None
+        outcome.counts[f"software.{software or 'unknown'}"] += 1
+
+
+def _export_task(item: _Input, options: _Options, outcome: _Outcome) -> None:
+    archive = _parse(item, options)
+    _tally(outcome, archive)
+    records = iter_records([archive], kinds=options.kinds, fields=options.fields)
+    if options.to == "jsonl":
+        outcome.rows.extend(_dumps(record) for record in records)
+        return
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for record in records:
+        writer.writerow([_cell(value) for value in record.values()])
+    outcome.rows.extend(buffer.getvalue().splitlines())
+
+
+def _cell(value: Any) -> Any:
+    """A CSV cell: nested values (splits, relay legs) as JSON, None as empty."""
+    if isinstance(value, list | dict):
+        return _dumps(value)
+    return "" if value is None else value
+
+
+def _csv_header(kinds: tuple[str, ...], fields: tuple[str, ...] | None) -> str:
+    (kind,) = kinds
+    names = FIELDS[kind] if fields is None else [f for f in fields if f in FIELDS[kind]]
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="").writerow(["v", "kind", *names])
+    return buffer.getvalue()
+
+
+_TASKS: dict[str, Callable[[_Input, _Options, _Outcome], None]] = {
+    "parse": _parse_task,
+    "scan": _scan_task,
+    "validate": _validate_task,
+    "stats": _stats_task,
+    "export": _export_task,
+}
+
+
+# -- driver ------------------------------------------------------------------ #
+
+
+def _outcomes(
+    command: str, items: list[_Input], options: _Options, jobs: int
+) -> Iterator[_Outcome]:
+    """Each file's outcome, in input order, as soon as it and those before it finish."""
+    work = partial(_run, _TASKS[command], options)
+    if jobs == 1 or len(items) < 2:
+        yield from map(work, items)
+        return
+    with ProcessPoolExecutor(min(jobs, len(items))) as pool:
+        yield from pool.map(work, items)
+
+
+def _stats(totals: Counter[str], first: str | None, last: str | None) -> dict[str, Any]:
+    """The ``stats`` document: totals, then warnings and software by name."""
+
+    def group(prefix: str) -> dict[str, int]:
+        items = ((k.removeprefix(prefix), n) for k, n in totals.items() if k.startswith(prefix))
+        return dict(sorted(items, key=lambda item: (-item[1], item[0])))
+
+    plain = ("files", "bytes", "meets", "clubs", "swimmers", "swims", "relays", "splits")
+    return {
+        **{name: totals[name] for name in plain},
+        "failed": totals["failed"],
+        "first_meet": first,
+        "last_meet": last,
+        "warnings": group("severity."),
+        "kinds": group("kind."),
+        "software": group("software."),
+    }
+
+
+def _summary(command: str, totals: Counter[str], seconds: float) -> str:
+    megabytes = totals["bytes"] / 1e6
+    parts = [
+        f"tunas {command}: {totals['files']:,} files, {megabytes:,.1f} MB in {seconds:.2f} s "
+        f"({megabytes / seconds if seconds else 0.0:,.1f} MB/s)"
+    ]
+    if command == "scan":
+        parts.append(f"{totals['meets']:,} meets, {totals['clubs']:,} clubs")
+    elif command != "validate":
+        parts.append(
+            f"{totals['meets']:,} meets, {totals['swims']:,} swims, {totals['relays']:,} relays"
+        )
+    severities = {k.removeprefix("severity."): n for k, n in totals.items() if "severity." in k}
+    if command != "scan":
+        detail = ", ".join(f"{n:,} {name}" for name, n in sorted(severities.items()))
+        parts.append(f"{sum(severities.values()):,} warnings" + (f" ({detail})" if detail else ""))
+    if totals["failed"]:
+        noun = "invalid" if command == "validate" else "failed"
+        parts.append(f"{totals['failed']:,} {noun}")
+    return "; ".join(parts)
+
+
+def _non_negative(text: str) -> int:
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {value}")
+    return value
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="tunas", description="Bulk-process USA Swimming .cl2 / Hy-Tek .hy3 result files."
+    )
+    commands = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("paths", nargs="+", metavar="PATH", help="files, directories or .zip")
+    common.add_argument("--format", choices=sorted(_ENGINES), help="only (or force) this format")
+    common.add_argument(
+        "-j", "--jobs", type=_non_negative, default=1, help="worker processes (0: one per CPU)"
+    )
+    common.add_argument("-o", "--output", type=Path, help="write rows here (default: stdout)")
+    common.add_argument("-q", "--quiet", action="store_true", help="no summary on stderr")
+    common.add_argument("--encoding", default="cp1252", help="text encoding (cp1252)")
+    common.add_argument("--errors", default="replace", help="decoding error handler (replace)")
+
+    reading = argparse.ArgumentParser(add_help=False)
+    reading.add_argument(
+        "--max-warnings", type=_non_negative, help="full warnings kept per (record, field, kind)"
+    )
+    reading.add_argument(
+        "--verify-checksums", action="store_true", help="check .hy3 line checksums"
+    )
+    parsing = argparse.ArgumentParser(add_help=False)
+    parsing.add_argument("--strict", action="store_true", help="fail a file on any warning")
+
+    both = [common, reading, parsing]
+    commands.add_parser("parse", parents=both, help="parse files, one summary row per file")
+    scan_cmd = commands.add_parser("scan", parents=[common], help="list meets without parsing")
+    scan_cmd.add_argument("--index", action="store_true", help="also write .idx.json sidecars")
+    commands.add_parser(
+        "validate", parents=[common, reading], help="structural checks, one row per file"
+    )
+    commands.add_parser("stats", parents=both, help="corpus totals as one JSON object")
+    export = commands.add_parser("export", parents=both, help="swims/relays/meets as rows")
+    export.add_argument("--to", choices=("jsonl", "csv"), default="jsonl", help="row format")
+    export.add_argument(
+        "--kinds", default="swim,relay", help="comma-separated kinds: meet, swim, relay"
+    )
+    export.add_argument("--fields", help="comma-separated fields to keep (default: all)")
+    return parser
+
+
+def _options(args: argparse.Namespace) -> _Options:
+    """Check the command's options against each other and bundle them for workers."""
+    kinds = tuple(getattr(args, "kinds", "swim,relay").split(","))
+    fields = tuple(args.fields.split(",")) if getattr(args, "fields", None) else None
+    if args.command == "export":
+        unknown = [kind for kind in kinds if kind not in KINDS]
+        if unknown:
+            raise ValueError(f"unknown record kind(s): {', '.join(unknown)}")
+        if args.to == "csv" and len(kinds) != 1:
+            raise ValueError("--to csv needs exactly one of --kinds meet, swim or relay")
+        iter_records([], kinds=kinds, fields=fields)  # validates the field names
+    return _Options(
+        encoding=args.encoding,
+        errors=args.errors,
+        strict=getattr(args, "strict", False),
+        max_warnings=getattr(args, "max_warnings", None),
+        verify_checksums=getattr(args, "verify_checksums", False),
+        index=getattr(args, "index", False),
+        kinds=kinds,
+        fields=fields,
+        to=getattr(args, "to", "jsonl"),
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the ``tunas`` command line; return the process exit status."""
+    parser = _parser()
+    args = parser.parse_args(argv)
+    try:
+        options = _options(args)
+        items = _inputs(args.paths, args.format)
+    except (ValueError, OSError, zipfile.BadZipFile) as exc:
+        parser.error(str(exc))
+    jobs = args.jobs or os.cpu_count() or 1
+
+    out: TextIO = sys.stdout
+    if args.output is not None:
+        out = open(args.output, "w", encoding="utf-8", newline="")  # noqa: SIM115
+    totals: Counter[str] = Counter()
+    first: str | None = None
+    last: str | None = None
+    started = time.perf_counter()
+    try:
+        if args.command == "export" and options.to == "csv":
+            out.write(_csv_header(options.kinds, options.fields) + "\n")
+        for outcome in _outcomes(args.command, items, options, jobs):
+            totals += outcome.counts
+            totals["failed"] += outcome.failed
+            if outcome.first is not None and outcome.last is not None:
+                first = outcome.first if first is None else min(first, outcome.first)
+                last = outcome.last if last is None else max(last, outcome.last)
+            for row in outcome.rows:
+                out.write(row + "\n")
+            if outcome.error is not None:
+                print(f"tunas {args.command}: {outcome.source}: {outcome.error}", file=sys.stderr)
+                if args.command in ("parse", "validate", "scan"):
+                    out.write(_dumps({"source": outcome.source, "error": outcome.error}) + "\n")
+        if args.command == "stats":
+            out.write(json.dumps(_stats(totals, first, last), indent=2) + "\n")
+        out.flush()
+    except BrokenPipeError:  # e.g. piped into `head`: stop quietly
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if not args.quiet:
+        print(_summary(args.command, totals, time.perf_counter() - started), file=sys.stderr)
+    return 1 if totals["failed"] else 0
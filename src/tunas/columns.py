@@ -0,0 +1,378 @@
+"""Columnar (struct-of-arrays) export of meet results and parse warnings.
+
+A :class:`ResultTable` holds one row per result (individual swim or relay) as a set of
+stdlib :class:`array.array` columns: times and dates as int32, enums as small integer
+codes, and strings dictionary-encoded as int32 codes into a per-table value list. It
+is built in one pass — from a :class:`~tunas.models.Meet` via
+:meth:`Meet.to_columns() <tunas.models.Meet.to_columns>` or from a stream of archives
+via :func:`to_columns` — and hands its buffers to NumPy without copying when NumPy is
+installed (:meth:`ResultTable.to_numpy`).
+
+A :class:`WarningTable` does the same for parse diagnostics (:func:`warnings_to_columns`),
+one row per warning tagged with the generating software of its file, so defects can be
+counted per software product across a corpus.
+
+Missing values are :data:`NULL` (``-1``) in integer columns and NaN in ``points``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import math
+from array import array
+from collections.abc import Iterable
+from enum import Enum
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from tunas._corpus import swim_age
+from tunas._parser.diagnostics import IssueKind, ParseReport, Severity
+from tunas.athletes import athlete_key
+from tunas.enums import Course, ResultStatus, Session, Sex, Stroke
+from tunas.event import Event
+from tunas.geography import LSC
+from tunas.models import IndividualSwim, Meet, Relay
+from tunas.time import Time
+
+if TYPE_CHECKING:
+    from tunas.parser import MeetArchive
+
+__all__ = [
+    "NULL",
+    "COLUMNS",
+    "ResultTable",
+    "to_columns",
+    "WARNING_COLUMNS",
+    "WarningTable",
+    "warnings_to_columns",
+]
+
+NULL = -1
+
+# Enum-coded columns: the code is the member's position in its enum, so codes are
+# stable across tables built by the same tunas version.
+_ENUMS: dict[str, type[Enum]] = {
+    "event": Event,
+    "stroke": Stroke,
+    "course": Course,
+    "session": Session,
+    "status": ResultStatus,
+    "event_sex": Sex,
+    "sex": Sex,
+    "lsc": LSC,
+}
+# Dictionary-encoded string columns (int32 codes into ResultTable.dictionaries).
+_STRINGS = ("source", "meet", "swimmer_id", "swimmer", "club", "relay_letter")
+
+# name -> array typecode, in column order.
+COLUMNS: dict[str, str] = {
+    "source": "i",
+    "meet": "i",
+    "relay": "b",  # 1 for a relay row, 0 for an individual swim
+    "event": "h",
+    "distance": "h",
+    "stroke": "b",
+    "course": "b",
+    "session": "b",
+    "status": "b",
+    "event_sex": "b",
+    "time": "i",  # centiseconds
+    "seed_time": "i",  # centiseconds
+    "date": "i",  # proleptic Gregorian ordinal (datetime.date.toordinal)
+    "swimmer_id": "i",  # athlete_key; NULL for relays and unidentified swimmers
+    "swimmer": "i",  # full name; NULL for relays
+    "sex": "b",  # swimmer's sex; NULL for relays
+    "age": "b",  # swimmer's age for the swim; NULL for relays or if unknown
+    "club": "i",  # team code
+    "lsc": "h",  # club's LSC
+    "relay_letter": "i",
+    "heat": "h",
+    "lane": "h",
+    "rank": "h",
+    "points": "d",
+}
+
+# Warning-table columns: name -> array typecode, in column order.
+WARNING_COLUMNS: dict[str, str] = {
+    "source": "i",
+    "software": "i",  # SourceFile.software_name of the warning's file
+    "software_version": "i",
+    "line_no": "i",  # NULL on rows tallying suppressed warnings
+    "record_type": "i",
+    "field": "i",
+    "kind": "b",
+    "severity": "b",
+    "count": "i",  # 1, or the number of suppressed warnings a tally row stands for
+}
+_WARNING_ENUMS: dict[str, type[Enum]] = {"kind": IssueKind, "severity": Severity}
+_WARNING_STRINGS = ("source", "software", "software_version", "record_type", "field")
+
+_ENUM_CODES: dict[type[Enum], dict[Enum, int]] = {
+    enum: {member: code for code, member in enumerate(enum)}
+    for enum in {*_ENUMS.values(), *_WARNING_ENUMS.values()}
+}
+
+
+class _Table:
+    """Shared storage for the column tables: typed arrays plus per-column dictionaries."""
+
+    __slots__ = ("columns", "dictionaries", "_lookup")
+
+    _SCHEMA: ClassVar[dict[str, str]]
+    _ENUM_COLUMNS: ClassVar[dict[str, type[Enum]]]
+    _STRING_COLUMNS: ClassVar[tuple[str, ...]]
+
+    def __init__(self) -> None:
+        self.columns: dict[str, array[Any]] = {
+            name: array(typecode) for name, typecode in self._SCHEMA.items()
+        }
+        self.dictionaries: dict[str, list[Any]] = {
+            name: list(e) for name, e in self._ENUM_COLUMNS.items()
+        }
+        self.dictionaries.update({name: [] for name in self._STRING_COLUMNS})
+        self._lookup: dict[str, dict[str, int]] = {name: {} for name in self._STRING_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)}, columns={len(self.columns)})"
+
+    def _truncate(self, rows: int) -> None:
+        """Drop rows past ``rows``, undoing a partly appended batch."""
+        for values in self.columns.values():
+            if len(values) > rows:
+                del values[rows:]
+
+    def _encode(self, column: str, value: str | None) -> int:
+        if value is None:
+            return NULL
+        lookup = self._lookup[column]
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(lookup)
+            self.dictionaries[column].append(value)
+        return code
+
+    def decode(self, column: str) -> list[Any]:
+        """A column as Python values: codes resolved via :attr:`dictionaries`, NULL as None."""
+        values = self.columns[column]
+        dictionary = self.dictionaries.get(column)
+        if dictionary is not None:
+            return [dictionary[v] if v != NULL else None for v in values]
+        if values.typecode == "d":
+            return [None if math.isnan(v) else v for v in values]
+        return [v if v != NULL else None for v in values]
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Zero-copy NumPy views of every column (``numpy.frombuffer``).
+
+        The views share memory with the arrays; while any is alive the table cannot
+        grow.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        try:
+            np = importlib.import_module("numpy")
+        except ImportError as exc:
+            raise ImportError(f"{type(self).__name__}.to_numpy() requires numpy") from exc
+        return {
+            name: np.frombuffer(values, dtype=values.typecode)
+            for name, values in self.columns.items()
+        }
+
+
+class ResultTable(_Table):
+    """Meet results as struct-of-arrays columns (see :data:`COLUMNS` for the schema).
+
+    Attributes:
+        columns: Column name -> :class:`array.array`, all the same length.
+        dictionaries: For each coded column, the values its codes index: enum members
+            for enum columns, strings (in first-seen order) for string columns.
+    """
+
+    __slots__ = ()
+
+    _SCHEMA = COLUMNS
+    _ENUM_COLUMNS = _ENUMS
+    _STRING_COLUMNS = _STRINGS
+
+    # -- building ---------------------------------------------------------- #
+
+    def add(self, archive: MeetArchive) -> None:
+        """Append every result in one archive."""
+        for meet in archive.meets:
+            self.add_meet(meet, source=archive.source)
+
+    def add_meet(self, meet: Meet, *, source: str | None = None) -> None:
+        """Append one row per result in ``meet``; on error, none of the meet's rows.
+
+        Raises:
+            BufferError: If a :meth:`to_numpy` view of this table is still alive
+                (arrays with exported buffers cannot grow).
+            OverflowError: If a value does not fit its column's type.
+        """
+        rows = len(self)
+        try:
+            self._add_results(meet, source)
+        except BaseException:
+            self._truncate(rows)
+            raise
+
+    def _add_results(self, meet: Meet, source: str | None) -> None:
+        col = self.columns
+        source_code = self._encode("source", source)
+        meet_code = self._encode("meet", meet.name)
+        for result in meet.results:
+            event = result.event
+            club = result.club
+            col["source"].append(source_code)
+            col["meet"].append(meet_code)
+            col["event"].append(_code(event))
+            col["distance"].append(event.distance)
+            col["stroke"].append(_code(event.stroke))
+            col["course"].append(_code(event.course))
+            col["session"].append(_code(result.session))
+            col["status"].append(_code(result.status))
+            col["event_sex"].append(_code(result.event_sex))
+            col["time"].append(_centis(result.time))
+            col["seed_time"].append(_centis(result.seed_time))
+            col["date"].append(result.date.toordinal() if result.date else NULL)
+            col["club"].append(self._encode("club", club.team_code if club else None))
+            col["lsc"].append(_code(club.lsc if club else None))
+            col["heat"].append(_int(result.heat))
+            col["lane"].append(_int(result.lane))
+            col["rank"].append(_int(result.rank))
+            col["points"].append(result.points if result.points is not None else math.nan)
+            if isinstance(result, IndividualSwim):
+                swimmer = result.swimmer
+                age = swim_age(result)
+                col["relay"].append(0)
+                col["swimmer_id"].append(self._encode("swimmer_id", athlete_key(swimmer)))
+                col["swimmer"].append(self._encode("swimmer", swimmer.full_name))
+                col["sex"].append(_code(swimmer.sex))
+                col["age"].append(age if age is not None and 0 <= age <= 127 else NULL)
+                col["relay_letter"].append(NULL)
+            else:
+                col["relay"].append(1)
+                col["swimmer_id"].append(NULL)
+                col["swimmer"].append(NULL)
+                col["sex"].append(NULL)
+                col["age"].append(NULL)
+                letter = result.relay_letter if isinstance(result, Relay) else None
+                col["relay_letter"].append(self._encode("relay_letter", letter))
+
+
+def to_columns(archives: Iterable[MeetArchive]) -> ResultTable:
+    """Build one :class:`ResultTable` from a stream of archives (e.g. a reader's iterator)."""
+    table = ResultTable()
+    for archive in archives:
+        table.add(archive)
+    return table
+
+
+class WarningTable(_Table):
+    """Parse warnings as struct-of-arrays columns (see :data:`WARNING_COLUMNS`).
+
+    Each kept warning is one row with ``count`` 1. Warnings suppressed by
+    ``max_warnings`` add one row per tally and severity, with ``line_no`` NULL and
+    their number in ``count``, so summing ``count`` gives exact totals.
+
+    Attributes:
+        columns: Column name -> :class:`array.array`, all the same length.
+        dictionaries: For each coded column, the values its codes index.
+    """
+
+    __slots__ = ()
+
+    _SCHEMA = WARNING_COLUMNS
+    _ENUM_COLUMNS = _WARNING_ENUMS
+    _STRING_COLUMNS = _WARNING_STRINGS
+
+    def add(self, archive: MeetArchive) -> None:
+        """Append one archive's warnings, tagged with its file's generating software."""
+        source_file = next((m.source_file for m in archive.meets if m.source_file), None)
+        self.add_report(
+            archive.report,
+            source=archive.source,
+            software=source_file.software_name if source_file else None,
+            software_version=source_file.software_version if source_file else None,
+        )
+
+    def add_report(
+        self,
+        report: ParseReport,
+        *,
+        source: str | None = None,
+        software: str | None = None,
+        software_version: str | None = None,
+    ) -> None:
+        """Append a report's warnings and suppressed tallies.
+
+        Args:
+            report: The report to export.
+            source: Source for the tally rows (kept warnings carry their own).
+            software: Generating software name for every row.
+            software_version: Generating software version for every row.
+
+        Raises:
+            BufferError: If a :meth:`to_numpy` view of this table is still alive.
+        """
+        col = self.columns
+        software_code = self._encode("software", software)
+        version_code = self._encode("software_version", software_version)
+        rows: list[tuple[str | None, int, str | None, str | None, IssueKind, Severity, int]]
+        rows = [
+            (w.source, w.line_no, w.record_type, w.field, w.kind, w.severity, 1)
+            for w in report.warnings
+        ]
+        rows += [
+            (source, NULL, t.record_type, t.field, t.kind, severity, n)
+            for t in report.suppressed.values()
+            for severity, n in t.by_severity.items()
+        ]
+        for row_source, line_no, record_type, field, kind, severity, count in rows:
+            col["source"].append(self._encode("source", row_source))
+            col["software"].append(software_code)
+            col["software_version"].append(version_code)
+            col["line_no"].append(line_no)
+            col["record_type"].append(self._encode("record_type", record_type))
+            col["field"].append(self._encode("field", field))
+            col["kind"].append(_code(kind))
+            col["severity"].append(_code(severity))
+            col["count"].append(count)
+
+    def totals(self, *columns: str) -> dict[tuple[Any, ...], int]:
+        """Summed ``count`` per distinct combination of ``columns`` (decoded values).
+
+        ``table.totals("software", "kind")`` answers which software produces which
+        defects, and how often.
+
+        Raises:
+            KeyError: If a column is not in :data:`WARNING_COLUMNS`.
+        """
+        decoded = [self.decode(name) for name in columns]
+        out: dict[tuple[Any, ...], int] = {}
+        for key, count in zip(zip(*decoded, strict=True), self.columns["count"], strict=True):
+            out[key] = out.get(key, 0) + count
+        return out
+
+
+def warnings_to_columns(archives: Iterable[MeetArchive]) -> WarningTable:
+    """Build one :class:`WarningTable` from a stream of archives."""
+    table = WarningTable()
+    for archive in archives:
+        table.add(archive)
+    return table
+
+
+def _code(member: Enum | None) -> int:
+    return _ENUM_CODES[type(member)][member] if member is not None else NULL
+
+
+def _centis(time: Time | None) -> int:
+    return time.centiseconds if time is not None else NULL
+
+
+def _int(value: int | None) -> int:
+    return value if value is not None else NULL
@@ -0,0 +1,482 @@
+"""Compact struct-of-arrays storage for a meet's individual swims.
+
+An :class:`~tunas.models.IndividualSwim` is a slotted object of some thirty fields,
+most of them ``None``, plus a list of :class:`~tunas.models.Split` objects that each
+carry their own :class:`~tunas.time.Time`. :func:`compact` moves every individual
+swim of a meet into one :class:`SwimStore` — parallel :class:`array.array` columns
+(times and dates as int32, enums as small codes, strings and swimmers/clubs as
+int32 references into per-store tables), sparse side tables for the Hy-Tek-only
+fields that are almost always empty, and one flat run of split columns — and puts a
+two-slot :class:`CompactSwim` view in its place in ``meet.results``, each club's
+``results`` and each swimmer's ``swims``.
+
+Views are registered as virtual subclasses of ``IndividualSwim``, so
+``isinstance`` checks, the ``Meet``/``Club``/``Swimmer`` accessors and every exporter
+keep working. They are read-only: fields are decoded from the columns on access,
+and ``splits`` builds a fresh list each time. Relays are left as they are.
+"""
+
+from __future__ import annotations
+
+import datetime
+import math
+from array import array
+from collections.abc import Hashable, Sequence
+from enum import Enum
+from typing import Any, cast
+
+from tunas.enums import (
+    AttachStatus,
+    Course,
+    EventTimeClass,
+    Organization,
+    ResultStatus,
+    Session,
+    Sex,
+    SplitType,
+)
+from tunas.event import Event
+from tunas.models import Club, IndividualSwim, Meet, Split, Swim, Swimmer
+from tunas.time import Time
+
+__all__ = ["NULL", "SwimStore", "CompactSwim", "compact"]
+
+NULL = -1
+
+# Code = position in the enum, as in :mod:`tunas.columns`.
+_MEMBERS: dict[type[Enum], tuple[Any, ...]] = {
+    enum: tuple(enum)
+    for enum in (
+        AttachStatus,
+        Course,
+        Event,
+        EventTimeClass,
+        Organization,
+        ResultStatus,
+        Session,
+        Sex,
+        SplitType,
+    )
+}
+_CODES: dict[type[Enum], dict[Any, int]] = {
+    enum: {member: code for code, member in enumerate(members)}
+    for enum, members in _MEMBERS.items()
+}
+
+# Fields kept in per-row dicts: set on a small minority of swims (mostly `.hy3`).
+_SPARSE = ("dq_code", "dq_reason", "converted_seed_time", "converted_seed_course", "backup_times")
+
+
+class SwimStore:
+    """Parallel columns holding the individual swims of one meet.
+
+    Rows are appended in the meet's result order by :func:`compact`; a
+    :class:`CompactSwim` reads row ``i`` back. Integer columns use :data:`NULL` for a
+    missing value, ``points`` uses NaN.
+
+    Attributes:
+        meet: The meet the swims belong to.
+        swimmers: Swimmer table indexed by the ``swimmer`` column.
+        clubs: Club table indexed by the ``club`` column.
+        strings: String table indexed by ``event_number`` and ``swimmer_age_class``.
+    """
+
+    __slots__ = (
+        "meet",
+        "swimmers",
+        "clubs",
+        "strings",
+        "_refs",
+        "swimmer",
+        "club",
+        "organization",
+        "session",
+        "event",
+        "event_min_age",
+        "event_max_age",
+        "event_sex",
+        "status",
+        "time",
+        "date",
+        "event_number",
+        "heat",
+        "lane",
+        "rank",
+        "points",
+        "seed_time",
+        "seed_course",
+        "event_min_time_class",
+        "event_max_time_class",
+        "swimmer_age_class",
+        "attach_status",
+        "sparse",
+        "split_start",
+        "split_distance",
+        "split_time",
+        "split_type",
+    )
+
+    def __init__(self, meet: Meet) -> None:
+        self.meet = meet
+        self.swimmers: list[Swimmer] = []
+        self.clubs: list[Club] = []
+        self.strings: list[str] = []
+        self._refs: dict[Hashable, int] = {}
+        self.swimmer = array("i")
+        self.club = array("i")
+        self.organization = array("b")
+        self.session = array("b")
+        self.event = array("h")
+        self.event_min_age = array("h")
+        self.event_max_age = array("h")
+        self.event_sex = array("b")
+        self.status = array("b")
+        self.time = array("i")  # centiseconds
+        self.date = array("i")  # proleptic Gregorian ordinal
+        self.event_number = array("i")
+        self.heat = array("h")
+        self.lane = array("h")
+        self.rank = array("i")
+        self.points = array("d")
+        self.seed_time = array("i")
+        self.seed_course = array("b")
+        self.event_min_time_class = array("b")
+        self.event_max_time_class = array("b")
+        self.swimmer_age_class = array("i")
+        self.attach_status = array("b")
+        self.sparse: dict[str, dict[int, Any]] = {name: {} for name in _SPARSE}
+        # Row i's splits are split_*[split_start[i]:split_start[i + 1]].
+        self.split_start = array("i", [0])
+        self.split_distance = array("i")
+        self.split_time = array("i")
+        self.split_type = array("b")
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __repr__(self) -> str:
+        return f"SwimStore(meet={self.meet.name!r}, rows={len(self)})"
+
+    # -- building ---------------------------------------------------------- #
+
+    def append(self, swim: IndividualSwim) -> int:
+        """Store one swim as a new row and return the row index.
+
+        Raises:
+            OverflowError: If a numeric field does not fit its column.
+        """
+        row = len(self)
+        self.swimmer.append(self._ref(swim.swimmer, self.swimmers))
+        self.club.append(self._ref(swim.club, self.clubs))
+        self.organization.append(_code(swim.organization))
+        self.session.append(_code(swim.session))
+        self.event.append(_code(swim.event))
+        self.event_min_age.append(_int(swim.event_min_age))
+        self.event_max_age.append(_int(swim.event_max_age))
+        self.event_sex.append(_code(swim.event_sex))
+        self.status.append(_code(swim.status))
+        self.time.append(_centis(swim.time))
+        self.date.append(swim.date.toordinal() if swim.date is not None else NULL)
+        self.event_number.append(self._ref(swim.event_number, self.strings))
+        self.heat.append(_int(swim.heat))
+        self.lane.append(_int(swim.lane))
+        self.rank.append(_int(swim.rank))
+        self.points.append(swim.points if swim.points is not None else math.nan)
+        self.seed_time.append(_centis(swim.seed_time))
+        self.seed_course.append(_code(swim.seed_course))
+        self.event_min_time_class.append(_code(swim.event_min_time_class))
+        self.event_max_time_class.append(_code(swim.event_max_time_class))
+        self.swimmer_age_class.append(self._ref(swim.swimmer_age_class, self.strings))
+        self.attach_status.append(_code(swim.attach_status))
+        for name in _SPARSE:
+            value = getattr(swim, name)
+            if value:
+                self.sparse[name][row] = value
+        for split in swim.splits:
+            self.split_distance.append(split.distance)
+            self.split_time.append(_centis(split.time))
+            self.split_type.append(_code(split.split_type))
+        self.split_start.append(len(self.split_time))
+        return row
+
+    def _ref[V: Hashable](self, value: V | None, table: list[V]) -> int:
+        """Index of ``value`` in ``table`` (appending it on first sight), or NULL."""
+        if value is None:
+            return NULL
+        code = self._refs.get(value)
+        if code is None:
+            code = self._refs[value] = len(table)
+            table.append(value)
+        return code
+
+    # -- access ------------------------------------------------------------ #
+
+    def splits(self, row: int) -> tuple[Split, ...]:
+        """Row ``row``'s splits as new :class:`~tunas.models.Split` objects."""
+        members = _MEMBERS[SplitType]
+        return tuple(
+            Split(
+                distance=self.split_distance[i],
+                time=_time(self.split_time[i]),
+                split_type=members[self.split_type[i]],
+            )
+            for i in range(self.split_start[row], self.split_start[row + 1])
+        )
+
+
+class CompactSwim(Swim):
+    """Read-only view of one :class:`SwimStore` row, behaving like an ``IndividualSwim``.
+
+    Identity is the view: one view per row is shared by the meet, club and swimmer
+    lists, so ``is`` and identity equality behave as they did for the original.
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: SwimStore, row: int) -> None:
+        self._store = store
+        self._row = row
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactSwim(swimmer={self.swimmer.full_name!r}, "
+            f"event={self.event.name}, status={self.status.name}, time={self.time})"
+        )
+
+    def __str__(self) -> str:
+        return f"{self.swimmer.full_name} {self.event.name} {self.time}"
+
+    # -- IndividualSwim fields --------------------------------------------- #
+
+    @property
+    def meet(self) -> Meet:
+        """Meet this result belongs to."""
+        return self._store.meet
+
+    @property
+    def swimmer(self) -> Swimmer:
+        """Swimmer who produced this result."""
+        store = self._store
+        return store.swimmers[store.swimmer[self._row]]
+
+    @property
+    def club(self) -> Club | None:
+        """Club the swimmer represents."""
+        code = self._store.club[self._row]
+        return self._store.clubs[code] if code != NULL else None
+
+    @property
+    def organization(self) -> Organization | None:
+        """Governing body code."""
+        return _member(Organization, self._store.organization[self._row])
+
+    @property
+    def session(self) -> Session:
+        """Meet session."""
+        return _required(Session, self._store.session[self._row])
+
+    @property
+    def event(self) -> Event:
+        """The swum event."""
+        return _required(Event, self._store.event[self._row])
+
+    @property
+    def event_min_age(self) -> int | None:
+        """Minimum age restriction for the event."""
+        return _opt(self._store.event_min_age[self._row])
+
+    @property
+    def event_max_age(self) -> int | None:
+        """Maximum age restriction for the event."""
+        return _opt(self._store.event_max_age[self._row])
+
+    @property
+    def event_sex(self) -> Sex:
+        """Sex category for the event."""
+        return _required(Sex, self._store.event_sex[self._row])
+
+    @property
+    def status(self) -> ResultStatus:
+        """The result status."""
+        return _required(ResultStatus, self._store.status[self._row])
+
+    @property
+    def time(self) -> Time | None:
+        """The final swim time."""
+        return _time(self._store.time[self._row])
+
+    @property
+    def date(self) -> datetime.date | None:
+        """Date the event was swum."""
+        ordinal = self._store.date[self._row]
+        return datetime.date.fromordinal(ordinal) if ordinal != NULL else None
+
+    @property
+    def event_number(self) -> str | None:
+        """Coded event number."""
+        return self._string(self._store.event_number[self._row])
+
+    @property
+    def heat(self) -> int | None:
+        """Swum heat number."""
+        return _opt(self._store.heat[self._row])
+
+    @property
+    def lane(self) -> int | None:
+        """Swum lane number."""
+        return _opt(self._store.lane[self._row])
+
+    @property
+    def rank(self) -> int | None:
+        """Official place finish."""
+        return _opt(self._store.rank[self._row])
+
+    @property
+    def points(self) -> float | None:
+        """Scored points."""
+        points = self._store.points[self._row]
+        return None if math.isnan(points) else points
+
+    @property
+    def seed_time(self) -> Time | None:
+        """Entry/seed time."""
+        return _time(self._store.seed_time[self._row])
+
+    @property
+    def seed_course(self) -> Course | None:
+        """Entry/seed course."""
+        return _member(Course, self._store.seed_course[self._row])
+
+    @property
+    def event_min_time_class(self) -> EventTimeClass | None:
+        """Minimum entry time class required."""
+        return _member(EventTimeClass, self._store.event_min_time_class[self._row])
+
+    @property
+    def event_max_time_class(self) -> EventTimeClass | None:
+        """Maximum entry time class."""
+        return _member(EventTimeClass, self._store.event_max_time_class[self._row])
+
+    @property
+    def dq_code(self) -> str | None:
+        """2-character Hy-Tek DQ code."""
+        return self._store.sparse["dq_code"].get(self._row)
+
+    @property
+    def dq_reason(self) -> str | None:
+        """Human-readable DQ description."""
+        return self._store.sparse["dq_reason"].get(self._row)
+
+    @property
+    def converted_seed_time(self) -> Time | None:
+        """Seed time converted to the meet's course (Hy-Tek only)."""
+        return self._store.sparse["converted_seed_time"].get(self._row)
+
+    @property
+    def converted_seed_course(self) -> Course | None:
+        """Seed course converted to the meet's course (Hy-Tek only)."""
+        return self._store.sparse["converted_seed_course"].get(self._row)
+
+    @property
+    def backup_times(self) -> tuple[Time, ...]:
+        """Watch or manual backup times (Hy-Tek only)."""
+        return self._store.sparse["backup_times"].get(self._row, ())  # type: ignore[no-any-return]
+
+    @property
+    def swimmer_age_class(self) -> str | None:
+        """Coded age class at the time of the swim."""
+        return self._string(self._store.swimmer_age_class[self._row])
+
+    @property
+    def attach_status(self) -> AttachStatus:
+        """Attached or unattached status."""
+        return _required(AttachStatus, self._store.attach_status[self._row])
+
+    @property
+    def splits(self) -> tuple[Split, ...]:
+        """Cumulative splits, read-only (a tuple, like every field of the view)."""
+        return self._store.splits(self._row)
+
+    @property
+    def is_relay_leg(self) -> bool:
+        """Always False."""
+        return False
+
+    @property
+    def course(self) -> Course | None:
+        """Swim course (derived from the event)."""
+        return self.event.course
+
+    def _string(self, code: int) -> str | None:
+        return self._store.strings[code] if code != NULL else None
+
+
+# Virtual subclass of IndividualSwim, and so also of MeetResult and Swim.
+IndividualSwim.register(CompactSwim)
+
+
+def compact(meet: Meet) -> SwimStore:
+    """Move ``meet``'s individual swims into a :class:`SwimStore`, in place.
+
+    Each ``IndividualSwim`` in ``meet.results``, its club's ``results`` and its
+    swimmer's ``swims`` is replaced, at the same position, by one shared
+    :class:`CompactSwim` view. Views already in the meet are left alone, so
+    compacting twice only stores swims added since.
+
+    Returns:
+        The store now backing the meet's swims.
+
+    Raises:
+        OverflowError: If a numeric field does not fit its column; the meet is
+            unchanged.
+    """
+    store = SwimStore(meet)
+    views: dict[int, CompactSwim] = {}
+    for result in meet.results:
+        if type(result) is IndividualSwim:
+            views[id(result)] = CompactSwim(store, store.append(result))
+    if not views:
+        return store
+    _swap(meet.results, views)
+    for club in meet.clubs:
+        _swap(club.results, views)
+    for swimmer in meet.swimmers:
+        _swap(swimmer.swims, views)
+    return store
+
+
+def _swap(items: Sequence[Any], views: dict[int, CompactSwim]) -> None:
+    target = cast(list[Any], items)
+    for i, item in enumerate(target):
+        view = views.get(id(item))
+        if view is not None:
+            target[i] = view
+
+
+def _member[E: Enum](enum: type[E], code: int) -> E | None:
+    return _MEMBERS[enum][code] if code != NULL else None
+
+
+def _required[E: Enum](enum: type[E], code: int) -> E:
+    member: E = _MEMBERS[enum][code]
+    return member
+
+
+def _code(member: Enum | None) -> int:
+    return _CODES[type(member)][member] if member is not None else NULL
+
+
+def _centis(time: Time | None) -> int:
+    return time.centiseconds if time is not None else NULL
+
+
+def _time(centis: int) -> Time | None:
+    return Time(centis) if centis != NULL else None
+
+
+def _int(value: int | None) -> int:
+    return value if value is not None else NULL
+
+
+def _opt(value: int) -> int | None:
+    return value if value != NULL else None
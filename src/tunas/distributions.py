@@ -0,0 +1,331 @@
+"""Streaming, mergeable time distributions (quantile sketches) per event, age group and sex.
+
+:class:`QuantileSketch` is a relative-error quantile sketch (DDSketch): times fall into
+logarithmic buckets, so any quantile is answered to within ``relative_accuracy`` of a
+time actually swum, memory depends on the spread of times rather than their number, and
+two sketches merge exactly by adding bucket counts. :class:`TimeDistributions` keeps one
+sketch per :class:`DistributionKey` while archives stream past; partial tables built in
+separate processes combine with :meth:`~TimeDistributions.merge`, and a table persists
+as JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from tunas._corpus import swim_age, timed_swims
+from tunas.enums import Sex
+from tunas.event import Event
+from tunas.models import Meet
+from tunas.standards import age_group
+from tunas.time import Time
+
+if TYPE_CHECKING:
+    from tunas.parser import MeetArchive
+
+__all__ = ["QuantileSketch", "DistributionKey", "TimeDistributions"]
+
+_FORMAT_VERSION = 1
+
+
+class QuantileSketch:
+    """A mergeable relative-error quantile sketch of swim times.
+
+    Args:
+        relative_accuracy: Bound on the relative error of any quantile (0 < a < 1).
+            The default 0.5% keeps a 20-second to 2-hour range in about 600 buckets.
+
+    Raises:
+        ValueError: If ``relative_accuracy`` is out of range.
+    """
+
+    __slots__ = ("relative_accuracy", "_log_gamma", "_bins", "_zeros", "count", "min", "max")
+
+    def __init__(self, relative_accuracy: float = 0.005) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be in (0, 1), got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self._log_gamma = math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self._bins: dict[int, int] = {}
+        self._zeros = 0  # 0.00 has no logarithm; counted exactly instead
+        self.count = 0
+        self.min: int | None = None
+        self.max: int | None = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return (
+            f"QuantileSketch(count={self.count}, buckets={len(self._bins)}, "
+            f"relative_accuracy={self.relative_accuracy})"
+        )
+
+    # -- building ---------------------------------------------------------- #
+
+    def add(self, time: Time | int, weight: int = 1) -> None:
+        """Record a time (a :class:`~tunas.time.Time` or centiseconds), ``weight`` times."""
+        centis = time.centiseconds if isinstance(time, Time) else time
+        if centis < 0:
+            raise ValueError(f"time must be non-negative, got {centis}")
+        if centis == 0:
+            self._zeros += weight
+        else:
+            index = math.ceil(math.log(centis) / self._log_gamma)
+            self._bins[index] = self._bins.get(index, 0) + weight
+        self.count += weight
+        self.min = centis if self.min is None else min(self.min, centis)
+        self.max = centis if self.max is None else max(self.max, centis)
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Fold another sketch into this one (exact: bucket counts add).
+
+        Raises:
+            ValueError: If the sketches use different relative accuracies.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                f"cannot merge sketches with relative accuracy {other.relative_accuracy} "
+                f"into {self.relative_accuracy}"
+            )
+        for index, n in other._bins.items():
+            self._bins[index] = self._bins.get(index, 0) + n
+        self._zeros += other._zeros
+        self.count += other.count
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    # -- queries ----------------------------------------------------------- #
+
+    def quantile(self, q: float) -> Time | None:
+        """The time at quantile ``q`` (0 = fastest, 1 = slowest), or None if empty.
+
+        Raises:
+            ValueError: If ``q`` is outside [0, 1].
+        """
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Sequence[float]) -> list[Time | None]:
+        """Several quantiles in one pass over the buckets (see :meth:`quantile`)."""
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError(f"quantile must be in [0, 1], got {q}")
+        if self.count == 0 or not qs:
+            return [None] * len(qs)
+        assert self.min is not None and self.max is not None
+        ranks = sorted((q * (self.count - 1), i) for i, q in enumerate(qs))
+        out: list[Time | None] = [None] * len(qs)
+        pending = iter(ranks)
+        rank, slot = next(pending)
+        seen = 0
+        for value, n in self._buckets():
+            seen += n
+            while seen > rank:
+                if rank == 0:  # the extremes are tracked exactly
+                    out[slot] = Time(self.min)
+                elif rank == self.count - 1:
+                    out[slot] = Time(self.max)
+                else:
+                    out[slot] = Time(min(max(value, self.min), self.max))
+                step = next(pending, None)
+                if step is None:
+                    return out
+                rank, slot = step
+        raise AssertionError("bucket counts do not add up to count")
+
+    def _buckets(self) -> Iterator[tuple[int, int]]:
+        """(representative centiseconds, count) per bucket, fastest first."""
+        if self._zeros:
+            yield 0, self._zeros
+        gamma = math.exp(self._log_gamma)
+        for index in sorted(self._bins):
+            yield round(2 * gamma**index / (gamma + 1)), self._bins[index]
+
+    # -- persistence ------------------------------------------------------- #
+
+    def to_dict(self) -> dict[str, Any]:
+        """A JSON-serializable form, restored by :meth:`from_dict`."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "bins": [[index, n] for index, n in sorted(self._bins.items())],
+            "zeros": self._zeros,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> QuantileSketch:
+        """Rebuild a sketch written by :meth:`to_dict`."""
+        sketch = cls(data["relative_accuracy"])
+        sketch._bins = {index: n for index, n in data["bins"]}
+        sketch._zeros = data["zeros"]
+        sketch.count = data["count"]
+        sketch.min = data["min"]
+        sketch.max = data["max"]
+        return sketch
+
+
+@dataclass(frozen=True, slots=True)
+class DistributionKey:
+    """Identifies one time distribution.
+
+    Attributes:
+        event: The event swum.
+        age_group: Age-group label, or None when distributions are not split by age.
+        sex: The swimmers' sex.
+    """
+
+    event: Event
+    age_group: str | None
+    sex: Sex
+
+
+class TimeDistributions:
+    """A :class:`QuantileSketch` per event, age group and sex across every archive added.
+
+    Every timed individual swim (``OK`` or ``EXHIBITION``) counts — prelims and finals
+    alike, identified swimmer or not.
+
+    Args:
+        relative_accuracy: Passed to each :class:`QuantileSketch`.
+        age_groups: Maps a swimmer's age to its group label; defaults to the
+            standards groups (:func:`~tunas.standards.age_group`). ``None`` pools
+            all ages. Swims whose age is unknown are counted in :attr:`skipped_swims`.
+    """
+
+    __slots__ = ("relative_accuracy", "age_groups", "skipped_swims", "_sketches")
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.005,
+        *,
+        age_groups: Callable[[int], str] | None = age_group,
+    ) -> None:
+        QuantileSketch(relative_accuracy)  # validate up front
+        self.relative_accuracy = relative_accuracy
+        self.age_groups = age_groups
+        self.skipped_swims = 0
+        self._sketches: dict[DistributionKey, QuantileSketch] = {}
+
+    # -- building ---------------------------------------------------------- #
+
+    def update(self, archives: Iterable[MeetArchive]) -> None:
+        """Add every archive in ``archives``."""
+        for archive in archives:
+            self.add(archive)
+
+    def add(self, archive: MeetArchive) -> None:
+        """Add one archive's swims."""
+        for meet in archive.meets:
+            self.add_meet(meet)
+
+    def add_meet(self, meet: Meet) -> None:
+        """Add one meet's swims."""
+        for swim in timed_swims(meet):
+            assert swim.time is not None
+            group: str | None = None
+            if self.age_groups is not None:
+                age = swim_age(swim)
+                if age is None:
+                    self.skipped_swims += 1
+                    continue
+                group = self.age_groups(age)
+            key = DistributionKey(event=swim.event, age_group=group, sex=swim.swimmer.sex)
+            sketch = self._sketches.get(key)
+            if sketch is None:
+                sketch = self._sketches[key] = QuantileSketch(self.relative_accuracy)
+            sketch.add(swim.time)
+
+    def merge(self, other: TimeDistributions) -> None:
+        """Fold another table (e.g. from a worker process) into this one.
+
+        Raises:
+            ValueError: If the tables use different relative accuracies.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                f"cannot merge distributions with relative accuracy "
+                f"{other.relative_accuracy} into {self.relative_accuracy}"
+            )
+        for key, sketch in other._sketches.items():
+            mine = self._sketches.get(key)
+            if mine is None:
+                mine = self._sketches[key] = QuantileSketch(self.relative_accuracy)
+            mine.merge(sketch)
+        self.skipped_swims += other.skipped_swims
+
+    # -- queries ----------------------------------------------------------- #
+
+    def __len__(self) -> int:
+        return len(self._sketches)
+
+    def __repr__(self) -> str:
+        swims = sum(s.count for s in self._sketches.values())
+        return f"TimeDistributions(distributions={len(self)}, swims={swims})"
+
+    def keys(self) -> list[DistributionKey]:
+        """Every distribution with at least one swim."""
+        return list(self._sketches)
+
+    def sketch(self, key: DistributionKey) -> QuantileSketch | None:
+        """The sketch for ``key``, or None if no swim was added there."""
+        return self._sketches.get(key)
+
+    def quantiles(
+        self,
+        event: Event,
+        sex: Sex,
+        qs: Sequence[float],
+        *,
+        age_group: str | None = None,
+    ) -> list[Time | None]:
+        """Times at quantiles ``qs`` for one distribution (all None if it is empty)."""
+        sketch = self._sketches.get(DistributionKey(event=event, age_group=age_group, sex=sex))
+        return sketch.quantiles(qs) if sketch is not None else [None] * len(qs)
+
+    # -- persistence ------------------------------------------------------- #
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write every sketch to a JSON file."""
+        data = {
+            "version": _FORMAT_VERSION,
+            "relative_accuracy": self.relative_accuracy,
+            "skipped_swims": self.skipped_swims,
+            "sketches": [
+                [key.event.name, key.age_group, key.sex.value, sketch.to_dict()]
+                for key, sketch in self._sketches.items()
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, separators=(",", ":"))
+
+    @classmethod
+    def load(
+        cls,
+        path: str | os.PathLike[str],
+        *,
+        age_groups: Callable[[int], str] | None = age_group,
+    ) -> TimeDistributions:
+        """Reload a table written by :meth:`save`.
+
+        Raises:
+            ValueError: If the file is not a supported distributions table.
+        """
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        if not isinstance(data, dict) or data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"{os.fspath(path)!r} is not a version {_FORMAT_VERSION} table")
+        table = cls(data["relative_accuracy"], age_groups=age_groups)
+        table.skipped_swims = data["skipped_swims"]
+        for event, group, sex, sketch in data["sketches"]:
+            key = DistributionKey(event=Event[event], age_group=group, sex=Sex(sex))
+            table._sketches[key] = QuantileSketch.from_dict(sketch)
+        return table
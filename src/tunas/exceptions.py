@@ -30,6 +30,10 @@ class ParseError(TunasError):
             f"{'.' + warning.field if warning.field else ''}: {warning.reason}"
         )
 
+    def __reduce__(self) -> tuple[type[ParseError], tuple[ParseWarning]]:
+        # Rebuild from the warning, so the error survives pickling (worker processes).
+        return type(self), (self.warning,)
+
 
 class StandardsError(TunasError):
     """Raised when bundled time-standards data is missing or inconsistent."""
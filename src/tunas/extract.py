@@ -0,0 +1,313 @@
+"""Record-level extraction of `.cl2` subsets: copy matching lines, recount the Z0.
+
+:func:`extract_cl2` writes the part of an SDIF file that concerns some clubs,
+events or swimmers — for example one club's slice of a championship — without
+building any objects. Every record is a fixed-width line, so the selected lines
+are copied byte for byte (line endings included) and only the key fields needed
+to select them are decoded: team codes from ``C1``, member IDs from ``D0``/``F0``
+and event distance, stroke and course from ``D0``/``E0``. The file trailer is the
+one record that changes: each ``Z0`` keeps its other columns but has its record,
+meet, team and swimmer counts recomputed for the lines written — records counted
+by type letter, as the readers check them — so the result parses without count
+warnings.
+
+Selection works on whole entries. An individual entry is a ``D0`` record with the
+``D1``/``D2``/``D3``/``G0`` (and any other) records that follow it; a relay entry
+is an ``E0`` with its ``F0`` legs and ``G0`` splits. A club's ``C1``/``C2``
+records are written ahead of its first selected entry (or, when only ``clubs`` is
+given, always), and the file and meet headers — ``A0``, ``B1``, ``B2`` and any
+other records outside a club — are always written.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from tunas._parser.cl2 import _D0_COURSE_COLS, _E0_COURSE_COLS, _Z0_CHECKS, c1_team_code
+from tunas._parser.fields import RECORD_WIDTH, Record, code_value, course_value, int_value
+from tunas._parser.ids import SHORT_ID_LENGTH, normalize_id, short_id
+from tunas.enums import Course, Stroke
+from tunas.event import Event
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+__all__ = ["extract_cl2"]
+
+# Z0 count columns (start, length) beyond the record-type checks in ``_Z0_CHECKS``.
+_Z0_TEAMS = (54, 4)
+_Z0_SWIMMERS = (64, 6)
+
+# Records that start an entry; everything else inside a club continues the open one.
+_ENTRY_STARTS = frozenset({b"D0", b"E0"})
+
+
+def extract_cl2(
+    source: str | os.PathLike[str] | BinaryIO,
+    dest: str | os.PathLike[str] | BinaryIO,
+    *,
+    clubs: Iterable[str] | None = None,
+    events: Iterable[Event] | None = None,
+    swimmers: Iterable[str] | None = None,
+    encoding: str = "cp1252",
+    errors: str = "replace",
+) -> int:
+    """Copy the records of ``source`` matching the filters to ``dest``; return lines written.
+
+    The source is read once, line by line, and matching lines are written as they
+    are read (each club's leading records and each entry are held back only until
+    it is known whether they match). Filters combine: an entry is written if its
+    club, event and swimmer all match the filters given. With no filters the
+    output is the input with its ``Z0`` counts recomputed.
+
+    Args:
+        source: File path or an open binary stream.
+        dest: File path (overwritten) or an open binary stream.
+        clubs: Team codes as :func:`~tunas.read_cl2` reports them (LSC, code and
+            extension, e.g. ``"PCSCSC"``).
+        events: Events to keep, matched on distance, stroke and course; a swim's
+            course is resolved as :func:`~tunas.read_cl2` resolves it.
+        swimmers: Member IDs (12- or 14-char) whose individual entries, and the
+            relays they swam a leg of, are kept.
+        encoding: Text encoding of the key fields.
+        errors: Error handling scheme for decoding errors.
+
+    Raises:
+        ValueError: If ``source`` and ``dest`` are the same file, or a recomputed
+            count does not fit its ``Z0`` column.
+    """
+    extractor = _Extractor(
+        clubs=None if clubs is None else frozenset(clubs),
+        events=None if events is None else frozenset(events),
+        swimmers=None if swimmers is None else _member_keys(swimmers, encoding, errors),
+        encoding=encoding,
+        errors=errors,
+    )
+    if (
+        isinstance(source, str | os.PathLike)
+        and isinstance(dest, str | os.PathLike)
+        and Path(dest).exists()
+        and Path(source).resolve() == Path(dest).resolve()
+    ):
+        raise ValueError(f"cannot extract {os.fspath(source)!r} onto itself")
+    if isinstance(source, str | os.PathLike):
+        with open(source, "rb") as src:
+            return _extract_to(extractor, src, dest)
+    return _extract_to(extractor, source, dest)
+
+
+def _extract_to(
+    extractor: _Extractor, src: BinaryIO, dest: str | os.PathLike[str] | BinaryIO
+) -> int:
+    if isinstance(dest, str | os.PathLike):
+        with open(dest, "wb") as out:
+            return extractor.run(src, out)
+    return extractor.run(src, dest)
+
+
+def _member_keys(ids: Iterable[str], encoding: str, errors: str) -> frozenset[bytes]:
+    keys = (short_id(None, normalize_id(member_id)) for member_id in ids)
+    return frozenset(key.encode(encoding, errors) for key in keys if key)
+
+
+def _entry_members(entry: list[bytes]) -> set[bytes]:
+    """12-char member IDs of a D0 swimmer or of an E0 relay's F0 legs, undecoded."""
+    members: set[bytes] = set()
+    for raw in entry:
+        kind = raw[0:2]
+        if kind == b"D0":
+            member_id = raw[39:51].strip()
+        elif kind == b"F0":
+            member_id = raw[50:62].strip() or raw[92:106].strip()[:SHORT_ID_LENGTH]
+        else:
+            continue
+        if member_id:
+            members.add(member_id)
+    return members
+
+
+class _Extractor:
+    """One pass of :func:`extract_cl2`: filter state, held-back lines and Z0 counts."""
+
+    __slots__ = (
+        "clubs",
+        "events",
+        "swimmers",
+        "encoding",
+        "errors",
+        "_out",
+        "_written",
+        "_letters",
+        "_meets",
+        "_teams",
+        "_members",
+        "_course",
+        "_club",
+        "_club_ok",
+        "_heads",
+        "_entry",
+        "_events_seen",
+    )
+
+    def __init__(
+        self,
+        *,
+        clubs: Collection[str] | None,
+        events: Collection[Event] | None,
+        swimmers: Collection[bytes] | None,
+        encoding: str,
+        errors: str,
+    ) -> None:
+        self.clubs = clubs
+        self.events = events
+        self.swimmers = swimmers
+        self.encoding = encoding
+        self.errors = errors
+        self._written = 0
+        self._reset_counts()
+        self._course: Course | None = None
+        self._club: str | None = None
+        self._club_ok = True
+        self._heads: list[bytes] | None = None  # None once written (or if not in a club)
+        self._entry: list[bytes] = []
+        self._events_seen: dict[tuple[object, ...], Event | None] = {}
+
+    def _reset_counts(self) -> None:
+        self._letters: Counter[bytes] = Counter()
+        self._meets = 0
+        self._teams: set[str] = set()
+        self._members: set[bytes] = set()  # 12-char IDs (or name and birth date)
+
+    def _record(self, raw: bytes) -> Record:
+        return Record(raw.decode(self.encoding, self.errors), 0, "")
+
+    def run(self, src: BinaryIO, out: BinaryIO) -> int:
+        self._out = out
+        for raw in src:
+            kind = raw[0:2]
+            if kind in _ENTRY_STARTS:
+                self._close_entry()
+                self._entry.append(raw)
+            elif kind == b"C1":
+                self._close_club()
+                self._open_club(raw)
+            elif kind == b"B1" or kind == b"Z0":
+                self._close_club()
+                self._club, self._club_ok = None, self._keeps_club(None)
+                if kind == b"Z0":
+                    self._write_z0(raw)
+                else:
+                    self._course = course_value(self._record(raw).raw(150, 1))[1]
+                    self._meets += 1
+                    self._write([raw])
+            elif self._entry:
+                self._entry.append(raw)
+            elif self._heads is not None:
+                self._heads.append(raw)
+            elif self._club is None or self._club_ok:
+                # Header records, and records of a kept club outside any entry.
+                self._write([raw])
+        self._close_club()
+        return self._written
+
+    # -- selection ------------------------------------------------------------ #
+
+    def _keeps_club(self, team: str | None) -> bool:
+        return self.clubs is None or team in self.clubs
+
+    def _open_club(self, raw: bytes) -> None:
+        team = c1_team_code(self._record(raw))[0]
+        self._club, self._club_ok = team, self._keeps_club(team)
+        self._heads = [raw] if self._club_ok else None
+
+    def _close_club(self) -> None:
+        self._close_entry()
+        if self._heads is not None and self.events is None and self.swimmers is None:
+            self._write_heads()
+        self._heads = None
+
+    def _close_entry(self) -> None:
+        entry = self._entry
+        if not entry:
+            return
+        self._entry = []
+        if not self._club_ok:
+            return
+        members = _entry_members(entry)
+        if self.swimmers is not None and members.isdisjoint(self.swimmers):
+            return
+        if self.events is not None and self._entry_event(entry[0]) not in self.events:
+            return
+        self._write_heads()
+        self._members |= members
+        head = entry[0]
+        if not members and head[0:2] == b"D0":
+            # A swimmer without a member ID still counts once, by name and birth date.
+            self._members.add(head[11:39] + head[55:63])
+        self._write(entry)
+
+    def _entry_event(self, raw: bytes) -> Event | None:
+        dist, stroke, cols = (
+            (68, 72, _D0_COURSE_COLS) if raw[0:2] == b"D0" else (22, 26, _E0_COURSE_COLS)
+        )
+        # Few distinct events per meet: resolve each combination of key fields once.
+        key = (raw[dist - 1 : stroke], *(raw[pos - 1 : pos] for pos in cols), self._course)
+        try:
+            return self._events_seen[key]
+        except KeyError:
+            pass
+        rec = self._record(raw)
+        distance = int_value(rec.raw(dist, 4))[1]
+        code = code_value(rec.raw(stroke, 1), Stroke)[1]
+        course = next(
+            (c for c in (course_value(rec.raw(pos, 1))[1] for pos in cols) if c is not None),
+            self._course,
+        )
+        event = None
+        if distance is not None and code is not None and course is not None:
+            event = Event.find(distance, code, course)
+        self._events_seen[key] = event
+        return event
+
+    # -- output --------------------------------------------------------------- #
+
+    def _write_heads(self) -> None:
+        heads = self._heads
+        if heads is None:
+            return
+        self._heads = None
+        if self._club is not None:
+            self._teams.add(self._club)
+        self._write(heads)
+
+    def _write(self, lines: list[bytes]) -> None:
+        self._out.writelines(lines)
+        self._written += len(lines)
+        letters = self._letters
+        for raw in lines:
+            letters[raw[0:1]] += 1
+
+    def _write_z0(self, raw: bytes) -> None:
+        """Write ``raw`` with the counts of the lines written since the previous Z0."""
+        body = raw.rstrip(b"\r\n")
+        line = bytearray(body.ljust(RECORD_WIDTH))
+        fields = [
+            (
+                chk.start,
+                chk.length,
+                self._meets if chk.letter is None else self._letters[chk.letter.encode()],
+            )
+            for chk in _Z0_CHECKS
+        ]
+        fields += [(*_Z0_TEAMS, len(self._teams)), (*_Z0_SWIMMERS, len(self._members))]
+        for start, length, count in fields:
+            text = str(count).rjust(length)
+            if len(text) > length:
+                raise ValueError(f"{count} does not fit the {length}-column Z0 field at {start}")
+            line[start - 1 : start - 1 + length] = text.encode("ascii")
+        self._write([bytes(line) + raw[len(body) :]])
+        self._reset_counts()
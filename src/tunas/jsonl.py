@@ -0,0 +1,233 @@
+"""Streaming JSON Lines export: one object per swim, relay or meet.
+
+:func:`write_jsonl` consumes archives one at a time and writes each record as soon as
+it is built, so memory stays flat however large the corpus is. Records are plain
+JSON — no cyclic references to follow — and every line carries the schema version
+(``"v"``) and its ``"kind"``, so consumers can dispatch and evolve safely.
+
+Value encoding: times are integer centiseconds, dates ISO ``YYYY-MM-DD`` strings,
+enums their member names (``"FREE_100_SCY"``, ``"FINALS"``, ``"OK"``), and missing
+values ``null``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from enum import Enum
+from typing import TYPE_CHECKING, Any, TextIO
+
+from tunas._corpus import swim_age
+from tunas.athletes import athlete_key
+from tunas.models import IndividualSwim, Meet, MeetResult, Relay, RelaySwim, Split
+from tunas.time import Time
+
+if TYPE_CHECKING:
+    import datetime
+
+    from tunas.parser import MeetArchive
+
+__all__ = ["SCHEMA_VERSION", "KINDS", "FIELDS", "iter_records", "write_jsonl"]
+
+# Bump when a field changes meaning or is removed; adding fields keeps the version.
+SCHEMA_VERSION = 1
+
+KINDS = ("meet", "swim", "relay")
+
+type _Extractor = Callable[[Any, str], Any]
+
+
+def _name(member: Enum | None) -> str | None:
+    return member.name if member is not None else None
+
+
+def _iso(date: datetime.date | None) -> str | None:
+    return date.isoformat() if date is not None else None
+
+
+def _centis(time: Time | None) -> int | None:
+    return time.centiseconds if time is not None else None
+
+
+def _splits(splits: list[Split]) -> list[list[int | None]]:
+    return [[s.distance, _centis(s.time)] for s in splits]
+
+
+def _leg(leg: RelaySwim) -> dict[str, Any]:
+    swimmer = leg.swimmer
+    return {
+        "order": _name(leg.order),
+        "athlete": athlete_key(swimmer) if swimmer is not None else None,
+        "swimmer": swimmer.full_name if swimmer is not None else None,
+        "time": _centis(leg.time),
+        "status": leg.status.name,
+    }
+
+
+_MEET: dict[str, _Extractor] = {
+    "source": lambda m, src: src,
+    "name": lambda m, src: m.name,
+    "start_date": lambda m, src: _iso(m.start_date),
+    "end_date": lambda m, src: _iso(m.end_date),
+    "city": lambda m, src: m.city,
+    "state": lambda m, src: _name(m.state),
+    "country": lambda m, src: _name(m.country),
+    "course": lambda m, src: _name(m.course),
+    "meet_type": lambda m, src: _name(m.meet_type),
+    "software_name": lambda m, src: m.source_file.software_name if m.source_file else None,
+    "clubs": lambda m, src: len(m.clubs),
+    "swimmers": lambda m, src: len(m.swimmers),
+    "results": lambda m, src: len(m.results),
+}
+
+# Fields shared by swims and relays.
+_RESULT: dict[str, _Extractor] = {
+    "source": lambda r, src: src,
+    "meet": lambda r, src: r.meet.name,
+    "meet_date": lambda r, src: _iso(r.meet.start_date),
+    "event": lambda r, src: r.event.name,
+    "session": lambda r, src: r.session.name,
+    "status": lambda r, src: r.status.name,
+    "time": lambda r, src: _centis(r.time),
+    "seed_time": lambda r, src: _centis(r.seed_time),
+    "date": lambda r, src: _iso(r.date),
+    "heat": lambda r, src: r.heat,
+    "lane": lambda r, src: r.lane,
+    "rank": lambda r, src: r.rank,
+    "points": lambda r, src: r.points,
+    "club": lambda r, src: r.club.team_code if r.club else None,
+    "lsc": lambda r, src: _name(r.club.lsc) if r.club else None,
+    "dq_code": lambda r, src: r.dq_code,
+    "splits": lambda r, src: _splits(r.splits),
+}
+
+_SWIM: dict[str, _Extractor] = {
+    **_RESULT,
+    "athlete": lambda r, src: athlete_key(r.swimmer),
+    "swimmer": lambda r, src: r.swimmer.full_name,
+    "sex": lambda r, src: r.swimmer.sex.name,
+    "age": lambda r, src: swim_age(r),
+}
+
+_RELAY: dict[str, _Extractor] = {
+    **_RESULT,
+    "relay_letter": lambda r, src: r.relay_letter,
+    "legs": lambda r, src: [_leg(leg) for leg in r.legs],
+}
+
+FIELDS: dict[str, tuple[str, ...]] = {
+    "meet": tuple(_MEET),
+    "swim": tuple(_SWIM),
+    "relay": tuple(_RELAY),
+}
+
+_TABLES = {"meet": _MEET, "swim": _SWIM, "relay": _RELAY}
+
+
+def iter_records(
+    archives: Iterable[MeetArchive],
+    *,
+    kinds: Collection[str] = ("swim", "relay"),
+    fields: Sequence[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield one JSON-ready dict per record, in source order (see :func:`write_jsonl`).
+
+    Raises:
+        ValueError: On an unknown kind, or a field no selected kind has.
+    """
+    plan = _plan(kinds, fields)  # validated eagerly, before any archive is read
+    return (
+        record
+        for archive in archives
+        for meet in archive.meets
+        for record in _meet_records(meet, archive.source, plan)
+    )
+
+
+def write_jsonl(
+    archives: Iterable[MeetArchive],
+    dest: str | os.PathLike[str] | TextIO,
+    *,
+    kinds: Collection[str] = ("swim", "relay"),
+    fields: Sequence[str] | None = None,
+) -> int:
+    """Stream records from ``archives`` to ``dest`` as JSON Lines; return lines written.
+
+    Archives are consumed one at a time and nothing is retained, so a reader's
+    iterator can be passed straight in.
+
+    Args:
+        archives: Archives to export (e.g. ``read_cl2(paths)``).
+        dest: File path (overwritten, UTF-8) or an open text stream.
+        kinds: Record kinds to emit, any of ``"meet"``, ``"swim"``, ``"relay"``. A
+            meet line precedes that meet's swims and relays.
+        fields: Fields to include (in this order); each kind keeps the ones it has
+            (see :data:`FIELDS`). Default: every field. ``"v"`` and ``"kind"`` are
+            always included.
+
+    Raises:
+        ValueError: On an unknown kind, or a field no selected kind has.
+    """
+    records = iter_records(archives, kinds=kinds, fields=fields)
+    if isinstance(dest, str | os.PathLike):
+        with open(dest, "w", encoding="utf-8", newline="\n") as fh:
+            return _write(records, fh)
+    return _write(records, dest)
+
+
+def _write(records: Iterator[dict[str, Any]], dest: TextIO) -> int:
+    encode = json.JSONEncoder(
+        ensure_ascii=False, check_circular=False, separators=(",", ":")
+    ).encode
+    write = dest.write
+    count = 0
+    for record in records:
+        write(encode(record))
+        write("\n")
+        count += 1
+    return count
+
+
+def _plan(
+    kinds: Collection[str], fields: Sequence[str] | None
+) -> dict[str, list[tuple[str, _Extractor]]]:
+    """Per selected kind, the ordered ``(field, extractor)`` pairs to emit."""
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        raise ValueError(f"unknown record kind(s): {', '.join(sorted(unknown))}")
+    if fields is not None:
+        available = {name for kind in kinds for name in _TABLES[kind]}
+        missing = [name for name in fields if name not in available]
+        if missing:
+            raise ValueError(f"unknown field(s) for {sorted(kinds)}: {', '.join(missing)}")
+    plan: dict[str, list[tuple[str, _Extractor]]] = {}
+    for kind in kinds:
+        table = _TABLES[kind]
+        names = table if fields is None else [name for name in fields if name in table]
+        plan[kind] = [(name, table[name]) for name in names]
+    return plan
+
+
+def _meet_records(
+    meet: Meet, source: str, plan: dict[str, list[tuple[str, _Extractor]]]
+) -> Iterator[dict[str, Any]]:
+    meet_plan = plan.get("meet")
+    if meet_plan is not None:
+        yield _record("meet", meet, source, meet_plan)
+    swim_plan = plan.get("swim")
+    relay_plan = plan.get("relay")
+    result: MeetResult
+    for result in meet.results:
+        if isinstance(result, IndividualSwim):
+            if swim_plan is not None:
+                yield _record("swim", result, source, swim_plan)
+        elif isinstance(result, Relay) and relay_plan is not None:
+            yield _record("relay", result, source, relay_plan)
+
+
+def _record(kind: str, obj: Any, source: str, plan: list[tuple[str, _Extractor]]) -> dict[str, Any]:
+    record: dict[str, Any] = {"v": SCHEMA_VERSION, "kind": kind}
+    for name, extract in plan:
+        record[name] = extract(obj, source)
+    return record
@@ -0,0 +1,416 @@
+"""Lazy access to large result files: scan once, parse clubs on demand.
+
+:func:`open_cl2` / :func:`open_hy3` make one fast pass over a file, recording where
+each meet's header and each club's records sit (byte offsets and line numbers) and
+which member IDs and events each club's records mention — without building any
+objects. A :class:`LazyMeet` then parses only what is asked for: looking up one
+club, one swimmer or one event seeks to the matching club blocks and feeds just
+those lines (behind the file and meet headers) through the regular parse engine,
+grafting the resulting ``Club``, ``Swimmer`` and result objects into one ``Meet``.
+
+Granularity is the club block: a swimmer's swims and a club's relays always live
+in their club's records, so a block parses exactly as it would in a full read.
+Objects therefore match :func:`~tunas.read_cl2` / :func:`~tunas.read_hy3` output,
+except that clubs and results appear in the order they were loaded, and the Z0
+count checks (which need the whole file) are not run.
+
+The scan can be kept: :func:`index_cl2` / :func:`index_hy3` (or ``index=True`` on
+the readers, during a normal parse) write it to a ``<name>.idx.json`` sidecar,
+which :func:`open_cl2` and the one-shot readers :func:`seek_cl2` /
+:func:`seek_hy3` reuse for as long as the file's size and modification time are
+unchanged. The seek readers parse just one meet, club or swimmer with a fresh
+engine and return an independent :class:`~tunas.MeetArchive`.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from itertools import chain
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tunas._parser.cl2 import _Cl2Engine
+from tunas._parser.diagnostics import LINE_KINDS, ParseReport, Severity
+from tunas._parser.engine import _BaseEngine
+from tunas._parser.hy3 import _Hy3Engine
+from tunas._parser.ids import identity_keys
+from tunas._parser.scan import (
+    LAYOUTS,
+    BlockIndex,
+    FileIndex,
+    MeetIndex,
+    Span,
+    read_sidecar,
+    read_spans,
+    scan,
+    write_sidecar,
+)
+from tunas.parser import MeetArchive
+
+if TYPE_CHECKING:
+    import datetime
+
+    from tunas.event import Event
+    from tunas.models import Club, Meet, MeetResult, Swimmer
+
+__all__ = [
+    "LazyArchive",
+    "LazyMeet",
+    "open_cl2",
+    "open_hy3",
+    "index_cl2",
+    "index_hy3",
+    "seek_cl2",
+    "seek_hy3",
+]
+
+_ENGINES: dict[str, type[_BaseEngine]] = {"cl2": _Cl2Engine, "hy3": _Hy3Engine}
+
+
+def open_cl2(
+    path: str | os.PathLike[str],
+    *,
+    strict: bool = False,
+    encoding: str = "cp1252",
+    errors: str = "replace",
+) -> LazyArchive:
+    """Scan a `.cl2` file for lazy, per-club access (see the module docs).
+
+    A fresh sidecar index (see :func:`index_cl2`) is used instead of scanning.
+
+    Args:
+        path: The file to open. It is re-read on each access, so it must not change
+            while the archive is in use.
+        strict: As for :func:`~tunas.read_cl2`, applied to every part parsed.
+        encoding: Text encoding of the file.
+        errors: Error handling scheme for decoding errors.
+    """
+    return LazyArchive._open(path, "cl2", strict, encoding, errors)
+
+
+def open_hy3(
+    path: str | os.PathLike[str],
+    *,
+    strict: bool = False,
+    encoding: str = "cp1252",
+    errors: str = "replace",
+) -> LazyArchive:
+    """Scan a `.hy3` file for lazy, per-club access (see :func:`open_cl2`)."""
+    return LazyArchive._open(path, "hy3", strict, encoding, errors)
+
+
+def index_cl2(
+    path: str | os.PathLike[str], *, encoding: str = "cp1252", errors: str = "replace"
+) -> FileIndex:
+    """Scan a `.cl2` file and write its index to the ``<name>.idx.json`` sidecar.
+
+    The index maps each meet (``B1``), club (``C1``) and swimmer (``D0``) to byte
+    offsets and line ranges. Returns the index.
+    """
+    return _build_index(path, "cl2", encoding, errors)
+
+
+def index_hy3(
+    path: str | os.PathLike[str], *, encoding: str = "cp1252", errors: str = "replace"
+) -> FileIndex:
+    """Scan a `.hy3` file and write its sidecar index (see :func:`index_cl2`)."""
+    return _build_index(path, "hy3", encoding, errors)
+
+
+def seek_cl2(
+    path: str | os.PathLike[str],
+    *,
+    meet: int | None = None,
+    team_code: str | None = None,
+    member_id: str | None = None,
+    strict: bool = False,
+    encoding: str = "cp1252",
+    errors: str = "replace",
+) -> MeetArchive:
+    """Parse only the selected part of a `.cl2` file, via its record-offset index.
+
+    The sidecar index is used if fresh; otherwise the file is scanned and the
+    sidecar (re)written. The selected records are then read by seeking and parsed,
+    behind the file and meet headers, by a fresh engine, so diagnostics carry the
+    records' real line numbers. Filters combine; meets with no selected records
+    are left out. The Z0 count checks are not run.
+
+    Args:
+        path: The file to read.
+        meet: Position of the one meet to read (all meets if None).
+        team_code: Read only this club's records.
+        member_id: Read only this swimmer's individual entries (12- or 14-char ID),
+            with their club's header records. Relays are club records and are
+            not included.
+        strict: As for :func:`~tunas.read_cl2`.
+        encoding: Text encoding of the file.
+        errors: Error handling scheme for decoding errors.
+
+    Raises:
+        IndexError: If ``meet`` is out of range.
+        ParseError: As for :func:`~tunas.read_cl2`, for the records read.
+    """
+    return _seek(path, "cl2", meet, team_code, member_id, strict, encoding, errors)
+
+
+def seek_hy3(
+    path: str | os.PathLike[str],
+    *,
+    meet: int | None = None,
+    team_code: str | None = None,
+    member_id: str | None = None,
+    strict: bool = False,
+    encoding: str = "cp1252",
+    errors: str = "replace",
+) -> MeetArchive:
+    """Parse only the selected part of a `.hy3` file (see :func:`seek_cl2`).
+
+    Swimmer entries are the ``D1`` record with its ``E1``/``E2``/``G1``/``H1``/``H2``
+    records, and ``team_code`` is the code as :func:`~tunas.read_hy3` reports it.
+    """
+    return _seek(path, "hy3", meet, team_code, member_id, strict, encoding, errors)
+
+
+def _build_index(path: str | os.PathLike[str], fmt: str, encoding: str, errors: str) -> FileIndex:
+    with open(path, "rb") as fh:
+        index = scan(fh, LAYOUTS[fmt], encoding=encoding, errors=errors)
+    write_sidecar(path, index, fmt)
+    return index
+
+
+def _seek(
+    path: str | os.PathLike[str],
+    fmt: str,
+    meet: int | None,
+    team_code: str | None,
+    member_id: str | None,
+    strict: bool,
+    encoding: str,
+    errors: str,
+) -> MeetArchive:
+    index = read_sidecar(path, fmt) or _build_index(path, fmt, encoding, errors)
+    if meet is not None and not 0 <= meet < len(index.meets):
+        raise IndexError(
+            f"meet index {meet} out of range: {os.fspath(path)!r} has {len(index.meets)} meet(s)"
+        )
+    keys = identity_keys(None, member_id)
+    spans: list[Span] = [index.header] if index.header is not None else []
+    for meet_index in index.meets if meet is None else [index.meets[meet]]:
+        selected: list[Span] = []
+        for block in meet_index.blocks.values():
+            if team_code is not None and block.team_code != team_code:
+                continue
+            if not keys:
+                selected += block.spans
+            elif runs := next((block.swimmers[k] for k in keys if k in block.swimmers), None):
+                selected += [*block.heads, *runs]
+        if selected or (team_code is None and not keys):
+            spans += [meet_index.header, *selected]
+
+    engine = _ENGINES[fmt](strict=strict)
+    source = str(path)
+    with open(path, "rb") as fh:
+        lines = read_spans(
+            fh, sorted(spans, key=lambda s: s.offset), encoding=encoding, errors=errors
+        )
+        engine.parse_numbered(lines, source)
+    return MeetArchive(source=source, meets=engine.meets, report=engine.report)
+
+
+class LazyArchive:
+    """A scanned file whose meets are parsed on demand.
+
+    Attributes:
+        source: The file path.
+        index: The scan result: byte/line spans and keys per meet and club block.
+        meets: One :class:`LazyMeet` per meet in the file.
+    """
+
+    __slots__ = ("source", "index", "meets", "_engine_cls", "_strict", "_encoding", "_errors")
+
+    def __init__(
+        self,
+        source: str | os.PathLike[str],
+        index: FileIndex,
+        engine_cls: type[_BaseEngine],
+        *,
+        strict: bool = False,
+        encoding: str = "cp1252",
+        errors: str = "replace",
+    ) -> None:
+        self.source = str(Path(os.fspath(source)))
+        self.index = index
+        self._engine_cls = engine_cls
+        self._strict = strict
+        self._encoding = encoding
+        self._errors = errors
+        self.meets = [LazyMeet(self, meet) for meet in index.meets]
+
+    @classmethod
+    def _open(
+        cls, path: str | os.PathLike[str], fmt: str, strict: bool, encoding: str, errors: str
+    ) -> LazyArchive:
+        index = read_sidecar(path, fmt)
+        if index is None:
+            with open(path, "rb") as fh:
+                index = scan(fh, LAYOUTS[fmt], encoding=encoding, errors=errors)
+        engine_cls = _ENGINES[fmt]
+        return cls(path, index, engine_cls, strict=strict, encoding=encoding, errors=errors)
+
+    def __repr__(self) -> str:
+        return f"LazyArchive(source={self.source!r}, meets={len(self.meets)})"
+
+    def _parse(self, spans: Iterable[Span]) -> _BaseEngine:
+        """Parse the file header plus ``spans`` (in file order) with a fresh engine.
+
+        Raises:
+            ValueError: If the file's size changed since it was scanned.
+        """
+        if os.stat(self.source).st_size != self.index.size:
+            raise ValueError(f"{self.source} changed since it was scanned")
+        header = [self.index.header] if self.index.header is not None else []
+        engine = self._engine_cls(strict=self._strict)
+        with open(self.source, "rb") as fh:
+            lines = read_spans(
+                fh,
+                chain(header, sorted(spans, key=lambda s: s.offset)),
+                encoding=self._encoding,
+                errors=self._errors,
+            )
+            engine.parse_numbered(lines, self.source)
+        return engine
+
+
+class LazyMeet:
+    """One meet of a :class:`LazyArchive`; clubs are parsed when first needed.
+
+    Attributes:
+        index: This meet's spans and per-club keys.
+        report: Diagnostics for the parts parsed so far (the meet header, then
+            each loaded block).
+    """
+
+    __slots__ = ("_archive", "index", "report", "_meet", "_header_warnings", "_loaded")
+
+    def __init__(self, archive: LazyArchive, index: MeetIndex) -> None:
+        self._archive = archive
+        self.index = index
+        self.report = ParseReport()
+        self._meet: Meet | None = None
+        self._header_warnings = 0
+        self._loaded: set[str | None] = set()
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyMeet(name={self.name!r}, clubs={len(self.index.blocks)}, "
+            f"loaded={len(self._loaded)})"
+        )
+
+    # -- header (no parsing) ----------------------------------------------- #
+
+    @property
+    def name(self) -> str | None:
+        """Meet name, as scanned."""
+        return self.index.name
+
+    @property
+    def start_date(self) -> datetime.date | None:
+        """Meet start date, as scanned."""
+        return self.index.start_date
+
+    @property
+    def team_codes(self) -> list[str | None]:
+        """Team code of every club block, in file order (None: records before any C1)."""
+        return list(self.index.blocks)
+
+    @property
+    def loaded(self) -> frozenset[str | None]:
+        """Team codes of the blocks parsed so far."""
+        return frozenset(self._loaded)
+
+    # -- materialization ---------------------------------------------------- #
+
+    @property
+    def meet(self) -> Meet:
+        """The meet, holding only what has been loaded so far.
+
+        The first access parses the file and meet headers.
+        """
+        if self._meet is None:
+            engine = self._archive._parse([self.index.header])
+            self._meet = engine.meets[0]
+            self.report = engine.report
+            self._header_warnings = len(engine.report.warnings)
+        return self._meet
+
+    def club(self, team_code: str) -> Club | None:
+        """The club with ``team_code``, parsing its block(s) on first access.
+
+        Returns None if the meet has no such club (or only unattached swimmers
+        under that code).
+        """
+        self._load([team_code])
+        return next((c for c in self.meet.clubs if c.team_code == team_code), None)
+
+    def swimmer(self, member_id: str) -> Swimmer | None:
+        """The swimmer with this member ID (12-char USS# or 14-char ID), or None.
+
+        Only the club blocks whose records mention the ID are parsed.
+        """
+        self._load([b.team_code for b in self._blocks() if member_id in b.swimmer_ids])
+        return next(
+            (s for s in self.meet.swimmers if member_id in identity_keys(s.id_short, s.id_long)),
+            None,
+        )
+
+    def results_for(self, event: Event) -> list[MeetResult]:
+        """Individual swims and relays for ``event``, parsing only blocks that enter it."""
+        key = (event.distance, event.stroke)
+        self._load([b.team_code for b in self._blocks() if key in b.events])
+        return [r for r in self.meet.results if r.event == event]
+
+    def load(self) -> Meet:
+        """Parse every block not loaded yet and return the (now complete) meet."""
+        self._load(list(self.index.blocks))
+        return self.meet
+
+    def _blocks(self) -> Iterable[BlockIndex]:
+        return self.index.blocks.values()
+
+    def _load(self, team_codes: Iterable[str | None]) -> None:
+        """Parse the named blocks that are not loaded yet, in one engine pass."""
+        blocks = self.index.blocks
+        wanted = [c for c in dict.fromkeys(team_codes) if c in blocks and c not in self._loaded]
+        if not wanted:
+            return
+        meet = self.meet
+        spans = [self.index.header, *(s for c in wanted for s in blocks[c].spans)]
+        engine = self._archive._parse(spans)
+        part = engine.meets[0]
+        for club in part.clubs:
+            club.meet = meet
+            meet.clubs.append(club)
+        for swimmer in part.swimmers:
+            swimmer.meet = meet
+            meet.swimmers.append(swimmer)
+        for result in part.results:
+            result.meet = meet
+            meet.results.append(result)
+        self._absorb(engine.report)
+        self._loaded.update(wanted)
+
+    def _absorb(self, part: ParseReport) -> None:
+        """Add a block parse's counts and diagnostics, minus its repeated header."""
+        report = self.report
+        warnings = part.warnings[self._header_warnings :]
+        for warning in warnings:
+            report.add(warning)
+        report.records_skipped += sum(w.severity is Severity.SKIPPED for w in warnings)
+        report.fields_recovered += sum(
+            w.severity is Severity.RECOVERED and w.kind not in LINE_KINDS for w in warnings
+        )
+        report.swimmers_parsed += part.swimmers_parsed
+        report.individual_swims_parsed += part.individual_swims_parsed
+        report.relays_parsed += part.relays_parsed
+        report.splits_parsed += part.splits_parsed
@@ -9,7 +9,7 @@ MeetHost, SourceFile, ClubEntryCounts) are frozen and hashable.
 from __future__ import annotations
 
 import datetime
-from abc import ABC, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -38,6 +38,8 @@ from tunas.geography import LSC, Country, State
 from tunas.time import Time
 
 if TYPE_CHECKING:
+    from tunas.columns import ResultTable
+    from tunas.compact import SwimStore
     from tunas.enums import Session
 
 # A swimmer/leg citizenship is either one of the two non-country SDIF codes or a
@@ -288,7 +290,7 @@ class Swim(ABC):
 
 
 @dataclass(slots=True, kw_only=True, eq=False)
-class MeetResult:
+class MeetResult(metaclass=ABCMeta):
     """Base class for a meet result row (IndividualSwim or Relay).
 
     Attributes:
@@ -753,3 +755,41 @@ class Meet:
     def relays_for(self, event: Event) -> list[Relay]:
         """Relays for an event in source order."""
         return [r for r in self.relays if r.event == event]
+
+    def to_columns(self) -> ResultTable:
+        """The meet's results as array-backed columns (see :mod:`tunas.columns`)."""
+        from tunas.columns import ResultTable
+
+        table = ResultTable()
+        table.add_meet(self, source=self.source_file.path if self.source_file else None)
+        return table
+
+    def compact(self) -> SwimStore:
+        """Move the individual swims into struct-of-arrays storage (see :mod:`tunas.compact`)."""
+        from tunas.compact import compact
+
+        return compact(self)
+
+    def release(self) -> None:
+        """Break the meet's reference cycles so it is freed by reference counting.
+
+        The graph is cyclic (a club lists its swimmers, each of which points back
+        at the club and the meet; a relay lists legs that point back at it), so a
+        dropped meet otherwise waits for the cyclic garbage collector. This empties
+        every list that closes a cycle: the meet's ``results``, ``swimmers`` and
+        ``clubs``, each club's ``results``/``swimmers``, each swimmer's ``swims``
+        and each relay's ``legs``/``alternates``. Objects still referenced
+        elsewhere stay usable but are detached from the meet's collections.
+        """
+        for result in self.results:
+            if isinstance(result, Relay):
+                result.legs.clear()
+                result.alternates.clear()
+        for swimmer in self.swimmers:
+            swimmer.swims.clear()
+        for club in self.clubs:
+            club.results.clear()
+            club.swimmers.clear()
+        self.results.clear()
+        self.swimmers.clear()
+        self.clubs.clear()
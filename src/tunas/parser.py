@@ -4,14 +4,27 @@ from __future__ import annotations
 
 import os
 from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TextIO
+from typing import BinaryIO, TextIO
 
 from tunas._parser.cl2 import _Cl2Engine
-from tunas._parser.diagnostics import IssueKind, ParseReport, ParseWarning, Severity
+from tunas._parser.diagnostics import (
+    HandlerStats,
+    IssueKind,
+    ParseReport,
+    ParseWarning,
+    Severity,
+    WarningTally,
+    check_max_warnings,
+)
 from tunas._parser.engine import _BaseEngine
+from tunas._parser.gcmode import check_gc_mode, managed_gc
 from tunas._parser.hy3 import _Hy3Engine
+from tunas._parser.interning import Interner, intern_limit
+from tunas._parser.parallel import check_workers, parse_parallel
+from tunas._parser.scan import LAYOUTS, Scanner, raw_lines, write_sidecar
 from tunas.models import Meet
 
 __all__ = [
@@ -22,6 +35,8 @@ __all__ = [
     "ParseWarning",
     "Severity",
     "IssueKind",
+    "HandlerStats",
+    "WarningTally",
 ]
 
 # Path-like or iterable-of-paths or open text stream.
@@ -53,6 +68,12 @@ def read_cl2(
     strict: bool = False,
     encoding: str = "cp1252",
     errors: str = "replace",
+    intern: bool | int = False,
+    gc_mode: str = "default",
+    index: bool = False,
+    workers: int = 1,
+    profile: bool = False,
+    max_warnings: int | None = None,
 ) -> Iterator[MeetArchive]:
     """Parse `.cl2` / SDIF v3 files, yielding one :class:`MeetArchive` per source.
 
@@ -73,6 +94,32 @@ def read_cl2(
             Otherwise, parsing is lenient. Fatal M1 structural violations always raise.
         encoding: Text encoding to use when opening file paths.
         errors: Error handling scheme for decoding errors.
+        intern: Share equal strings and frozen values (``MeetHost``, ``SwimmerContact``,
+            ``ClubEntryCounts``, ``Split``) across every file of this call, trading a
+            dictionary lookup per field for a smaller resident corpus. ``True`` bounds
+            the table at 65,536 distinct values; a positive int sets the bound.
+        gc_mode: Cyclic garbage collection while each file parses: ``"default"``
+            leaves it alone, ``"pause"`` disables it until the file is parsed, and
+            ``"freeze"`` then calls :func:`gc.freeze`, which moves every object alive
+            in the process (not only the parsed meets) into the permanent generation
+            so later collections skip it. Frozen objects are never collected, only
+            reclaimed by reference counting: pair it with :meth:`Meet.release` when
+            discarding meets, and avoid it in long-running processes.
+        index: Also write each file's record-offset index to a ``<name>.idx.json``
+            sidecar as it is parsed (ignored for streams), for
+            :func:`~tunas.lazy.seek_cl2` and :func:`~tunas.lazy.open_cl2`.
+        workers: With more than one, each file holding several meets is split at
+            its ``B1`` records and the meets are parsed in up to ``workers``
+            processes, then reassembled in order (same meets, ``SourceFile`` and
+            report, ``Z0`` checks included). Single-meet files and streams are
+            parsed in the calling process.
+        profile: Time every record handler and count its calls and warnings into
+            ``report.profile`` (see :class:`HandlerStats`). Off by default, when
+            dispatch is not instrumented at all.
+        max_warnings: Keep full detail for only the first ``max_warnings`` warnings
+            of each (record type, field, kind) per file; the rest are counted in
+            ``report.suppressed`` (see :class:`WarningTally`), bounding memory on
+            badly generated files. ``None`` (the default) keeps every warning.
 
     Yields:
         :class:`MeetArchive` objects in source order — one per file/stream.
@@ -80,8 +127,23 @@ def read_cl2(
     Raises:
         ParseError: During iteration, on a fatal structural violation, or in strict
             mode on any parse warning. The earliest failing source raises first.
+        ValueError: If ``intern`` or ``workers`` is a non-positive int, ``max_warnings``
+            is negative, or ``gc_mode`` is unknown.
     """
-    return _read(source, _Cl2Engine, ".cl2", strict=strict, encoding=encoding, errors=errors)
+    return _read(
+        source,
+        _Cl2Engine,
+        ".cl2",
+        strict=strict,
+        encoding=encoding,
+        errors=errors,
+        intern=intern,
+        gc_mode=gc_mode,
+        index=index,
+        workers=workers,
+        profile=profile,
+        max_warnings=max_warnings,
+    )
 
 
 def read_hy3(
@@ -90,6 +152,13 @@ def read_hy3(
     strict: bool = False,
     encoding: str = "cp1252",
     errors: str = "replace",
+    intern: bool | int = False,
+    gc_mode: str = "default",
+    index: bool = False,
+    workers: int = 1,
+    profile: bool = False,
+    max_warnings: int | None = None,
+    verify_checksums: bool = False,
 ) -> Iterator[MeetArchive]:
     """Parse Hy-Tek `.hy3` result files, yielding one :class:`MeetArchive` per source.
 
@@ -106,8 +175,39 @@ def read_hy3(
             or an open text stream. A stream yields exactly one archive (``source="<stream>"``).
         strict: If True, raises ParseError on the first recovered/skipped warning.
             Otherwise, parsing is lenient. Fatal M1 structural violations always raise.
-        encoding: Text encoding to use when opening file paths.
+        encoding: Text encoding to use when opening file paths; also the encoding
+            checksums are computed over.
         errors: Error handling scheme for decoding errors.
+        intern: Share equal strings and frozen values (``MeetHost``, ``SwimmerContact``,
+            ``ClubEntryCounts``, ``Split``) across every file of this call, trading a
+            dictionary lookup per field for a smaller resident corpus. ``True`` bounds
+            the table at 65,536 distinct values; a positive int sets the bound.
+        gc_mode: Cyclic garbage collection while each file parses: ``"default"``
+            leaves it alone, ``"pause"`` disables it until the file is parsed, and
+            ``"freeze"`` then calls :func:`gc.freeze`, which moves every object alive
+            in the process (not only the parsed meets) into the permanent generation
+            so later collections skip it. Frozen objects are never collected, only
+            reclaimed by reference counting: pair it with :meth:`Meet.release` when
+            discarding meets, and avoid it in long-running processes.
+        index: Also write each file's record-offset index to a ``<name>.idx.json``
+            sidecar as it is parsed (ignored for streams), for
+            :func:`~tunas.lazy.seek_hy3` and :func:`~tunas.lazy.open_hy3`.
+        workers: With more than one, each file holding several meets is split at
+            its ``B1`` records and the meets are parsed in up to ``workers``
+            processes, then reassembled in order (same meets, ``SourceFile`` and
+            report, ``Z0`` checks included). Single-meet files and streams are
+            parsed in the calling process.
+        profile: Time every record handler and count its calls and warnings into
+            ``report.profile`` (see :class:`HandlerStats`). Off by default, when
+            dispatch is not instrumented at all.
+        max_warnings: Keep full detail for only the first ``max_warnings`` warnings
+            of each (record type, field, kind) per file; the rest are counted in
+            ``report.suppressed`` (see :class:`WarningTally`), bounding memory on
+            badly generated files. ``None`` (the default) keeps every warning.
+        verify_checksums: Check each line's columns 129-130 against the checksum of
+            its data, reporting a :attr:`IssueKind.BAD_CHECKSUM` warning (or raising,
+            in strict mode) for each mismatch or missing checksum. Files marked as
+            a `USAS Club Times Export`, which carry no checksums, are not checked.
 
     Yields:
         :class:`MeetArchive` objects in source order — one per file/stream.
@@ -115,8 +215,24 @@ def read_hy3(
     Raises:
         ParseError: During iteration, on a fatal structural violation, or in strict
             mode on any parse warning. The earliest failing source raises first.
+        ValueError: If ``intern`` or ``workers`` is a non-positive int, ``max_warnings``
+            is negative, or ``gc_mode`` is unknown.
     """
-    return _read(source, _Hy3Engine, ".hy3", strict=strict, encoding=encoding, errors=errors)
+    return _read(
+        source,
+        _Hy3Engine,
+        ".hy3",
+        strict=strict,
+        encoding=encoding,
+        errors=errors,
+        intern=intern,
+        gc_mode=gc_mode,
+        index=index,
+        workers=workers,
+        profile=profile,
+        max_warnings=max_warnings,
+        verify_checksums=verify_checksums,
+    )
 
 
 def _read(
@@ -127,22 +243,79 @@ def _read(
     strict: bool,
     encoding: str,
     errors: str,
+    intern: bool | int = False,
+    gc_mode: str = "default",
+    index: bool = False,
+    workers: int = 1,
+    profile: bool = False,
+    max_warnings: int | None = None,
+    verify_checksums: bool = False,
 ) -> Iterator[MeetArchive]:
-    """Dispatch to the stream or path iterator; shared by both readers."""
+    """Dispatch to the stream or path iterator; shared by both readers.
+
+    The interner (if any) is created here, so its table lives exactly as long as
+    this call's iterator and is shared by every file the iterator parses.
+    """
+    limit = intern_limit(intern)
+    interner = Interner(limit) if limit is not None else None
+    mode = check_gc_mode(gc_mode)
+    workers = check_workers(workers)
+    max_warnings = check_max_warnings(max_warnings)
     if hasattr(source, "read"):  # an open text stream — a single unit of work
-        return _iter_stream(source, engine_cls, strict)  # type: ignore[arg-type]
+        return _iter_stream(
+            source,  # type: ignore[arg-type]
+            engine_cls,
+            strict,
+            interner,
+            mode,
+            profile,
+            max_warnings,
+            verify_checksums,
+            encoding,
+        )
 
     paths = _resolve_paths(source, suffix)
-    return _iter_paths(paths, engine_cls, strict=strict, encoding=encoding, errors=errors)
+    return _iter_paths(
+        paths,
+        engine_cls,
+        strict=strict,
+        encoding=encoding,
+        errors=errors,
+        interner=interner,
+        mode=mode,
+        fmt=suffix[1:],
+        index=index,
+        workers=workers,
+        profile=profile,
+        max_warnings=max_warnings,
+        verify_checksums=verify_checksums,
+    )
 
 
 def _iter_stream(
-    stream: TextIO, engine_cls: type[_BaseEngine], strict: bool
+    stream: TextIO,
+    engine_cls: type[_BaseEngine],
+    strict: bool,
+    interner: Interner | None = None,
+    mode: str = "default",
+    profile: bool = False,
+    max_warnings: int | None = None,
+    verify_checksums: bool = False,
+    encoding: str = "cp1252",
+    source: str = "<stream>",
 ) -> Iterator[MeetArchive]:
-    """Parse a single open text stream into exactly one archive."""
-    engine = engine_cls(strict=strict)
-    engine.parse_source(stream, "<stream>")
-    yield MeetArchive(source="<stream>", meets=engine.meets, report=engine.report)
+    """Parse a single open text stream into exactly one archive, labelled ``source``."""
+    engine = engine_cls(
+        strict=strict,
+        interner=interner,
+        profile=profile,
+        max_warnings=max_warnings,
+        verify_checksums=verify_checksums,
+        encoding=encoding,
+    )
+    with managed_gc(mode):
+        engine.parse_source(stream, source)
+    yield MeetArchive(source=source, meets=engine.meets, report=engine.report)
 
 
 def _iter_paths(
@@ -152,10 +325,57 @@ def _iter_paths(
     strict: bool,
     encoding: str,
     errors: str,
+    interner: Interner | None = None,
+    mode: str = "default",
+    fmt: str,
+    index: bool = False,
+    workers: int = 1,
+    profile: bool = False,
+    max_warnings: int | None = None,
+    verify_checksums: bool = False,
 ) -> Iterator[MeetArchive]:
-    """Yield one archive per path, in order, parsing each file as it is consumed."""
-    for path in paths:
-        yield _parse_one(path, engine_cls, strict, encoding, errors)
+    """Yield one archive per path, in order, parsing each file as it is consumed.
+
+    With several ``workers``, one process pool serves every file of the call; its
+    processes start with the first multi-meet file.
+    """
+    if workers == 1:
+        for path in paths:
+            yield _parse_one(
+                path,
+                engine_cls,
+                strict,
+                encoding,
+                errors,
+                interner,
+                mode,
+                fmt,
+                index,
+                None,
+                profile,
+                max_warnings,
+                verify_checksums,
+            )
+        return
+    from concurrent.futures import ProcessPoolExecutor  # loads multiprocessing; only needed here
+
+    with ProcessPoolExecutor(workers) as pool:
+        for path in paths:
+            yield _parse_one(
+                path,
+                engine_cls,
+                strict,
+                encoding,
+                errors,
+                interner,
+                mode,
+                fmt,
+                index,
+                pool,
+                profile,
+                max_warnings,
+                verify_checksums,
+            )
 
 
 def _resolve_paths(
@@ -176,10 +396,58 @@ def _resolve_paths(
 
 
 def _parse_one(
-    path: Path, engine_cls: type[_BaseEngine], strict: bool, encoding: str, errors: str
+    path: Path,
+    engine_cls: type[_BaseEngine],
+    strict: bool,
+    encoding: str,
+    errors: str,
+    interner: Interner | None = None,
+    mode: str = "default",
+    fmt: str = "cl2",
+    index: bool = False,
+    pool: Executor | None = None,
+    profile: bool = False,
+    max_warnings: int | None = None,
+    verify_checksums: bool = False,
 ) -> MeetArchive:
-    """Parse a single file with its own engine, returning its archive."""
-    engine = engine_cls(strict=strict)
-    with open(path, encoding=encoding, errors=errors) as fh:
-        engine.parse_source(fh, str(path))
+    """Parse a single file with its own engine, returning its archive.
+
+    With ``index``, the file is read in binary so a :class:`Scanner` sees each
+    line's byte offset on the way to the engine, and the index is written to the
+    file's sidecar once the parse succeeds. With a ``pool``, a multi-meet file is
+    parsed one meet per task (see :mod:`tunas._parser.parallel`).
+    """
+    engine = engine_cls(
+        strict=strict,
+        interner=interner,
+        profile=profile,
+        max_warnings=max_warnings,
+        verify_checksums=verify_checksums,
+        encoding=encoding,
+    )
+    limit = interner.limit if interner is not None else None
+    if pool is not None:
+        split = parse_parallel(
+            engine, path, fmt, pool, encoding=encoding, errors=errors, intern=limit, mode=mode
+        )
+        if split is not None:
+            if index:
+                write_sidecar(path, split, fmt)
+            return MeetArchive(source=str(path), meets=engine.meets, report=engine.report)
+    if not index:
+        with open(path, encoding=encoding, errors=errors) as fh, managed_gc(mode):
+            engine.parse_source(fh, str(path))
+    else:
+        scanner = Scanner(LAYOUTS[fmt], encoding=encoding, errors=errors)
+        with open(path, "rb") as fh, managed_gc(mode):
+            engine.parse_source(_scanned(fh, scanner), str(path))
+        write_sidecar(path, scanner.finish(), fmt)
     return MeetArchive(source=str(path), meets=engine.meets, report=engine.report)
+
+
+def _scanned(fh: BinaryIO, scanner: Scanner) -> Iterator[str]:
+    """Decode ``fh`` line by line, feeding each raw line to ``scanner`` first."""
+    encoding, errors = scanner.encoding, scanner.errors
+    for raw in raw_lines(fh):
+        scanner.feed(raw)
+        yield raw.decode(encoding, errors)
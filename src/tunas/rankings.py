@@ -0,0 +1,245 @@
+"""Streaming top-N time lists per event, age group, sex and (optionally) LSC.
+
+:class:`Rankings` consumes archives as a reader yields them and keeps, per
+:class:`RankingKey`, only the athletes currently in that list — so a season-wide
+"top 100" for every event and age group is one pass over the corpus with memory
+proportional to the list size, not the number of swims.
+"""
+
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import datetime
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from tunas._corpus import swim_age, timed_swims
+from tunas.athletes import athlete_key
+from tunas.enums import Sex
+from tunas.event import Event
+from tunas.geography import LSC
+from tunas.models import Meet
+from tunas.standards import age_group
+from tunas.time import Time
+
+if TYPE_CHECKING:
+    from tunas.parser import MeetArchive
+
+__all__ = ["RankingKey", "RankedSwim", "Rankings"]
+
+
+@dataclass(frozen=True, slots=True)
+class RankingKey:
+    """Identifies one ranking list.
+
+    Attributes:
+        event: The event ranked.
+        age_group: Age-group label, or None when rankings are not split by age.
+        sex: The swimmers' sex.
+        lsc: The clubs' LSC, or None when rankings are not split by LSC (or unattached).
+    """
+
+    event: Event
+    age_group: str | None
+    sex: Sex
+    lsc: LSC | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RankedSwim:
+    """One row of a ranking list: an athlete's best swim in that list.
+
+    Attributes:
+        rank: 1-based place; tied times share a rank (1, 2, 2, 4, ...).
+        athlete: The athlete's :func:`~tunas.athletes.athlete_key`.
+        name: The swimmer's full name.
+        club: The club's team code, or None if unattached.
+        time: The ranked time.
+        date: Date of the swim, if recorded.
+        meet: Name of the meet.
+        source: Archive source (file path) it was parsed from.
+    """
+
+    rank: int
+    athlete: str
+    name: str
+    club: str | None
+    time: Time
+    date: datetime.date | None
+    meet: str
+    source: str
+
+
+@dataclass(slots=True)
+class _Entry:
+    # (centiseconds, swim date ordinal, arrival sequence): a total order in which
+    # an equal time keeps the earlier swim, and bisect finds an exact entry.
+    order: tuple[int, int, int]
+    row: RankedSwim
+
+
+class _Board:
+    """One bounded list: entries sorted by ``order``, at most one per athlete.
+
+    Holds ``size`` entries plus any tied with the last place. An athlete pushed
+    out can never return with an old swim: ``size`` others have since swum faster.
+    """
+
+    __slots__ = ("entries", "by_athlete")
+
+    def __init__(self) -> None:
+        self.entries: list[_Entry] = []
+        self.by_athlete: dict[str, _Entry] = {}
+
+    def offer(self, entry: _Entry, size: int) -> None:
+        entries = self.entries
+        current = self.by_athlete.get(entry.row.athlete)
+        if current is not None:
+            if entry.order >= current.order:
+                return
+            del entries[bisect.bisect_left(entries, current.order, key=_order)]
+        elif len(entries) >= size and entry.order[0] > entries[size - 1].order[0]:
+            return
+        bisect.insort(entries, entry, key=_order)
+        self.by_athlete[entry.row.athlete] = entry
+        if len(entries) > size:
+            cutoff = entries[size - 1].order[0]
+            while entries[-1].order[0] > cutoff:
+                del self.by_athlete[entries.pop().row.athlete]
+
+    def ranked(self) -> list[RankedSwim]:
+        rows: list[RankedSwim] = []
+        rank = 0
+        previous: int | None = None
+        for position, entry in enumerate(self.entries, start=1):
+            if entry.order[0] != previous:
+                rank, previous = position, entry.order[0]
+            rows.append(dataclasses.replace(entry.row, rank=rank))
+        return rows
+
+
+def _order(entry: _Entry) -> tuple[int, int, int]:
+    return entry.order
+
+
+class Rankings:
+    """Top-``size`` lists across every archive added so far.
+
+    Each timed individual swim (``OK`` or ``EXHIBITION``) by an identified swimmer
+    is offered to the list for its event, the swimmer's age group and sex, and —
+    with ``by_lsc`` — the club's LSC. A list holds one entry per athlete (their
+    fastest swim; the earlier on a tie) and keeps every swim tied with last place,
+    so it can run a little over ``size``.
+
+    Args:
+        size: Places kept per list.
+        age_groups: Maps a swimmer's age to its group label; defaults to the
+            standards groups (:func:`~tunas.standards.age_group`). ``None`` ranks
+            all ages together. Swims whose age is unknown are counted in
+            :attr:`skipped_swims` rather than ranked.
+        by_lsc: Also split lists by the club's LSC.
+    """
+
+    __slots__ = ("size", "age_groups", "by_lsc", "skipped_swims", "_boards", "_sequence")
+
+    def __init__(
+        self,
+        size: int = 100,
+        *,
+        age_groups: Callable[[int], str] | None = age_group,
+        by_lsc: bool = False,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"size must be at least 1, got {size}")
+        self.size = size
+        self.age_groups = age_groups
+        self.by_lsc = by_lsc
+        self.skipped_swims = 0
+        self._boards: dict[RankingKey, _Board] = {}
+        self._sequence = 0
+
+    # -- building ---------------------------------------------------------- #
+
+    def update(self, archives: Iterable[MeetArchive]) -> None:
+        """Add every archive in ``archives``."""
+        for archive in archives:
+            self.add(archive)
+
+    def add(self, archive: MeetArchive) -> None:
+        """Add one archive's swims."""
+        for meet in archive.meets:
+            self.add_meet(meet, source=archive.source)
+
+    def add_meet(self, meet: Meet, *, source: str) -> None:
+        """Add one meet's swims."""
+        for swim in timed_swims(meet):
+            assert swim.time is not None
+            athlete = athlete_key(swim.swimmer)
+            group: str | None = None
+            if athlete is not None and self.age_groups is not None:
+                age = swim_age(swim)
+                if age is None:
+                    athlete = None
+                else:
+                    group = self.age_groups(age)
+            if athlete is None:
+                self.skipped_swims += 1
+                continue
+            club = swim.club
+            key = RankingKey(
+                event=swim.event,
+                age_group=group,
+                sex=swim.swimmer.sex,
+                lsc=club.lsc if self.by_lsc and club is not None else None,
+            )
+            board = self._boards.get(key)
+            if board is None:
+                board = self._boards[key] = _Board()
+            self._sequence += 1
+            date = swim.date or meet.start_date
+            board.offer(
+                _Entry(
+                    (swim.time.centiseconds, date.toordinal(), self._sequence),
+                    RankedSwim(
+                        rank=0,
+                        athlete=athlete,
+                        name=swim.swimmer.full_name,
+                        club=club.team_code if club is not None else None,
+                        time=swim.time,
+                        date=swim.date,
+                        meet=meet.name,
+                        source=source,
+                    ),
+                ),
+                self.size,
+            )
+
+    # -- queries ----------------------------------------------------------- #
+
+    def __len__(self) -> int:
+        return len(self._boards)
+
+    def __repr__(self) -> str:
+        return f"Rankings(size={self.size}, lists={len(self)})"
+
+    def keys(self) -> list[RankingKey]:
+        """Every list that has at least one entry."""
+        return list(self._boards)
+
+    def top(
+        self,
+        event: Event,
+        sex: Sex,
+        *,
+        age_group: str | None = None,
+        lsc: LSC | None = None,
+    ) -> list[RankedSwim]:
+        """One ranking list, fastest first (empty if nothing was ranked there)."""
+        return self.ranking(RankingKey(event=event, age_group=age_group, sex=sex, lsc=lsc))
+
+    def ranking(self, key: RankingKey) -> list[RankedSwim]:
+        """The list for ``key``, fastest first (empty if nothing was ranked there)."""
+        board = self._boards.get(key)
+        return board.ranked() if board is not None else []
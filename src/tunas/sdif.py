@@ -0,0 +1,908 @@
+"""SDIF (`.cl2`) writer: serialize ``Meet`` graphs as fixed-width records.
+
+:func:`write_cl2` is the inverse of :func:`~tunas.read_cl2`. Each record type has
+a format string built once from its column layout (the same start columns the
+reader uses), so a record is one ``str.format`` call on already-converted field
+values, and lines are written as they are built — memory does not grow with the
+output. Codes are written in their SDIF form: courses as ``S``/``Y``/``L`` (``X``
+for a timed DQ), times as ``M:SS.HH`` or the non-time code (``NT``, ``NS``,
+``DNF``, ``DQ``, ``SCR``), dates as ``MMDDYYYY`` and event ages as ``UN``/``OV``
+bounds.
+
+Records follow the layout real files use. Per meet: ``B1`` (and ``B2`` for a
+host); per club: ``C1`` (and ``C2`` for coach details or entry counts), then the
+club's results in order. The swims of one swimmer in one event become a single
+``D0`` with a column group per session, followed on the swimmer's first ``D0`` by
+``D1``/``D2``/``D3`` when there is registration, address or long-ID data, and by
+``G0`` splits. A relay becomes an ``E0`` with one ``F0`` per leg swimmer and that
+leg's ``G0`` splits. Swimmers without a club are written under an unattached
+(``UN``) ``C1``, and swimmers with no individual swim get a ``D0`` without event
+fields only when an ``F0`` cannot carry what is known about them. The file ends
+with one ``Z0`` whose counts are those the reader checks.
+
+A written file reads back to the same meets, clubs, swimmers, results, relay legs
+and splits, with these limits of the format: ``.hy3``-only fields (venue, DQ
+codes, backup times, e-mail, exhibition status) are dropped, free text is cut to
+its column width, prelim points are not stored (``D0``/``E0`` carry finals
+points only), and a split with no time cannot be written.
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+import math
+import os
+from collections import Counter
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, TextIO
+
+from tunas._parser.cl2 import (
+    _AFFILIATION_COLUMNS,
+    _FIRST_SPLIT_COL,
+    _INDIVIDUAL_SESSIONS,
+    _LEG_NUMBERS,
+    _RELAY_LEG_SESSIONS,
+    _RELAY_SESSIONS,
+    _SPLIT_WIDTH,
+    _SPLITS_PER_RECORD,
+    _Z0_CHECKS,
+    SessionColumns,
+)
+from tunas._parser.fields import RECORD_WIDTH
+from tunas.enums import Course, FileType, ResultStatus, Session, SplitType
+from tunas.geography import LSC
+from tunas.models import IndividualSwim, Relay, RelaySwim, Split
+
+if TYPE_CHECKING:
+    from enum import StrEnum
+
+    from tunas.event import Event
+    from tunas.models import Club, Meet, MeetResult, SourceFile, Swimmer
+    from tunas.time import Time
+
+__all__ = ["write_cl2"]
+
+type _Field = tuple[int, int]
+
+
+def _template(code: str, *fields: _Field, right: Collection[int] = ()) -> str:
+    """A format string for one record: ``code``, then each ``(start, length)`` field
+    padded and cut to its columns (right-aligned if ``start`` is in ``right``), blanks
+    between, ``RECORD_WIDTH`` wide and newline-terminated."""
+    parts = [code]
+    pos = len(code) + 1
+    for start, length in fields:
+        align = ">" if start in right else "<"
+        parts.append(" " * (start - pos) + f"{{:{align}{length}.{length}}}")
+        pos = start + length
+    parts.append(" " * (RECORD_WIDTH + 1 - pos) + "\n")
+    return "".join(parts)
+
+
+def _session_fields(sessions: Sequence[SessionColumns]) -> list[_Field]:
+    """Time/course, heat/lane, place and points fields of a D0/E0, in template order."""
+    fields: list[_Field] = []
+    for cols in sessions:
+        fields += [(cols.time, 8), (cols.course, 1)]
+    fields += [(col, 2) for cols in sessions for col in (cols.heat, cols.lane) if col]
+    fields += [(cols.place, 3) for cols in sessions if cols.place]
+    fields += [(cols.points, 4) for cols in sessions if cols.points]
+    return fields
+
+
+def _numeric_columns(sessions: Sequence[SessionColumns]) -> set[int]:
+    """Start columns of the right-aligned session fields (all but the course bytes)."""
+    return {col for col, _ in _session_fields(sessions)} - {cols.course for cols in sessions}
+
+
+_SPLIT_FIELDS = [
+    (_FIRST_SPLIT_COL + j * _SPLIT_WIDTH, _SPLIT_WIDTH) for j in range(_SPLITS_PER_RECORD)
+]
+
+_A0 = _template(
+    "A0", (3, 1), (4, 8), (12, 2), (44, 20), (64, 10), (74, 20), (94, 12), (106, 8), (156, 2)
+)
+_B1 = _template(
+    "B1",
+    *[(3, 1), (12, 30), (42, 22), (64, 22), (86, 20), (106, 2), (108, 10), (118, 3), (121, 1)],
+    *[(122, 8), (130, 8), (138, 4), (150, 1)],
+    right={138},
+)
+_B2 = _template(
+    "B2", (3, 1), (12, 30), (42, 22), (64, 22), (86, 20), (106, 2), (108, 10), (118, 3), (121, 12)
+)
+_C1 = _template(
+    "C1",
+    *[(3, 1), (12, 6), (18, 30), (48, 16), (64, 22), (86, 22), (108, 20), (128, 2), (130, 10)],
+    *[(140, 3), (143, 1), (150, 1)],
+)
+_C2 = _template(
+    "C2",
+    *[(3, 1), (12, 6), (18, 30), (48, 12), (60, 6), (66, 6), (72, 5), (77, 6), (83, 6)],
+    *[(89, 16), (150, 1)],
+    right={60, 66, 72, 77, 83},
+)
+_D0 = _template(
+    "D0",
+    *[(3, 1), (12, 28), (40, 12), (52, 1), (53, 3), (56, 8), (64, 2), (66, 1), (67, 1)],
+    *[(68, 4), (72, 1), (73, 4), (77, 4), (81, 8), (89, 8), (97, 1)],
+    *_session_fields(_INDIVIDUAL_SESSIONS),
+    (143, 2),
+    right={68, 89, *_numeric_columns(_INDIVIDUAL_SESSIONS)},
+)
+_D1 = _template(
+    "D1",
+    *[(3, 1), (12, 6), (18, 1), (19, 28), (48, 12), (60, 1), (61, 3), (64, 8), (72, 2)],
+    *[(74, 1), (75, 30), (105, 20), (125, 12), (137, 12), (149, 8), (157, 1)],
+)
+_D2 = _template(
+    "D2",
+    *[(3, 1), (12, 6), (18, 1), (19, 28), (47, 30), (77, 30), (107, 20), (127, 2), (141, 10)],
+    *[(151, 3), (154, 1), (155, 1), (156, 1)],
+)
+_D3 = _template("D3", (3, 14), (17, 15), (32, 2), *[(col, 1) for col, _ in _AFFILIATION_COLUMNS])
+_E0 = _template(
+    "E0",
+    *[(3, 1), (12, 1), (13, 6), (19, 2), (21, 1), (22, 4), (26, 1), (27, 4), (31, 4)],
+    *[(35, 3), (38, 8), (46, 8), (54, 1)],
+    *_session_fields(_RELAY_SESSIONS),
+    (100, 2),
+    right={19, 22, 35, 46, *_numeric_columns(_RELAY_SESSIONS)},
+)
+_F0 = _template(
+    "F0",
+    *[(3, 1), (16, 6), (22, 1), (23, 28), (51, 12), (63, 3), (66, 8), (74, 2), (76, 1)],
+    *[(pos, 1) for _, pos in _RELAY_LEG_SESSIONS],
+    *[(80, 8), (88, 1), (89, 4), (93, 14), (107, 15)],
+    right={80, 89},
+)
+_G0 = _template(
+    "G0",
+    *[(3, 1), (16, 28), (44, 12), (56, 1), (57, 2), (59, 4), (63, 1)],
+    *_SPLIT_FIELDS,
+    (144, 1),
+    right={57, 59, *(col for col, _ in _SPLIT_FIELDS)},
+)
+# Z0 count fields (start, length) in column order, with what each one counts.
+_Z0_COUNTS = sorted(
+    [(chk.start, chk.length, chk.letter or "meets") for chk in _Z0_CHECKS]
+    + [(54, 4, "teams"), (64, 6, "swimmers")]
+)
+_Z0 = _template(
+    "Z0",
+    *[(3, 1), (12, 2), (14, 30)],
+    *[(start, length) for start, length, _ in _Z0_COUNTS],
+    right={start for start, _, _ in _Z0_COUNTS},
+)
+
+_COURSE_LETTERS = {Course.SCM: "S", Course.SCY: "Y", Course.LCM: "L"}
+# Statuses with a code of their own in a time field; others are written as "NT".
+_TIME_CODES = frozenset(
+    {ResultStatus.NT, ResultStatus.NS, ResultStatus.DNF, ResultStatus.DQ, ResultStatus.SCR}
+)
+_SESSION_ORDER = {cols.session: i for i, cols in enumerate(_INDIVIDUAL_SESSIONS)}
+# Course-byte indexes into a D0/E0 session-field list, in the reader's priority order.
+_COURSE_SLOTS = (5, 1, 3)
+_UNATTACHED_TEAM = ("    UN", "")
+_NO_NAME = "NO SWIMMER NAME"
+
+
+def write_cl2(
+    meets: Iterable[Meet],
+    dest: str | os.PathLike[str] | TextIO,
+    *,
+    encoding: str = "cp1252",
+) -> int:
+    """Write ``meets`` to ``dest`` as one SDIF v3 file; return records written.
+
+    The file and trailer records (``A0``/``Z0``) take their details from the
+    first meet's :class:`~tunas.SourceFile` (results file, version ``V3``, when
+    it has none). Meets are consumed one at a time, so a generator can be passed.
+
+    Args:
+        meets: Meets to write, in order.
+        dest: File path (overwritten; ``encoding``, CRLF line endings, characters
+            the encoding lacks replaced) or an open text stream, which receives
+            ``\\n``-terminated lines.
+        encoding: Text encoding of a file written to a path.
+
+    Raises:
+        ValueError: If a number, time or team code does not fit its column, or a
+            swim's splits need more ``G0`` records than the sequence column allows.
+    """
+    if isinstance(dest, str | os.PathLike):
+        with open(dest, "w", encoding=encoding, errors="replace", newline="\r\n") as fh:
+            return _Writer(fh).run(meets)
+    return _Writer(dest).run(meets)
+
+
+# -- field values ------------------------------------------------------------- #
+
+
+def _code(value: StrEnum | None) -> str:
+    # A StrEnum member formats as its value, so it is passed through as is.
+    return "" if value is None else value
+
+
+def _course(value: Course | None) -> str:
+    return "" if value is None else _COURSE_LETTERS[value]
+
+
+@functools.lru_cache(maxsize=4096)
+def _date(value: datetime.date | None) -> str:
+    return "" if value is None else f"{value.month:02d}{value.day:02d}{value.year:04d}"
+
+
+def _int(value: int | None, width: int, field: str) -> str:
+    if value is None:
+        return ""
+    text = str(value)
+    if len(text) > width:
+        raise ValueError(f"{field} {value} does not fit its {width}-column field")
+    return text
+
+
+def _time(value: Time | None) -> str:
+    if value is None:
+        return ""
+    # ``str(value)``, without the per-component property lookups.
+    minutes, rest = divmod(value.centiseconds, 6000)
+    if not minutes:
+        return f"{rest // 100}.{rest % 100:02d}"
+    if minutes > 99:
+        raise ValueError(f"time {value} does not fit its 8-column field")
+    return f"{minutes}:{rest // 100:02d}.{rest % 100:02d}"
+
+
+def _decimal(value: float | None, width: int = 4) -> str:
+    """``value`` with as many decimals as fit ``width`` columns (points, takeoffs)."""
+    if value is None:
+        return ""
+    for places in (2, 1, 0):
+        text = f"{value:.{places}f}"
+        if len(text) <= width:
+            return text.rstrip("0").rstrip(".") if places else text
+    raise ValueError(f"{value} does not fit its {width}-column field")
+
+
+def _name(last: str, first: str, middle: str | None) -> str:
+    return f"{last}, {first} {middle}" if middle else f"{last}, {first}"
+
+
+def _event_age(low: int | None, high: int | None) -> str:
+    low_text = "UN" if low is None else f"{low:02d}"
+    high_text = "OV" if high is None else f"{high:02d}"
+    return low_text + high_text
+
+
+def _team_fields(club: Club) -> tuple[str, str]:
+    """The C1 team code (cols 12/6: LSC + code) and extension (col 150) of ``club``."""
+    code = club.team_code
+    if club.lsc is not None and not code.startswith(club.lsc.value):
+        code = club.lsc.value + code
+    elif club.lsc is None and len(code) > 2:
+        try:
+            LSC(code[:2])
+        except ValueError:
+            pass
+        else:
+            code = "  " + code  # the first two letters are not this club's LSC
+    if len(code) > 7:
+        raise ValueError(f"team code {club.team_code!r} does not fit its 7-column field")
+    return code[:6], code[6:]
+
+
+def _entries(results: Iterable[MeetResult]) -> Iterator[list[MeetResult]]:
+    """Consecutive results that share one D0/E0 record: one per session, in order."""
+    group: list[MeetResult] = []
+    key: tuple[object, ...] = ()
+    for result in results:
+        result_key = _entry_key(result)
+        if (
+            group
+            and result_key == key
+            and _SESSION_ORDER[result.session] > _SESSION_ORDER[group[-1].session]
+        ):
+            group.append(result)
+            continue
+        if group:
+            yield group
+        group, key = [result], result_key
+    if group:
+        yield group
+
+
+def _entry_key(result: MeetResult) -> tuple[object, ...]:
+    common = (
+        result.organization,
+        result.event,
+        result.event_sex,
+        result.event_min_age,
+        result.event_max_age,
+        result.event_number,
+        result.date,
+        result.seed_time,
+        result.seed_course,
+        result.event_min_time_class,
+        result.event_max_time_class,
+    )
+    if isinstance(result, IndividualSwim):
+        return (id(result.swimmer), result.swimmer_age_class, result.attach_status, *common)
+    if isinstance(result, Relay):
+        return (result.relay_letter, result.total_age, *common)
+    return (id(result), *common)
+
+
+def _split_rows(
+    splits: Sequence[Split], max_rows: int
+) -> list[tuple[int, int, int, SplitType, list[str]]]:
+    """G0 rows ``(sequence, total splits, increment, type, ten times)`` for ``splits``.
+
+    Each split type is written as its own sequence. The increment is the greatest
+    common divisor of the distances, so every split lands in a slot; records whose
+    slots are all blank are left out.
+    """
+    if not splits:
+        return []
+    timed = [s for s in splits if s.time is not None and s.distance > 0]
+    rows = []
+    for split_type in dict.fromkeys(s.split_type for s in timed):
+        group = [s for s in timed if s.split_type is split_type]
+        increment = math.gcd(*(s.distance for s in group))
+        last_slot = max(s.distance for s in group) // increment - 1
+        records = last_slot // _SPLITS_PER_RECORD + 1
+        if records > max_rows:
+            raise ValueError(
+                f"{len(group)} splits every {increment} need {records} G0 records; "
+                f"at most {max_rows} fit"
+            )
+        slots = [""] * (records * _SPLITS_PER_RECORD)
+        for s in group:
+            slots[s.distance // increment - 1] = _time(s.time)
+        for seq in range(records):
+            times = slots[seq * _SPLITS_PER_RECORD : (seq + 1) * _SPLITS_PER_RECORD]
+            if any(times):
+                rows.append((seq + 1, len(group), increment, split_type, times))
+    return rows
+
+
+def _leg_splits(relay: Relay) -> dict[int, list[Split]]:
+    """``relay.splits`` by leg number, with distances from the start of the leg."""
+    leg_distance = relay.event.leg_distance()
+    legs: dict[int, list[Split]] = {}
+    for split in relay.splits:
+        if split.time is None or split.distance <= 0:
+            continue
+        number = (split.distance - 1) // leg_distance + 1
+        if number not in _LEG_NUMBERS.values():
+            continue
+        leg = legs.setdefault(number, [])
+        # One G0 record per leg, so one split type: the leg's first.
+        split_type = leg[0].split_type if leg else split.split_type
+        leg.append(Split(split.distance - (number - 1) * leg_distance, split.time, split_type))
+    return legs
+
+
+# -- writer ------------------------------------------------------------------- #
+
+
+class _Writer:
+    """One :func:`write_cl2` call: the output stream, per-meet caches and Z0 counts."""
+
+    def __init__(self, out: TextIO) -> None:
+        self._write = out.write
+        self._written = 0
+        self._letters: Counter[str] = Counter()
+        self._meets = 0
+        self._teams: set[str] = set()
+        self._swimmers = 0
+        self._meet: Meet | None = None
+        self._people: dict[int, tuple[str, str, str, str, str]] = {}
+        self._described: set[int] = set()
+
+    def _emit(self, template: str, *values: str) -> None:
+        self._write(template.format(*values))
+        self._letters[template[0]] += 1
+        self._written += 1
+
+    def run(self, meets: Iterable[Meet]) -> int:
+        org = ""
+        source: SourceFile | None = None
+        for meet in meets:
+            if self._meet is None:
+                org, source = _code(meet.organization), meet.source_file
+                self._header(org, source)
+            self._write_meet(meet)
+        if self._meet is None:
+            self._header(org, source)
+        self._trailer(org, source)
+        return self._written
+
+    # -- file and meet records ------------------------------------------------ #
+
+    def _header(self, org: str, source: SourceFile | None) -> None:
+        if source is None:
+            self._emit(_A0, org, "V3", FileType.MEET_RESULTS, "", "", "", "", "", "")
+            return
+        self._emit(
+            _A0,
+            org,
+            source.sdif_version or "V3",
+            _code(source.file_type or FileType.MEET_RESULTS),
+            source.software_name or "",
+            source.software_version or "",
+            source.contact_name or "",
+            source.contact_phone or "",
+            _date(source.created),
+            _code(source.submitted_by_lsc),
+        )
+
+    def _trailer(self, org: str, source: SourceFile | None) -> None:
+        counts = {**self._letters, "meets": self._meets, "teams": len(self._teams)}
+        counts["swimmers"] = self._swimmers
+        file_type = source.file_type if source is not None else None
+        self._emit(
+            _Z0,
+            org,
+            _code(file_type or FileType.MEET_RESULTS),
+            (source.notes if source is not None else None) or "",
+            *(_int(counts.get(what, 0), n, f"Z0 {what} count") for _, n, what in _Z0_COUNTS),
+        )
+
+    def _write_meet(self, meet: Meet) -> None:
+        self._meet = meet
+        self._meets += 1
+        self._people = {}
+        self._described = set()
+        org = _code(meet.organization)
+        self._emit(
+            _B1,
+            org,
+            meet.name,
+            meet.address_one or "",
+            meet.address_two or "",
+            meet.city or "",
+            _code(meet.state),
+            meet.postal_code or "",
+            _code(meet.country),
+            _code(meet.meet_type),
+            _date(meet.start_date),
+            _date(meet.end_date),
+            _int(meet.altitude, 4, "altitude"),
+            _course(meet.course),
+        )
+        host = meet.host
+        if host is not None:
+            self._emit(
+                _B2,
+                org,
+                host.name or "",
+                host.address_one or "",
+                host.address_two or "",
+                host.city or "",
+                _code(host.state),
+                host.postal_code or "",
+                _code(host.country),
+                host.phone or "",
+            )
+        results = [r for r in meet.results if r.club is None]
+        swimmers = [s for s in meet.swimmers if s.club is None]
+        unattached = bool(results or swimmers)
+        if results:
+            # Keep ``meet.results`` in order: the unattached block goes before the
+            # first club whose results come after the first unattached one.
+            position = {id(r): i for i, r in enumerate(meet.results)}
+            first = position[id(results[0])]
+        for club in meet.clubs:
+            if unattached and results and club.results and position[id(club.results[0])] > first:
+                self._club(None, _UNATTACHED_TEAM, results, swimmers)
+                unattached = False
+            self._club(club, _team_fields(club), club.results, club.swimmers)
+        if unattached:
+            self._club(None, _UNATTACHED_TEAM, results, swimmers)
+        self._swimmers += len(self._people)
+
+    # -- clubs ---------------------------------------------------------------- #
+
+    def _club(
+        self,
+        club: Club | None,
+        team: tuple[str, str],
+        results: Iterable[MeetResult],
+        swimmers: Iterable[Swimmer],
+    ) -> None:
+        assert self._meet is not None
+        base, ext = team
+        if club is None:
+            org = _code(self._meet.organization)
+            self._emit(_C1, org, base, "Unattached", "", "", "", "", "", "", "", "", ext)
+        else:
+            org = _code(club.organization)
+            self._emit(
+                _C1,
+                org,
+                base,
+                club.full_name or club.abbreviated_name or club.team_code,
+                club.abbreviated_name or "",
+                club.address_one or "",
+                club.address_two or "",
+                club.city or "",
+                _code(club.state),
+                club.postal_code or "",
+                _code(club.country),
+                _code(club.region),
+                ext,
+            )
+            counts = club.entry_counts
+            if club.coach or club.coach_phone or club.short_name or counts is not None:
+                self._emit(
+                    _C2,
+                    org,
+                    base,
+                    club.coach or "",
+                    club.coach_phone or "",
+                    *(
+                        (
+                            _int(counts.num_individual_swims, 6, "entry count"),
+                            _int(counts.num_athletes, 6, "entry count"),
+                            _int(counts.num_relay_entries, 5, "entry count"),
+                            _int(counts.num_relay_name_records, 6, "entry count"),
+                            _int(counts.num_split_records, 6, "entry count"),
+                        )
+                        if counts is not None
+                        else ("",) * 5
+                    ),
+                    club.short_name or "",
+                    ext,
+                )
+        self._teams.add(base.strip() + ext)
+        for swimmer in swimmers:
+            if _needs_d0(swimmer):
+                self._bare_d0(swimmer, org, team)
+        for entry in _entries(results):
+            if isinstance(entry[0], IndividualSwim):
+                self._individual(entry, team)  # type: ignore[arg-type]
+            elif isinstance(entry[0], Relay):
+                self._relay(entry, team)  # type: ignore[arg-type]
+
+    # -- swimmers and individual swims ---------------------------------------- #
+
+    def _person(self, swimmer: Swimmer) -> tuple[str, str, str, str, str]:
+        """Name, USS#, citizenship, birthday and sex fields of ``swimmer``."""
+        key = id(swimmer)
+        person = self._people.get(key)
+        if person is None:
+            person = self._people[key] = (
+                _name(swimmer.last_name, swimmer.first_name, swimmer.middle_initial),
+                swimmer.id_short or "",
+                _code(swimmer.citizenship),
+                _date(swimmer.birthday),
+                swimmer.sex,
+            )
+        return person
+
+    def _bare_d0(self, swimmer: Swimmer, org: str, team: tuple[str, str]) -> None:
+        name, uss, citizenship, birthday, sex = self._person(swimmer)
+        blank = ("",) * (_D0.count("{") - 8)  # no event or result fields
+        self._emit(_D0, org, name, uss, "", citizenship, birthday, "", sex, *blank)
+        self._describe(swimmer, org, team, "", "")
+
+    def _individual(self, entry: list[IndividualSwim], team: tuple[str, str]) -> None:
+        first = entry[0]
+        swimmer = first.swimmer
+        name, uss, citizenship, birthday, sex = self._person(swimmer)
+        org = _code(first.organization)
+        attach = _code(first.attach_status)
+        age_class = first.swimmer_age_class or ""
+        event = first.event
+        seed_course = _course(first.seed_course)
+        self._emit(
+            _D0,
+            org,
+            name,
+            uss,
+            attach,
+            citizenship,
+            birthday,
+            age_class,
+            sex,
+            first.event_sex,
+            _int(event.distance, 4, "distance"),
+            event.stroke,
+            first.event_number or "",
+            _event_age(first.event_min_age, first.event_max_age),
+            _date(first.date),
+            _time(first.seed_time),
+            seed_course,
+            *self._sessions(entry, _INDIVIDUAL_SESSIONS, event, seed_course),
+            _time_classes(first),
+        )
+        self._describe(swimmer, org, team, attach, age_class)
+        for swim in entry:
+            session = swim.session
+            for row in _split_rows(swim.splits, 9):
+                seq, total, increment, split_type, times = row
+                self._emit(
+                    _G0,
+                    org,
+                    name,
+                    uss,
+                    str(seq),
+                    _int(total, 2, "split count"),
+                    _int(increment, 4, "split distance"),
+                    split_type,
+                    *times,
+                    session,
+                )
+
+    def _sessions(
+        self,
+        entry: Sequence[MeetResult],
+        layout: Sequence[SessionColumns],
+        event: Event,
+        seed_course: str,
+    ) -> list[str]:
+        """Session field values of a D0/E0 in template order (see ``_session_fields``)."""
+        assert self._meet is not None
+        by_session = {result.session: result for result in entry}
+        results = [by_session.get(cols.session) for cols in layout]
+        letter = _COURSE_LETTERS[event.course]
+        values: list[str] = []
+        for result in results:
+            if result is None:
+                values += ["", ""]
+            elif result.time is not None:
+                values += [_time(result.time), "X" if result.status is ResultStatus.DQ else letter]
+            else:
+                status = result.status if result.status in _TIME_CODES else ResultStatus.NT
+                values += [status, letter]
+        # The reader takes the event course from the first course byte that names one,
+        # then the seed course, then the meet's: make sure that finds this event's.
+        found = next((values[i] for i in _COURSE_SLOTS if values[i] not in ("", "X")), None)
+        found = found or seed_course or None
+        if found != letter and (found is not None or self._meet.course is not event.course):
+            blank = next((i for i in _COURSE_SLOTS if not values[i]), None)
+            if blank is not None:
+                values[blank] = letter
+        for cols, result in zip(layout, results, strict=True):
+            if cols.heat:
+                values.append(_int(result.heat, 2, "heat") if result else "")
+            if cols.lane:
+                values.append(_int(result.lane, 2, "lane") if result else "")
+        for cols, result in zip(layout, results, strict=True):
+            if cols.place:
+                values.append(_int(result.rank, 3, "place") if result else "")
+        for cols, result in zip(layout, results, strict=True):
+            if cols.points:
+                values.append(_decimal(result.points) if result else "")
+        return values
+
+    def _describe(
+        self, swimmer: Swimmer, org: str, team: tuple[str, str], attach: str, age_class: str
+    ) -> None:
+        """The D1/D2/D3 records of ``swimmer``, after its first D0 only."""
+        key = id(swimmer)
+        if key in self._described:
+            return
+        self._described.add(key)
+        name, uss, citizenship, birthday, sex = self._person(swimmer)
+        base, ext = team
+        contact, reg = swimmer.contact, swimmer.registration
+        if (contact and (contact.phone_primary or contact.phone_secondary)) or (
+            reg
+            and (
+                reg.member_status
+                or reg.registration_date
+                or reg.old_member_number
+                or reg.admin_info
+            )
+        ):
+            self._emit(
+                _D1,
+                org,
+                base,
+                ext,
+                name,
+                uss,
+                attach,
+                citizenship,
+                birthday,
+                age_class,
+                sex,
+                (reg and reg.admin_info) or "",
+                (reg and reg.old_member_number) or "",
+                (contact and contact.phone_primary) or "",
+                (contact and contact.phone_secondary) or "",
+                _date(reg.registration_date if reg else None),
+                _code(reg.member_status if reg else None),
+            )
+        if (
+            contact
+            and (
+                contact.address
+                or contact.city
+                or contact.state
+                or contact.postal_code
+                or contact.country
+                or contact.region
+                or contact.alt_mailing_name
+            )
+        ) or (reg and (reg.season or reg.fina_other_federation)):
+            self._emit(
+                _D2,
+                org,
+                base,
+                ext,
+                name,
+                (contact and contact.alt_mailing_name) or "",
+                (contact and contact.address) or "",
+                (contact and contact.city) or "",
+                _code(contact.state if contact else None),
+                (contact and contact.postal_code) or "",
+                _code(contact.country if contact else None),
+                _code(contact.region if contact else None),
+                (reg and reg.fina_other_federation) or "",
+                _code(reg.season if reg else None),
+            )
+        ethnicity = ""
+        affiliations: Iterable[str] = ("",) * len(_AFFILIATION_COLUMNS)
+        if reg is not None:
+            if reg.ethnicity_primary or reg.ethnicity_secondary:
+                ethnicity = _code(reg.ethnicity_primary) or " "
+                ethnicity += _code(reg.ethnicity_secondary)
+            if reg.affiliations:
+                affiliations = [
+                    "Y" if aff in reg.affiliations else "" for _, aff in _AFFILIATION_COLUMNS
+                ]
+        if (
+            swimmer.id_long
+            or swimmer.preferred_first_name
+            or ethnicity
+            or (reg and reg.affiliations)
+        ):
+            self._emit(
+                _D3,
+                swimmer.id_long or "",
+                swimmer.preferred_first_name or "",
+                ethnicity,
+                *affiliations,
+            )
+
+    # -- relays --------------------------------------------------------------- #
+
+    def _relay(self, entry: list[Relay], team: tuple[str, str]) -> None:
+        first = entry[0]
+        org = _code(first.organization)
+        base = team[0]
+        event = first.event
+        seed_course = _course(first.seed_course)
+        legs = _relay_legs(entry)
+        splits = {relay.session: _leg_splits(relay) for relay in entry}
+        # Splits go after their leg's F0; a relay with splits for a leg no F0 names
+        # gets all its G0s straight after the E0, one per leg in order.
+        upfront = [
+            relay
+            for relay in entry
+            if not splits[relay.session].keys() <= {_leg_number(leg) for leg in relay.legs}
+        ]
+        self._emit(
+            _E0,
+            org,
+            first.relay_letter,
+            base,
+            _int(len(legs), 2, "F0 count"),
+            first.event_sex,
+            _int(event.distance, 4, "distance"),
+            event.stroke,
+            first.event_number or "",
+            _event_age(first.event_min_age, first.event_max_age),
+            _int(first.total_age, 3, "total age"),
+            _date(first.date),
+            _time(first.seed_time),
+            seed_course,
+            *self._sessions(entry, _RELAY_SESSIONS, event, seed_course),
+            _time_classes(first),
+        )
+        for relay in upfront:
+            by_leg = splits.pop(relay.session)
+            for number in range(1, max(by_leg) + 1):
+                self._relay_splits(org, "", "", relay, by_leg.get(number, []))
+        by_session = {relay.session: relay for relay in entry}
+        for leg_entry in legs:
+            name, uss = self._f0(org, team, first, leg_entry)
+            for session, leg in leg_entry.items():
+                by_leg = splits.get(session, {})
+                leg_number = _leg_number(leg)
+                if leg_number in by_leg:
+                    self._relay_splits(org, name, uss, by_session[session], by_leg.pop(leg_number))
+
+    def _f0(
+        self, org: str, team: tuple[str, str], relay: Relay, legs: dict[Session, RelaySwim]
+    ) -> tuple[str, str]:
+        """One swimmer's F0 across the sessions of a relay; return its name and USS#."""
+        # The F0 holds one leg time, course and takeoff; the reader files it on the
+        # finals leg, else the first.
+        leg = legs.get(Session.FINALS) or next(iter(legs.values()))
+        swimmer = leg.swimmer
+        sex: str
+        if swimmer is None:
+            name, uss, birthday, sex = _NO_NAME, "", "", relay.event_sex
+            id_long = preferred = ""
+        else:
+            name, uss, _, birthday, sex = self._person(swimmer)
+            id_long = swimmer.id_long or ""
+            preferred = swimmer.preferred_first_name or ""
+        takeoff = leg.takeoff_time
+        self._emit(
+            _F0,
+            org,
+            team[0],
+            relay.relay_letter,
+            name,
+            uss,
+            _code(leg.citizenship),
+            birthday,
+            leg.swimmer_age_class or "",
+            sex,
+            *(_code(legs[s].order) if s in legs else "" for s, _ in _RELAY_LEG_SESSIONS),
+            _time(leg.time),
+            _course(leg.course),
+            _decimal(takeoff / 100) if takeoff is not None else "",
+            id_long,
+            preferred,
+        )
+        return name, uss
+
+    def _relay_splits(
+        self, org: str, name: str, uss: str, relay: Relay, splits: list[Split]
+    ) -> None:
+        """One leg's G0 (blank when ``splits`` is empty, to step past the leg)."""
+        rows = _split_rows(splits, 1)
+        seq, total, increment, split_type, times = (
+            rows[0] if rows else (1, 0, relay.event.leg_distance(), SplitType.CUMULATIVE, [""] * 10)
+        )
+        self._emit(
+            _G0,
+            org,
+            name,
+            uss,
+            str(seq),
+            _int(total, 2, "split count"),
+            _int(increment, 4, "split distance"),
+            split_type,
+            *times,
+            relay.session,
+        )
+
+
+def _needs_d0(swimmer: Swimmer) -> bool:
+    """Whether a swimmer with no individual swim needs a D0 of its own: one with no
+    relay leg either, or with registration or address details an F0 cannot carry."""
+    if any(isinstance(swim, IndividualSwim) for swim in swimmer.swims):
+        return False
+    return not swimmer.swims or swimmer.contact is not None or swimmer.registration is not None
+
+
+def _leg_number(leg: RelaySwim) -> int | None:
+    return None if leg.order is None else _LEG_NUMBERS.get(leg.order)
+
+
+def _time_classes(result: MeetResult) -> str:
+    low, high = result.event_min_time_class, result.event_max_time_class
+    if low is None and high is None:
+        return ""
+    return (_code(low) or " ") + _code(high)
+
+
+def _relay_legs(entry: Sequence[Relay]) -> list[dict[Session, RelaySwim]]:
+    """The legs of ``entry`` grouped by swimmer: one F0 each, in first-seen order."""
+    legs: dict[int, dict[Session, RelaySwim]] = {}
+    for relay in entry:
+        for leg in (*relay.legs, *relay.alternates):
+            key = id(leg.swimmer) if leg.swimmer is not None else id(leg)
+            if relay.session in legs.setdefault(key, {}):
+                key = id(leg)  # the same swimmer twice in one relay
+                legs[key] = {}
+            legs[key][relay.session] = leg
+    return list(legs.values())
@@ -0,0 +1,646 @@
+"""Memory-mappable binary snapshots (``.tunas``) of parsed meets.
+
+:func:`write_snapshot` lays a corpus out as fixed-width sections of int32 fields —
+meets, clubs, swimmers, results, relay legs and splits — plus a UTF-8 string table.
+:class:`Snapshot` maps the file with :mod:`mmap` and reads nothing up front: opening a
+multi-gigabyte corpus costs one header read, :meth:`Snapshot.headers` scans only the
+meets section, and :meth:`Snapshot.meet` materializes one :class:`~tunas.models.Meet`
+(with its clubs, swimmers and results) from just the pages that meet occupies.
+
+A snapshot keeps the fields corpus analytics use, not every parsed field:
+
+- meets: name, dates, city, state, country, course, meet type, organization, venue,
+  age-up date, sanction number, and the source file path;
+- clubs: team code, LSC, full name, organization;
+- swimmers: names, sex, both member IDs, birthday, club;
+- results: event and restrictions, session, status, times (result and seed), date,
+  event number, heat, lane, rank, points, age class, relay letter and total age, DQ
+  code and reason, splits, and relay legs (swimmer, order, time, status, age class).
+
+Everything else (contacts, registrations, host details, backup times, ...) is left at
+its default on the materialized objects. Snapshots use the writer's native byte order
+and are not portable across endianness.
+
+Enum fields are stored as the member's position in its enum. The header records a
+digest of every stored enum's member names, in order, so a snapshot written before an
+enum gained, lost or reordered members is rejected on open instead of decoding to the
+wrong members.
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from tunas.enums import (
+    Course,
+    MeetType,
+    Organization,
+    RelayLegOrder,
+    ResultStatus,
+    Session,
+    Sex,
+    SplitType,
+)
+from tunas.event import Event
+from tunas.geography import LSC, Country, State
+from tunas.models import (
+    Club,
+    IndividualSwim,
+    Meet,
+    MeetResult,
+    Relay,
+    RelaySwim,
+    SourceFile,
+    Split,
+    Swimmer,
+)
+from tunas.time import Time
+
+__all__ = ["MeetHeader", "Snapshot", "write_snapshot"]
+
+_MAGIC = b"TUNASNAP"
+_VERSION = 2
+_NULL = -1
+
+# Per-section int32 field names, in on-disk order.
+_MEET = (
+    "name", "start_date", "end_date", "city", "state", "country", "course", "meet_type",
+    "organization", "venue", "age_up_date", "sanction_number", "source",
+    "club_start", "club_count", "swimmer_start", "swimmer_count", "result_start",
+    "result_count",
+)  # fmt: skip
+_CLUB = ("team_code", "lsc", "full_name", "organization")
+_SWIMMER = (
+    "club", "first_name", "last_name", "middle_initial", "preferred_first_name", "sex",
+    "id_short", "id_long", "birthday",
+)  # fmt: skip
+_RESULT = (
+    "relay", "club", "swimmer", "organization", "session", "event", "event_min_age",
+    "event_max_age", "event_sex", "status", "time", "date", "event_number", "heat", "lane",
+    "rank", "points", "seed_time", "seed_course", "age_class", "relay_letter", "total_age",
+    "dq_code", "dq_reason", "split_start", "split_count", "leg_start", "leg_count",
+)  # fmt: skip
+_LEG = ("swimmer", "order", "time", "status", "age_class")
+_SPLIT = ("distance", "time", "split_type")
+
+_SECTIONS = ("meets", "clubs", "swimmers", "results", "legs", "splits", "offsets", "strings")
+_WIDTHS = {
+    "meets": len(_MEET),
+    "clubs": len(_CLUB),
+    "swimmers": len(_SWIMMER),
+    "results": len(_RESULT),
+    "legs": len(_LEG),
+    "splits": len(_SPLIT),
+}
+# magic, version, little-endian flag, enum digest, then (offset, length) per section.
+_HEADER = struct.Struct(f"=8sII8s{2 * len(_SECTIONS)}Q")
+
+# Every enum stored by position; their member lists make up the header's enum digest.
+_ENUMS: tuple[type[Enum], ...] = (
+    Country, Course, Event, LSC, MeetType, Organization, RelayLegOrder, ResultStatus,
+    Session, Sex, SplitType, State,
+)  # fmt: skip
+
+_MEMBERS: dict[type[Enum], tuple[Any, ...]] = {}
+_CODES: dict[type[Enum], dict[Any, int]] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class MeetHeader:
+    """A meet's summary, read without materializing the meet.
+
+    Attributes:
+        index: Position of the meet in the snapshot.
+        name: Meet name.
+        start_date: Start date.
+        source: Source file path, if recorded.
+        clubs: Number of clubs.
+        swimmers: Number of swimmers.
+        results: Number of results.
+    """
+
+    index: int
+    name: str
+    start_date: datetime.date
+    source: str | None
+    clubs: int
+    swimmers: int
+    results: int
+
+
+def write_snapshot(meets: Iterable[Meet], path: str | os.PathLike[str]) -> int:
+    """Write ``meets`` (consumed once, e.g. from a reader) to a ``.tunas`` file.
+
+    Returns:
+        The number of meets written.
+    """
+    writer = _Writer()
+    for meet in meets:
+        writer.add_meet(meet)
+    writer.write(path)
+    return writer.meet_count
+
+
+class Snapshot:
+    """A read-only, memory-mapped view of a ``.tunas`` file.
+
+    Raises:
+        ValueError: If the file is not a snapshot this version (or byte order) can read.
+    """
+
+    __slots__ = ("path", "_file", "_mmap", "_views", "_sections", "_string_cache")
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._file = open(path, "rb")  # noqa: SIM115 - held open for the mapping's lifetime
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file cannot be mapped
+            self._file.close()
+            raise ValueError(f"{self.path!r} is not a tunas snapshot") from None
+        self._views: list[memoryview] = []
+        self._string_cache: dict[int, str] = {}
+        try:
+            self._sections = self._open_sections()
+        except ValueError:
+            self.close()
+            raise
+
+    def _open_sections(self) -> dict[str, memoryview]:
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"{self.path!r} is not a tunas snapshot")
+        magic, version, little, digest, *spans = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path!r} is not a tunas snapshot")
+        if version != _VERSION:
+            raise ValueError(f"{self.path!r} is snapshot version {version}, not {_VERSION}")
+        if bool(little) != (sys.byteorder == "little"):
+            raise ValueError(f"{self.path!r} was written on a machine of other byte order")
+        if digest != _enum_digest():
+            raise ValueError(f"{self.path!r} was written with other enum definitions")
+        base = memoryview(self._mmap)
+        self._views.append(base)
+        sections: dict[str, memoryview] = {}
+        for i, name in enumerate(_SECTIONS):
+            offset, length = spans[2 * i], spans[2 * i + 1]
+            raw = base[offset : offset + length]
+            self._views.append(raw)
+            if name == "strings":
+                sections[name] = raw
+            else:
+                view = raw.cast("q" if name == "offsets" else "i")
+                self._views.append(view)
+                sections[name] = view
+        return sections
+
+    def close(self) -> None:
+        """Unmap the file. Materialized objects stay valid."""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> Snapshot:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._sections["meets"]) // _WIDTHS["meets"]
+
+    def __iter__(self) -> Iterator[Meet]:
+        """Materialize each meet in turn."""
+        for i in range(len(self)):
+            yield self.meet(i)
+
+    def __getitem__(self, index: int) -> Meet:
+        return self.meet(index)
+
+    def __repr__(self) -> str:
+        return f"Snapshot({self.path!r}, meets={len(self)})"
+
+    @property
+    def swimmer_count(self) -> int:
+        """Swimmers across all meets."""
+        return len(self._sections["swimmers"]) // _WIDTHS["swimmers"]
+
+    @property
+    def result_count(self) -> int:
+        """Results across all meets."""
+        return len(self._sections["results"]) // _WIDTHS["results"]
+
+    # -- access ------------------------------------------------------------ #
+
+    def headers(self) -> Iterator[MeetHeader]:
+        """Every meet's :class:`MeetHeader`, touching only the meets section."""
+        for i in range(len(self)):
+            m = self._row("meets", i)
+            yield MeetHeader(
+                index=i,
+                name=self._str(m[0]) or "",
+                start_date=datetime.date.fromordinal(m[1]),
+                source=self._str(m[12]),
+                clubs=m[14],
+                swimmers=m[16],
+                results=m[18],
+            )
+
+    def meet(self, index: int) -> Meet:
+        """Materialize one meet with its clubs, swimmers and results.
+
+        Raises:
+            IndexError: If there is no meet at ``index``.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(f"meet index {index} out of range")
+        s = self._str
+        (
+            name, start, end, city, state, country, course, meet_type, organization, venue,
+            age_up, sanction, source, club_start, club_count, swimmer_start, swimmer_count,
+            result_start, result_count,
+        ) = self._row("meets", index)  # fmt: skip
+        source_path = s(source)
+        meet = Meet(
+            organization=_member(Organization, organization),
+            name=s(name) or "",
+            start_date=datetime.date.fromordinal(start),
+            end_date=_date(end),
+            city=s(city),
+            state=_member(State, state),
+            country=_member(Country, country),
+            course=_member(Course, course),
+            meet_type=_member(MeetType, meet_type),
+            venue=s(venue),
+            age_up_date=_date(age_up),
+            sanction_number=s(sanction),
+            source_file=SourceFile(path=source_path) if source_path is not None else None,
+        )
+        clubs: list[Club] = []
+        for i in range(club_start, club_start + club_count):
+            team_code, lsc, full_name, club_org = self._row("clubs", i)
+            clubs.append(
+                Club(
+                    meet=meet,
+                    organization=_member(Organization, club_org),
+                    team_code=s(team_code) or "",
+                    lsc=_member(LSC, lsc),
+                    full_name=s(full_name),
+                )
+            )
+        meet.clubs = clubs
+
+        def club(i: int) -> Club | None:
+            return clubs[i - club_start] if i != _NULL else None
+
+        swimmers: list[Swimmer] = []
+        for i in range(swimmer_start, swimmer_start + swimmer_count):
+            (
+                club_i, first, last, middle, preferred, sex, id_short, id_long, birthday,
+            ) = self._row("swimmers", i)  # fmt: skip
+            swimmer = Swimmer(
+                meet=meet,
+                first_name=s(first) or "",
+                last_name=s(last) or "",
+                sex=_member(Sex, sex) or Sex.MIXED,
+                id_short=s(id_short),
+                id_long=s(id_long),
+                middle_initial=s(middle),
+                preferred_first_name=s(preferred),
+                birthday=_date(birthday),
+                club=club(club_i),
+            )
+            swimmers.append(swimmer)
+            if swimmer.club is not None:
+                swimmer.club.swimmers.append(swimmer)
+        meet.swimmers = swimmers
+
+        def swimmer_at(i: int) -> Swimmer | None:
+            return swimmers[i - swimmer_start] if i != _NULL else None
+
+        for i in range(result_start, result_start + result_count):
+            result = self._result(meet, i, club, swimmer_at)
+            meet.results.append(result)
+            if result.club is not None:
+                result.club.results.append(result)
+        return meet
+
+    def _result(self, meet: Meet, index: int, club: Any, swimmer_at: Any) -> MeetResult:
+        s = self._str
+        (
+            relay, club_i, swimmer_i, organization, session, event, min_age, max_age,
+            event_sex, status, time, date, event_number, heat, lane, rank, points, seed_time,
+            seed_course, age_class, relay_letter, total_age, dq_code, dq_reason, split_start,
+            split_count, leg_start, leg_count,
+        ) = self._row("results", index)  # fmt: skip
+        common: dict[str, Any] = {
+            "meet": meet,
+            "club": club(club_i),
+            "organization": _member(Organization, organization),
+            "session": _member(Session, session),
+            "event": _member(Event, event),
+            "event_min_age": _int(min_age),
+            "event_max_age": _int(max_age),
+            "event_sex": _member(Sex, event_sex),
+            "status": _member(ResultStatus, status),
+            "time": _time(time),
+            "date": _date(date),
+            "event_number": s(event_number),
+            "heat": _int(heat),
+            "lane": _int(lane),
+            "rank": _int(rank),
+            "points": points / 100 if points != _NULL else None,
+            "seed_time": _time(seed_time),
+            "seed_course": _member(Course, seed_course),
+            "dq_code": s(dq_code),
+            "dq_reason": s(dq_reason),
+            "splits": [self._split(j) for j in range(split_start, split_start + split_count)],
+        }
+        if not relay:
+            swimmer = swimmer_at(swimmer_i)
+            swim = IndividualSwim(**common, swimmer=swimmer, swimmer_age_class=s(age_class))
+            swimmer.swims.append(swim)
+            return swim
+        result = Relay(**common, relay_letter=s(relay_letter) or "", total_age=_int(total_age))
+        for j in range(leg_start, leg_start + leg_count):
+            leg_swimmer_i, order, leg_time, leg_status, leg_age_class = self._row("legs", j)
+            leg = RelaySwim(
+                swimmer=swimmer_at(leg_swimmer_i),
+                relay=result,
+                order=_member(RelayLegOrder, order),
+                time=_time(leg_time),
+                status=_member(ResultStatus, leg_status) or ResultStatus.OK,
+                swimmer_age_class=s(leg_age_class),
+            )
+            if leg.order is RelayLegOrder.ALTERNATE:
+                result.alternates.append(leg)
+            else:
+                result.legs.append(leg)
+                if leg.swimmer is not None:
+                    leg.swimmer.swims.append(leg)
+        return result
+
+    def _split(self, index: int) -> Split:
+        distance, time, split_code = self._row("splits", index)
+        split_type = _member(SplitType, split_code)
+        assert split_type is not None
+        return Split(distance, _time(time), split_type)
+
+    def _row(self, section: str, index: int) -> list[int]:
+        width = _WIDTHS[section]
+        return self._sections[section][index * width : (index + 1) * width].tolist()
+
+    def _str(self, index: int) -> str | None:
+        if index == _NULL:
+            return None
+        cached = self._string_cache.get(index)
+        if cached is None:
+            offsets = self._sections["offsets"]
+            raw = self._sections["strings"][offsets[index] : offsets[index + 1]]
+            cached = self._string_cache[index] = str(raw, "utf-8")
+        return cached
+
+
+class _Writer:
+    """Accumulates sections as arrays; meets can be released once added."""
+
+    __slots__ = ("sections", "strings", "string_bytes", "offsets", "meet_count")
+
+    def __init__(self) -> None:
+        self.sections = {name: array("i") for name in _WIDTHS}
+        self.strings: dict[str, int] = {}
+        self.string_bytes = bytearray()
+        self.offsets = array("q", [0])
+        self.meet_count = 0
+
+    def text(self, value: str | None) -> int:
+        if value is None:
+            return _NULL
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+            self.string_bytes += value.encode("utf-8")
+            self.offsets.append(len(self.string_bytes))
+        return index
+
+    def add_meet(self, meet: Meet) -> None:
+        t = self.text
+        sec = self.sections
+        clubs: dict[int, int] = {}
+        swimmers: dict[int, int] = {}
+        club_list = list(meet.clubs)
+        swimmer_list = list(meet.swimmers)
+        for c in club_list:
+            clubs[id(c)] = 0
+        for sw in swimmer_list:
+            swimmers[id(sw)] = 0
+        # Objects referenced from the graph but not listed on the meet still round-trip.
+        referenced: list[Swimmer | None] = []
+        for result in meet.results:
+            if isinstance(result, IndividualSwim):
+                referenced.append(result.swimmer)
+            elif isinstance(result, Relay):
+                referenced += (leg.swimmer for leg in (*result.legs, *result.alternates))
+        for person in referenced:
+            if person is not None and id(person) not in swimmers:
+                swimmers[id(person)] = 0
+                swimmer_list.append(person)
+        owners: list[Club | None] = [sw.club for sw in swimmer_list]
+        owners += (result.club for result in meet.results)
+        for owner in owners:
+            if owner is not None and id(owner) not in clubs:
+                clubs[id(owner)] = 0
+                club_list.append(owner)
+
+        club_start = len(sec["clubs"]) // _WIDTHS["clubs"]
+        for i, c in enumerate(club_list):
+            clubs[id(c)] = club_start + i
+            sec["clubs"].extend(
+                (t(c.team_code), _code(c.lsc), t(c.full_name), _code(c.organization))
+            )
+        swimmer_start = len(sec["swimmers"]) // _WIDTHS["swimmers"]
+        for i, sw in enumerate(swimmer_list):
+            swimmers[id(sw)] = swimmer_start + i
+            sec["swimmers"].extend(
+                (
+                    clubs[id(sw.club)] if sw.club is not None else _NULL,
+                    t(sw.first_name),
+                    t(sw.last_name),
+                    t(sw.middle_initial),
+                    t(sw.preferred_first_name),
+                    _code(sw.sex),
+                    t(sw.id_short),
+                    t(sw.id_long),
+                    _ordinal(sw.birthday),
+                )
+            )
+        result_start = len(sec["results"]) // _WIDTHS["results"]
+        for result in meet.results:
+            self._add_result(result, clubs, swimmers)
+
+        source = meet.source_file.path if meet.source_file is not None else None
+        sec["meets"].extend(
+            (
+                t(meet.name),
+                meet.start_date.toordinal(),
+                _ordinal(meet.end_date),
+                t(meet.city),
+                _code(meet.state),
+                _code(meet.country),
+                _code(meet.course),
+                _code(meet.meet_type),
+                _code(meet.organization),
+                t(meet.venue),
+                _ordinal(meet.age_up_date),
+                t(meet.sanction_number),
+                t(source),
+                club_start,
+                len(club_list),
+                swimmer_start,
+                len(swimmer_list),
+                result_start,
+                len(meet.results),
+            )
+        )
+        self.meet_count += 1
+
+    def _add_result(
+        self, result: MeetResult, clubs: dict[int, int], swimmers: dict[int, int]
+    ) -> None:
+        t = self.text
+        sec = self.sections
+        split_start = len(sec["splits"]) // _WIDTHS["splits"]
+        splits = result.splits if isinstance(result, IndividualSwim | Relay) else []
+        for split in splits:
+            sec["splits"].extend((split.distance, _centis(split.time), _code(split.split_type)))
+        leg_start = len(sec["legs"]) // _WIDTHS["legs"]
+        legs: list[RelaySwim] = []
+        if isinstance(result, Relay):
+            legs = [*result.legs, *result.alternates]
+            for leg in legs:
+                sec["legs"].extend(
+                    (
+                        swimmers[id(leg.swimmer)] if leg.swimmer is not None else _NULL,
+                        _code(leg.order),
+                        _centis(leg.time),
+                        _code(leg.status),
+                        t(leg.swimmer_age_class),
+                    )
+                )
+        individual = isinstance(result, IndividualSwim)
+        sec["results"].extend(
+            (
+                0 if individual else 1,
+                clubs[id(result.club)] if result.club is not None else _NULL,
+                swimmers[id(result.swimmer)] if isinstance(result, IndividualSwim) else _NULL,
+                _code(result.organization),
+                _code(result.session),
+                _code(result.event),
+                _nullable(result.event_min_age),
+                _nullable(result.event_max_age),
+                _code(result.event_sex),
+                _code(result.status),
+                _centis(result.time),
+                _ordinal(result.date),
+                t(result.event_number),
+                _nullable(result.heat),
+                _nullable(result.lane),
+                _nullable(result.rank),
+                round(result.points * 100) if result.points is not None else _NULL,
+                _centis(result.seed_time),
+                _code(result.seed_course),
+                t(result.swimmer_age_class) if isinstance(result, IndividualSwim) else _NULL,
+                t(result.relay_letter) if isinstance(result, Relay) else _NULL,
+                _nullable(result.total_age) if isinstance(result, Relay) else _NULL,
+                t(result.dq_code),
+                t(result.dq_reason),
+                split_start,
+                len(splits),
+                leg_start,
+                len(legs),
+            )
+        )
+
+    def write(self, path: str | os.PathLike[str]) -> None:
+        payloads: list[bytes | bytearray | array[Any]] = [
+            *(self.sections[name] for name in _WIDTHS),
+            self.offsets,
+            self.string_bytes,
+        ]
+        spans: list[int] = []
+        offset = _HEADER.size
+        for payload in payloads:
+            offset += -offset % 8  # 8-byte aligned so int64 offsets can be cast in place
+            size = len(payload) * (payload.itemsize if isinstance(payload, array) else 1)
+            spans += (offset, size)
+            offset += size
+        with open(path, "wb") as fh:
+            fh.write(
+                _HEADER.pack(_MAGIC, _VERSION, sys.byteorder == "little", _enum_digest(), *spans)
+            )
+            for payload, start in zip(payloads, spans[::2], strict=True):
+                fh.write(b"\0" * (start - fh.tell()))
+                fh.write(payload)
+
+
+@functools.cache
+def _enum_digest() -> bytes:
+    """8-byte digest of the member names, in order, of every enum in ``_ENUMS``."""
+    text = "\n".join(f"{e.__name__}:{','.join(e.__members__)}" for e in _ENUMS)
+    return hashlib.blake2b(text.encode(), digest_size=8).digest()
+
+
+def _code(member: Enum | None) -> int:
+    if member is None:
+        return _NULL
+    enum = type(member)
+    codes = _CODES.get(enum)
+    if codes is None:
+        codes = _CODES[enum] = {m: i for i, m in enumerate(enum)}
+    return codes[member]
+
+
+def _member[E: Enum](enum: type[E], code: int) -> E | None:
+    if code == _NULL:
+        return None
+    members = _MEMBERS.get(enum)
+    if members is None:
+        members = _MEMBERS[enum] = tuple(enum)
+    member: E = members[code]
+    return member
+
+
+def _nullable(value: int | None) -> int:
+    return value if value is not None else _NULL
+
+
+def _int(value: int) -> int | None:
+    return value if value != _NULL else None
+
+
+def _centis(time: Time | None) -> int:
+    return time.centiseconds if time is not None else _NULL
+
+
+def _time(centis: int) -> Time | None:
+    return Time(centis) if centis != _NULL else None
+
+
+def _ordinal(date: datetime.date | None) -> int:
+    return date.toordinal() if date is not None else _NULL
+
+
+def _date(ordinal: int) -> datetime.date | None:
+    return datetime.date.fromordinal(ordinal) if ordinal != _NULL else None
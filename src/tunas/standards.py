@@ -12,7 +12,7 @@ from tunas.event import Event
 from tunas.exceptions import StandardsError
 from tunas.time import Time
 
-__all__ = ["TimeStandard", "qualifies_for", "all_qualified", "standard_time"]
+__all__ = ["TimeStandard", "age_group", "qualifies_for", "all_qualified", "standard_time"]
 
 _DATA_FILE = "standards-2025-2028.json"
 
@@ -42,7 +42,11 @@ _AGE_GROUPS: tuple[tuple[int, str], ...] = (
 _OLDEST_AGE_GROUP = "17_18"
 
 
-def _age_group(age: int) -> str:
+def age_group(age: int) -> str:
+    """The standards age-group label for an age: ``"10_U"``, ``"11_12"`` ... ``"17_18"``.
+
+    Ages above 18 fall into the oldest group, matching how the cuts are published.
+    """
     for upper, label in _AGE_GROUPS:
         if age <= upper:
             return label
@@ -78,7 +82,7 @@ def _check_sex(sex: Sex) -> None:
 
 def _cutoff(standard: TimeStandard, event: Event, age: int, sex: Sex) -> int | None:
     """Cutoff in centiseconds for one (standard, event, age, sex), or ``None``."""
-    return _load_index().get((standard.name, _age_group(age), sex.value, event.name))
+    return _load_index().get((standard.name, age_group(age), sex.value, event.name))
 
 
 def qualifies_for(time: Time, event: Event, age: int, sex: Sex) -> TimeStandard | None:
@@ -0,0 +1,585 @@
+"""A local SQLite corpus store: bulk-load parsed archives once, query them repeatedly.
+
+:class:`Store` flattens each :class:`~tunas.parser.MeetArchive` into normalized tables
+(files, meets, clubs, swimmers, swims, relays, legs, splits, warnings) with one batched
+``executemany`` per table inside a single transaction per archive. Files are
+deduplicated by the SHA-256 of their bytes, so re-ingesting a directory only loads new
+files. Query helpers return small frozen rows; the underlying
+:attr:`Store.connection` is available for anything else.
+
+Enums are stored by member name, dates as ISO ``YYYY-MM-DD`` text, and times as integer
+centiseconds. Athletes are keyed by :func:`~tunas.athletes.athlete_key`. Warnings
+suppressed by ``max_warnings`` are stored as one row per tally and severity, with a
+NULL ``line_no`` and their number in ``count``, so summing ``count`` gives the parse's
+totals.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import os
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from tunas._corpus import COUNTING_STATUSES, swim_age
+from tunas.athletes import athlete_key
+from tunas.enums import ResultStatus, Session
+from tunas.event import Event
+from tunas.models import Club, IndividualSwim, Meet, Relay, Split, Swimmer
+from tunas.parser import MeetArchive, read_cl2, read_hy3
+from tunas.time import Time
+
+__all__ = ["Store", "StoredMeet", "StoredSwim"]
+
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    sha256 TEXT UNIQUE,
+    ingested TEXT NOT NULL,
+    records_skipped INTEGER NOT NULL,
+    fields_recovered INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meets (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    name TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT,
+    city TEXT,
+    state TEXT,
+    country TEXT,
+    course TEXT,
+    meet_type TEXT,
+    software_name TEXT
+);
+CREATE TABLE IF NOT EXISTS clubs (
+    id INTEGER PRIMARY KEY,
+    meet_id INTEGER NOT NULL REFERENCES meets(id),
+    team_code TEXT NOT NULL,
+    lsc TEXT,
+    name TEXT
+);
+CREATE TABLE IF NOT EXISTS swimmers (
+    id INTEGER PRIMARY KEY,
+    meet_id INTEGER NOT NULL REFERENCES meets(id),
+    club_id INTEGER REFERENCES clubs(id),
+    athlete_id TEXT,
+    id_long TEXT,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    sex TEXT NOT NULL,
+    birthday TEXT
+);
+CREATE TABLE IF NOT EXISTS swims (
+    id INTEGER PRIMARY KEY,
+    meet_id INTEGER NOT NULL REFERENCES meets(id),
+    swimmer_id INTEGER NOT NULL REFERENCES swimmers(id),
+    club_id INTEGER REFERENCES clubs(id),
+    athlete_id TEXT,
+    event TEXT NOT NULL,
+    session TEXT NOT NULL,
+    status TEXT NOT NULL,
+    time INTEGER,
+    seed_time INTEGER,
+    date TEXT,
+    age INTEGER,
+    heat INTEGER,
+    lane INTEGER,
+    rank INTEGER,
+    points REAL
+);
+CREATE TABLE IF NOT EXISTS relays (
+    id INTEGER PRIMARY KEY,
+    meet_id INTEGER NOT NULL REFERENCES meets(id),
+    club_id INTEGER REFERENCES clubs(id),
+    relay_letter TEXT NOT NULL,
+    event TEXT NOT NULL,
+    session TEXT NOT NULL,
+    status TEXT NOT NULL,
+    time INTEGER,
+    date TEXT,
+    rank INTEGER,
+    points REAL
+);
+CREATE TABLE IF NOT EXISTS legs (
+    relay_id INTEGER NOT NULL REFERENCES relays(id),
+    position INTEGER NOT NULL,
+    leg_order TEXT,
+    swimmer_id INTEGER REFERENCES swimmers(id),
+    athlete_id TEXT,
+    event TEXT,
+    status TEXT NOT NULL,
+    time INTEGER
+);
+CREATE TABLE IF NOT EXISTS splits (
+    swim_id INTEGER REFERENCES swims(id),
+    relay_id INTEGER REFERENCES relays(id),
+    distance INTEGER NOT NULL,
+    time INTEGER,
+    split_type TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS warnings (
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    line_no INTEGER,  -- NULL on rows tallying suppressed warnings
+    record_type TEXT,
+    field TEXT,
+    severity TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    reason TEXT,
+    count INTEGER NOT NULL  -- 1, or the number of suppressed warnings
+);
+CREATE INDEX IF NOT EXISTS swims_athlete ON swims(athlete_id, event);
+CREATE INDEX IF NOT EXISTS swims_event ON swims(event, time);
+CREATE INDEX IF NOT EXISTS swims_date ON swims(date);
+CREATE INDEX IF NOT EXISTS swims_club ON swims(club_id);
+CREATE INDEX IF NOT EXISTS swimmers_athlete ON swimmers(athlete_id);
+CREATE INDEX IF NOT EXISTS clubs_team ON clubs(team_code);
+CREATE INDEX IF NOT EXISTS relays_event ON relays(event, time);
+CREATE INDEX IF NOT EXISTS legs_athlete ON legs(athlete_id);
+CREATE INDEX IF NOT EXISTS meets_date ON meets(start_date);
+"""
+
+# One SELECT shared by the swim queries; columns match StoredSwim's fields.
+_SWIM_SELECT = """
+SELECT s.athlete_id, sw.first_name || ' ' || sw.last_name, c.team_code, m.name,
+       s.event, s.session, s.status, s.time, s.date
+FROM swims s
+JOIN swimmers sw ON sw.id = s.swimmer_id
+JOIN meets m ON m.id = s.meet_id
+LEFT JOIN clubs c ON c.id = s.club_id
+"""
+
+_COUNTING = tuple(s.name for s in COUNTING_STATUSES)
+
+
+@dataclass(frozen=True, slots=True)
+class StoredMeet:
+    """A meet row.
+
+    Attributes:
+        id: Row ID in the ``meets`` table.
+        name: Meet name.
+        start_date: Start date.
+        source: Source path of the file it was loaded from.
+    """
+
+    id: int
+    name: str
+    start_date: datetime.date
+    source: str
+
+
+@dataclass(frozen=True, slots=True)
+class StoredSwim:
+    """An individual swim row, as returned by the query helpers.
+
+    Attributes:
+        athlete: The athlete's :func:`~tunas.athletes.athlete_key`, or None.
+        name: The swimmer's name.
+        club: Team code of the club, or None if unattached.
+        meet: Meet name.
+        event: The event swum.
+        session: Session it was swum in.
+        status: Result status.
+        time: The swim time, or None.
+        date: Date of the swim, if recorded.
+    """
+
+    athlete: str | None
+    name: str
+    club: str | None
+    meet: str
+    event: Event
+    session: Session
+    status: ResultStatus
+    time: Time | None
+    date: datetime.date | None
+
+
+class Store:
+    """A SQLite database of parsed meets.
+
+    Args:
+        path: Database file (created if missing), or ``":memory:"``.
+
+    Raises:
+        ValueError: If ``path`` holds a store written by an incompatible version.
+    """
+
+    __slots__ = ("connection",)
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:") -> None:
+        self.connection = sqlite3.connect(path)
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, _SCHEMA_VERSION):
+            self.connection.close()
+            raise ValueError(f"store schema version {version} is not {_SCHEMA_VERSION}")
+        with self.connection:
+            self.connection.executescript(_SCHEMA)
+            self.connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    def __enter__(self) -> Store:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        files, meets, swims = self.connection.execute(
+            "SELECT (SELECT count(*) FROM files), (SELECT count(*) FROM meets), "
+            "(SELECT count(*) FROM swims)"
+        ).fetchone()
+        return f"Store(files={files}, meets={meets}, swims={swims})"
+
+    # -- loading ----------------------------------------------------------- #
+
+    def contains(self, sha256: str) -> bool:
+        """True if a file with this content hash has been ingested."""
+        row = self.connection.execute("SELECT 1 FROM files WHERE sha256 = ?", (sha256,))
+        return row.fetchone() is not None
+
+    def ingest_files(self, paths: Iterable[str | os.PathLike[str]], *, strict: bool = False) -> int:
+        """Parse and load every file not already stored; return how many were loaded.
+
+        ``.hy3`` files are read with :func:`~tunas.read_hy3`, anything else with
+        :func:`~tunas.read_cl2`. A file whose bytes match an ingested file is skipped
+        without being parsed.
+        """
+        loaded = 0
+        for item in paths:
+            path = Path(os.fspath(item))
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            if self.contains(digest):
+                continue
+            reader = read_hy3 if path.suffix.lower() == ".hy3" else read_cl2
+            for archive in reader(path, strict=strict):
+                self.ingest(archive, sha256=digest)
+            loaded += 1
+        return loaded
+
+    def ingest(self, archive: MeetArchive, *, sha256: str | None = None) -> bool:
+        """Load one archive in a single transaction; return False if ``sha256`` is known.
+
+        Without ``sha256`` the archive is always loaded (no deduplication).
+        """
+        if sha256 is not None and self.contains(sha256):
+            return False
+        conn = self.connection
+        with conn:
+            batch = _Batch(conn)
+            report = archive.report
+            file_id = batch.insert(
+                "files",
+                archive.source,
+                sha256,
+                datetime.datetime.now(datetime.UTC).isoformat(timespec="seconds"),
+                report.records_skipped,
+                report.fields_recovered,
+            )
+            for w in report.warnings:
+                batch.add(
+                    "warnings",
+                    file_id,
+                    w.line_no,
+                    w.record_type,
+                    w.field,
+                    w.severity.name,
+                    w.kind.name,
+                    w.reason,
+                    1,
+                )
+            for tally in report.suppressed.values():
+                for severity, n in tally.by_severity.items():
+                    batch.add(
+                        "warnings",
+                        file_id,
+                        None,
+                        tally.record_type,
+                        tally.field,
+                        severity.name,
+                        tally.kind.name,
+                        None,
+                        n,
+                    )
+            for meet in archive.meets:
+                batch.add_meet(meet, file_id)
+            batch.flush()
+        return True
+
+    # -- queries ----------------------------------------------------------- #
+
+    def meets(self) -> list[StoredMeet]:
+        """Every stored meet, by start date."""
+        rows = self.connection.execute(
+            "SELECT m.id, m.name, m.start_date, f.source FROM meets m "
+            "JOIN files f ON f.id = m.file_id ORDER BY m.start_date, m.id"
+        )
+        return [
+            StoredMeet(id_, name, datetime.date.fromisoformat(start), source)
+            for id_, name, start, source in rows
+        ]
+
+    def swims(
+        self,
+        *,
+        athlete: str | None = None,
+        event: Event | None = None,
+        club: str | None = None,
+        since: datetime.date | None = None,
+        until: datetime.date | None = None,
+        timed_only: bool = False,
+        limit: int | None = None,
+    ) -> list[StoredSwim]:
+        """Individual swims matching every given filter, fastest first within an event.
+
+        Args:
+            athlete: Athlete key (12-char USS#).
+            event: Event swum.
+            club: Team code.
+            since: Earliest swim date (inclusive).
+            until: Latest swim date (inclusive).
+            timed_only: Only swims with a time and an ``OK``/``EXHIBITION`` status.
+            limit: Return at most this many rows.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if athlete is not None:
+            clauses.append("s.athlete_id = ?")
+            params.append(athlete)
+        if event is not None:
+            clauses.append("s.event = ?")
+            params.append(event.name)
+        if club is not None:
+            clauses.append("c.team_code = ?")
+            params.append(club)
+        if since is not None:
+            clauses.append("s.date >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            clauses.append("s.date <= ?")
+            params.append(until.isoformat())
+        if timed_only:
+            clauses.append(
+                f"s.time IS NOT NULL AND s.status IN ({', '.join('?' * len(_COUNTING))})"
+            )
+            params.extend(_COUNTING)
+        sql = _SWIM_SELECT
+        if clauses:
+            sql += "WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY s.event, s.time IS NULL, s.time, s.date IS NULL, s.date, s.id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [_swim(row) for row in self.connection.execute(sql, params)]
+
+    def best(self, athlete: str, event: Event) -> StoredSwim | None:
+        """The athlete's fastest timed swim in ``event``, or None.
+
+        Ties go to the earliest dated swim; undated swims come last.
+        """
+        rows = self.swims(athlete=athlete, event=event, timed_only=True, limit=1)
+        return rows[0] if rows else None
+
+
+class _Batch:
+    """Row buffers for one archive, with IDs assigned up front so rows can reference
+    each other before anything is written; :meth:`flush` writes each table with one
+    ``executemany``.
+    """
+
+    __slots__ = ("conn", "rows", "next_id")
+
+    _COLUMNS = {
+        "files": 6,
+        "meets": 11,
+        "clubs": 5,
+        "swimmers": 9,
+        "swims": 16,
+        "relays": 11,
+        "legs": 8,
+        "splits": 5,
+        "warnings": 8,
+    }
+    _KEYED = ("files", "meets", "clubs", "swimmers", "swims", "relays")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+        self.rows: dict[str, list[tuple[Any, ...]]] = {table: [] for table in self._COLUMNS}
+        self.next_id = {
+            table: conn.execute(f"SELECT coalesce(max(id), 0) + 1 FROM {table}").fetchone()[0]
+            for table in self._KEYED
+        }
+
+    def insert(self, table: str, *values: Any) -> int:
+        """Queue a row for a table with an ``id`` column; return the ID it will get."""
+        row_id: int = self.next_id[table]
+        self.next_id[table] = row_id + 1
+        self.rows[table].append((row_id, *values))
+        return row_id
+
+    def add(self, table: str, *values: Any) -> None:
+        """Queue a row for a table without an ``id`` column."""
+        self.rows[table].append(values)
+
+    def flush(self) -> None:
+        for table, rows in self.rows.items():
+            if rows:
+                marks = ", ".join("?" * self._COLUMNS[table])
+                self.conn.executemany(f"INSERT INTO {table} VALUES ({marks})", rows)
+            rows.clear()
+
+    def add_meet(self, meet: Meet, file_id: int) -> None:
+        source_file = meet.source_file
+        meet_id = self.insert(
+            "meets",
+            file_id,
+            meet.name,
+            meet.start_date.isoformat(),
+            _iso(meet.end_date),
+            meet.city,
+            _name(meet.state),
+            _name(meet.country),
+            _name(meet.course),
+            _name(meet.meet_type),
+            source_file.software_name if source_file else None,
+        )
+        clubs: dict[int, int] = {}
+        swimmers: dict[int, int] = {}
+
+        def club_id(club: Club | None) -> int | None:
+            return clubs[id(club)] if club is not None else None
+
+        def swimmer_id(swimmer: Swimmer | None) -> int | None:
+            if swimmer is None:
+                return None
+            if id(swimmer) not in swimmers:  # a swimmer outside meet.swimmers
+                swimmers[id(swimmer)] = self._swimmer(swimmer, meet_id, club_id(swimmer.club))
+            return swimmers[id(swimmer)]
+
+        for club in meet.clubs:
+            clubs[id(club)] = self.insert(
+                "clubs", meet_id, club.team_code, _name(club.lsc), club.full_name
+            )
+        for result in meet.results:  # clubs referenced by results but not listed
+            if result.club is not None and id(result.club) not in clubs:
+                clubs[id(result.club)] = self.insert(
+                    "clubs", meet_id, result.club.team_code, _name(result.club.lsc), None
+                )
+        for swimmer in meet.swimmers:
+            if swimmer.club is not None and id(swimmer.club) not in clubs:
+                clubs[id(swimmer.club)] = self.insert(
+                    "clubs", meet_id, swimmer.club.team_code, _name(swimmer.club.lsc), None
+                )
+            swimmers[id(swimmer)] = self._swimmer(swimmer, meet_id, club_id(swimmer.club))
+
+        for result in meet.results:
+            if isinstance(result, IndividualSwim):
+                swim_id = self.insert(
+                    "swims",
+                    meet_id,
+                    swimmer_id(result.swimmer),
+                    club_id(result.club),
+                    athlete_key(result.swimmer),
+                    result.event.name,
+                    result.session.name,
+                    result.status.name,
+                    _centis(result.time),
+                    _centis(result.seed_time),
+                    _iso(result.date),
+                    swim_age(result),
+                    result.heat,
+                    result.lane,
+                    result.rank,
+                    result.points,
+                )
+                self._splits(result.splits, swim_id, None)
+            elif isinstance(result, Relay):
+                relay_id = self.insert(
+                    "relays",
+                    meet_id,
+                    club_id(result.club),
+                    result.relay_letter,
+                    result.event.name,
+                    result.session.name,
+                    result.status.name,
+                    _centis(result.time),
+                    _iso(result.date),
+                    result.rank,
+                    result.points,
+                )
+                for position, leg in enumerate(result.legs, start=1):
+                    self.add(
+                        "legs",
+                        relay_id,
+                        position,
+                        _name(leg.order),
+                        swimmer_id(leg.swimmer),
+                        athlete_key(leg.swimmer) if leg.swimmer is not None else None,
+                        _name(leg.event),
+                        leg.status.name,
+                        _centis(leg.time),
+                    )
+                self._splits(result.splits, None, relay_id)
+
+    def _swimmer(self, swimmer: Swimmer, meet_id: int, club_id: int | None) -> int:
+        return self.insert(
+            "swimmers",
+            meet_id,
+            club_id,
+            athlete_key(swimmer),
+            swimmer.id_long,
+            swimmer.first_name,
+            swimmer.last_name,
+            swimmer.sex.name,
+            _iso(swimmer.birthday),
+        )
+
+    def _splits(self, splits: list[Split], swim_id: int | None, relay_id: int | None) -> None:
+        for split in splits:
+            self.add(
+                "splits",
+                swim_id,
+                relay_id,
+                split.distance,
+                _centis(split.time),
+                split.split_type.name,
+            )
+
+
+def _swim(row: tuple[Any, ...]) -> StoredSwim:
+    athlete, name, club, meet, event, session, status, centis, date = row
+    return StoredSwim(
+        athlete=athlete,
+        name=name,
+        club=club,
+        meet=meet,
+        event=Event[event],
+        session=Session[session],
+        status=ResultStatus[status],
+        time=Time(centis) if centis is not None else None,
+        date=datetime.date.fromisoformat(date) if date else None,
+    )
+
+
+def _name(member: Enum | None) -> str | None:
+    return member.name if member is not None else None
+
+
+def _iso(date: datetime.date | None) -> str | None:
+    return date.isoformat() if date is not None else None
+
+
+def _centis(time: Time | None) -> int | None:
+    return time.centiseconds if time is not None else None
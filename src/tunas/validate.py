@@ -0,0 +1,139 @@
+"""Fast structural validation of `.cl2`/`.hy3` files, without building objects.
+
+:func:`validate_cl2` / :func:`validate_hy3` check a file the way the readers do
+before they build anything — line widths, record types, the parent record each
+record needs, mandatory (M1) fields and the ``Z0`` counts, plus (opt-in) the
+`.hy3` line checksums — by slicing fields straight out of the raw lines. No
+``Meet`` graph is built, so a file is checked several times faster than
+:func:`~tunas.read_cl2` parses it: a cheap gate for rejecting broken uploads
+before ingesting them.
+
+Findings are the readers' :class:`~tunas.ParseWarning` values, collected in a
+:class:`~tunas.ParseReport`. A validator never raises on file content: issues a
+reader would raise on are recorded with ``Severity.FATAL`` and checking goes on,
+so one pass lists every structural problem. Checks that need parsed values
+(event resolution, names, relay swimmer matching) are left to the readers, so a
+file that validates can still produce warnings when parsed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TextIO
+
+from tunas._parser.diagnostics import ParseReport, Severity, check_max_warnings
+from tunas._parser.lint import Cl2Linter, Hy3Linter, Linter
+from tunas.parser import Source, _resolve_paths
+
+__all__ = ["ValidationResult", "validate_cl2", "validate_hy3"]
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """The structural check of a single source file (or stream).
+
+    Attributes:
+        source: File path, or "<stream>" for an open text stream.
+        report: Every finding, with ``files_read``, ``records_skipped`` and
+            ``fields_recovered`` counted as a parse would count them (the object
+            counts stay zero).
+    """
+
+    source: str
+    report: ParseReport = field(default_factory=ParseReport)
+
+    @property
+    def valid(self) -> bool:
+        """Whether a lenient read would succeed: no ``FATAL`` finding."""
+        return self.report.count(severity=Severity.FATAL) == 0
+
+
+def validate_cl2(
+    source: Source,
+    *,
+    encoding: str = "cp1252",
+    errors: str = "replace",
+    max_warnings: int | None = None,
+) -> Iterator[ValidationResult]:
+    """Check `.cl2` / SDIF v3 files, yielding one :class:`ValidationResult` per source.
+
+    Sources are resolved and read lazily, in order, exactly as by
+    :func:`~tunas.read_cl2`.
+
+    Args:
+        source: File path, directory (walked recursively for `*.cl2`), iterable of
+            paths, or an open text stream (one result, ``source="<stream>"``).
+        encoding: Text encoding to use when opening file paths.
+        errors: Error handling scheme for decoding errors.
+        max_warnings: Keep full detail for only the first ``max_warnings`` findings
+            of each (record type, field, kind) per file, as on the readers.
+
+    Yields:
+        :class:`ValidationResult` objects in source order.
+
+    Raises:
+        ValueError: If ``max_warnings`` is negative.
+    """
+    linter = Cl2Linter(max_warnings=check_max_warnings(max_warnings))
+    return _validate(source, linter, ".cl2", encoding, errors)
+
+
+def validate_hy3(
+    source: Source,
+    *,
+    encoding: str = "cp1252",
+    errors: str = "replace",
+    max_warnings: int | None = None,
+    verify_checksums: bool = False,
+) -> Iterator[ValidationResult]:
+    """Check Hy-Tek `.hy3` files, yielding one :class:`ValidationResult` per source.
+
+    Args:
+        source: File path, directory (walked recursively for `*.hy3`), iterable of
+            paths, or an open text stream (one result, ``source="<stream>"``).
+        encoding: Text encoding to use when opening file paths; also the encoding
+            checksums are computed over.
+        errors: Error handling scheme for decoding errors.
+        max_warnings: Keep full detail for only the first ``max_warnings`` findings
+            of each (record type, field, kind) per file, as on the readers.
+        verify_checksums: Also compare each line's checksum (columns 129-130) with
+            its first 128 columns, reporting mismatched and missing checksums as
+            ``IssueKind.BAD_CHECKSUM``. `USAS Club Times Export` files are not checked.
+
+    Yields:
+        :class:`ValidationResult` objects in source order.
+
+    Raises:
+        ValueError: If ``max_warnings`` is negative.
+    """
+    linter = Hy3Linter(
+        max_warnings=check_max_warnings(max_warnings),
+        verify_checksums=verify_checksums,
+        encoding=encoding,
+    )
+    return _validate(source, linter, ".hy3", encoding, errors)
+
+
+def _validate(
+    source: Source, linter: Linter, suffix: str, encoding: str, errors: str
+) -> Iterator[ValidationResult]:
+    if hasattr(source, "read"):
+        return _validate_stream(source, linter)  # type: ignore[arg-type]
+    return _validate_paths(_resolve_paths(source, suffix), linter, encoding, errors)
+
+
+def _validate_stream(
+    stream: TextIO, linter: Linter, source: str = "<stream>"
+) -> Iterator[ValidationResult]:
+    yield ValidationResult(source, linter.lint(stream, source))
+
+
+def _validate_paths(
+    paths: list[Path], linter: Linter, encoding: str, errors: str
+) -> Iterator[ValidationResult]:
+    for path in paths:
+        with open(path, encoding=encoding, errors=errors) as fh:
+            report = linter.lint(fh, str(path))
+        yield ValidationResult(str(path), report)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import io
+
 import pytest
 from conftest import A0, B1, C1, Z0, d0, e0, f0, parse_lines, rec
 
-from tunas import IssueKind, ParseError, Severity
+from tunas import HandlerStats, IssueKind, ParseError, ParseReport, Severity, read_cl2
 
 
 def _warning_count(report: object) -> int:
@@ -238,3 +240,115 @@ def test_report_by_severity_and_filters() -> None:
     assert by_sev[Severity.RECOVERED]
     assert archive.report.warnings_for(severity=Severity.SKIPPED)
     assert archive.report.has_warnings
+
+
+def test_indexed_counts_include_suppressed_and_direct_appends() -> None:
+    lines = [A0, B1, C1, *(d0(birth="") for _ in range(4)), d0(uss=""), Z0]
+    report = _capped(lines, 1)
+    assert len(report.warnings) == 2 and report.warning_count == 5
+    assert report.count(field="birthday") == 4
+    assert report.count(kind=IssueKind.MISSING, severity=Severity.SKIPPED) == 1
+    assert report.count(source="elsewhere") == 0
+    assert report.counts("severity") == {Severity.RECOVERED: 4, Severity.SKIPPED: 1}
+    assert report.counts("record_type") == {"D0": 5}
+    with pytest.raises(ValueError, match="by"):
+        report.counts("line_no")
+
+    (warning,) = report.warnings_for(field="birthday", source="<stream>")
+    assert warning.line_no == 4
+    report.warnings.append(warning)  # appended directly, not via add()
+    assert report.count(field="birthday") == 5
+    assert len(report.warnings_for(field="birthday")) == 2
+
+
+def test_filtered_warnings_are_recounted() -> None:
+    lines = [A0, B1, C1, d0(birth=""), d0(uss=""), d0(birth=""), Z0]
+    report = parse_lines(lines).report
+    assert len(report.by_severity[Severity.RECOVERED]) == 2  # builds the position index
+    report.warnings = report.warnings[:1]  # replaced
+    assert report.by_severity[Severity.RECOVERED] == report.warnings
+    assert report.warning_count == 1 and report.count(severity=Severity.SKIPPED) == 0
+    del report.warnings[:]  # shortened in place
+    assert report.warnings_for(field="birthday") == [] and report.warning_count == 0
+    capped = _capped(lines, 0)
+    capped.warnings.clear()  # only kept warnings go; suppressed ones still count
+    assert capped.warning_count == 3 and capped.counts("severity")[Severity.SKIPPED] == 1
+
+
+# -- opt-in handler profiling -------------------------------------------------- #
+
+
+def _profiled(lines: list[str]) -> ParseReport:
+    (archive,) = read_cl2(io.StringIO("\n".join(lines) + "\n"), profile=True)
+    return archive.report
+
+
+def test_profile_off_by_default() -> None:
+    assert parse_lines([A0, B1, C1, d0(), Z0]).report.profile == {}
+
+
+def test_profile_counts_calls_time_and_warnings() -> None:
+    report = _profiled([A0, B1, C1, d0(), d0(birth=""), e0(), f0(), f0(), Z0])
+    profile = report.profile
+    assert set(profile) == {"A0", "B1", "C1", "D0", "E0", "F0", "Z0"}
+    d0_stats = profile["D0"]
+    assert (d0_stats.handler, d0_stats.calls) == ("_h_d0", 2)
+    assert d0_stats.seconds > 0
+    assert d0_stats.warnings == len(report.warnings_for(record_type="D0"))
+    assert profile["F0"].calls == 2
+
+
+def test_profile_merges_with_report() -> None:
+    total = _profiled([A0, B1, C1, d0(), Z0])
+    total.merge(_profiled([A0, B1, C1, d0(), d0(), Z0]))
+    assert total.profile["D0"].calls == 3
+    assert total.profile["A0"].calls == 2
+    assert isinstance(total.profile["A0"], HandlerStats)
+
+
+# -- bounded warning storage --------------------------------------------------- #
+
+
+def _capped(lines: list[str], max_warnings: int | None) -> ParseReport:
+    (archive,) = read_cl2(io.StringIO("\n".join(lines) + "\n"), max_warnings=max_warnings)
+    return archive.report
+
+
+def test_max_warnings_keeps_first_per_key_and_tallies_rest() -> None:
+    lines = [A0, B1, C1, *(d0(birth="") for _ in range(5)), d0(birth="13452010"), d0(uss=""), Z0]
+    full, capped = _capped(lines, None), _capped(lines, 2)
+    assert len(full.warnings) == 7 and full.suppressed == {}
+    kept = [(w.line_no, w.kind) for w in capped.warnings]
+    assert kept == [
+        (4, IssueKind.MISSING),
+        (5, IssueKind.MISSING),
+        (9, IssueKind.MALFORMED),
+        (10, IssueKind.MISSING),
+    ]
+    (tally,) = capped.suppressed.values()
+    assert (tally.record_type, tally.field, tally.kind) == ("D0", "birthday", IssueKind.MISSING)
+    assert tally.count == 3 and tally.by_severity == {Severity.RECOVERED: 3}
+    assert tally.examples == [("<stream>", 6), ("<stream>", 7), ("<stream>", 8)]
+    # The counters stay exact.
+    assert (capped.records_skipped, capped.fields_recovered) == (
+        full.records_skipped,
+        full.fields_recovered,
+    )
+    assert capped.warning_count == full.warning_count == 7
+    assert _capped(lines, 0).warnings == [] and _capped(lines, 0).has_warnings
+
+
+def test_merge_applies_the_receiving_cap() -> None:
+    lines = [A0, B1, C1, *(d0(birth="") for _ in range(3)), Z0]
+    total = ParseReport(max_warnings=4)
+    for _ in range(3):
+        total.merge(_capped(lines, 2))
+    assert len(total.warnings) == 4
+    (tally,) = total.suppressed.values()
+    assert tally.count == 5 and len(tally.examples) == 5
+    assert total.fields_recovered == 9
+
+
+def test_max_warnings_validated() -> None:
+    with pytest.raises(ValueError, match="max_warnings"):
+        read_cl2(io.StringIO(""), max_warnings=-1)
@@ -14,7 +14,7 @@ from pathlib import Path
 import pytest
 from conftest import A0, B1, C1, DATA_DIR, Z0, d0, rec
 
-from tunas import ParseError, ParseReport, read_cl2
+from tunas import IssueKind, MeetArchive, ParseError, ParseReport, read_cl2
 
 _GOLDEN = [str(DATA_DIR / "reno_walk_on_meet.cl2"), str(DATA_DIR / "aaa_league_championship.cl2")]
 
@@ -135,3 +135,70 @@ def test_report_merge_method() -> None:
     assert (a.files_read, a.meets_parsed, a.swimmers_parsed) == (2, 7, 10)
     # b is left untouched
     assert (b.files_read, b.meets_parsed, b.swimmers_parsed) == (1, 5, 7)
+
+
+# --- meets of one file in worker processes ----------------------------------- #
+
+
+def _multi_meet_file(tmp_path: Path) -> Path:
+    """Both golden meets (and a synthetic one) behind one A0, with the first file's Z0."""
+    aaa, reno = (Path(p).read_bytes().splitlines(keepends=True) for p in reversed(_GOLDEN))
+    body = [line for line in aaa if not line.startswith(b"Z0")]
+    trailer = [line for line in aaa if line.startswith(b"Z0")]
+    extra = [line for line in reno if not line.startswith((b"A0", b"Z0"))]
+    synthetic = [f"{line}\n".encode() for line in (B1, C1, d0())]
+    path = tmp_path / "season.cl2"
+    path.write_bytes(b"".join(body + extra + synthetic + trailer))
+    return path
+
+
+def _shape(archive: MeetArchive) -> tuple[object, ...]:
+    meets = [(m.name, len(m.results), len(m.swimmers), len(m.clubs)) for m in archive.meets]
+    report = {k: v for k, v in vars(archive.report).items() if k != "warnings"}
+    return meets, report, archive.report.warnings
+
+
+def test_workers_reassemble_same_archive(tmp_path: Path) -> None:
+    path = _multi_meet_file(tmp_path)
+    (serial,) = read_cl2(path)
+    (parallel,) = read_cl2(path, workers=2)
+    assert len(parallel.meets) == 3
+    assert _shape(parallel) == _shape(serial)
+    assert parallel.report.warnings_for(kind=IssueKind.COUNT_MISMATCH)  # Z0 checks ran
+    source_file = parallel.meets[0].source_file
+    assert source_file is not None and source_file == serial.meets[0].source_file
+    assert all(m.source_file is source_file for m in parallel.meets)
+
+
+def test_workers_strict_raises_earliest_meet(tmp_path: Path) -> None:
+    path = tmp_path / "bad.cl2"
+    lines = [A0, B1, C1, d0(), B1, C1, d0(birth=""), Z0]  # missing birthday in meet 2
+    path.write_text("\n".join(lines) + "\n")
+    with pytest.raises(ParseError) as excinfo:
+        list(read_cl2(path, strict=True, workers=2))
+    assert excinfo.value.warning.line_no == 7  # the worker's error, rebuilt intact
+
+
+def test_workers_validated_eagerly() -> None:
+    with pytest.raises(ValueError, match="workers"):
+        read_cl2(_GOLDEN, workers=0)
+
+
+def test_workers_merge_handler_profiles(tmp_path: Path) -> None:
+    path = _multi_meet_file(tmp_path)
+    (serial,) = read_cl2(path, profile=True)
+    (parallel,) = read_cl2(path, profile=True, workers=2)
+
+    def calls(report: ParseReport) -> dict[str, tuple[int, int]]:
+        return {k: (v.calls, v.warnings) for k, v in report.profile.items()}
+
+    assert calls(parallel.report) == calls(serial.report)
+    assert parallel.report.profile["A0"].calls == 1  # the header is counted once
+
+
+def test_workers_apply_warning_cap_like_serial(tmp_path: Path) -> None:
+    path = _multi_meet_file(tmp_path)
+    (serial,) = read_cl2(path, max_warnings=3)
+    (parallel,) = read_cl2(path, max_warnings=3, workers=2)
+    assert serial.report.suppressed
+    assert _shape(parallel) == _shape(serial)
@@ -222,7 +222,7 @@ def hy3_rec(*fields: tuple[int, str]) -> str:
     """Build a valid 130-char `.hy3` line, placing ``(start_1indexed, text)`` fields.
 
     The trailing 2-digit checksum is computed over the data body so the line
-    passes :func:`tunas._parser.checksum.checksum_matches`.
+    passes ``verify_checksums``.
     """
     buf = [" "] * 128
     for start, text in fields:
@@ -6,9 +6,9 @@ import io
 import os
 
 import pytest
-from conftest import A1, B1_HY3, B2_HY3, C1_HY3, d1, e1, e2
+from conftest import A1, B1_HY3, B2_HY3, C1_HY3, DATA_DIR, d1, e1, e2
 
-from tunas import read_hy3
+from tunas import IssueKind, ParseError, Severity, read_hy3
 
 
 def _single_meet_text() -> str:
@@ -119,3 +119,56 @@ def test_per_meet_scope_two_b1_blocks() -> None:
     assert meets[0].swimmers[0].meet is meets[0]
     assert meets[1].swimmers[0].meet is meets[1]
     assert meets[0].swimmers[0] is not meets[1].swimmers[0]
+
+
+def _resummed(line: str, checksum: str) -> str:
+    return line[:128] + checksum
+
+
+def _bad(line: str) -> str:
+    return _resummed(line, "00" if line[128:] != "00" else "11")
+
+
+def test_checksums_verified_on_request() -> None:
+    lines = [A1, B1_HY3, C1_HY3, d1(), _bad(e1()), _resummed(e2(), "  ")]
+    text = "\n".join(lines) + "\n"
+    assert not next(read_hy3(io.StringIO(text))).report.has_warnings
+    report = next(read_hy3(io.StringIO(text), verify_checksums=True)).report
+    bad, missing = report.warnings
+    assert (bad.line_no, bad.field, bad.column) == (5, "checksum", "129/2")
+    assert bad.kind is IssueKind.BAD_CHECKSUM and bad.severity is Severity.RECOVERED
+    assert bad.reason == f"checksum {_bad(e1())[128:]!r} does not match {e1()[128:]!r}"
+    assert missing.line_no == 6 and missing.reason.startswith("missing checksum")
+    assert report.fields_recovered == 0  # a line check, not a recovered field
+    assert report.individual_swims_parsed == 1
+
+
+def test_checksums_strict_raises() -> None:
+    text = "\n".join([A1, B1_HY3, C1_HY3, _bad(d1()), e1(), e2()]) + "\n"
+    with pytest.raises(ParseError) as exc:
+        next(read_hy3(io.StringIO(text), strict=True, verify_checksums=True))
+    assert exc.value.warning.line_no == 4
+
+
+def test_club_times_export_is_not_checksummed() -> None:
+    club_times = _resummed(A1[:2] + "17" + A1[4:128], "  ")
+    text = "\n".join([club_times, B1_HY3, C1_HY3, _resummed(d1(), "  "), e1(), e2()]) + "\n"
+    assert not next(read_hy3(io.StringIO(text), verify_checksums=True)).report.has_warnings
+
+
+def test_golden_file_checksums() -> None:
+    path = DATA_DIR / "pasa_distance_intersquad.hy3"
+    verified = next(read_hy3(path, verify_checksums=True)).report
+    assert verified.warnings == next(read_hy3(path)).report.warnings
+
+
+def test_checksums_verified_in_parallel(tmp_path: object) -> None:
+    meet = [B1_HY3, B2_HY3, C1_HY3, d1(), e1(), e2()]
+    lines = [A1, *meet, *meet[:-1], _bad(e2())]
+    path = os.path.join(str(tmp_path), "two.hy3")
+    with open(path, "w") as fh:
+        fh.write("\n".join(lines) + "\n")
+    (serial,) = read_hy3(path, verify_checksums=True)
+    (parallel,) = read_hy3(path, verify_checksums=True, workers=2)
+    assert [w.line_no for w in serial.report.warnings] == [13]
+    assert parallel.report.warnings == serial.report.warnings
@@ -0,0 +1,412 @@
+"""Deterministic synthetic `.cl2` / `.hy3` files for scale and stress testing.
+
+Builds on the record builders in ``conftest`` (and so on ``hy3_checksum``): every
+line is a fixture-grade record, the `.cl2` trailer declares the true ``Z0`` counts
+and every `.hy3` line carries its checksum. A :class:`Spec` fixes the shape — meets
+per file, clubs, swimmers, relay ratio, split density and error rate — and a seed,
+so the same spec always produces byte-identical files. Each :class:`SynthFile`
+also reports what a parse of it should count, so stress tests can assert on it.
+
+Use from tests (``from synth import Spec, synth_cl2``) or from the command line::
+
+    python tests/synth.py OUT_DIR --format hy3 --files 100 --swimmers 5000 --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import random
+import sys
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from conftest import A0, A1, d0, d1, e0, e1, e2, f0, f2, f3, f3_slot, g0, g1, g1_block, hy3_rec, rec
+
+__all__ = ["Spec", "SynthFile", "synth_cl2", "synth_hy3", "write_corpus"]
+
+# Individual events and relays: (distance, cl2 stroke code, hy3 stroke letter,
+# base seconds per 100 yards).
+_EVENTS = [
+    (50, "1", "A", 62.0),
+    (100, "1", "A", 62.0),
+    (200, "1", "A", 67.0),
+    (500, "1", "A", 72.0),
+    (100, "2", "B", 70.0),
+    (100, "3", "C", 78.0),
+    (100, "4", "D", 68.0),
+    (200, "5", "E", 74.0),
+]
+_RELAYS = [(200, "6", "A", 58.0), (200, "7", "E", 64.0), (400, "6", "A", 60.0)]
+_LAST = ["Nguyen", "Smith", "Garcia", "Kim", "Patel", "Johnson", "Chen", "Lopez", "Brown", "Ito"]
+_FIRST = ["Ava", "Liam", "Mia", "Noah", "Zoe", "Eli", "Ivy", "Leo", "Ada", "Max", "Uma", "Kai"]
+_LSCS = ["PC", "SI", "SN", "CC", "OR", "AZ"]
+
+
+@dataclass(frozen=True)
+class Spec:
+    """The shape of one synthetic file.
+
+    Attributes:
+        meets: Meets (``B1`` blocks) in the file.
+        clubs: Clubs per meet.
+        swimmers: Swimmers per meet, spread over the clubs.
+        swims: Individual swims per swimmer.
+        relay_ratio: Relays per swimmer (4 legs each, drawn from the club's swimmers).
+        split_density: Fraction of swims of 100 or more yards that carry splits.
+        error_rate: Fraction of swimmer records (``.cl2`` ``D0``, ``.hy3`` ``D1``)
+            given a recoverable error: a blank or malformed birthday, one warning each.
+        seed: Seed for every random choice; equal specs give identical files.
+    """
+
+    meets: int = 1
+    clubs: int = 4
+    swimmers: int = 100
+    swims: int = 3
+    relay_ratio: float = 0.1
+    split_density: float = 0.5
+    error_rate: float = 0.0
+    seed: int = 0
+
+
+@dataclass
+class SynthFile:
+    """A generated file and the counts a parse of it should report."""
+
+    text: str
+    meets: int = 0
+    swimmers: int = 0
+    individual_swims: int = 0
+    relays: int = 0
+    splits: int = 0
+    errors: int = 0
+    counts: dict[str, int] = field(default_factory=dict)  # records per type
+
+
+@dataclass
+class _Swimmer:
+    number: int
+    member_id: str
+    last: str
+    first: str
+    sex: str
+    birth: datetime.date
+    age: int
+
+
+class _Builder:
+    """Shared state of one file: the RNG, the output lines and the running counts."""
+
+    def __init__(self, spec: Spec) -> None:
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.out = SynthFile(text="")
+        self.lines: list[str] = []
+        self.serial = 0
+
+    def add(self, line: str) -> None:
+        self.lines.append(line)
+        kind = line[0:2]
+        self.out.counts[kind] = self.out.counts.get(kind, 0) + 1
+
+    def member_id(self, width: int) -> str:
+        """A unique hex ID: an odd multiplier is a bijection mod 16**width."""
+        self.serial += 1
+        n = (self.spec.seed * 1_000_003 + self.serial) * 0x9E3779B1 % 16**width
+        return f"{n:0{width}X}"
+
+    def swimmers(self, meet_date: datetime.date, count: int, id_width: int) -> list[_Swimmer]:
+        rng, out = self.rng, []
+        for i in range(count):
+            age = rng.randint(9, 18)
+            birth = meet_date - datetime.timedelta(days=365 * age + rng.randint(1, 360))
+            out.append(
+                _Swimmer(
+                    number=i + 1,
+                    member_id=self.member_id(id_width),
+                    last=rng.choice(_LAST) + "-" + _syllable(rng),
+                    first=rng.choice(_FIRST),
+                    sex=rng.choice("FM"),
+                    birth=birth,
+                    age=(meet_date - birth).days // 365,
+                )
+            )
+        return out
+
+    def seconds(self, distance: int, per_100: float, age: int) -> float:
+        """A plausible time: slower for younger swimmers, with per-swim noise."""
+        youth = 1 + max(0, 16 - age) * 0.04
+        return per_100 * distance / 100 * youth * self.rng.uniform(0.95, 1.12)
+
+    def error(self) -> str | None:
+        """A bad birthday (blank or malformed) for ``error_rate`` of the swimmer records."""
+        if self.rng.random() >= self.spec.error_rate:
+            return None
+        self.out.errors += 1
+        return self.rng.choice(["", "13452010"])
+
+
+def _syllable(rng: random.Random) -> str:
+    return rng.choice("BDKLMRST") + rng.choice("aeiou") + rng.choice("nrsx")
+
+
+def _clubs(builder: _Builder, swimmers: list[_Swimmer]) -> list[tuple[str, str, list[_Swimmer]]]:
+    """``(lsc, code, members)`` per club, splitting the swimmers round-robin."""
+    n = max(1, builder.spec.clubs)
+    return [
+        (_LSCS[i % len(_LSCS)], f"S{i:03d}"[-4:], swimmers[i::n])
+        for i in range(n)
+        if swimmers[i::n]
+    ]
+
+
+def _cl2_time(seconds: float) -> str:
+    minutes, rest = divmod(round(seconds * 100), 6000)
+    return f"{minutes}:{rest // 100:02d}.{rest % 100:02d}" if minutes else f"{rest / 100:.2f}"
+
+
+def _hy3_time(seconds: float) -> str:
+    return f"{seconds:.2f}"
+
+
+def _cumulative(builder: _Builder, total: float, distance: int) -> list[float]:
+    """Cumulative 50-yard splits ending exactly at ``total``."""
+    legs = distance // 50
+    weights = [builder.rng.uniform(0.9, 1.1) for _ in range(legs)]
+    weights[0] *= 0.92  # the start
+    scale = total / sum(weights)
+    out, acc = [], 0.0
+    for w in weights:
+        acc += w * scale
+        out.append(acc)
+    out[-1] = total
+    return out
+
+
+# -- SDIF .cl2 ------------------------------------------------------------------- #
+
+
+def synth_cl2(spec: Spec) -> SynthFile:
+    """Generate one `.cl2` file for ``spec``."""
+    b = _Builder(spec)
+    b.add(A0)
+    start = datetime.date(2025, 1, 4)
+    for m in range(spec.meets):
+        date = start + datetime.timedelta(days=7 * m)
+        mdy = date.strftime("%m%d%Y")
+        b.add(
+            rec(
+                (1, "B1"), (3, "1"), (12, f"Synthetic Invitational {m + 1}"), (86, "Santa Clara"),
+                (106, "CA"), (121, "3"), (122, mdy), (130, mdy), (150, "2"),
+            )
+        )  # fmt: skip
+        b.out.meets += 1
+        swimmers = b.swimmers(date, spec.swimmers, 12)
+        b.out.swimmers += len(swimmers)
+        for lsc, code, members in _clubs(b, swimmers):
+            team = lsc + code
+            name = f"Synthetic {code} Aquatics"
+            b.add(rec((1, "C1"), (3, "1"), (12, team), (18, name), (48, code), (143, "1")))
+            for sw in members:
+                for dist, stroke, _, per_100 in b.rng.sample(
+                    _EVENTS, min(spec.swims, len(_EVENTS))
+                ):
+                    _cl2_swim(b, sw, dist, stroke, per_100, mdy)
+            for _ in range(round(len(members) * spec.relay_ratio)):
+                if len(members) >= 4:
+                    _cl2_relay(b, team, b.rng.sample(members, 4), mdy)
+    counts = b.out.counts
+    letters = {k: sum(v for t, v in counts.items() if t[0] == k) for k in "BCDEFG"}
+    b.add(
+        rec(
+            (1, "Z0"), (3, "1"), (12, "02"), (14, "Synthetic corpus"), (44, str(letters["B"])),
+            (47, str(spec.meets)), (50, str(letters["C"])), (58, str(letters["D"])),
+            (70, str(letters["E"])), (75, str(letters["F"])), (81, str(letters["G"])),
+        )
+    )  # fmt: skip
+    b.out.text = "\r\n".join(b.lines) + "\r\n"
+    return b.out
+
+
+def _cl2_name(sw: _Swimmer) -> str:
+    return f"{sw.last}, {sw.first}"
+
+
+def _cl2_swim(b: _Builder, sw: _Swimmer, dist: int, stroke: str, per_100: float, mdy: str) -> None:
+    seconds = b.seconds(dist, per_100, sw.age)
+    bad = b.error()
+    b.add(
+        d0(
+            uss=sw.member_id,
+            name=_cl2_name(sw),
+            sex=sw.sex,
+            esex=sw.sex,
+            birth=sw.birth.strftime("%m%d%Y") if bad is None else bad,
+            age_class=str(sw.age),
+            dist=str(dist),
+            stroke=stroke,
+            eage="UNOV",
+            date=mdy,
+            seed=_cl2_time(seconds * 1.02),
+            finals=_cl2_time(seconds),
+            finals_place=str(b.rng.randint(1, 16)),
+        )
+    )
+    b.out.individual_swims += 1
+    if dist >= 100 and b.rng.random() < b.spec.split_density:
+        times = [_cl2_time(t) for t in _cumulative(b, seconds, dist)]
+        chunks = [times[i : i + 10] for i in range(0, len(times), 10)]
+        for seq, chunk in enumerate(chunks, start=1):
+            b.add(g0(uss=sw.member_id, seq=str(seq), total=str(len(chunks)), times=tuple(chunk)))
+        b.out.splits += len(times)
+
+
+def _cl2_relay(b: _Builder, team: str, legs: list[_Swimmer], mdy: str) -> None:
+    dist, stroke, _, per_100 = b.rng.choice(_RELAYS)
+    sexes = {sw.sex for sw in legs}
+    esex = sexes.pop() if len(sexes) == 1 else "X"
+    seconds = [b.seconds(dist // 4, per_100, sw.age) for sw in legs]
+    b.add(
+        e0(
+            letter="A", team=team, esex=esex, dist=str(dist), stroke=stroke, eage="UNOV",
+            total_age=str(sum(sw.age for sw in legs)), date=mdy, finals=_cl2_time(sum(seconds)),
+        )
+    )  # fmt: skip
+    for order, (sw, leg) in enumerate(zip(legs, seconds, strict=True), start=1):
+        b.add(
+            f0(
+                team=team, name=_cl2_name(sw), uss=sw.member_id,
+                birth=sw.birth.strftime("%m%d%Y"), sex=sw.sex, order_finals=str(order),
+                leg_time=_cl2_time(leg),
+            )
+        )  # fmt: skip
+    b.out.relays += 1
+
+
+# -- Hy-Tek .hy3 ------------------------------------------------------------------ #
+
+
+def synth_hy3(spec: Spec) -> SynthFile:
+    """Generate one `.hy3` file for ``spec`` (every line checksummed)."""
+    b = _Builder(spec)
+    b.add(A1)
+    start = datetime.date(2025, 1, 4)
+    for m in range(spec.meets):
+        date = start + datetime.timedelta(days=7 * m)
+        mdy = date.strftime("%m%d%Y")
+        b.add(
+            hy3_rec(
+                (1, "B1"), (3, f"Synthetic Invitational {m + 1}"), (48, "Rinconada Pool"),
+                (93, mdy), (101, mdy), (109, mdy), (117, "  12"),
+            )
+        )  # fmt: skip
+        b.add(hy3_rec((1, "B2"), (99, "Y"), (109, f"25-{m + 1:03d}")))
+        b.out.meets += 1
+        swimmers = b.swimmers(date, spec.swimmers, 14)
+        b.out.swimmers += len(swimmers)
+        for lsc, code, members in _clubs(b, swimmers):
+            b.add(hy3_rec((1, "C1"), (3, code), (8, f"Synthetic {code} Aquatics"), (54, lsc)))
+            for sw in members:
+                _hy3_swimmer(b, sw, mdy)
+            for _ in range(round(len(members) * spec.relay_ratio)):
+                if len(members) >= 4:
+                    _hy3_relay(b, code, b.rng.sample(members, 4), mdy)
+    b.out.text = "\r\n".join(b.lines) + "\r\n"
+    return b.out
+
+
+def _hy3_swimmer(b: _Builder, sw: _Swimmer, mdy: str) -> None:
+    bad = b.error()
+    b.add(
+        d1(
+            sex=sw.sex, number=str(sw.number), last=sw.last, first=sw.first, preferred=sw.first,
+            member=sw.member_id, birth=sw.birth.strftime("%m%d%Y") if bad is None else bad,
+            age=str(sw.age),
+        )
+    )  # fmt: skip
+    for dist, _, stroke, per_100 in b.rng.sample(_EVENTS, min(b.spec.swims, len(_EVENTS))):
+        seconds = b.seconds(dist, per_100, sw.age)
+        b.add(
+            e1(
+                number=str(sw.number), event_sex="G" if sw.sex == "F" else "B", dist=str(dist),
+                stroke=stroke, seed=_hy3_time(seconds * 1.02),
+            )
+        )  # fmt: skip
+        b.add(e2(time=_hy3_time(seconds), place=str(b.rng.randint(1, 16)), date=mdy))
+        b.out.individual_swims += 1
+        if dist >= 100 and b.rng.random() < b.spec.split_density:
+            splits = _cumulative(b, seconds, dist)
+            # G1 counters are pool lengths: every 50 yards is two 25-yard lengths.
+            blocks = [g1_block("F", 2 * (i + 1), _hy3_time(t)) for i, t in enumerate(splits)]
+            for i in range(0, len(blocks), 11):
+                b.add(g1(*blocks[i : i + 11]))
+            b.out.splits += len(splits)
+
+
+def _hy3_relay(b: _Builder, code: str, legs: list[_Swimmer], mdy: str) -> None:
+    dist, _, stroke, per_100 = b.rng.choice(_RELAYS)
+    sexes = {sw.sex for sw in legs}
+    event_sex = {"F": "G", "M": "B"}[sexes.pop()] if len(sexes) == 1 else "X"
+    total = sum(b.seconds(dist // 4, per_100, sw.age) for sw in legs)
+    b.add(
+        hy3_rec(
+            (1, "F1"), (3, code), (8, "A"), (15, event_sex), (19, str(dist).rjust(3)),
+            (22, stroke), (53, _hy3_time(total * 1.02).rjust(7)), (60, "Y"),
+        )
+    )  # fmt: skip
+    b.add(f2(time=_hy3_time(total), place=str(b.rng.randint(1, 8)), date=mdy))
+    slots = [
+        f3_slot(sw.sex, str(sw.number), sw.last[:5], "F", str(order))
+        for order, sw in enumerate(legs, start=1)
+    ]
+    b.add(f3(*slots))
+    b.out.relays += 1
+
+
+# -- corpus ----------------------------------------------------------------------- #
+
+_GENERATORS = {"cl2": synth_cl2, "hy3": synth_hy3}
+
+
+def write_corpus(directory: Path, spec: Spec, *, files: int = 1, fmt: str = "cl2") -> list[Path]:
+    """Write ``files`` generated files into ``directory``; file ``i`` uses seed ``spec.seed + i``.
+
+    Raises:
+        ValueError: If ``fmt`` is not ``"cl2"`` or ``"hy3"``.
+    """
+    if fmt not in _GENERATORS:
+        raise ValueError(f"fmt must be 'cl2' or 'hy3', got {fmt!r}")
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(files):
+        synth = _GENERATORS[fmt](replace(spec, seed=spec.seed + i))
+        path = directory / f"synth_{spec.seed + i:05d}.{fmt}"
+        path.write_bytes(synth.text.encode("cp1252"))
+        paths.append(path)
+    return paths
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--format", choices=sorted(_GENERATORS), default="cl2")
+    parser.add_argument("--files", type=int, default=1)
+    defaults = Spec()
+    for name in ("meets", "clubs", "swimmers", "swims", "seed"):
+        parser.add_argument(f"--{name}", type=int, default=getattr(defaults, name))
+    for name in ("relay_ratio", "split_density", "error_rate"):
+        flag = "--" + name.replace("_", "-")
+        parser.add_argument(flag, type=float, default=getattr(defaults, name))
+    args = parser.parse_args(argv)
+    spec = Spec(
+        meets=args.meets, clubs=args.clubs, swimmers=args.swimmers, swims=args.swims,
+        relay_ratio=args.relay_ratio, split_density=args.split_density,
+        error_rate=args.error_rate, seed=args.seed,
+    )  # fmt: skip
+    for path in write_corpus(args.directory, spec, files=args.files, fmt=args.format):
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
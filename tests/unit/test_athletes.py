@@ -0,0 +1,103 @@
+"""Cross-meet athlete index: identity unions, swim references, and lookups."""
+
+from __future__ import annotations
+
+from conftest import (
+    A0,
+    A1,
+    B1,
+    B1_HY3,
+    B2_HY3,
+    C1,
+    C1_HY3,
+    Z0,
+    d0,
+    d1,
+    e0,
+    e1,
+    e2,
+    f0,
+    parse_hy3_lines,
+    parse_lines,
+    rec,
+)
+
+from tunas import AthleteIndex, Event, IndividualSwim, RelaySwim, athlete_key
+
+ID_SHORT = "49AC52F69618"
+ID_LONG = "49AC52F6961843"
+
+
+def test_same_id_across_archives_is_one_athlete() -> None:
+    first = parse_lines([A0, B1, C1, d0(dist="100"), Z0])
+    second = parse_lines([A0, B1, C1, d0(dist="200"), Z0])
+    index = AthleteIndex.from_archives([first, second])
+
+    assert len(index) == 1
+    athlete = index[ID_SHORT]
+    assert athlete.full_name == "Irene Zhong"
+    assert [s.event for s in athlete.swims] == [Event.FREE_100_SCY, Event.FREE_200_SCY]
+    assert index.swims(ID_SHORT) is athlete.swims
+    assert index.swims("nobody") == []
+    assert index.get("nobody") is None
+
+
+def test_cl2_long_id_links_hy3_export() -> None:
+    d3 = rec((1, "D3"), (3, ID_LONG))
+    cl2 = parse_lines([A0, B1, C1, d0(), d3, Z0])
+    hy3 = parse_hy3_lines([A1, B1_HY3, B2_HY3, C1_HY3, d1(member=ID_LONG), e1(), e2()])
+    index = AthleteIndex.from_archives([cl2, hy3])
+
+    assert len(index) == 1
+    athlete = index[ID_LONG]
+    assert athlete.ids == {ID_SHORT, ID_LONG}
+    assert len(athlete.swims) == 2
+
+
+def test_legacy_short_id_merges_previously_separate_athletes() -> None:
+    # A DOB-based legacy USS# is not the prefix of the 14-char ID: the two forms are
+    # only linked once a record carrying both is seen, which merges the athletes.
+    legacy = "122410IRENQZ"
+    only_short = parse_lines([A0, B1, C1, d0(uss=legacy), Z0])
+    only_long = parse_hy3_lines([A1, B1_HY3, B2_HY3, C1_HY3, d1(member=ID_LONG), e1(), e2()])
+    index = AthleteIndex.from_archives([only_short, only_long])
+    assert len(index) == 2
+
+    d3 = rec((1, "D3"), (3, ID_LONG))
+    both = parse_lines([A0, B1, C1, d0(uss=legacy), d3, Z0])
+    index.add(both)
+
+    assert len(index) == 1
+    athlete = index[legacy]
+    assert athlete is index[ID_LONG] is index[ID_SHORT]
+    assert len(athlete.swims) == 3
+    assert {a.key for a in index} == {athlete.key}
+
+
+def test_relay_legs_are_referenced_and_resolve() -> None:
+    archive = parse_lines([A0, B1, C1, d0(), e0(), f0(), f0(uss="", order_finals="2"), Z0])
+    index = AthleteIndex()
+    index.add(archive)
+
+    refs = index.swims(ID_SHORT)
+    assert [r.is_relay_leg for r in refs] == [False, True]
+    individual, leg = (r.resolve(archive.meets) for r in refs)
+    assert isinstance(individual, IndividualSwim)
+    assert isinstance(leg, RelaySwim)
+    assert refs[1].event is Event.FREE_50_SCY  # free-relay lead-off leg
+    assert leg.time is not None and refs[1].time == leg.time
+    assert index.unidentified_swims == 1  # the leg with no USS#
+
+
+def test_find_and_athlete_key_match_across_formats() -> None:
+    cl2 = parse_lines([A0, B1, C1, d0(), Z0])
+    hy3 = parse_hy3_lines([A1, B1_HY3, B2_HY3, C1_HY3, d1(member=ID_LONG), e1(), e2()])
+    cl2_swimmer = cl2.meets[0].swimmers[0]
+    hy3_swimmer = hy3.meets[0].swimmers[0]
+    assert athlete_key(cl2_swimmer) == athlete_key(hy3_swimmer) == ID_SHORT
+
+    index = AthleteIndex.from_archives([cl2])
+    athlete = index.find(hy3_swimmer)
+    assert athlete is not None and athlete.key == ID_SHORT
+    assert ID_LONG not in index  # find() never mutates the index
+    assert len(athlete.swims_in(Event.FREE_100_SCY)) == 1
@@ -0,0 +1,85 @@
+"""Incremental personal bests: selection rules, conversion hook, and persistence."""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from conftest import A0, B1, C1, Z0, d0, parse_lines
+
+from tunas import Course, Event, PersonalBests, Session, Time
+
+ID = "49AC52F69618"
+
+
+def _archive(*d0s: str) -> object:
+    return parse_lines([A0, B1, C1, *d0s, Z0])
+
+
+def test_keeps_fastest_with_provenance() -> None:
+    bests = PersonalBests()
+    assert bests.add(_archive(d0(finals="1:01.00"))) == 1
+    assert bests.add(_archive(d0(finals="1:02.00", date="01032025"))) == 0
+    assert bests.add(_archive(d0(finals="59.50", prelim="1:00.50", prelim_course="Y"))) == 1
+
+    best = bests.best(ID, Event.FREE_100_SCY)
+    assert best is not None
+    assert best.time == Time.parse("59.50")
+    assert best.session is Session.FINALS
+    assert best.meet == "Winter Champs"
+    assert best.meet_date == datetime.date(2025, 1, 1)
+    assert best.date == datetime.date(2025, 1, 2)
+    assert best.source == "<stream>"
+    assert bests.best(ID, Event.FREE_200_SCY) is None
+    assert ID in bests and len(bests) == 1
+
+
+def test_ignores_dq_no_time_and_unidentified() -> None:
+    bests = PersonalBests()
+    bests.add(_archive(d0(finals="DQ"), d0(uss="", name="Doe, Jane", finals="58.00")))
+    bests.add(_archive(d0(finals="55.00", finals_course="X")))  # DQ'd course byte
+    assert len(bests) == 0
+
+
+def test_tie_keeps_earlier_swim_and_readding_is_idempotent() -> None:
+    bests = PersonalBests()
+    later = _archive(d0(finals="1:00.00", date="01032025"))
+    earlier = _archive(d0(finals="1:00.00", date="01022025"))
+    bests.update([later, earlier, later])
+    best = bests.best(ID, Event.FREE_100_SCY)
+    assert best is not None and best.date == datetime.date(2025, 1, 2)
+
+
+def _to_lcm(event: Event, time: Time) -> Iterator[tuple[Event, Time]]:
+    target = Event.find(event.distance, event.stroke, Course.LCM)
+    if target is not None and event.course is not Course.LCM:
+        yield target, Time(round(time.centiseconds * 1.11))
+
+
+def test_converted_bests_never_displace_real_ones() -> None:
+    bests = PersonalBests(converter=_to_lcm)
+    bests.add(_archive(d0(finals="1:00.00")))
+    assert bests.best(ID, Event.FREE_100_LCM) is None
+    converted = bests.best(ID, Event.FREE_100_LCM, converted=True)
+    assert converted is not None
+    assert converted.time == Time(6660)
+    assert converted.converted_from is Event.FREE_100_SCY
+    assert list(bests.bests_for(ID, converted=True)) == [Event.FREE_100_SCY, Event.FREE_100_LCM]
+    assert list(bests.bests_for(ID)) == [Event.FREE_100_SCY]
+
+
+def test_save_and_load_round_trip(tmp_path: Path) -> None:
+    bests = PersonalBests(converter=_to_lcm)
+    bests.add(_archive(d0(finals="1:00.00"), d0(dist="50", finals="27.10")))
+    path = tmp_path / "bests.json"
+    bests.save(path)
+
+    reloaded = PersonalBests.load(path)
+    assert reloaded.sources == bests.sources == {"<stream>"}
+    assert reloaded.bests_for(ID, converted=True) == bests.bests_for(ID, converted=True)
+
+    path.write_text('{"version": 99}')
+    with pytest.raises(ValueError, match="version 1"):
+        PersonalBests.load(path)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from tunas._parser.checksum import DATA_WIDTH, hy3_checksum
+from tunas._parser.checksum import DATA_WIDTH, checked_lines, hy3_checksum, hy3_checksums
 
 
 def test_checksum_known_record() -> None:
@@ -20,3 +20,24 @@ def test_checksum_known_record() -> None:
 def test_checksum_wrong_length_raises() -> None:
     with pytest.raises(ValueError):
         hy3_checksum(b"too short")
+
+
+def test_bulk_checksums_match_single() -> None:
+    bodies = [bytes((i * 7 + j) % 256 for j in range(DATA_WIDTH)) for i in range(50)]
+    assert hy3_checksums(bodies) == [hy3_checksum(body) for body in bodies]
+    with pytest.raises(ValueError):
+        hy3_checksums([*bodies, b"too short"])
+
+
+def test_checked_lines_records_mismatches_ahead() -> None:
+    body = "A107".ljust(DATA_WIDTH)
+    good = body + hy3_checksum(body.encode("cp1252"))
+    accented = "D1Fé".ljust(DATA_WIDTH)
+    accented += hy3_checksum(accented.encode("cp1252"))  # summed over the CP-1252 bytes
+    lines = [(1, "\ufeff" + good), (2, body + "00"), (3, ""), (4, body + "  "), (5, good + "x")]
+    lines.append((6, accented))
+    mismatches: dict[int, tuple[str, str]] = {}
+    it = checked_lines(lines, mismatches)
+    assert next(it) == lines[0]
+    assert mismatches == {2: ("00", good[DATA_WIDTH:]), 4: ("  ", good[DATA_WIDTH:])}
+    assert list(it) == lines[1:]
@@ -0,0 +1,146 @@
+"""The ``tunas`` command line: inputs, commands, worker processes and exit status."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import shutil
+import zipfile
+from pathlib import Path
+
+import pytest
+from conftest import A0, B1, C1, DATA_DIR, Z0, d0
+
+from tunas import read_cl2
+from tunas.cli import main
+
+GOLDEN = ["aaa_league_championship.cl2", "pasa_distance_intersquad.hy3", "reno_walk_on_meet.cl2"]
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    """A directory of the golden files, plus a .zip holding the same files."""
+    meets = tmp_path / "meets"
+    meets.mkdir()
+    with zipfile.ZipFile(tmp_path / "meets.zip", "w") as zf:
+        for name in GOLDEN:
+            shutil.copy(DATA_DIR / name, meets / name)
+            zf.write(DATA_DIR / name, f"2026/{name}")
+    (meets / "notes.txt").write_text("not a result file")
+    return tmp_path
+
+
+def _run(capsys: pytest.CaptureFixture[str], *argv: str) -> tuple[int, str, str]:
+    status = main(list(argv))
+    out, err = capsys.readouterr()
+    return status, out, err
+
+
+def _rows(out: str) -> list[dict[str, object]]:
+    return [json.loads(line) for line in out.splitlines()]
+
+
+def test_parse_rows_per_file(corpus: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    status, out, err = _run(capsys, "parse", str(corpus / "meets"), str(corpus / "meets.zip"))
+    assert status == 0
+    rows = _rows(out)
+    assert [r["source"] for r in rows] == [
+        *(str(corpus / "meets" / name) for name in GOLDEN),
+        *(f"{corpus / 'meets.zip'}!2026/{name}" for name in GOLDEN),
+    ]
+    report = next(read_cl2(DATA_DIR / GOLDEN[0])).report
+    assert rows[0]["swims"] == rows[3]["swims"] == report.individual_swims_parsed
+    assert rows[0]["warnings"] == report.warning_count
+    assert err.startswith("tunas parse: 6 files") and "warnings (" in err
+
+
+def test_workers_match_serial(corpus: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    for command in ("parse", "export", "stats"):
+        _, serial, _ = _run(capsys, command, str(corpus / "meets"), "-q")
+        _, parallel, _ = _run(capsys, command, str(corpus / "meets"), "-q", "--jobs", "2")
+        assert parallel == serial
+
+
+def test_scan_lists_meets(corpus: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    status, out, _ = _run(capsys, "scan", str(corpus / "meets"), "--format", "hy3", "--index")
+    assert status == 0
+    (row,) = _rows(out)
+    assert row["meet"] == "2021 PASA SC Distance Intersquad Meet"
+    assert row["start_date"] == "2021-05-01"
+    assert (corpus / "meets" / "pasa_distance_intersquad.hy3.idx.json").is_file()
+
+
+def test_validate_exit_status(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    bad = tmp_path / "bad.cl2"
+    bad.write_text("\n".join([A0, B1, C1, d0(name=""), Z0]) + "\n")
+    good = DATA_DIR / GOLDEN[2]
+    status, out, err = _run(capsys, "validate", str(good), str(bad))
+    assert status == 1
+    first, second = _rows(out)
+    assert first["valid"] is True and second["valid"] is False
+    assert second["fatal"] == 1 and second["kinds"] == {"missing": 1}
+    assert "1 invalid" in err
+
+
+def test_stats_document(corpus: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    status, out, _ = _run(capsys, "stats", str(corpus / "meets"), "-q")
+    stats = json.loads(out)
+    archives = list(read_cl2(corpus / "meets"))
+    assert status == 0
+    assert stats["files"] == 3 and stats["meets"] == 3 and stats["failed"] == 0
+    assert stats["first_meet"] == "2021-05-01" and stats["last_meet"] == "2026-05-10"
+    cl2_swims = sum(a.report.individual_swims_parsed for a in archives)
+    assert stats["swims"] == cl2_swims + 61
+    assert sum(stats["software"].values()) == 3
+
+
+def test_export_csv(corpus: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = corpus / "swims.csv"
+    args = ["--to", "csv", "--kinds", "swim", "--fields", "athlete,event,time,splits"]
+    status, out, _ = _run(capsys, "export", str(corpus / "meets"), *args, "-o", str(path), "-q")
+    assert status == 0 and out == ""
+    header, *rows = csv.reader(io.StringIO(path.read_text()))
+    assert header == ["v", "kind", "athlete", "event", "time", "splits"]
+    assert len(rows) == sum(1 for r in rows if r[1] == "swim") > 0
+    assert all(isinstance(json.loads(r[5]), list) for r in rows)
+
+
+def test_parse_failure_is_reported(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    bad = tmp_path / "bad.cl2"
+    bad.write_text("\n".join([A0, B1, C1, d0(name=""), Z0]) + "\n")
+    status, out, err = _run(capsys, "parse", str(bad), str(DATA_DIR / GOLDEN[2]))
+    assert status == 1
+    failed, ok = _rows(out)
+    assert failed["source"] == str(bad) and "swimmer_name" in str(failed["error"])
+    assert ok["meets"] == 1
+    assert "1 failed" in err
+
+
+def test_decoding_failure_is_reported(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    shutil.copy(DATA_DIR / GOLDEN[2], tmp_path / "b.cl2")
+    (tmp_path / "a.cl2").write_bytes("\n".join([A0, B1, C1, d0(name="Péna, Ana"), Z0]).encode())
+    bad = "\n".join([A0, B1, C1, d0(name="Peña, Ana"), Z0]).encode("cp1252")  # not UTF-8
+    (tmp_path / "c.cl2").write_bytes(bad)
+    for jobs in ("1", "2"):
+        args = ["--encoding", "utf-8", "--errors", "strict", "--jobs", jobs]
+        status, out, err = _run(capsys, "parse", str(tmp_path), *args)
+        assert status == 1
+        a, b, c = _rows(out)
+        assert a["meets"] == b["meets"] == 1 and "utf-8" in str(c["error"])
+        assert "1 failed" in err
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["parse", "missing.cl2"],
+        ["export", str(DATA_DIR), "--to", "csv"],
+        ["export", str(DATA_DIR), "--kinds", "swim", "--fields", "nope"],
+        ["parse", str(DATA_DIR), "--jobs", "-1"],
+    ],
+)
+def test_usage_errors(argv: list[str], capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as exc:
+        main(argv)
+    assert exc.value.code == 2
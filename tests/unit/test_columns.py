@@ -0,0 +1,124 @@
+"""Columnar export: schema, dictionary encoding, NULLs, and consistency with the models."""
+
+from __future__ import annotations
+
+import datetime
+import importlib.util
+import io
+from array import array
+
+import pytest
+from conftest import A0, B1, C1, DATA_DIR, Z0, d0, e0, parse_lines
+
+from tunas import (
+    COLUMNS,
+    WARNING_COLUMNS,
+    Event,
+    IssueKind,
+    ResultStatus,
+    ResultTable,
+    Session,
+    Severity,
+    Sex,
+    read_cl2,
+    to_columns,
+    warnings_to_columns,
+)
+
+
+def test_meet_to_columns_encodes_rows() -> None:
+    archive = parse_lines(
+        [
+            A0,
+            B1,
+            C1,
+            d0(),
+            d0(uss="OTHERSWIMMER", name="Doe, Jane", finals="NS", birth="", age_class=""),
+            e0(),
+            Z0,
+        ]
+    )
+    table = archive.meets[0].to_columns()
+
+    assert len(table) == 3
+    assert set(table.columns) == set(COLUMNS)
+    assert all(len(column) == 3 for column in table.columns.values())
+    assert table.columns["time"].itemsize == 4
+    assert table.decode("relay") == [0, 0, 1]
+    assert table.decode("event") == [
+        Event.FREE_100_SCY,
+        Event.FREE_100_SCY,
+        Event.FREE_200_RELAY_SCY,
+    ]
+    assert table.decode("time") == [6000, None, 10500]
+    assert table.decode("session") == [Session.FINALS] * 3
+    assert table.decode("status")[0] is ResultStatus.OK
+    assert table.decode("swimmer_id") == ["49AC52F69618", "OTHERSWIMMER", None]
+    assert table.decode("swimmer") == ["Irene Q Zhong", "Jane Doe", None]
+    assert table.dictionaries["club"] == ["PCSCSC"]  # three rows, one dictionary entry
+    assert table.decode("sex") == [Sex.FEMALE, Sex.FEMALE, None]
+    assert table.decode("age") == [14, None, None]
+    assert table.decode("relay_letter") == [None, None, "A"]
+    assert table.decode("date")[0] == datetime.date(2025, 1, 2).toordinal()
+    assert table.decode("points") == [None, None, None]
+
+
+def test_value_overflow_leaves_the_table_consistent() -> None:
+    (meet,) = parse_lines([A0, B1, C1, d0(), d0(uss="OTHERSWIMMER"), e0(), Z0]).meets
+    table = meet.to_columns()
+    meet.results[1].heat = 40_000  # past int16
+    with pytest.raises(OverflowError):
+        table.add_meet(meet)
+    assert {len(column) for column in table.columns.values()} == {3}
+    meet.results[1].heat = 4
+    table.add_meet(meet)
+    assert len(table) == 6 and table.decode("heat")[3:] == [None, 4, None]
+
+
+def test_stream_matches_models() -> None:
+    paths = sorted(DATA_DIR.glob("*.cl2"))
+    archives = list(read_cl2(paths))
+    table = to_columns(archives)
+
+    results = [r for a in archives for m in a.meets for r in m.results]
+    assert len(table) == len(results)
+    assert table.decode("event") == [r.event for r in results]
+    assert table.decode("time") == [r.time.centiseconds if r.time else None for r in results]
+    assert table.decode("club") == [r.club.team_code if r.club else None for r in results]
+    assert set(table.dictionaries["source"]) == {str(p) for p in paths}
+
+    extra = ResultTable()
+    for archive in archives:
+        extra.add(archive)
+    assert {k: v.tobytes() for k, v in extra.columns.items()} == {
+        k: v.tobytes() for k, v in table.columns.items()
+    }
+
+
+def test_to_numpy_is_zero_copy_or_reports_missing_numpy() -> None:
+    table = parse_lines([A0, B1, C1, d0(), Z0]).meets[0].to_columns()
+    if importlib.util.find_spec("numpy") is None:
+        with pytest.raises(ImportError):
+            table.to_numpy()
+        return
+    views = table.to_numpy()
+    assert views["time"].tolist() == table.columns["time"].tolist()
+    views["time"][0] = 1
+    assert table.columns["time"] == array("i", [1])
+
+
+def test_warning_table_tags_software_and_counts_suppressed() -> None:
+    lines = [A0, B1, C1, *(d0(birth="") for _ in range(3)), d0(uss=""), Z0]
+    stream = io.StringIO("\n".join(lines) + "\n")
+    table = warnings_to_columns(read_cl2(stream, max_warnings=1))
+
+    assert set(table.columns) == set(WARNING_COLUMNS)
+    assert len(table) == 3  # two kept warnings and one tally row
+    assert table.decode("line_no") == [4, 7, None]
+    assert table.decode("count") == [1, 1, 2]
+    assert table.decode("software") == ["Hy-Tek"] * 3
+    assert table.decode("source") == ["<stream>"] * 3
+    assert table.totals("software", "kind") == {
+        ("Hy-Tek", IssueKind.MISSING): 4,
+    }
+    assert table.totals("severity") == {(Severity.RECOVERED,): 3, (Severity.SKIPPED,): 1}
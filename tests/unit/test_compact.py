@@ -0,0 +1,79 @@
+"""Compact swim storage: views match the originals and keep the object graph working."""
+
+from __future__ import annotations
+
+import io
+from typing import Any
+
+from conftest import DATA_DIR
+
+from tunas import IndividualSwim, Meet, Swim, read_cl2, read_hy3, to_columns, write_jsonl
+from tunas.compact import CompactSwim, compact
+from tunas.models import MeetResult
+from tunas.parser import MeetArchive
+
+_FIELDS = [name for name in IndividualSwim.__slots__ if not name.startswith("_")]
+_FIELDS += [name for name in MeetResult.__slots__ if not name.startswith("_")]
+
+
+def _archives() -> list[MeetArchive]:
+    return [*read_cl2(sorted(DATA_DIR.glob("*.cl2"))), *read_hy3(DATA_DIR.glob("*.hy3"))]
+
+
+def _values(swim: Any) -> list[Any]:
+    """Every field, with graph references reduced to something comparable."""
+    refs = {"meet": lambda m: m.name, "swimmer": lambda s: s.full_name}
+    refs["club"] = lambda c: c.team_code if c is not None else None
+    refs["splits"] = list  # a view's splits are a read-only tuple
+    row = [refs[n](getattr(swim, n)) if n in refs else getattr(swim, n) for n in _FIELDS]
+    return row + [swim.course, swim.is_relay_leg]
+
+
+def test_views_reproduce_every_field() -> None:
+    originals = [m for a in _archives() for m in a.meets]
+    compacted = [m for a in _archives() for m in a.meets]
+    for meet in compacted:
+        swimmers = [s.swimmer for s in meet.individual_swims]
+        store = meet.compact()
+        assert len(store) == len(swimmers)
+        assert [s.swimmer for s in meet.individual_swims] == swimmers
+    for before, after in zip(originals, compacted, strict=True):
+        swims = after.individual_swims
+        assert swims and all(type(s) is CompactSwim for s in swims)
+        assert all(s.meet is after for s in swims)
+        assert [_values(s) for s in swims] == [_values(s) for s in before.individual_swims]
+
+
+def test_graph_links_share_one_view() -> None:
+    (archive,) = read_cl2(DATA_DIR / "aaa_league_championship.cl2")
+    meet: Meet = archive.meets[0]
+    swimmer = meet.individual_swims[0].swimmer
+    club = meet.individual_swims[0].club
+    compact(meet)
+
+    view = meet.individual_swims[0]
+    assert isinstance(view, IndividualSwim) and isinstance(view, Swim)
+    assert isinstance(view, MeetResult) and issubclass(CompactSwim, MeetResult)
+    assert isinstance(view.splits, tuple)  # read-only: appending cannot be silently lost
+    assert view.swimmer is swimmer and view.club is club
+    assert any(s is view for s in swimmer.swims)
+    assert club is not None and any(r is view for r in club.results)
+    assert swimmer.individual_swims and view in meet.individual_swims_for(view.event)
+    assert len(compact(meet)) == 0  # already compacted: nothing left to move
+    assert "CompactSwim(" in repr(view)
+
+
+def test_exporters_unchanged_by_compaction() -> None:
+    plain, packed = _archives(), _archives()
+    for archive in packed:
+        for meet in archive.meets:
+            meet.compact()
+    expected, actual = to_columns(plain).columns, to_columns(packed).columns
+    assert {k: v.tobytes() for k, v in expected.items()} == {
+        k: v.tobytes() for k, v in actual.items()
+    }
+
+    out_plain, out_packed = io.StringIO(), io.StringIO()
+    write_jsonl(plain, out_plain, kinds=["meet", "swim", "relay"])
+    write_jsonl(packed, out_packed, kinds=["meet", "swim", "relay"])
+    assert out_plain.getvalue() == out_packed.getvalue()
@@ -0,0 +1,77 @@
+"""Quantile sketches: accuracy, exact merges, keyed distributions, and persistence."""
+
+from __future__ import annotations
+
+import pickle
+import random
+from pathlib import Path
+
+import pytest
+from conftest import A0, B1, C1, Z0, d0, parse_lines
+
+from tunas import DistributionKey, Event, QuantileSketch, Sex, Time, TimeDistributions
+
+
+def test_quantiles_within_relative_accuracy() -> None:
+    rng = random.Random(7)
+    values = sorted(rng.randint(2_000, 60_000) for _ in range(5_000))
+    sketch = QuantileSketch(0.01)
+    for v in values:
+        sketch.add(v)
+
+    assert len(sketch) == 5_000
+    assert sketch.quantile(0) == Time(values[0])
+    assert sketch.quantile(1) == Time(values[-1])
+    for q in (0.1, 0.25, 0.5, 0.9, 0.99):
+        got = sketch.quantile(q)
+        expected = values[int(q * (len(values) - 1))]
+        assert got is not None and abs(got.centiseconds - expected) <= 0.01 * expected + 1
+
+
+def test_merge_is_exact_and_checks_accuracy() -> None:
+    whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for v in range(1_000, 9_000, 7):
+        whole.add(v)
+        (left if v % 2 else right).add(v)
+    left.merge(right)
+
+    assert left.to_dict() == whole.to_dict()
+    assert left.quantiles([0.5, 0.05]) == whole.quantiles([0.5, 0.05])
+    assert QuantileSketch().quantile(0.5) is None
+    with pytest.raises(ValueError):
+        left.merge(QuantileSketch(0.02))
+    with pytest.raises(ValueError):
+        left.quantile(1.5)
+
+
+def test_distributions_keyed_mergeable_and_persistent(tmp_path: Path) -> None:
+    first = parse_lines(
+        [A0, B1, C1, d0(finals="1:00.00"), d0(uss="OTHERSWIMMER", finals="1:10.00", sex="M"), Z0]
+    )
+    second = parse_lines([A0, B1, C1, d0(finals="1:02.00"), d0(finals="58.00", age_class=""), Z0])
+
+    a, b = TimeDistributions(), TimeDistributions()
+    a.add(first)
+    b.add(second)
+    a.merge(pickle.loads(pickle.dumps(b)))  # as if returned from a worker process
+
+    female = DistributionKey(Event.FREE_100_SCY, "13_14", Sex.FEMALE)
+    assert set(a.keys()) == {female, DistributionKey(Event.FREE_100_SCY, "13_14", Sex.MALE)}
+    sketch = a.sketch(female)
+    assert sketch is not None and sketch.count == 3  # birthday gives the 4th swim's age
+    assert a.quantiles(Event.FREE_100_SCY, Sex.FEMALE, [0, 1], age_group="13_14") == [
+        Time.parse("58.00"),
+        Time.parse("1:02.00"),
+    ]
+    assert a.quantiles(Event.FLY_50_SCY, Sex.FEMALE, [0.5]) == [None]
+
+    path = tmp_path / "dist.json"
+    a.save(path)
+    loaded = TimeDistributions.load(path)
+    assert loaded.keys() == a.keys()
+    assert loaded.quantiles(Event.FREE_100_SCY, Sex.FEMALE, [0.5], age_group="13_14") == (
+        a.quantiles(Event.FREE_100_SCY, Sex.FEMALE, [0.5], age_group="13_14")
+    )
+    path.write_text('{"version": 99}')
+    with pytest.raises(ValueError):
+        TimeDistributions.load(path)
@@ -1,3 +1,8 @@
+import subprocess
+import sys
+
+import pytest
+
 import tunas
 
 
@@ -40,3 +45,29 @@ def test_key_public_api_present() -> None:
         "State",
     ):
         assert name in tunas.__all__
+
+
+def test_exports_match_all() -> None:
+    assert set(tunas._MODULE_OF) == set(tunas.__all__) - {"__version__"}
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError, match="no_such_name"):
+        tunas.no_such_name  # noqa: B018
+
+
+def _modules_after(code: str) -> set[str]:
+    out = subprocess.run(
+        [sys.executable, "-c", f"{code}; import sys; print(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {name for name in out.stdout.split() if name.startswith("tunas")}
+
+
+def test_import_is_lazy() -> None:
+    assert _modules_after("import tunas") == {"tunas", "tunas._version"}
+    loaded = _modules_after("from tunas import Time")
+    assert "tunas.time" in loaded
+    assert not loaded & {"tunas.geography", "tunas.models", "tunas.parser"}
@@ -0,0 +1,126 @@
+"""SDIF subsets: selected records are copied verbatim and the Z0 counts recomputed."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+from conftest import A0, B1, C1, DATA_DIR, Z0, d0, e0, f0, g0, rec
+
+from tunas import Event, IssueKind, MeetArchive, read_cl2
+from tunas.extract import extract_cl2
+
+AAA = DATA_DIR / "aaa_league_championship.cl2"
+RENO = DATA_DIR / "reno_walk_on_meet.cl2"
+
+C1_OTHER = rec((1, "C1"), (3, "1"), (12, "PCPASA"), (18, "Palo Alto Stanford"), (143, "1"))
+OTHER = "AAAAAAAAAAAA"
+
+
+def _extract(source: Path | bytes, **filters: object) -> tuple[bytes, MeetArchive]:
+    src = io.BytesIO(source) if isinstance(source, bytes) else source
+    out = io.BytesIO()
+    written = extract_cl2(src, out, **filters)  # type: ignore[arg-type]
+    data = out.getvalue()
+    assert written == len(data.splitlines())
+    return data, next(read_cl2(io.StringIO(data.decode("cp1252"))))
+
+
+def _counts(archive: MeetArchive) -> int:
+    return archive.report.count(kind=IssueKind.COUNT_MISMATCH)
+
+
+def _file(*lines: str, newline: str = "\n") -> bytes:
+    return "".join(line + newline for line in lines).encode("cp1252")
+
+
+@pytest.mark.parametrize("path", [AAA, RENO])
+def test_no_filters_copies_the_file(path: Path) -> None:
+    data, archive = _extract(path)
+    *body, z0 = data.splitlines(keepends=True)
+    *source_body, source_z0 = path.read_bytes().splitlines(keepends=True)
+    assert body == source_body
+    # Both files count only D0 lines as "D records"; the readers count every D line.
+    assert z0[:57] == source_z0[:57] and z0[69:] == source_z0[69:]
+    assert _counts(next(read_cl2(path))) == 1 and _counts(archive) == 0
+
+
+def test_club_slice_parses_like_the_full_club() -> None:
+    (full,) = next(read_cl2(AAA)).meets
+    expected = next(c for c in full.clubs if c.team_code == "R5BALB")
+    data, archive = _extract(AAA, clubs=["R5BALB"])
+    (meet,) = archive.meets
+    assert [c.team_code for c in meet.clubs] == ["R5BALB"]
+    assert len(meet.results) == len(expected.results)
+    assert _counts(archive) == 0
+    source = set(AAA.read_bytes().splitlines())
+    assert all(line in source for line in data.splitlines()[:-1])  # all but the Z0
+
+
+def test_event_filter_resolves_course() -> None:
+    (full,) = next(read_cl2(AAA)).meets
+    data, archive = _extract(AAA, events=[Event.FREE_50_SCY])
+    (meet,) = archive.meets
+    assert {r.event for r in meet.results} == {Event.FREE_50_SCY}
+    assert len(meet.results) == sum(r.event is Event.FREE_50_SCY for r in full.results)
+    assert _counts(archive) == 0
+    _, archive = _extract(AAA, events=[Event.FREE_50_LCM])
+    assert archive.meets[0].results == [] and archive.meets[0].clubs == []
+
+
+def test_swimmer_filter_keeps_their_relays() -> None:
+    source = _file(
+        A0,
+        B1,
+        C1,
+        d0(),
+        g0(),
+        d0(uss=OTHER, name="Other, Olive"),
+        e0(),
+        f0(),
+        f0(uss=OTHER, name="Other, Olive", order_finals="2"),
+        e0(letter="B"),
+        f0(uss=OTHER, name="Other, Olive", letter="B"),
+        C1_OTHER,
+        d0(uss=OTHER, name="Other, Olive"),
+        Z0,
+    )
+    data, archive = _extract(source, swimmers=["49AC52F69618XX"])
+    (meet,) = archive.meets
+    assert [c.team_code for c in meet.clubs] == ["PCSCSC"]
+    assert len(meet.individual_swims) == 1 and len(meet.relays) == 1
+    assert data.splitlines()[2:7] == source.splitlines()[2:5] + source.splitlines()[6:8]
+    assert _counts(archive) == 0
+
+
+def test_z0_counts_are_recomputed() -> None:
+    source = _file(A0, B1, C1, d0(), g0(), C1_OTHER, d0(uss=OTHER), Z0, newline="\r\n")
+    data, archive = _extract(source, clubs=["PCPASA"])
+    *_, z0 = data.split(b"\r\n")[:-1]
+    assert data.endswith(b"\r\n") and len(z0) == len(Z0)
+    assert z0[:43] == Z0.encode()[:43]
+    assert [z0[43:46], z0[46:49], z0[49:53], z0[53:57], z0[57:63], z0[63:69]] == [
+        b"  1",
+        b"  1",
+        b"   1",
+        b"   1",
+        b"     1",
+        b"     1",
+    ]
+    assert _counts(archive) == 0
+
+
+def test_clubs_without_entries() -> None:
+    source = _file(A0, B1, C1, C1_OTHER, d0(uss=OTHER), Z0)
+    _, archive = _extract(source, clubs=["PCSCSC"])
+    assert [c.team_code for c in archive.meets[0].clubs] == ["PCSCSC"]
+    _, archive = _extract(source, clubs=["PCSCSC"], events=[Event.FREE_100_SCY])
+    assert archive.meets[0].clubs == []
+
+
+def test_paths_and_same_file(tmp_path: Path) -> None:
+    dest = tmp_path / "reno.cl2"
+    assert extract_cl2(RENO, dest, clubs=["SNSPKS"]) == len(dest.read_bytes().splitlines())
+    with pytest.raises(ValueError, match="onto itself"):
+        extract_cl2(dest, dest)
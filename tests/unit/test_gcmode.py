@@ -0,0 +1,72 @@
+"""GC-aware parsing: collector pause/freeze around a parse and Meet.release()."""
+
+from __future__ import annotations
+
+import gc
+import io
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+from conftest import A0, B1, C1, DATA_DIR, Z0, d0
+
+from tunas import ParseError, read_cl2, read_hy3
+
+
+@contextmanager
+def _collections() -> Iterator[list[int]]:
+    """Record the generation of every collection that starts inside the block."""
+    seen: list[int] = []
+
+    def callback(phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            seen.append(info["generation"])
+
+    gc.callbacks.append(callback)
+    try:
+        yield seen
+    finally:
+        gc.callbacks.remove(callback)
+
+
+def test_release_breaks_every_cycle() -> None:
+    gc.disable()
+    try:
+        gc.collect()
+        archives = [*read_cl2(DATA_DIR), *read_hy3(DATA_DIR)]
+        for archive in archives:
+            for meet in archive.meets:
+                meet.release()
+                assert not (meet.results or meet.swimmers or meet.clubs)
+        del archives, archive, meet
+        assert gc.collect() == 0  # everything was already freed by refcounting
+    finally:
+        gc.enable()
+
+
+def test_pause_suspends_collection_and_restores_state() -> None:
+    path = DATA_DIR / "aaa_league_championship.cl2"
+    with _collections() as seen:
+        (archive,) = read_cl2(path, gc_mode="pause")
+    assert len(seen) <= 1 and gc.isenabled()  # at most the one pass after the file
+    assert archive.meets and archive.meets[0].results
+
+    bad = io.StringIO("\n".join([A0, B1, C1, d0(finals="9:99:99.99"), Z0]) + "\n")
+    with pytest.raises(ParseError):
+        list(read_cl2(bad, strict=True, gc_mode="pause"))
+    assert gc.isenabled()
+
+
+def test_freeze_moves_parsed_graph_to_permanent_generation() -> None:
+    before = gc.get_freeze_count()
+    try:
+        (archive,) = read_hy3(DATA_DIR / "pasa_distance_intersquad.hy3", gc_mode="freeze")
+        assert gc.get_freeze_count() > before and gc.isenabled()
+        assert gc.is_tracked(archive.meets[0])
+    finally:
+        gc.unfreeze()
+
+
+def test_unknown_mode_rejected_eagerly() -> None:
+    with pytest.raises(ValueError, match="gc_mode"):
+        read_cl2(DATA_DIR, gc_mode="off")
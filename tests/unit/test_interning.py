@@ -0,0 +1,62 @@
+"""Opt-in interning: equal values share one instance per reader run, bounded."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+from conftest import A0, B1, C1, DATA_DIR, Z0, d0, g0, rec
+
+from tunas import read_cl2, read_hy3
+from tunas._parser.interning import Interner
+
+B2 = rec((1, "B21"), (12, "Host Club"), (42, "1 Pool Rd"), (86, "Reno"), (106, "NV"))
+
+
+def _stream(*lines: str) -> io.StringIO:
+    return io.StringIO("\n".join([A0, B1, B2, C1, *lines, Z0]) + "\n")
+
+
+def test_interner_shares_equal_values_and_stays_bounded() -> None:
+    interner = Interner(limit=2)
+    first = "".join(["Sierra", " Marlins"])
+    again = "".join(["Sierra", " Marlins"])
+    assert first is not again
+    assert interner(first) is first and interner(again) is first
+    assert interner.hits == 1
+
+    interner("a long club name")
+    overflow = "".join(["not", " retained"])
+    assert interner(overflow) is overflow and len(interner) == 2
+    assert interner("".join(["not", " retained"])) is not overflow
+    with pytest.raises(ValueError):
+        Interner(limit=0)
+
+
+def test_values_shared_within_a_run() -> None:
+    archive = next(read_cl2(_stream(d0(), g0(), d0(uss="OTHERSWIMMER"), g0()), intern=True))
+    first, second = archive.meets[0].individual_swims
+    assert first.splits[0] == second.splits[0] and first.splits[0] is second.splits[0]
+    assert first.swimmer.first_name is second.swimmer.first_name
+    assert archive.meets[0].host is not None and archive.meets[0].host.city == "Reno"
+
+
+def test_values_shared_across_files_only_when_enabled() -> None:
+    path = sorted(DATA_DIR.glob("*.cl2"))[0]
+    a, b = (arc.meets[0] for arc in read_cl2([path, path], intern=True))
+    assert a.clubs[0].full_name is b.clubs[0].full_name
+    assert a.host == b.host and (a.host is None or a.host is b.host)
+    x, y = (arc.meets[0] for arc in read_cl2([path, path]))
+    assert x.clubs[0].full_name == y.clubs[0].full_name
+    assert x.clubs[0].full_name is not y.clubs[0].full_name
+
+
+def test_interning_does_not_change_results() -> None:
+    plain = [m for a in read_hy3(DATA_DIR) for m in a.meets]
+    shared = [m for a in read_hy3(DATA_DIR, intern=64) for m in a.meets]
+    assert [len(m.results) for m in plain] == [len(m.results) for m in shared]
+    for p, s in zip(plain, shared, strict=True):
+        assert [r.time for r in p.results] == [r.time for r in s.results]
+        assert [r.splits for r in p.results] == [r.splits for r in s.results]  # type: ignore[attr-defined]
+    with pytest.raises(ValueError):
+        read_cl2(DATA_DIR, intern=0)
@@ -0,0 +1,71 @@
+"""JSON Lines export: record shapes, field selection, schema version, and streaming."""
+
+from __future__ import annotations
+
+import io
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from conftest import A0, B1, C1, DATA_DIR, Z0, d0, e0, f0, g0, parse_lines
+
+from tunas import MeetArchive, read_cl2, write_jsonl
+from tunas.jsonl import FIELDS, SCHEMA_VERSION
+
+
+def _lines(buffer: io.StringIO) -> list[dict[str, object]]:
+    return [json.loads(line) for line in buffer.getvalue().splitlines()]
+
+
+def test_records_per_kind() -> None:
+    archive = parse_lines([A0, B1, C1, d0(), g0(), e0(), f0(), Z0])
+    out = io.StringIO()
+    assert write_jsonl([archive], out, kinds=("meet", "swim", "relay")) == 3
+
+    meet, swim, relay = _lines(out)
+    assert meet == {
+        "v": SCHEMA_VERSION,
+        "kind": "meet",
+        **{k: meet[k] for k in FIELDS["meet"]},
+    }
+    assert meet["name"] == "Winter Champs" and meet["results"] == 2
+    assert swim["kind"] == "swim" and swim["v"] == SCHEMA_VERSION
+    assert swim["event"] == "FREE_100_SCY" and swim["session"] == "FINALS"
+    assert swim["time"] == 6000 and swim["date"] == "2025-01-02"
+    assert swim["athlete"] == "49AC52F69618" and swim["club"] == "PCSCSC"
+    assert swim["splits"] and swim["splits"][0][0] == 50  # type: ignore[index]
+    assert relay["kind"] == "relay" and relay["relay_letter"] == "A"
+    assert relay["legs"][0]["athlete"] == "49AC52F69618"  # type: ignore[index]
+
+
+def test_field_selection_and_validation(tmp_path: Path) -> None:
+    archive = parse_lines([A0, B1, C1, d0(), e0(), Z0])
+    out = io.StringIO()
+    write_jsonl([archive], out, fields=["time", "event", "relay_letter"])
+    swim, relay = _lines(out)
+    assert list(swim) == ["v", "kind", "time", "event"]
+    assert list(relay) == ["v", "kind", "time", "event", "relay_letter"]
+
+    path = tmp_path / "out.jsonl"
+    with pytest.raises(ValueError, match="nonsense"):
+        write_jsonl([archive], path, fields=["time", "nonsense"])
+    assert not path.exists()  # validated before the file is opened
+    with pytest.raises(ValueError):
+        write_jsonl([archive], path, kinds=["swims"])
+
+
+def test_streams_archives_without_retaining_them(tmp_path: Path) -> None:
+    consumed: list[str] = []
+
+    def archives() -> Iterator[MeetArchive]:
+        for archive in read_cl2(DATA_DIR):
+            consumed.append(archive.source)
+            yield archive
+
+    path = tmp_path / "all.jsonl"
+    count = write_jsonl(archives(), path, kinds=["meet", "swim", "relay"])
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == count
+    assert consumed == sorted(str(p) for p in DATA_DIR.rglob("*.cl2"))
+    assert {json.loads(line)["source"] for line in lines} == set(consumed)
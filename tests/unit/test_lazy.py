@@ -0,0 +1,173 @@
+"""Lazy archives and seek readers: scanned spans parse like a full read."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import A0, B1, C1, DATA_DIR, Z0, d0, g0, rec
+
+from tunas import Event, Meet, read_cl2, read_hy3
+from tunas._parser.scan import read_sidecar, sidecar_path
+from tunas.lazy import index_hy3, open_cl2, open_hy3, seek_cl2, seek_hy3
+
+RENO = DATA_DIR / "reno_walk_on_meet.cl2"
+HY3 = DATA_DIR / "pasa_distance_intersquad.hy3"
+
+
+def _swims(meet: Meet) -> list[tuple[str, str, str]]:
+    return sorted((s.swimmer.full_name, str(s.event), str(s.time)) for s in meet.individual_swims)
+
+
+def test_scan_builds_nothing_until_asked() -> None:
+    (lazy,) = open_cl2(RENO).meets
+    assert lazy.team_codes == ["PCRENO", "SNSPKS", "SNUN"]
+    assert lazy.name and lazy.start_date is not None
+    assert lazy.loaded == frozenset() and lazy.report.files_read == 0
+
+
+def test_club_parses_only_its_block() -> None:
+    (full,) = next(read_cl2(RENO)).meets
+    (lazy,) = open_cl2(RENO).meets
+    club = lazy.club("SNSPKS")
+    assert club is not None and club.meet is lazy.meet
+    assert lazy.loaded == {"SNSPKS"}
+    (expected,) = (c for c in full.clubs if c.team_code == "SNSPKS")
+    assert len(club.results) == len(expected.results)
+    assert lazy.meet.clubs == [club]
+    assert lazy.club("NOPE") is None
+
+
+def test_swimmer_and_event_lookups() -> None:
+    (full,) = next(read_cl2(RENO)).meets
+    target = full.swimmers[-1]
+    assert target.id_short is not None
+    (lazy,) = open_cl2(RENO).meets
+    found = lazy.swimmer(target.id_short)
+    assert found is not None and found.full_name == target.full_name
+    assert len(lazy.loaded) == 1
+
+    event: Event = full.individual_swims[0].event
+    (lazy,) = open_cl2(RENO).meets
+    results = lazy.results_for(event)
+    assert len(results) == len([r for r in full.results if r.event == event])
+
+
+@pytest.mark.parametrize(
+    ("path", "reader", "opener"), [(RENO, read_cl2, open_cl2), (HY3, read_hy3, open_hy3)]
+)
+def test_load_matches_full_read(path: Path, reader: Any, opener: Any) -> None:
+    archive = next(reader(path))
+    (lazy,) = opener(path).meets
+    meet = lazy.load()
+    (full,) = archive.meets
+    assert _swims(meet) == _swims(full)
+    assert len(meet.relays) == len(full.relays)
+    assert {c.team_code for c in meet.clubs} == {c.team_code for c in full.clubs}
+    assert all(s.meet is meet for s in meet.swimmers)
+    # Every diagnostic keeps its real line number; only the file-wide Z0 check is absent.
+    expected = {(w.line_no, w.kind) for w in archive.report.warnings if w.record_type != "Z0"}
+    assert {(w.line_no, w.kind) for w in lazy.report.warnings} == expected
+    assert lazy.report.individual_swims_parsed == archive.report.individual_swims_parsed
+
+
+def test_changed_file_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "meet.cl2"
+    shutil.copy(RENO, path)
+    (lazy,) = open_cl2(path).meets
+    with path.open("a") as fh:
+        fh.write("\n")
+    with pytest.raises(ValueError, match="changed"):
+        lazy.club("PCRENO")
+
+
+# -- sidecar index and seek readers --------------------------------------- #
+
+
+def _copy(tmp_path: Path, source: Path) -> Path:
+    path = tmp_path / source.name
+    shutil.copy(source, path)
+    return path
+
+
+def _entries(meet: Meet) -> list[tuple[str, str, str]]:
+    return [(str(s.event), str(s.time), str(s.session)) for s in meet.individual_swims]
+
+
+@pytest.mark.parametrize(
+    ("source", "reader", "seek"), [(RENO, read_cl2, seek_cl2), (HY3, read_hy3, seek_hy3)]
+)
+def test_seek_swimmer_matches_full_read(
+    tmp_path: Path, source: Path, reader: Any, seek: Any
+) -> None:
+    path = _copy(tmp_path, source)
+    (full,) = next(reader(path, index=True)).meets
+    assert sidecar_path(path).exists()
+    for swimmer in full.swimmers:
+        if not swimmer.individual_swims:
+            continue
+        member_id = swimmer.id_long or swimmer.id_short
+        archive = seek(path, member_id=member_id)
+        (meet,) = archive.meets
+        (found,) = meet.swimmers
+        assert found.full_name == swimmer.full_name
+        assert _entries(meet) == [
+            (str(s.event), str(s.time), str(s.session)) for s in swimmer.individual_swims
+        ]
+        assert all(w.line_no > 1 for w in archive.report.warnings)
+
+
+def test_seek_club_and_meet(tmp_path: Path) -> None:
+    path = _copy(tmp_path, RENO)
+    (full,) = next(read_cl2(path)).meets
+    (meet,) = seek_cl2(path, team_code="SNSPKS").meets
+    assert [c.team_code for c in meet.clubs] == ["SNSPKS"]
+    assert _swims(meet) == sorted(
+        (s.swimmer.full_name, str(s.event), str(s.time))
+        for s in full.individual_swims
+        if s.club is not None and s.club.team_code == "SNSPKS"
+    )
+    assert _swims(seek_cl2(path, meet=0).meets[0]) == _swims(full)
+    assert seek_cl2(path, member_id="NOSUCHID0000").meets == []
+    for meet_index in (1, -1):
+        with pytest.raises(IndexError, match="has 1 meet"):
+            seek_cl2(path, meet=meet_index)
+
+
+def test_seek_legacy_ids_and_carriage_returns(tmp_path: Path) -> None:
+    lines = [
+        A0,
+        B1,
+        C1,
+        d0(uss="LEGACY000001"),
+        rec((1, "D3"), (3, "49AC52F69618XX")),  # not a prefix match of the D0's ID
+        g0(uss="LEGACY000001"),
+        d0(uss="OTHERSWIMMER", name="Other, Olive"),
+        Z0,
+    ]
+    path = tmp_path / "legacy.cl2"
+    path.write_bytes("\r".join([*lines, ""]).encode("cp1252"))  # old Mac line endings
+    (full,) = next(read_cl2(path, index=True)).meets
+    (legacy, other) = full.swimmers
+    for member_id in ("LEGACY000001", "49AC52F69618XX", "49AC52F69618"):
+        (meet,) = seek_cl2(path, member_id=member_id).meets
+        (found,) = meet.swimmers
+        assert found.full_name == legacy.full_name
+        assert _entries(meet) == _entries(full)[:1] and meet.individual_swims[0].splits
+    (meet,) = seek_cl2(path, member_id="OTHERSWIMMER").meets
+    assert [s.full_name for s in meet.swimmers] == [other.full_name]
+
+
+def test_sidecar_reused_until_file_changes(tmp_path: Path) -> None:
+    path = _copy(tmp_path, HY3)
+    index = index_hy3(path)
+    assert read_sidecar(path, "hy3") == index
+    assert read_sidecar(path, "cl2") is None  # written for the other format
+    assert open_hy3(path).index == index
+    with path.open("ab") as fh:
+        fh.write(b"\r\n")
+    assert read_sidecar(path, "hy3") is None
+    seek_hy3(path, meet=0)  # rescans and rewrites the stale sidecar
+    assert read_sidecar(path, "hy3") is not None
@@ -0,0 +1,109 @@
+"""Streaming top-N rankings: bounded lists, one entry per athlete, ties, and keys."""
+
+from __future__ import annotations
+
+import pytest
+from conftest import A0, B1, C1, Z0, d0, parse_lines, rec
+
+from tunas import LSC, Event, RankingKey, Rankings, Sex, Time
+
+C1_OTHER = rec((1, "C1"), (3, "1"), (12, "SNAAAA"), (18, "Other Aquatics"), (48, "AAAA"))
+
+
+def _swimmer(n: int, finals: str, **kw: str) -> str:
+    return d0(uss=f"SWIMMER{n:05d}", name=f"Swimmer, Number{n}", finals=finals, **kw)
+
+
+def _times(rankings: Rankings, **kw: object) -> list[tuple[int, str]]:
+    rows = rankings.top(Event.FREE_100_SCY, Sex.FEMALE, **kw)  # type: ignore[arg-type]
+    return [(r.rank, str(r.time)) for r in rows]
+
+
+def test_bounded_list_keeps_fastest_with_ties() -> None:
+    archive = parse_lines(
+        [
+            A0,
+            B1,
+            C1,
+            _swimmer(1, "1:00.00"),
+            _swimmer(2, "58.00"),
+            _swimmer(3, "59.00"),
+            _swimmer(4, "59.00"),
+            _swimmer(5, "1:01.00"),
+            Z0,
+        ]
+    )
+    rankings = Rankings(2)
+    rankings.add(archive)
+
+    # The tie for 2nd is kept in full; slower swims fell off the list.
+    assert _times(rankings, age_group="13_14") == [(1, "58.00"), (2, "59.00"), (2, "59.00")]
+    first = rankings.top(Event.FREE_100_SCY, Sex.FEMALE, age_group="13_14")[0]
+    assert first.athlete == "SWIMMER00002"
+    assert first.name == "Number2 Swimmer"
+    assert first.meet == "Winter Champs" and first.source == "<stream>"
+
+    # A faster swim breaks the tie and pushes both 59.00s out.
+    rankings.add(parse_lines([A0, B1, C1, _swimmer(6, "57.00"), Z0]))
+    assert _times(rankings, age_group="13_14") == [(1, "57.00"), (2, "58.00")]
+
+
+def test_one_entry_per_athlete() -> None:
+    rankings = Rankings(3)
+    rankings.add(parse_lines([A0, B1, C1, _swimmer(1, "1:00.00"), _swimmer(2, "59.00"), Z0]))
+    rankings.add(parse_lines([A0, B1, C1, _swimmer(1, "58.00"), _swimmer(2, "1:02.00"), Z0]))
+
+    rows = rankings.top(Event.FREE_100_SCY, Sex.FEMALE, age_group="13_14")
+    assert [(r.athlete, str(r.time)) for r in rows] == [
+        ("SWIMMER00001", "58.00"),
+        ("SWIMMER00002", "59.00"),
+    ]
+
+
+def test_keys_split_by_age_group_sex_and_lsc() -> None:
+    archive = parse_lines(
+        [
+            A0,
+            B1,
+            C1,
+            _swimmer(1, "1:00.00"),
+            _swimmer(2, "59.00", age_class="10"),
+            _swimmer(3, "58.00", sex="M", esex="M"),
+            C1_OTHER,
+            _swimmer(4, "57.00"),
+            _swimmer(5, "56.00", age_class="", birth=""),
+            Z0,
+        ]
+    )
+    rankings = Rankings(10, by_lsc=True)
+    rankings.add(archive)
+
+    assert rankings.skipped_swims == 1  # no age class and no birthday
+    assert set(rankings.keys()) == {
+        RankingKey(Event.FREE_100_SCY, "13_14", Sex.FEMALE, LSC.PACIFIC),
+        RankingKey(Event.FREE_100_SCY, "10_U", Sex.FEMALE, LSC.PACIFIC),
+        RankingKey(Event.FREE_100_SCY, "13_14", Sex.MALE, LSC.PACIFIC),
+        RankingKey(Event.FREE_100_SCY, "13_14", Sex.FEMALE, LSC.SIERRA_NEVADA),
+    }
+    pacific = rankings.top(Event.FREE_100_SCY, Sex.FEMALE, age_group="13_14", lsc=LSC.PACIFIC)
+    assert [r.club for r in pacific] == ["PCSCSC"]
+
+    open_lists = Rankings(10, age_groups=None)
+    open_lists.add(archive)
+    assert _times(open_lists)[:2] == [(1, "56.00"), (2, "57.00")]
+    assert open_lists.top(Event.FREE_100_SCY, Sex.FEMALE, age_group="13_14") == []
+
+
+def test_equal_times_rank_the_earlier_swim_first() -> None:
+    rankings = Rankings(1)
+    rankings.add(parse_lines([A0, B1, C1, _swimmer(1, "59.00", date="01032025"), Z0]))
+    rankings.add(parse_lines([A0, B1, C1, _swimmer(2, "59.00", date="01022025"), Z0]))
+
+    rows = rankings.top(Event.FREE_100_SCY, Sex.FEMALE, age_group="13_14")
+    assert [(r.rank, r.athlete) for r in rows] == [(1, "SWIMMER00002"), (1, "SWIMMER00001")]
+    assert rows[0].time == Time.parse("59.00")
+
+
+def test_size_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        Rankings(0)
@@ -0,0 +1,186 @@
+"""SDIF writer: meets written by write_cl2 read back to the same object graph."""
+
+from __future__ import annotations
+
+import dataclasses
+import io
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import A0, B1, C1, DATA_DIR, Z0, d0, e0, f0, g0, parse_lines, rec
+
+from tunas import IssueKind, Meet, MeetArchive, Relay, Time, read_cl2, read_hy3
+from tunas.sdif import write_cl2
+
+AAA = DATA_DIR / "aaa_league_championship.cl2"
+RENO = DATA_DIR / "reno_walk_on_meet.cl2"
+OTHER = "AAAAAAAAAAAA"
+
+
+def _write(meets: list[Meet]) -> tuple[list[str], MeetArchive]:
+    out = io.StringIO()
+    written = write_cl2(meets, out)
+    lines = out.getvalue().splitlines()
+    assert written == len(lines) and {len(line) for line in lines} == {160}
+    return lines, next(read_cl2(io.StringIO(out.getvalue())))
+
+
+def _fields(obj: Any, *skip: str) -> dict[str, Any]:
+    return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj) if f.name not in skip}
+
+
+def _graph(meet: Meet) -> dict[str, Any]:
+    """Everything a meet holds, with object references replaced by their keys."""
+
+    def key(swimmer: Any) -> Any:
+        return swimmer and (swimmer.id_short, swimmer.id_long)
+
+    results = []
+    for r in meet.results:
+        row = _fields(r, "meet", "club", "swimmer", "legs", "alternates", "splits")
+        row["club"] = r.club and r.club.team_code
+        row["splits"] = [(s.distance, s.time, s.split_type) for s in r.splits]
+        if isinstance(r, Relay):
+            row["legs"] = [
+                (key(leg.swimmer), *_fields(leg, "swimmer", "relay").values())
+                for leg in (*r.legs, *r.alternates)
+            ]
+        else:
+            row["swimmer"] = key(r.swimmer)
+        results.append(row)
+    swimmers = [
+        (key(s), repr(_fields(s, "meet", "club", "swims")), s.club and s.club.team_code)
+        for s in meet.swimmers
+    ]
+    return {
+        "meet": _fields(meet, "results", "swimmers", "clubs", "source_file"),
+        "clubs": [_fields(c, "meet", "results", "swimmers") for c in meet.clubs],
+        "swimmers": sorted(swimmers),
+        "results": results,
+    }
+
+
+@pytest.mark.parametrize("path", [AAA, RENO])
+def test_golden_files_round_trip(path: Path) -> None:
+    archive = next(read_cl2(path))
+    lines, again = _write(archive.meets)
+    assert [_graph(m) for m in again.meets] == [_graph(m) for m in archive.meets]
+    assert again.meets[0].source_file is not None and archive.meets[0].source_file is not None
+    assert _fields(again.meets[0].source_file, "path") == _fields(
+        archive.meets[0].source_file, "path"
+    )
+    # Nothing the source did not already warn about (its D0-only Z0 count aside).
+    kinds = Counter((w.kind, w.field) for w in again.report.warnings)
+    assert not kinds - Counter((w.kind, w.field) for w in archive.report.warnings)
+    assert again.report.count(kind=IssueKind.COUNT_MISMATCH) == 0
+
+
+def test_relay_splits_follow_their_legs() -> None:
+    archive = parse_lines(
+        [
+            A0,
+            B1,
+            C1,
+            e0(),
+            f0(order_finals="1"),
+            g0(split_dist="25", times=("12.50", "26.50")),
+            f0(uss=OTHER, name="Other, Olive", order_finals="2", takeoff="0.05"),
+            g0(uss=OTHER, split_dist="25", times=("40.00", "53.00")),
+            f0(uss="", name="Nobody, Nora", order_finals="A", leg_time=""),
+            Z0,
+        ]
+    )
+    lines, again = _write(archive.meets)
+    assert [line[:2] for line in lines[3:9]] == ["E0", "F0", "G0", "F0", "G0", "F0"]
+    assert _graph(again.meets[0]) == _graph(archive.meets[0])
+    (relay,) = again.meets[0].relays
+    assert [s.distance for s in relay.splits] == [25, 50, 75, 100]
+    assert relay.legs[1].takeoff_time == 5 and relay.alternates[0].swimmer is None
+
+
+def test_relay_splits_without_legs_follow_the_e0() -> None:
+    archive = parse_lines(
+        [A0, B1, C1, e0(), g0(split_dist="25", times=("", "26.00")), g0(times=("53.00",)), Z0]
+    )
+    lines, again = _write(archive.meets)
+    assert [line[:2] for line in lines[3:6]] == ["E0", "G0", "G0"]
+    assert _graph(again.meets[0]) == _graph(archive.meets[0])
+    assert [s.distance for s in again.meets[0].relays[0].splits] == [50, 100]
+
+
+def test_swimmer_details_and_unattached_swimmers() -> None:
+    archive = parse_lines(
+        [
+            A0,
+            B1,
+            rec((1, "C1"), (3, "1"), (12, "PC  UN"), (18, "Unattached")),
+            d0(prelim="1:01.00", prelim_course="Y", finals="DQ", finals_course=""),
+            rec((1, "D1"), (3, "1"), (125, "4085551234"), (149, "09012024"), (157, "R")),
+            rec((1, "D2"), (3, "1"), (77, "1 Main St"), (107, "San Jose"), (127, "CA")),
+            rec((1, "D3"), (3, "49AC52F69618XX"), (17, "Reenie"), (32, "QS"), (37, "Y")),
+            g0(session="P"),
+            C1,
+            e0(),
+            f0(uss=OTHER, name="Other, Olive"),
+            rec((1, "D1"), (3, "1"), (157, "N")),
+            Z0,
+        ]
+    )
+    meet = archive.meets[0]
+    assert meet.swimmers[0].club is None and meet.swimmers[1].registration is not None
+    lines, again = _write(archive.meets)
+    assert _graph(again.meets[0]) == _graph(meet)
+    # The relay-only swimmer's registration needs a D0 of their own.
+    assert [line[:2] for line in lines[8:12]] == ["C1", "D0", "D1", "E0"]
+
+
+def test_event_course_and_status_codes() -> None:
+    archive = parse_lines(
+        [
+            A0,
+            B1,
+            C1,
+            d0(seed="", seed_course="", finals="1:00.00", finals_course="X"),
+            d0(uss=OTHER, dist="50", seed="", seed_course="", finals="NS", finals_course=""),
+            Z0,
+        ]
+    )
+    meet = archive.meets[0]
+    meet.course = None  # only the D0s can name the course now
+    lines, again = _write([meet])
+    assert lines[3][123] == "X" and lines[3][105] == "Y"  # finals DQ; prelims names the course
+    assert _graph(again.meets[0]) == _graph(meet)
+
+
+def test_paths_and_several_meets(tmp_path: Path) -> None:
+    meets = [*next(read_cl2(RENO)).meets, *next(read_cl2(AAA)).meets]
+    dest = tmp_path / "both.cl2"
+    written = write_cl2(iter(meets), dest)
+    data = dest.read_bytes()
+    assert data.count(b"\r\n") == written and data.count(b"\n") == written
+    (again,) = read_cl2(dest)
+    assert [_graph(m) for m in again.meets] == [_graph(m) for m in meets]
+    assert data.splitlines()[-1][46:49] == b"  2"  # two meets in the Z0
+    assert write_cl2([], io.StringIO()) == 2
+
+
+def test_hy3_meet_converts() -> None:
+    (meet,) = next(read_hy3(DATA_DIR / "pasa_distance_intersquad.hy3")).meets
+    _, again = _write([meet])
+    (converted,) = again.meets
+    assert [(r.event, r.session, r.status, r.time) for r in converted.results] == [
+        (r.event, r.session, r.status, r.time) for r in meet.results
+    ]
+    assert {s.id_short for s in converted.swimmers} == {s.id_short for s in meet.swimmers}
+
+
+def test_values_that_do_not_fit() -> None:
+    (meet,) = parse_lines([A0, B1, C1, d0(), Z0]).meets
+    meet.results[0].time = Time(100 * 6000)
+    with pytest.raises(ValueError, match="8-column"):
+        write_cl2([meet], io.StringIO())
+    meet.clubs[0].team_code = "PCSCSCXX"
+    with pytest.raises(ValueError, match="team code"):
+        write_cl2([meet], io.StringIO())
@@ -0,0 +1,84 @@
+"""Binary snapshots: round-trip of the stored fields, lazy headers, and format checks."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import DATA_DIR
+
+from tunas import IndividualSwim, Meet, Relay, Snapshot, read_cl2, read_hy3, write_snapshot
+
+
+def _meets() -> list[Meet]:
+    archives = [*read_cl2(sorted(DATA_DIR.glob("*.cl2"))), *read_hy3(DATA_DIR.glob("*.hy3"))]
+    return [m for a in archives for m in a.meets]
+
+
+def _summary(meet: Meet) -> list[Any]:
+    out: list[Any] = [meet.name, meet.start_date, meet.course, meet.state, meet.age_up_date]
+    out += [(c.team_code, c.lsc, c.full_name, len(c.swimmers)) for c in meet.clubs]
+    out += [(s.full_name, s.id_short, s.id_long, s.birthday, len(s.swims)) for s in meet.swimmers]
+    for r in meet.results:
+        row = [r.event, r.session, r.status, r.time, r.date, r.rank, r.points, r.seed_time]
+        row.append([(sp.distance, sp.time, sp.split_type) for sp in r.splits])  # type: ignore[attr-defined]
+        if isinstance(r, IndividualSwim):
+            row += [r.swimmer.full_name, r.swimmer_age_class]
+        elif isinstance(r, Relay):
+            row += [r.relay_letter, [(leg.order, leg.time, leg.event) for leg in r.legs]]
+            row.append([a.swimmer.full_name if a.swimmer else None for a in r.alternates])
+        out.append(row)
+    return out
+
+
+def test_round_trip_matches_parsed_meets(tmp_path: Path) -> None:
+    meets = _meets()
+    path = tmp_path / "corpus.tunas"
+    assert write_snapshot(iter(meets), path) == len(meets)
+
+    with Snapshot(path) as snap:
+        assert len(snap) == len(meets)
+        assert snap.result_count == sum(len(m.results) for m in meets)
+        loaded = list(snap)
+    # Materialized meets are ordinary objects and outlive the mapping.
+    for original, copy in zip(meets, loaded, strict=True):
+        assert _summary(copy) == _summary(original)
+        assert copy.source_file is not None and original.source_file is not None
+        assert copy.source_file.path == original.source_file.path
+
+
+def test_headers_and_random_access(tmp_path: Path) -> None:
+    meets = _meets()
+    path = tmp_path / "corpus.tunas"
+    write_snapshot(meets, path)
+
+    with Snapshot(path) as snap:
+        headers = list(snap.headers())
+        assert [h.name for h in headers] == [m.name for m in meets]
+        assert [h.results for h in headers] == [len(m.results) for m in meets]
+        last = snap[len(snap) - 1]
+        assert last.name == meets[-1].name
+        with pytest.raises(IndexError):
+            snap.meet(len(snap))
+
+
+def test_rejects_other_files(tmp_path: Path) -> None:
+    bad = tmp_path / "bad.tunas"
+    bad.write_bytes(b"not a snapshot at all" * 10)
+    with pytest.raises(ValueError, match="not a tunas snapshot"):
+        Snapshot(bad)
+    empty = tmp_path / "empty.tunas"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        Snapshot(empty)
+
+
+def test_rejects_other_enum_definitions(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.tunas"
+    write_snapshot(_meets()[:1], path)
+    data = bytearray(path.read_bytes())
+    data[16:24] = bytes(8)  # the enum digest: as if written with other enum members
+    path.write_bytes(data)
+    with pytest.raises(ValueError, match="other enum definitions"):
+        Snapshot(path)
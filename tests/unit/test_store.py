@@ -0,0 +1,116 @@
+"""SQLite store: bulk load of every table, content-hash dedup, and query helpers."""
+
+from __future__ import annotations
+
+import datetime
+import io
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+from conftest import A0, B1, C1, DATA_DIR, Z0, d0, e0, f0, g0, parse_lines
+
+from tunas import Event, ResultStatus, Store, Time, read_cl2, read_hy3
+
+ID = "49AC52F69618"
+
+
+def _count(store: Store, table: str) -> int:
+    return int(store.connection.execute(f"SELECT count(*) FROM {table}").fetchone()[0])
+
+
+def test_ingest_loads_every_table() -> None:
+    archive = parse_lines([A0, B1, C1, d0(), g0(), e0(), f0(), Z0])
+    with Store() as store:
+        assert store.ingest(archive)
+        assert _count(store, "meets") == 1
+        assert _count(store, "clubs") == 1
+        assert _count(store, "swimmers") == 1
+        assert _count(store, "swims") == 1
+        assert _count(store, "relays") == 1
+        assert _count(store, "legs") == 1
+        assert _count(store, "splits") == len(archive.meets[0].individual_swims[0].splits)
+        leg_athlete = store.connection.execute("SELECT athlete_id FROM legs").fetchone()[0]
+        assert leg_athlete == ID
+
+
+def test_queries_filter_and_order() -> None:
+    first = parse_lines([A0, B1, C1, d0(finals="1:01.00"), d0(uss="OTHERSWIMMER", finals="DQ"), Z0])
+    second = parse_lines([A0, B1, C1, d0(finals="59.00", date="01032025"), Z0])
+    with Store() as store:
+        store.ingest(first)
+        store.ingest(second)
+
+        swims = store.swims(athlete=ID)
+        assert [s.time for s in swims] == [Time.parse("59.00"), Time.parse("1:01.00")]
+        assert swims[0].name == "Irene Zhong" and swims[0].club == "PCSCSC"
+        assert swims[0].date == datetime.date(2025, 1, 3)
+
+        assert len(store.swims(event=Event.FREE_100_SCY)) == 3
+        assert len(store.swims(event=Event.FREE_100_SCY, timed_only=True)) == 2
+        assert store.swims(event=Event.FREE_100_SCY)[-1].status is ResultStatus.DQ
+        assert len(store.swims(club="PCSCSC", since=datetime.date(2025, 1, 3))) == 1
+        assert store.swims(until=datetime.date(2024, 12, 31)) == []
+
+        best = store.best(ID, Event.FREE_100_SCY)
+        assert best is not None and best.time == Time.parse("59.00")
+        assert store.best(ID, Event.FLY_50_SCY) is None
+        assert [m.name for m in store.meets()] == ["Winter Champs", "Winter Champs"]
+
+
+def test_ties_prefer_dated_swims() -> None:
+    undated = parse_lines([A0, B1, C1, d0(date=""), Z0])
+    dated = parse_lines([A0, B1, C1, d0(date="01052025"), Z0])
+    with Store() as store:
+        store.ingest(undated)
+        store.ingest(dated)
+        best = store.best(ID, Event.FREE_100_SCY)
+        assert best is not None and best.date == datetime.date(2025, 1, 5)
+
+
+def test_suppressed_warnings_are_counted() -> None:
+    lines = [A0, B1, C1, *(d0(birth="") for _ in range(4)), Z0]
+    archive = next(read_cl2(io.StringIO("\n".join(lines) + "\n"), max_warnings=1))
+    report = archive.report
+    assert report.suppressed and len(report.warnings) < report.warning_count
+    with Store() as store:
+        store.ingest(archive)
+        total = store.connection.execute("SELECT sum(count) FROM warnings").fetchone()[0]
+        tallied = store.connection.execute(
+            "SELECT count(*) FROM warnings WHERE line_no IS NULL AND reason IS NULL"
+        ).fetchone()[0]
+    assert total == report.warning_count and tallied == len(report.suppressed)
+
+
+def test_ingest_files_deduplicates_by_content(tmp_path: Path) -> None:
+    cl2 = sorted(DATA_DIR.glob("*.cl2"))[0]
+    copy = tmp_path / "renamed.cl2"
+    shutil.copy(cl2, copy)
+    hy3 = next(DATA_DIR.glob("*.hy3"))
+    db = tmp_path / "corpus.sqlite"
+
+    with Store(db) as store:
+        assert store.ingest_files([cl2, copy, hy3]) == 2
+        swims = _count(store, "swims")
+    with Store(db) as store:  # reopening keeps the data; re-ingesting is a no-op
+        assert store.ingest_files([cl2, hy3]) == 0
+        assert _count(store, "files") == 2
+        assert _count(store, "swims") == swims
+
+    expected = sum(
+        len(m.individual_swims)
+        for archive in (*read_cl2(cl2), *read_hy3(hy3))
+        for m in archive.meets
+    )
+    assert swims == expected
+
+
+def test_incompatible_schema_version_raises(tmp_path: Path) -> None:
+    db = tmp_path / "old.sqlite"
+    Store(db).close()
+    conn = sqlite3.connect(db)
+    conn.execute("PRAGMA user_version = 99")
+    conn.close()
+    with pytest.raises(ValueError):
+        Store(db)
@@ -0,0 +1,54 @@
+"""The synthetic corpus generator: valid files whose parse matches the declared counts."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Any
+
+import pytest
+from synth import Spec, SynthFile, synth_cl2, synth_hy3, write_corpus
+
+from tunas import IssueKind, read_cl2, read_hy3
+from tunas._parser.checksum import hy3_checksum
+
+SPEC = Spec(meets=2, clubs=3, swimmers=40, relay_ratio=0.25, split_density=0.5, seed=11)
+
+
+def _parse(gen: Any, reader: Any, spec: Spec) -> tuple[SynthFile, Any]:
+    synth = gen(spec)
+    return synth, next(reader(io.StringIO(synth.text))).report
+
+
+@pytest.mark.parametrize(("gen", "reader"), [(synth_cl2, read_cl2), (synth_hy3, read_hy3)])
+def test_clean_file_parses_to_declared_counts(gen: Any, reader: Any) -> None:
+    synth, report = _parse(gen, reader, SPEC)
+    assert report.warnings == []  # includes the .cl2 Z0 count check
+    assert (
+        report.meets_parsed,
+        report.swimmers_parsed,
+        report.individual_swims_parsed,
+        report.relays_parsed,
+        report.splits_parsed,
+    ) == (synth.meets, synth.swimmers, synth.individual_swims, synth.relays, synth.splits)
+    assert synth.relays and synth.splits
+
+
+@pytest.mark.parametrize(("gen", "reader"), [(synth_cl2, read_cl2), (synth_hy3, read_hy3)])
+def test_error_rate_injects_one_recovered_warning_each(gen: Any, reader: Any) -> None:
+    synth, report = _parse(gen, reader, Spec(swimmers=60, error_rate=0.2, seed=4))
+    assert synth.errors > 0
+    assert len(report.warnings) == synth.errors
+    assert {w.kind for w in report.warnings} <= {IssueKind.MISSING, IssueKind.MALFORMED}
+
+
+def test_seeded_and_checksummed(tmp_path: Path) -> None:
+    assert synth_hy3(SPEC).text == synth_hy3(SPEC).text
+    assert synth_cl2(SPEC).text != synth_cl2(Spec(seed=12)).text
+    for line in synth_hy3(SPEC).text.splitlines():
+        assert line[128:] == hy3_checksum(line[:128].encode("cp1252"))
+    paths = write_corpus(tmp_path, SPEC, files=2, fmt="hy3")
+    assert [p.name for p in paths] == ["synth_00011.hy3", "synth_00012.hy3"]
+    assert paths[0].read_bytes().decode("cp1252") == synth_hy3(SPEC).text
+    with pytest.raises(ValueError, match="fmt"):
+        write_corpus(tmp_path, SPEC, fmt="sd3")
@@ -0,0 +1,193 @@
+"""Structural validation: the same findings a parse reports, without building objects."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from unittest.mock import ANY
+
+import pytest
+from conftest import (
+    A0,
+    A1,
+    B1,
+    B1_HY3,
+    C1,
+    C1_HY3,
+    DATA_DIR,
+    Z0,
+    d0,
+    d1,
+    e0,
+    e1,
+    e2,
+    f0,
+    f1,
+    f2,
+    f3,
+    f3_slot,
+    g0,
+    g1,
+    g1_block,
+    rec,
+)
+
+from tunas import IssueKind, ParseError, Severity, read_cl2, read_hy3, validate_cl2, validate_hy3
+from tunas._parser.checksum import hy3_checksum
+from tunas.cli import main
+from tunas.validate import ValidationResult
+
+# The kinds a validator checks exhaustively (the rest need parsed values).
+STRUCTURAL = {
+    IssueKind.BAD_LENGTH,
+    IssueKind.UNKNOWN_RECORD,
+    IssueKind.ORPHANED,
+    IssueKind.COUNT_MISMATCH,
+}
+
+
+def _cl2(lines: list[str]) -> ValidationResult:
+    (result,) = validate_cl2(io.StringIO("\n".join(lines) + "\n"))
+    return result
+
+
+def _hy3(lines: list[str], **options: bool) -> ValidationResult:
+    (result,) = validate_hy3(io.StringIO("\n".join(lines) + "\n"), **options)
+    return result
+
+
+def _shape(w: object) -> tuple[object, ...]:
+    return tuple(getattr(w, a) for a in ("line_no", "record_type", "field", "kind", "reason"))
+
+
+@pytest.mark.parametrize("name", ["reno_walk_on_meet.cl2", "aaa_league_championship.cl2"])
+def test_golden_files_match_the_parse(name: str) -> None:
+    path = DATA_DIR / name
+    (result,) = validate_cl2(path)
+    parsed = next(read_cl2(path)).report
+    assert result.valid and result.source == str(path)
+    assert [_shape(w) for w in result.report.warnings] == [
+        _shape(w) for w in parsed.warnings if w.kind in STRUCTURAL
+    ]
+
+
+def test_golden_hy3_matches_the_parse() -> None:
+    path = DATA_DIR / "pasa_distance_intersquad.hy3"
+    (result,) = validate_hy3(path)
+    parsed = next(read_hy3(path)).report
+    assert result.valid and result.source == str(path)
+    structural = [_shape(w) for w in parsed.warnings if w.kind in STRUCTURAL]
+    # The one F2 whose relay event does not resolve is skipped by the parse, which then
+    # orphans its F3; the validator does not resolve events, so it keeps the relay.
+    (skipped,) = parsed.warnings_for(kind=IssueKind.UNKNOWN_CODE)
+    assert structural == [(skipped.line_no + 1, "F3", None, IssueKind.ORPHANED, ANY)]
+    assert result.report.warnings == []
+
+
+def test_structural_findings_match_the_parse() -> None:
+    lines = [
+        A0,
+        d0(),  # before any B1
+        B1,
+        C1,
+        rec((1, "D1")),  # no current swimmer
+        rec((1, "X9")),
+        d0(),
+        g0(),
+        e0(),
+        f0(),
+        d0() + "x" * 20,  # over-long
+        Z0,
+    ]
+    result = _cl2(lines)
+    parsed = next(read_cl2(io.StringIO("\n".join(lines) + "\n"))).report
+    assert result.valid
+    assert [_shape(w) for w in result.report.warnings] == [_shape(w) for w in parsed.warnings]
+    assert result.report.records_skipped == parsed.records_skipped
+
+
+def test_fatal_issues_are_collected_not_raised() -> None:
+    lines = [A0, B1, C1, d0(name=""), d0(sex=" "), d0(), Z0]
+    with pytest.raises(ParseError) as exc:
+        next(read_cl2(io.StringIO("\n".join(lines) + "\n")))
+    result = _cl2(lines)
+    assert not result.valid
+    fatal = result.report.warnings_for(severity=Severity.FATAL)
+    assert [(w.line_no, w.field) for w in fatal] == [(4, "swimmer_name"), (5, "sex")]
+    assert _shape(fatal[0]) == _shape(exc.value.warning)
+
+
+def test_hy3_checksums_verified_on_request() -> None:
+    good = d1()
+    bad = good[:128] + ("00" if good[128:] != "00" else "11")
+    blank = good[:128] + "  "
+    lines = [A1, B1_HY3, C1_HY3, good, bad, blank, e1(), e2()]
+    assert not _hy3(lines).report.has_warnings
+    bad, missing = _hy3(lines, verify_checksums=True).report.warnings
+    assert (bad.line_no, bad.kind, bad.column) == (5, IssueKind.BAD_CHECKSUM, "129/2")
+    assert bad.severity is Severity.RECOVERED
+    assert missing.line_no == 6 and missing.reason.startswith("missing checksum")
+    parsed = next(read_hy3(io.StringIO("\n".join(lines) + "\n"), verify_checksums=True))
+    assert [_shape(w) for w in parsed.report.warnings] == [_shape(bad), _shape(missing)]
+
+
+def test_hy3_structural_findings_match_the_parse() -> None:
+    split = g1(g1_block("F", 1, "30.00"))
+    leg = f3(f3_slot("F", "1", "Caden", "F", "1"))
+    lines = [
+        A1,
+        B1_HY3,
+        C1_HY3,
+        split,  # before any swim
+        f2(),  # no F1
+        leg,  # no F2
+        d1(number=""),
+        d1(number="2", first=""),
+        d1(),
+        e1(),
+        e2(),
+        split,
+        f1(),
+        f2(),
+        leg,
+        split,
+    ]
+    result = _hy3(lines)
+    parsed = next(read_hy3(io.StringIO("\n".join(lines) + "\n"))).report
+    assert result.valid
+    assert [_shape(w) for w in result.report.warnings] == [_shape(w) for w in parsed.warnings]
+    assert result.report.records_skipped == parsed.records_skipped
+    (fatal,) = _hy3([A1, B1_HY3, C1_HY3, f1(letter="")]).report.warnings
+    assert (fatal.severity, fatal.field) == (Severity.FATAL, "relay_letter")
+
+
+def test_hy3_checksums_use_the_encoding(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    body = d1(last="Renée")[:128]  # é is one byte in cp437, but not the cp1252 byte
+    athlete = body + hy3_checksum(body.encode("cp437"))
+    meet = [B1_HY3, C1_HY3, athlete, e1(), e2()]
+    path = tmp_path / "cp437.hy3"
+    path.write_bytes(("\r\n".join([A1, *meet, *meet]) + "\r\n").encode("cp437"))
+    options = {"encoding": "cp437", "verify_checksums": True}
+    (result,) = validate_hy3(path, **options)  # type: ignore[arg-type]
+    assert not result.report.has_warnings
+    for workers in (1, 2):
+        (archive,) = read_hy3(path, workers=workers, **options)  # type: ignore[arg-type]
+        assert not archive.report.has_warnings and len(archive.meets) == 2
+    assert main(["parse", str(path), "--encoding", "cp437", "--verify-checksums", "-q"]) == 0
+    assert json.loads(capsys.readouterr().out)["warnings"] == 0
+
+
+def test_hy3_parent_context() -> None:
+    lines = [A1, d1(), B1_HY3, C1_HY3, e2(), d1(number="7"), e1(number="8"), e2()]
+    reasons = [w.reason for w in _hy3(lines).report.warnings]
+    assert reasons == [
+        "D1 athlete with no preceding B1 meet",
+        "E2 result with no preceding E1 entry",
+        "E2 result with no resolvable athlete",
+    ]
+
+
+def test_bytes_source_rejected() -> None:
+    with pytest.raises(TypeError, match="validate_cl2"):
+        next(validate_cl2(io.BytesIO(A0.encode())))  # type: ignore[arg-type]